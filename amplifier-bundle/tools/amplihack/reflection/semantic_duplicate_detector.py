@@ -7,16 +7,222 @@ with a simpler, more effective semantic approach.
 Key Features:
 - Uses Claude Code SDK for semantic comparison
 - Provides explanations for duplicate decisions
-- LRU cache for efficiency
+- Persistent on-disk issue index with token/shingle (MinHash) signatures
+- Cheap prefilter so only the top-k candidates reach the LLM, checked concurrently
+- Pair cache keyed by content hash so repeated comparisons are free
 - Graceful fallback to difflib if SDK unavailable
 """
 
 import asyncio
 import hashlib
+import heapq
 import json
-from dataclasses import dataclass
+import os
+import random
+import re
+import tempfile
+from dataclasses import asdict, dataclass, field
 from difflib import SequenceMatcher
 from functools import lru_cache
+from pathlib import Path
+
+# MinHash parameters: 64 permutations gives ~0.125 standard error on the
+# Jaccard estimate, plenty for ranking candidates ahead of the LLM check.
+_NUM_PERMUTATIONS = 64
+_SHINGLE_SIZE = 3
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_PERMUTATIONS = [
+    (
+        random.Random(seed).randint(1, _MERSENNE_PRIME - 1),
+        random.Random(-seed).randint(0, _MERSENNE_PRIME - 1),
+    )
+    for seed in range(1, _NUM_PERMUTATIONS + 1)
+]
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def _tokenize(content: str) -> list[str]:
+    """Lowercase word tokens used for both token and shingle signatures."""
+    return _TOKEN_RE.findall(content.lower())
+
+
+def _shingles(tokens: list[str]) -> set[str]:
+    """Word shingles; short texts fall back to their individual tokens."""
+    if len(tokens) < _SHINGLE_SIZE:
+        return set(tokens)
+    return {" ".join(tokens[i : i + _SHINGLE_SIZE]) for i in range(len(tokens) - _SHINGLE_SIZE + 1)}
+
+
+def _minhash(shingles: set[str]) -> list[int]:
+    """MinHash signature over shingles (stable across processes)."""
+    if not shingles:
+        return [_MAX_HASH] * _NUM_PERMUTATIONS
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "big") for s in shingles
+    ]
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in _PERMUTATIONS
+    ]
+
+
+@dataclass
+class IssueSignature:
+    """Cheap similarity signature for one issue."""
+
+    content_hash: str
+    tokens: list[str]
+    minhash: list[int]
+
+    @classmethod
+    def from_content(cls, content: str) -> "IssueSignature":
+        tokens = _tokenize(content)
+        return cls(
+            content_hash=hashlib.sha256(content.encode()).hexdigest()[:16],
+            tokens=sorted(set(tokens)),
+            minhash=_minhash(_shingles(tokens)),
+        )
+
+    def similarity(self, other: "IssueSignature") -> float:
+        """Blend of token Jaccard and MinHash shingle-Jaccard estimate."""
+        a, b = set(self.tokens), set(other.tokens)
+        token_jaccard = len(a & b) / len(a | b) if a or b else 0.0
+        matches = sum(1 for x, y in zip(self.minhash, other.minhash, strict=True) if x == y)
+        return 0.5 * token_jaccard + 0.5 * matches / _NUM_PERMUTATIONS
+
+
+@dataclass
+class IndexedIssue:
+    """An issue stored in the persistent index."""
+
+    issue_id: str
+    title: str
+    body: str
+    pattern_type: str | None = None
+    priority: str = "medium"
+    repository: str = "current"
+    signature: IssueSignature | None = field(default=None, repr=False)
+
+    def to_issue(self) -> dict:
+        """Issue dict in the shape callers of detect_semantic_duplicate expect."""
+        return {
+            "id": self.issue_id,
+            "title": self.title,
+            "body": self.body,
+            "pattern_type": self.pattern_type,
+            "priority": self.priority,
+            "repository": self.repository,
+        }
+
+
+def _issue_content(issue: dict) -> str:
+    return f"{issue.get('title', '')}\n{issue.get('body', '')}"
+
+
+def _default_index_path() -> Path:
+    """Locate .claude/runtime/ the same way ReflectionLock does."""
+    current = Path(__file__).resolve().parent
+    while current != current.parent:
+        claude_dir = current / ".claude"
+        if claude_dir.exists():
+            return claude_dir / "runtime" / "reflection" / "issue_index.json"
+        current = current.parent
+    return Path.cwd() / ".claude" / "runtime" / "reflection" / "issue_index.json"
+
+
+class IssueIndex:
+    """Persistent on-disk index of known issues with precomputed signatures.
+
+    The index is a single JSON file loaded lazily on first use and rewritten
+    atomically on every insert, so concurrent reflection runs never observe a
+    half-written file.
+    """
+
+    def __init__(self, index_path: Path | None = None):
+        self.index_path = Path(index_path) if index_path else None
+        self._issues: dict[str, IndexedIssue] | None = None
+
+    def _path(self) -> Path:
+        if self.index_path is None:
+            self.index_path = _default_index_path()
+        return self.index_path
+
+    def _load(self) -> dict[str, IndexedIssue]:
+        if self._issues is not None:
+            return self._issues
+        self._issues = {}
+        path = self._path()
+        if path.exists():
+            try:
+                data = json.loads(path.read_text())
+                for raw in data.get("issues", []):
+                    signature = raw.pop("signature", None)
+                    issue = IndexedIssue(**raw)
+                    # Signatures from another permutation count are recomputed
+                    issue.signature = (
+                        IssueSignature(**signature)
+                        if signature and len(signature.get("minhash", [])) == _NUM_PERMUTATIONS
+                        else IssueSignature.from_content(_issue_content(issue.to_issue()))
+                    )
+                    self._issues[issue.issue_id] = issue
+            except (OSError, ValueError, TypeError) as e:
+                print(f"Issue index unreadable, starting empty: {e}")
+        return self._issues
+
+    def _save(self) -> None:
+        path = self._path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": 1, "issues": [asdict(i) for i in self._load().values()]}
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".issue_index.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp, path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def add(
+        self,
+        issue_id: str,
+        title: str,
+        body: str,
+        pattern_type: str | None = None,
+        priority: str = "medium",
+        repository: str = "current",
+    ) -> IndexedIssue:
+        """Index an issue (replacing any previous entry with the same id) and persist."""
+        issue = IndexedIssue(
+            issue_id=str(issue_id),
+            title=title,
+            body=body,
+            pattern_type=pattern_type,
+            priority=priority,
+            repository=repository,
+        )
+        issue.signature = IssueSignature.from_content(_issue_content(issue.to_issue()))
+        self._load()[issue.issue_id] = issue
+        self._save()
+        return issue
+
+    def signatures(self) -> dict[str, IssueSignature]:
+        """Stored signatures of all indexed issues, keyed by content hash."""
+        return {
+            i.signature.content_hash: i.signature
+            for i in self._load().values()
+            if i.signature is not None
+        }
+
+    def issues(self, repository: str | None = None) -> list[dict]:
+        """All indexed issues, optionally restricted to one repository."""
+        return [
+            i.to_issue()
+            for i in self._load().values()
+            if repository is None or i.repository == repository
+        ]
 
 
 @dataclass
@@ -41,10 +247,37 @@ class DuplicateDetectionResult:
 class SemanticDuplicateDetector:
     """Semantic duplicate detector using Claude SDK."""
 
-    def __init__(self):
-        """Initialize the detector."""
+    def __init__(
+        self,
+        index: IssueIndex | None = None,
+        top_k: int = 5,
+        max_concurrency: int = 4,
+        recall_sample_size: int = 3,
+    ):
+        """Initialize the detector.
+
+        Args:
+            index: Persistent issue index (default: .claude/runtime/reflection/)
+            top_k: Candidates passed from the prefilter to the LLM check
+            max_concurrency: Maximum concurrent LLM comparisons
+            recall_sample_size: Non-candidates audited with difflib per detection
+                to estimate prefilter recall (0 disables the audit)
+        """
         self._sdk_available = self._check_sdk_available()
-        self._cache = {}  # Simple in-memory cache for session
+        self._cache: dict[tuple[str, str], dict] = {}  # (new_hash, existing_hash) -> result
+        self._signatures: dict[str, IssueSignature] = {}  # content_hash -> signature
+        self.index = index if index is not None else IssueIndex()
+        self.top_k = top_k
+        self.max_concurrency = max_concurrency
+        self.recall_sample_size = recall_sample_size
+        self._stats = {
+            "comparisons_requested": 0,
+            "llm_calls": 0,
+            "cache_hits": 0,
+            "prefiltered_out": 0,
+            "candidate_duplicates": 0,
+            "missed_duplicates": 0,
+        }
 
     def _check_sdk_available(self) -> bool:
         """Check if Claude Code SDK is available."""
@@ -152,10 +385,78 @@ Don't consider duplicates if they:
             "explanation": explanation,
         }
 
+    def prefilter(
+        self, new_content: str, existing_issues: list[dict]
+    ) -> tuple[list[dict], list[dict]]:
+        """Split existing issues into top-k candidates and the rest.
+
+        Candidates keep their original relative order so ties resolve the
+        same way the unfiltered scan did.
+        """
+        if len(existing_issues) <= self.top_k:
+            return list(existing_issues), []
+
+        new_signature = self._signature(new_content)
+        scored = [
+            (new_signature.similarity(self._signature(_issue_content(issue))), -i)
+            for i, issue in enumerate(existing_issues)
+        ]
+        top = {-i for _, i in heapq.nlargest(self.top_k, scored)}
+        candidates = [issue for i, issue in enumerate(existing_issues) if i in top]
+        rest = [issue for i, issue in enumerate(existing_issues) if i not in top]
+        return candidates, rest
+
+    def _signature(self, content: str) -> IssueSignature:
+        """Signature for content, computed at most once per distinct content."""
+        content_hash = self._content_hash(content)
+        signature = self._signatures.get(content_hash)
+        if signature is None:
+            signature = self._signatures[content_hash] = IssueSignature.from_content(content)
+        return signature
+
+    async def _compare(self, new_content: str, issue: dict, semaphore: asyncio.Semaphore) -> dict:
+        """Compare against one issue, consulting the pair cache first."""
+        existing_content = _issue_content(issue)
+        key = (self._content_hash(new_content), self._content_hash(existing_content))
+        if key in self._cache:
+            self._stats["cache_hits"] += 1
+            return self._cache[key]
+
+        result = None
+        if self._sdk_available:
+            async with semaphore:
+                self._stats["llm_calls"] += 1
+                result = await self.detect_with_llm(new_content, existing_content)
+
+        # Fallback to simple detection if LLM unavailable
+        if result is None:
+            result = self.fallback_detect(new_content, existing_content)
+
+        self._cache[key] = result
+        return result
+
+    def _audit_recall(self, new_content: str, skipped: list[dict]) -> None:
+        """Check a sample of prefiltered-out issues with difflib to estimate recall."""
+        if not skipped or self.recall_sample_size <= 0:
+            return
+        sample = random.sample(skipped, min(self.recall_sample_size, len(skipped)))
+        for issue in sample:
+            if self.fallback_detect(new_content, _issue_content(issue))["is_duplicate"]:
+                self._stats["missed_duplicates"] += 1
+
     async def detect_semantic_duplicate(
-        self, title: str, body: str, existing_issues: list[dict]
+        self, title: str, body: str, existing_issues: list[dict] | None = None
     ) -> DuplicateDetectionResult:
-        """Main detection method."""
+        """Main detection method.
+
+        When ``existing_issues`` is None the persistent index is used. Only
+        the prefilter's top-k candidates are compared, concurrently.
+        """
+        if existing_issues is None:
+            existing_issues = self.index.issues()
+            # Reuse the signatures persisted with the index
+            self._signatures.update(self.index.signatures())
+
         if not existing_issues:
             return DuplicateDetectionResult(
                 is_duplicate=False,
@@ -165,29 +466,29 @@ Don't consider duplicates if they:
             )
 
         new_content = f"{title}\n{body}"
+        candidates, skipped = self.prefilter(new_content, existing_issues)
+        self._stats["comparisons_requested"] += len(existing_issues)
+        self._stats["prefiltered_out"] += len(skipped)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._compare(new_content, issue, semaphore) for issue in candidates)
+        )
+
         most_similar_issue = None
         highest_similarity = 0.0
         best_explanation = ""
 
-        for issue in existing_issues:
-            existing_content = f"{issue.get('title', '')}\n{issue.get('body', '')}"
-
-            # Try LLM detection first
-            result = await self.detect_with_llm(new_content, existing_content)
-
-            # Fallback to simple detection if LLM unavailable
-            if result is None:
-                result = self.fallback_detect(new_content, existing_content)
-
+        for issue, result in zip(candidates, results, strict=True):
             similarity = result.get("similarity_score", 0.0)
+            if result.get("is_duplicate", False):
+                self._stats["candidate_duplicates"] += 1
             if similarity > highest_similarity:
                 highest_similarity = similarity
                 most_similar_issue = issue
                 best_explanation = result.get("explanation", "")
 
-                # Early exit if clear duplicate found
-                if result.get("is_duplicate", False) and similarity > 0.9:
-                    break
+        self._audit_recall(new_content, skipped)
 
         # Determine if duplicate based on highest similarity
         is_duplicate = highest_similarity > 0.75  # Threshold for duplicate
@@ -203,6 +504,17 @@ Don't consider duplicates if they:
             reason=best_explanation or f"Similarity: {highest_similarity:.1%}",
         )
 
+    def get_stats(self) -> dict:
+        """Prefilter and LLM usage counters."""
+        stats = dict(self._stats)
+        found = stats["candidate_duplicates"] + stats["missed_duplicates"]
+        # Recall is estimated from the difflib audit of prefiltered-out issues;
+        # None until at least one duplicate has been observed.
+        stats["prefilter_recall"] = stats["candidate_duplicates"] / found if found else None
+        llm_calls_without_prefilter = stats["comparisons_requested"] if self._sdk_available else 0
+        stats["llm_calls_saved"] = max(0, llm_calls_without_prefilter - stats["llm_calls"])
+        return stats
+
 
 # Global detector instance
 _detector = SemanticDuplicateDetector()
@@ -215,9 +527,7 @@ def check_duplicate_issue(
 
     This is the main entry point that matches the existing interface.
     """
-    # For now, return empty list of existing issues
-    # In production, this would fetch from GitHub API or cache
-    existing_issues = []
+    existing_issues = _detector.index.issues(repository)
 
     # Run async detection in sync context
     try:
@@ -249,13 +559,11 @@ def store_new_issue(
     priority: str = "medium",
     repository: str = "current",
 ) -> None:
-    """Store a new issue for future duplicate detection.
-
-    This maintains interface compatibility but is simplified.
-    In production, this would store to a persistent cache.
-    """
-    # For now, this is a no-op as we don't maintain persistent storage
-    # Could be extended to store in a file or database
+    """Store a new issue in the persistent index for future duplicate detection."""
+    try:
+        _detector.index.add(issue_id, title, body, pattern_type, priority, repository)
+    except OSError as e:
+        print(f"Failed to store issue {issue_id} in index: {e}")
 
 
 def get_performance_stats() -> dict:
@@ -264,12 +572,16 @@ def get_performance_stats() -> dict:
         "sdk_available": _detector._sdk_available,
         "cache_size": len(_detector._cache),
         "method": "semantic" if _detector._sdk_available else "fallback",
+        "indexed_issues": len(_detector.index),
+        **_detector.get_stats(),
     }
 
 
 # Maintain compatibility with existing interface
 __all__ = [
     "DuplicateDetectionResult",
+    "IssueIndex",
+    "SemanticDuplicateDetector",
     "check_duplicate_issue",
     "get_performance_stats",
     "store_new_issue",
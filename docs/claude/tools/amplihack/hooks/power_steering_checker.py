@@ -21,6 +21,7 @@ Phase 1 (MVP) Implementation:
 Phase 4 (Performance) Implementation:
 - Parallel SDK calls using asyncio.gather()
 - Transcript loaded ONCE, shared across parallel workers
+- Heuristic checkers read TranscriptFeatures extracted in ONE pass over it
 - All checks run (no early exit) for comprehensive feedback
 - No caching (not applicable to session-specific analysis)
 
@@ -34,6 +35,7 @@ import os
 import re
 import signal
 import sys
+from collections import Counter, deque
 from collections.abc import Callable
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -82,6 +84,14 @@ try:
 except ImportError:
     TURN_STATE_AVAILABLE = False
 
+# Import incremental transcript index (per-session sidecar)
+try:
+    from transcript_index import TranscriptIndex
+
+    TRANSCRIPT_INDEX_AVAILABLE = True
+except ImportError:
+    TRANSCRIPT_INDEX_AVAILABLE = False
+
 # Try to import completion evidence module
 try:
     from completion_evidence import (  # type: ignore[import-not-found]
@@ -111,7 +121,7 @@ except ImportError:
 
 
 # Security: Maximum transcript size to prevent memory exhaustion
-MAX_TRANSCRIPT_LINES = 50000  # Limit transcript to 50K lines (~10-20MB typical)
+MAX_TRANSCRIPT_LINES = 50000  # Keep the newest 50K lines (~10-20MB typical)
 
 # Timeout hierarchy: HOOK_TIMEOUT (120s) > PARALLEL_TIMEOUT (60s) > CHECKER_TIMEOUT (25s)
 # Individual checker execution budget (within parallel execution budget)
@@ -284,6 +294,86 @@ class PowerSteeringResult:
     )  # List of CheckerResult objects for visibility
 
 
+@dataclass
+class TranscriptFeatures:
+    """Everything the heuristic checkers read from a transcript, in one pass.
+
+    Built once per transcript by from_transcript() and shared by all _check_*
+    methods, which evaluate their heuristics against these flat lists instead
+    of each re-walking every message and content block. Lists keep transcript
+    order.
+    """
+
+    tool_names: Counter = field(default_factory=Counter)  # tool_use name -> call count
+    tool_uses_by_id: dict[str, list[dict]] = field(default_factory=dict)
+    bash_commands: list[tuple[int, Any]] = field(default_factory=list)  # (msg index, command)
+    file_ops: list[tuple[str, dict]] = field(default_factory=list)  # (Write|Edit, input)
+    todo_writes: list[Any] = field(default_factory=list)  # First TodoWrite input per message
+    assistant_texts: list[str] = field(default_factory=list)  # Text blocks, lowercased
+    user_contents: list[str] = field(default_factory=list)  # str(content), lowercased
+    tool_result_outputs: list[str] = field(default_factory=list)  # str(content), lowercased
+    tool_result_messages: list[dict] = field(default_factory=list)  # With a tool_use_id
+    status_messages: list[Any] = field(default_factory=list)  # assistant/tool_result "message"
+    has_user_message: bool = False
+
+    @classmethod
+    def from_transcript(cls, transcript: list[dict]) -> "TranscriptFeatures":
+        """Extract features from transcript with a single walk over its messages."""
+        features = cls()
+        for i, msg in enumerate(transcript):
+            msg_type = msg.get("type")
+            if msg_type == "assistant":
+                features.status_messages.append(msg.get("message", {}))
+                if "message" in msg:
+                    content = msg["message"].get("content", [])
+                    if isinstance(content, list):
+                        features._add_assistant_blocks(i, content)
+            elif msg_type == "user":
+                features.has_user_message = True
+                content = str(msg.get("message", {}).get("content", "")).lower()
+                features.user_contents.append(content)
+            elif msg_type == "tool_result":
+                message = msg.get("message", {})
+                features.status_messages.append(message)
+                features.tool_result_outputs.append(str(message.get("content", "")).lower())
+                if "message" in msg and message.get("tool_use_id"):
+                    features.tool_result_messages.append(message)
+        return features
+
+    def _add_assistant_blocks(self, index: int, content: list) -> None:
+        todo_write_seen = False
+        for block in content:
+            if not isinstance(block, dict):
+                continue
+            block_type = block.get("type")
+            if block_type == "text":
+                self.assistant_texts.append(str(block.get("text", "")).lower())
+            elif block_type == "tool_use":
+                name = block.get("name", "")
+                self.tool_names[name] += 1
+                block_id = block.get("id")
+                if isinstance(block_id, str):
+                    self.tool_uses_by_id.setdefault(block_id, []).append(block)
+                if name == "Bash":
+                    self.bash_commands.append((index, block.get("input", {}).get("command", "")))
+                elif name in ("Write", "Edit"):
+                    self.file_ops.append((name, block.get("input", {})))
+                elif name == "TodoWrite" and not todo_write_seen:
+                    todo_write_seen = True
+                    self.todo_writes.append(block.get("input", {}))
+
+    @property
+    def last_todo_write(self) -> Any:
+        """Input of the most recent non-empty TodoWrite call, or None."""
+        return next((todo_write for todo_write in reversed(self.todo_writes) if todo_write), None)
+
+    def written_paths(self, tools: tuple[str, ...] = ("Write", "Edit")) -> list[Any]:
+        """file_path of each file operation made with one of tools."""
+        return [
+            tool_input.get("file_path", "") for name, tool_input in self.file_ops if name in tools
+        ]
+
+
 class PowerSteeringChecker:
     """Analyzes session completeness using consideration checkers.
 
@@ -461,6 +551,15 @@ class PowerSteeringChecker:
         shared_runtime = get_shared_runtime_dir(str(project_root))
         self.runtime_dir = Path(shared_runtime) / "power-steering"
 
+        # Oldest messages dropped by the last _load_transcript; added to list
+        # positions so turn-state transcript indices stay absolute
+        self._transcript_evicted = 0
+
+        # (transcript, length, TranscriptFeatures) of the last transcript checked
+        self._features_cache: tuple[list[dict], int, TranscriptFeatures] | None = None
+        # Seconds spent in each heuristic checker, by consideration id
+        self._check_timings: dict[str, float] = {}
+
         self.config_path = (
             project_root / ".claude" / "tools" / "amplihack" / ".power_steering_config"
         )
@@ -720,11 +819,11 @@ class PowerSteeringChecker:
                         "Pre-compaction transcript load failed, falling back to provided transcript",
                         "WARNING",
                     )
-                    transcript = self._load_transcript(transcript_path)
+                    transcript = self._load_transcript(transcript_path, session_id)
                     compaction_detected = False  # Reset since we couldn't use pre-compaction
             else:
                 # No compaction or compaction data unavailable - use provided transcript
-                transcript = self._load_transcript(transcript_path)
+                transcript = self._load_transcript(transcript_path, session_id)
 
             # 3b. Initialize turn state management (fail-open on import error)
             if TURN_STATE_AVAILABLE:
@@ -895,10 +994,11 @@ class PowerSteeringChecker:
                     delta_analyzer = DeltaAnalyzer(log=lambda msg: self._log(msg, "INFO"))
 
                     # Get delta transcript (new messages since last block)
+                    evicted = self._transcript_evicted
                     start_idx, end_idx = turn_state_manager.get_delta_transcript_range(
-                        turn_state, len(transcript)
+                        turn_state, len(transcript) + evicted
                     )
-                    delta_messages = transcript[start_idx:end_idx]
+                    delta_messages = transcript[max(0, start_idx - evicted) : end_idx - evicted]
 
                     self._log(
                         f"Delta analysis: {len(delta_messages)} new messages since last block",
@@ -1038,7 +1138,10 @@ class PowerSteeringChecker:
                             )
 
                         turn_state = turn_state_manager.record_block_with_evidence(
-                            turn_state, failed_evidence, len(transcript), user_claims
+                            turn_state,
+                            failed_evidence,
+                            len(transcript) + self._transcript_evicted,
+                            user_claims,
                         )
                         turn_state_manager.save_state(turn_state)
 
@@ -1780,14 +1883,19 @@ class PowerSteeringChecker:
             # Fail-open: Don't block user if we can't save redirect
             self._log(f"Failed to save redirect: {e}", "ERROR")
 
-    def _load_transcript(self, transcript_path: Path) -> list[dict]:
+    def _load_transcript(self, transcript_path: Path, session_id: str | None = None) -> list[dict]:
         """Load transcript from JSONL file with size limits.
 
+        With a session_id, loads through the session's TranscriptIndex sidecar
+        so only lines appended since the previous stop-hook invocation are
+        parsed. Falls back to a full read if the index is unavailable.
+
         Args:
             transcript_path: Path to transcript file
+            session_id: Session identifier for the incremental index (optional)
 
         Returns:
-            List of message dictionaries (truncated if exceeds MAX_TRANSCRIPT_LINES)
+            List of message dictionaries (newest MAX_TRANSCRIPT_LINES if longer)
 
         Raises:
             OSError: If file cannot be read
@@ -1796,7 +1904,8 @@ class PowerSteeringChecker:
 
         Note:
             Transcripts exceeding MAX_TRANSCRIPT_LINES are truncated to prevent
-            memory exhaustion. A warning is logged when truncation occurs.
+            memory exhaustion, dropping the OLDEST messages. A warning is logged
+            when truncation occurs.
         """
         # Security: Validate transcript path is within project root
         if not self._validate_path(transcript_path, self.project_root):
@@ -1804,28 +1913,36 @@ class PowerSteeringChecker:
                 f"Transcript path {transcript_path} is outside project root {self.project_root}"
             )
 
-        messages = []
-        truncated = False
-
+        self._transcript_evicted = 0
+        if session_id and TRANSCRIPT_INDEX_AVAILABLE:
+            index = TranscriptIndex(
+                self.runtime_dir / session_id,
+                max_messages=MAX_TRANSCRIPT_LINES,
+                log=self._log,
+            )
+            try:
+                transcript = index.load(transcript_path)
+                self._transcript_evicted = index.evicted
+                return transcript
+            except OSError as e:
+                # Fail-open: index trouble must not hide the transcript
+                self._log(f"Transcript index unavailable, reading full transcript: {e}", "WARNING")
+
+        # Security: Enforce maximum transcript size, keeping the newest lines
+        lines: deque[str] = deque(maxlen=MAX_TRANSCRIPT_LINES)
+        line_num = 0
         with open(transcript_path) as f:
             for line_num, line in enumerate(f, 1):
-                # Security: Enforce maximum transcript size
-                if line_num > MAX_TRANSCRIPT_LINES:
-                    truncated = True
-                    break
-
-                line = line.strip()
-                if not line:
-                    continue
-                messages.append(json.loads(line))
+                lines.append(line)
 
-        if truncated:
+        if line_num > MAX_TRANSCRIPT_LINES:
+            self._transcript_evicted = line_num - MAX_TRANSCRIPT_LINES
             self._log(
-                f"Transcript truncated at {MAX_TRANSCRIPT_LINES} lines (original: {line_num})",
+                f"Transcript truncated to newest {MAX_TRANSCRIPT_LINES} lines (original: {line_num})",
                 "WARNING",
             )
 
-        return messages
+        return [json.loads(line) for line in lines if line.strip()]
 
     def _has_development_indicators(
         self,
@@ -2641,12 +2758,18 @@ class PowerSteeringChecker:
             checker_name = consideration["checker"]
 
             # Dispatch to specific checker or generic analyzer
+            start_time = datetime.now()
             if hasattr(self, checker_name) and callable(getattr(self, checker_name)):
                 checker_func = getattr(self, checker_name)
                 satisfied = checker_func(transcript, session_id)
             else:
                 # Generic analyzer for considerations without specific checker
                 satisfied = self._generic_analyzer(transcript, session_id, consideration)
+            elapsed = (datetime.now() - start_time).total_seconds()
+            self._check_timings[consideration["id"]] = elapsed
+            self._log(
+                f"Heuristic check '{consideration['id']}' took {elapsed * 1000:.1f}ms", "DEBUG"
+            )
 
             return CheckerResult(
                 consideration_id=consideration["id"],
@@ -2770,6 +2893,27 @@ class PowerSteeringChecker:
 
         return "\n".join(lines)
 
+    def _features(self, transcript: list[dict]) -> TranscriptFeatures:
+        """Return the TranscriptFeatures of transcript, extracting them once.
+
+        All checkers of a stop receive the same transcript list, so the first
+        one to run pays for the single pass and the rest reuse it. The cache
+        holds a reference to the list (so its id cannot be recycled) and its
+        length (so appended messages trigger a fresh pass).
+
+        Args:
+            transcript: List of message dictionaries
+
+        Returns:
+            Features shared by the heuristic checkers
+        """
+        cached = self._features_cache
+        if cached is not None and cached[0] is transcript and cached[1] == len(transcript):
+            return cached[2]
+        features = TranscriptFeatures.from_transcript(transcript)
+        self._features_cache = (transcript, len(transcript), features)
+        return features
+
     # ========================================================================
     # Phase 1: Top 5 Critical Checkers
     # ========================================================================
@@ -2785,18 +2929,7 @@ class PowerSteeringChecker:
             True if all TODOs completed, False otherwise
         """
         # Find last TodoWrite tool call
-        last_todo_write = None
-        for msg in reversed(transcript):
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "TodoWrite":
-                                last_todo_write = block.get("input", {})
-                                break
-            if last_todo_write:
-                break
+        last_todo_write = self._features(transcript).last_todo_write
 
         # If no TodoWrite found, consider satisfied (no todos to check)
         if not last_todo_write:
@@ -2830,18 +2963,7 @@ class PowerSteeringChecker:
         incomplete_todos = []
 
         # Find last TodoWrite tool call
-        last_todo_write = None
-        for msg in reversed(transcript):
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "TodoWrite":
-                                last_todo_write = block.get("input", {})
-                                break
-            if last_todo_write:
-                break
+        last_todo_write = self._features(transcript).last_todo_write
 
         if not last_todo_write:
             return []
@@ -3064,43 +3186,29 @@ class PowerSteeringChecker:
         Returns:
             True if no direct-to-main commits detected, False otherwise
         """
-        for i, msg in enumerate(transcript):
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "Bash":
-                                command = block.get("input", {}).get("command", "")
-                                # Detect git commit on main/master
-                                if "git commit" in command:
-                                    # Check NEARBY messages for branch context
-                                    if self._is_on_main_branch_near(transcript, i):
-                                        return False
-                                # Detect git push to main/master (explicit or bare)
-                                if "git push" in command:
-                                    if "origin main" in command or "origin master" in command:
-                                        return False
-                                    # Bare git push (no branch specified) while on main
-                                    if (
-                                        "origin main" not in command
-                                        and "origin master" not in command
-                                    ):
-                                        # Only flag if no branch is specified at all
-                                        # (git push, git push origin, git push -u origin)
-                                        parts = command.strip().split()
-                                        # If command is just "git push" or "git push origin"
-                                        # (no branch arg), check if we're on main
-                                        has_branch_arg = len(parts) > 3 or any(
-                                            p.startswith("feat/")
-                                            or p.startswith("fix/")
-                                            or p.startswith("docs/")
-                                            for p in parts
-                                        )
-                                        if not has_branch_arg and self._is_on_main_branch_near(
-                                            transcript, i
-                                        ):
-                                            return False
+        for i, command in self._features(transcript).bash_commands:
+            # Detect git commit on main/master
+            if "git commit" in command:
+                # Check NEARBY messages for branch context
+                if self._is_on_main_branch_near(transcript, i):
+                    return False
+            # Detect git push to main/master (explicit or bare)
+            if "git push" in command:
+                if "origin main" in command or "origin master" in command:
+                    return False
+                # Bare git push (no branch specified) while on main
+                if "origin main" not in command and "origin master" not in command:
+                    # Only flag if no branch is specified at all
+                    # (git push, git push origin, git push -u origin)
+                    parts = command.strip().split()
+                    # If command is just "git push" or "git push origin"
+                    # (no branch arg), check if we're on main
+                    has_branch_arg = len(parts) > 3 or any(
+                        p.startswith("feat/") or p.startswith("fix/") or p.startswith("docs/")
+                        for p in parts
+                    )
+                    if not has_branch_arg and self._is_on_main_branch_near(transcript, i):
+                        return False
         return True
 
     def _is_on_main_branch_near(self, transcript: list[dict], commit_index: int) -> bool:
@@ -3153,15 +3261,10 @@ class PowerSteeringChecker:
         Returns:
             True if workflow complete, False otherwise
         """
+        features = self._features(transcript)
+
         # Extract tool names used
-        tools_used = set()
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            tools_used.add(block.get("name", ""))
+        tools_used = features.tool_names
 
         has_file_ops = any(t in tools_used for t in ["Edit", "Write"])
 
@@ -3172,25 +3275,16 @@ class PowerSteeringChecker:
         # Check for ACTUAL test/validation commands, not just "Bash was used"
         has_tests = False
         direct_patterns = self.TEST_COMMAND_PATTERNS + self.VALIDATION_COMMAND_PATTERNS
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "Bash":
-                                command = block.get("input", {}).get("command", "")
-                                if any(p in command for p in direct_patterns):
-                                    has_tests = True
-                                    break
-                                # Accept python -c/node -e only with real validation
-                                if any(
-                                    p in command for p in self.INLINE_VALIDATION_PATTERNS
-                                ) and self._is_meaningful_validation(command):
-                                    has_tests = True
-                                    break
-                if has_tests:
-                    break
+        for _, command in features.bash_commands:
+            if any(p in command for p in direct_patterns):
+                has_tests = True
+                break
+            # Accept python -c/node -e only with real validation
+            if any(
+                p in command for p in self.INLINE_VALIDATION_PATTERNS
+            ) and self._is_meaningful_validation(command):
+                has_tests = True
+                break
 
         if not has_tests:
             return False
@@ -3219,76 +3313,66 @@ class PowerSteeringChecker:
             True if compliant, False otherwise
         """
         # Check Write and Edit tool calls for anti-patterns
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            tool_name = block.get("name", "")
-                            if tool_name in ["Write", "Edit"]:
-                                tool_input = block.get("input", {})
-                                file_path = tool_input.get("file_path", "")
-
-                                # Skip non-code files (docs, YAML, config) where
-                                # TODO/FIXME may appear legitimately
-                                if any(file_path.endswith(ext) for ext in self.NON_CODE_EXTENSIONS):
-                                    continue
-
-                                file_path_lower = file_path.lower()
-                                # Skip test files — they may contain TODO/NotImplementedError
-                                # as test data or assertion targets, not as actual stubs
-                                is_test_file = (
-                                    "/test" in file_path_lower
-                                    or "/tests/" in file_path_lower
-                                    or file_path_lower.split("/")[-1].startswith("test_")
-                                )
+        for _, tool_input in self._features(transcript).file_ops:
+            file_path = tool_input.get("file_path", "")
 
-                                # Check content for anti-patterns
-                                content_to_check = ""
-                                if "content" in tool_input:
-                                    content_to_check = str(tool_input["content"])
-                                elif "new_string" in tool_input:
-                                    content_to_check = str(tool_input["new_string"])
-
-                                # Look for TODO/FIXME/XXX (skip test files where these
-                                # may appear as test data or assertion strings)
-                                if not is_test_file and re.search(
-                                    r"\b(TODO|FIXME|XXX)\b", content_to_check
-                                ):
-                                    return False
-
-                                # Look for NotImplementedError (skip test files where
-                                # this appears in pytest.raises assertions)
-                                if not is_test_file and "NotImplementedError" in content_to_check:
-                                    return False
-
-                                # Look for stub patterns (with optional -> return type):
-                                # - Single-line: def f(): pass / def f() -> None: pass
-                                # - Multi-line:  def f():\n    pass
-                                # - Ellipsis:    def f(): ... / def f() -> int: ...
-                                # Skip if @abstractmethod context detected (legitimate pattern)
-                                # Use specific ABC patterns to avoid false matches on
-                                # "ABC Corp", "ABC123", etc. (Issue: round 4 audit D4)
-                                has_abstract = (
-                                    "@abstractmethod" in content_to_check
-                                    or "from abc import" in content_to_check.lower()
-                                    or "import abc" in content_to_check.lower()
-                                    or re.search(r"class\s+\w+\(.*\bABC\b", content_to_check)
-                                )
-                                if not has_abstract:
-                                    if re.search(
-                                        r"def\s+\w+\([^)]*\)(?:\s*->.*?)?:\s*(?:pass|\.\.\.)\s*$",
-                                        content_to_check,
-                                        re.MULTILINE,
-                                    ):
-                                        return False
-                                    if re.search(
-                                        r"def\s+\w+\([^)]*\)(?:\s*->.*?)?:\s*\n\s+(?:pass|\.\.\.)\s*$",
-                                        content_to_check,
-                                        re.MULTILINE,
-                                    ):
-                                        return False
+            # Skip non-code files (docs, YAML, config) where
+            # TODO/FIXME may appear legitimately
+            if any(file_path.endswith(ext) for ext in self.NON_CODE_EXTENSIONS):
+                continue
+
+            file_path_lower = file_path.lower()
+            # Skip test files — they may contain TODO/NotImplementedError
+            # as test data or assertion targets, not as actual stubs
+            is_test_file = (
+                "/test" in file_path_lower
+                or "/tests/" in file_path_lower
+                or file_path_lower.split("/")[-1].startswith("test_")
+            )
+
+            # Check content for anti-patterns
+            content_to_check = ""
+            if "content" in tool_input:
+                content_to_check = str(tool_input["content"])
+            elif "new_string" in tool_input:
+                content_to_check = str(tool_input["new_string"])
+
+            # Look for TODO/FIXME/XXX (skip test files where these
+            # may appear as test data or assertion strings)
+            if not is_test_file and re.search(r"\b(TODO|FIXME|XXX)\b", content_to_check):
+                return False
+
+            # Look for NotImplementedError (skip test files where
+            # this appears in pytest.raises assertions)
+            if not is_test_file and "NotImplementedError" in content_to_check:
+                return False
+
+            # Look for stub patterns (with optional -> return type):
+            # - Single-line: def f(): pass / def f() -> None: pass
+            # - Multi-line:  def f():\n    pass
+            # - Ellipsis:    def f(): ... / def f() -> int: ...
+            # Skip if @abstractmethod context detected (legitimate pattern)
+            # Use specific ABC patterns to avoid false matches on
+            # "ABC Corp", "ABC123", etc. (Issue: round 4 audit D4)
+            has_abstract = (
+                "@abstractmethod" in content_to_check
+                or "from abc import" in content_to_check.lower()
+                or "import abc" in content_to_check.lower()
+                or re.search(r"class\s+\w+\(.*\bABC\b", content_to_check)
+            )
+            if not has_abstract:
+                if re.search(
+                    r"def\s+\w+\([^)]*\)(?:\s*->.*?)?:\s*(?:pass|\.\.\.)\s*$",
+                    content_to_check,
+                    re.MULTILINE,
+                ):
+                    return False
+                if re.search(
+                    r"def\s+\w+\([^)]*\)(?:\s*->.*?)?:\s*\n\s+(?:pass|\.\.\.)\s*$",
+                    content_to_check,
+                    re.MULTILINE,
+                ):
+                    return False
 
         return True
 
@@ -3338,79 +3422,47 @@ class PowerSteeringChecker:
         Returns:
             True if tests run and passed, False otherwise
         """
+        features = self._features(transcript)
+
         # Look for test execution in Bash tool calls
-        for msg in transcript:
-            if msg.get("type") == "tool_result" and "message" in msg:
-                msg_data = msg["message"]
-                if msg_data.get("tool_use_id"):
-                    # Find corresponding tool_use
-                    for prev_msg in transcript:
-                        if prev_msg.get("type") == "assistant" and "message" in prev_msg:
-                            content = prev_msg["message"].get("content", [])
-                            if isinstance(content, list):
-                                for block in content:
-                                    if isinstance(block, dict):
-                                        if block.get("type") == "tool_use" and block.get(
-                                            "id"
-                                        ) == msg_data.get("tool_use_id"):
-                                            # Check if this was a test command
-                                            tool_name = block.get("name", "")
-                                            if tool_name == "Bash":
-                                                command = block.get("input", {}).get("command", "")
-                                                # Look for test commands using class constant
-                                                if any(
-                                                    pattern in command
-                                                    for pattern in self.TEST_COMMAND_PATTERNS
-                                                ):
-                                                    # Check result
-                                                    result_content = msg_data.get("content", [])
-                                                    if isinstance(result_content, list):
-                                                        for result_block in result_content:
-                                                            if isinstance(result_block, dict):
-                                                                if (
-                                                                    result_block.get("type")
-                                                                    == "tool_result"
-                                                                ):
-                                                                    # Check if tests passed
-                                                                    output = str(
-                                                                        result_block.get(
-                                                                            "content", ""
-                                                                        )
-                                                                    )
-                                                                    if (
-                                                                        "PASSED" in output
-                                                                        or "passed" in output
-                                                                    ):
-                                                                        return True
-                                                                    if (
-                                                                        "OK" in output
-                                                                        and "FAILED" not in output
-                                                                    ):
-                                                                        return True
+        for msg_data in features.tool_result_messages:
+            # Find corresponding tool_use
+            tool_use_id = msg_data.get("tool_use_id")
+            if not isinstance(tool_use_id, str):
+                continue
+            for block in features.tool_uses_by_id.get(tool_use_id, []):
+                # Check if this was a test command
+                if block.get("name", "") != "Bash":
+                    continue
+                command = block.get("input", {}).get("command", "")
+                # Look for test commands using class constant
+                if not any(pattern in command for pattern in self.TEST_COMMAND_PATTERNS):
+                    continue
+                # Check result
+                result_content = msg_data.get("content", [])
+                if isinstance(result_content, list):
+                    for result_block in result_content:
+                        if isinstance(result_block, dict):
+                            if result_block.get("type") == "tool_result":
+                                # Check if tests passed
+                                output = str(result_block.get("content", ""))
+                                if "PASSED" in output or "passed" in output:
+                                    return True
+                                if "OK" in output and "FAILED" not in output:
+                                    return True
 
         # Also accept validation commands (ruff, mypy, etc.) as testing
         # for sessions where formal test suites don't exist or aren't applicable
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "Bash":
-                                command = block.get("input", {}).get("command", "")
-                                # Accept linting/type-checking tools directly
-                                if any(
-                                    pattern in command
-                                    for pattern in self.VALIDATION_COMMAND_PATTERNS
-                                ):
-                                    return True
-                                # Accept python -c / node -e only if they do
-                                # meaningful validation (not just print('hello'))
-                                if any(
-                                    pattern in command
-                                    for pattern in self.INLINE_VALIDATION_PATTERNS
-                                ) and self._is_meaningful_validation(command):
-                                    return True
+        for _, command in features.bash_commands:
+            # Accept linting/type-checking tools directly
+            if any(pattern in command for pattern in self.VALIDATION_COMMAND_PATTERNS):
+                return True
+            # Accept python -c / node -e only if they do
+            # meaningful validation (not just print('hello'))
+            if any(
+                pattern in command for pattern in self.INLINE_VALIDATION_PATTERNS
+            ) and self._is_meaningful_validation(command):
+                return True
 
         # No tests or validation found
         return False
@@ -3460,57 +3512,43 @@ class PowerSteeringChecker:
         ci_passing = False
         is_draft = False
 
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict):
-                            if block.get("type") == "text":
-                                text = str(block.get("text", "")).lower()
-
-                                # Check for PR mentions
-                                if any(
-                                    keyword in text
-                                    for keyword in ["pr #", "pull request", "created pr"]
-                                ):
-                                    pr_mentioned = True
-
-                                # Check for draft PR
-                                if "draft" in text and "pr" in text:
-                                    is_draft = True
+        for text in self._features(transcript).assistant_texts:
+            # Check for PR mentions
+            if any(keyword in text for keyword in ["pr #", "pull request", "created pr"]):
+                pr_mentioned = True
+
+            # Check for draft PR
+            if "draft" in text and "pr" in text:
+                is_draft = True
+
+            # Check for CI mentions
+            if any(
+                keyword in text
+                for keyword in [
+                    "ci",
+                    "github actions",
+                    "continuous integration",
+                    "checks",
+                ]
+            ):
+                ci_mentioned = True
+
+                # Check for passing indicators
+                if any(
+                    keyword in text
+                    for keyword in [
+                        "passing",
+                        "passed",
+                        "success",
+                        "ready for review",
+                        "ready for your review",
+                    ]
+                ):
+                    ci_passing = True
 
-                                # Check for CI mentions
-                                if any(
-                                    keyword in text
-                                    for keyword in [
-                                        "ci",
-                                        "github actions",
-                                        "continuous integration",
-                                        "checks",
-                                    ]
-                                ):
-                                    ci_mentioned = True
-
-                                    # Check for passing indicators
-                                    if any(
-                                        keyword in text
-                                        for keyword in [
-                                            "passing",
-                                            "passed",
-                                            "success",
-                                            "ready for review",
-                                            "ready for your review",
-                                        ]
-                                    ):
-                                        ci_passing = True
-
-                                    # Check for failing indicators
-                                    if any(
-                                        keyword in text
-                                        for keyword in ["failing", "failed", "error"]
-                                    ):
-                                        return False
+                # Check for failing indicators
+                if any(keyword in text for keyword in ["failing", "failed", "error"]):
+                    return False
 
         # If draft PR, not ready
         if is_draft:
@@ -3558,38 +3596,26 @@ class PowerSteeringChecker:
         ci_mentioned = False
         mergeable_mentioned = False
 
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict):
-                            # Check text content for CI mentions
-                            if block.get("type") == "text":
-                                text = str(block.get("text", ""))
-                                text_lower = text.lower()
-
-                                if any(
-                                    keyword in text_lower
-                                    for keyword in [
-                                        "ci",
-                                        "github actions",
-                                        "continuous integration",
-                                    ]
-                                ):
-                                    ci_mentioned = True
+        # Check text content for CI mentions
+        for text_lower in self._features(transcript).assistant_texts:
+            if any(
+                keyword in text_lower
+                for keyword in [
+                    "ci",
+                    "github actions",
+                    "continuous integration",
+                ]
+            ):
+                ci_mentioned = True
 
-                                # Standard mode: only accept explicit "mergeable" or "passing" + "mergeable"
-                                # Don't accept just "ready" or "passing" alone
-                                if "mergeable" in text_lower:
-                                    mergeable_mentioned = True
+            # Standard mode: only accept explicit "mergeable" or "passing" + "mergeable"
+            # Don't accept just "ready" or "passing" alone
+            if "mergeable" in text_lower:
+                mergeable_mentioned = True
 
-                                # Check for failure indicators
-                                if any(
-                                    keyword in text_lower
-                                    for keyword in ["failing", "failed", "error"]
-                                ):
-                                    return False
+            # Check for failure indicators
+            if any(keyword in text_lower for keyword in ["failing", "failed", "error"]):
+                return False
 
         # If CI not mentioned, consider satisfied (not applicable)
         if not ci_mentioned:
@@ -3669,15 +3695,7 @@ class PowerSteeringChecker:
             True if no excessive questioning, False if agent over-asked
         """
         # Count actual AskUserQuestion tool invocations (the concrete signal)
-        ask_user_count = 0
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "AskUserQuestion":
-                                ask_user_count += 1
+        ask_user_count = self._features(transcript).tool_names["AskUserQuestion"]
 
         # More than 3 explicit AskUserQuestion invocations suggests the agent
         # was not working autonomously. This avoids false positives from
@@ -3699,14 +3717,10 @@ class PowerSteeringChecker:
         Returns:
             True if objective appears complete, False otherwise
         """
-        # Get first user message (the objective)
-        first_user_msg = None
-        for msg in transcript:
-            if msg.get("type") == "user":
-                first_user_msg = msg
-                break
+        features = self._features(transcript)
 
-        if not first_user_msg:
+        # Need a user message (the objective)
+        if not features.has_user_message:
             return True  # No objective to check
 
         # Look for completion indicators in assistant messages
@@ -3740,16 +3754,9 @@ class PowerSteeringChecker:
                                 return True
 
         # Also check for structural completion: PR creation or git push
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "Bash":
-                                command = block.get("input", {}).get("command", "")
-                                if "gh pr create" in command or "git push" in command:
-                                    return True
+        for _, command in features.bash_commands:
+            if "gh pr create" in command or "git push" in command:
+                return True
 
         return False  # No completion indicators found
 
@@ -3785,42 +3792,27 @@ class PowerSteeringChecker:
         public_code_modified = False
         doc_files_modified = False
 
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            tool_name = block.get("name", "")
-                            if tool_name in ["Write", "Edit"]:
-                                tool_input = block.get("input", {})
-                                file_path = tool_input.get("file_path", "").lower()
-
-                                # Only flag public-facing code changes
-                                is_code = any(
-                                    file_path.endswith(ext) for ext in self.CODE_FILE_EXTENSIONS
-                                )
-                                is_public = any(
-                                    indicator in file_path
-                                    for indicator in self.PUBLIC_CODE_INDICATORS
-                                )
-                                # __init__.py is public only inside public dirs
-                                if "__init__.py" in file_path and any(
-                                    d in file_path
-                                    for d in ["/commands/", "/skills/", "/scenarios/"]
-                                ):
-                                    is_public = True
-                                if is_code and is_public:
-                                    public_code_modified = True
+        # Only which paths were touched matters, so visit each once
+        for path in dict.fromkeys(self._features(transcript).written_paths()):
+            file_path = path.lower()
 
-                                # Check for doc files using class constant
-                                if any(
-                                    file_path.endswith(ext)
-                                    if ext.startswith(".")
-                                    else ext in file_path
-                                    for ext in self.DOC_FILE_EXTENSIONS
-                                ):
-                                    doc_files_modified = True
+            # Only flag public-facing code changes
+            is_code = any(file_path.endswith(ext) for ext in self.CODE_FILE_EXTENSIONS)
+            is_public = any(indicator in file_path for indicator in self.PUBLIC_CODE_INDICATORS)
+            # __init__.py is public only inside public dirs
+            if "__init__.py" in file_path and any(
+                d in file_path for d in ["/commands/", "/skills/", "/scenarios/"]
+            ):
+                is_public = True
+            if is_code and is_public:
+                public_code_modified = True
+
+            # Check for doc files using class constant
+            if any(
+                file_path.endswith(ext) if ext.startswith(".") else ext in file_path
+                for ext in self.DOC_FILE_EXTENSIONS
+            ):
+                doc_files_modified = True
 
         # Only flag if public-facing code was changed without doc updates
         if public_code_modified and not doc_files_modified:
@@ -3844,12 +3836,11 @@ class PowerSteeringChecker:
         feature_keywords = ["new feature", "add feature", "implement feature", "create feature"]
         has_new_feature = False
 
-        for msg in transcript:
-            if msg.get("type") == "user":
-                content = str(msg.get("message", {}).get("content", "")).lower()
-                if any(keyword in content for keyword in feature_keywords):
-                    has_new_feature = True
-                    break
+        features = self._features(transcript)
+        for content in features.user_contents:
+            if any(keyword in content for keyword in feature_keywords):
+                has_new_feature = True
+                break
 
         if not has_new_feature:
             return True  # No new feature, tutorial not needed
@@ -3858,18 +3849,10 @@ class PowerSteeringChecker:
         tutorial_patterns = ["example", "tutorial", "how_to", "guide", "demo"]
         has_tutorial = False
 
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            tool_name = block.get("name", "")
-                            if tool_name in ["Write", "Edit"]:
-                                file_path = block.get("input", {}).get("file_path", "").lower()
-                                if any(pattern in file_path for pattern in tutorial_patterns):
-                                    has_tutorial = True
-                                    break
+        for file_path in features.written_paths():
+            if any(pattern in file_path.lower() for pattern in tutorial_patterns):
+                has_tutorial = True
+                break
 
         return has_tutorial
 
@@ -3910,33 +3893,21 @@ class PowerSteeringChecker:
             new_features = []
             docs_file = None
 
-            for msg in transcript:
-                if msg.get("type") == "assistant" and "message" in msg:
-                    content = msg["message"].get("content", [])
-                    if isinstance(content, list):
-                        for block in content:
-                            if isinstance(block, dict) and block.get("type") == "tool_use":
-                                tool_name = block.get("name", "")
-                                if tool_name in ["Write", "Edit"]:
-                                    file_path = block.get("input", {}).get("file_path", "")
-
-                                    # Detect new feature by file location
-                                    if ".claude/commands/" in file_path and file_path.endswith(
-                                        ".md"
-                                    ):
-                                        new_features.append(("command", file_path))
-                                    elif ".claude/agents/" in file_path and file_path.endswith(
-                                        ".md"
-                                    ):
-                                        new_features.append(("agent", file_path))
-                                    elif ".claude/skills/" in file_path:
-                                        new_features.append(("skill", file_path))
-                                    elif ".claude/scenarios/" in file_path:
-                                        new_features.append(("scenario", file_path))
-
-                                    # Track docs file creation in docs/
-                                    if "docs/" in file_path and file_path.endswith(".md"):
-                                        docs_file = file_path
+            features = self._features(transcript)
+            for file_path in features.written_paths():
+                # Detect new feature by file location
+                if ".claude/commands/" in file_path and file_path.endswith(".md"):
+                    new_features.append(("command", file_path))
+                elif ".claude/agents/" in file_path and file_path.endswith(".md"):
+                    new_features.append(("agent", file_path))
+                elif ".claude/skills/" in file_path:
+                    new_features.append(("skill", file_path))
+                elif ".claude/scenarios/" in file_path:
+                    new_features.append(("scenario", file_path))
+
+                # Track docs file creation in docs/
+                if "docs/" in file_path and file_path.endswith(".md"):
+                    docs_file = file_path
 
             # Edge case 1: No new features detected
             if not new_features:
@@ -3965,29 +3936,22 @@ class PowerSteeringChecker:
             # Phase 3: Verify 2+ navigation paths in README
             readme_paths_count = 0
 
-            for msg in transcript:
-                if msg.get("type") == "assistant" and "message" in msg:
-                    content = msg["message"].get("content", [])
-                    if isinstance(content, list):
-                        for block in content:
-                            if isinstance(block, dict) and block.get("type") == "tool_use":
-                                tool_name = block.get("name", "")
-                                if tool_name in ["Write", "Edit"]:
-                                    file_path = block.get("input", {}).get("file_path", "")
-
-                                    # Check if README was edited
-                                    if "readme.md" in file_path.lower():
-                                        # Get the new content to check for documentation links
-                                        new_string = block.get("input", {}).get("new_string", "")
-                                        content_to_check = block.get("input", {}).get("content", "")
-                                        full_content = new_string or content_to_check
-
-                                        # Count references to the docs file
-                                        if docs_file and full_content:
-                                            # Extract just the filename from the path
-                                            doc_filename = docs_file.split("/")[-1]
-                                            # Count occurrences of the doc filename in README content
-                                            readme_paths_count += full_content.count(doc_filename)
+            for _, tool_input in features.file_ops:
+                file_path = tool_input.get("file_path", "")
+
+                # Check if README was edited
+                if "readme.md" in file_path.lower():
+                    # Get the new content to check for documentation links
+                    new_string = tool_input.get("new_string", "")
+                    content_to_check = tool_input.get("content", "")
+                    full_content = new_string or content_to_check
+
+                    # Count references to the docs file
+                    if docs_file and full_content:
+                        # Extract just the filename from the path
+                        doc_filename = docs_file.split("/")[-1]
+                        # Count occurrences of the doc filename in README content
+                        readme_paths_count += full_content.count(doc_filename)
 
             # Need at least 2 navigation paths (e.g., Features section + Documentation section)
             if readme_paths_count < 2:
@@ -4016,30 +3980,18 @@ class PowerSteeringChecker:
             code_modified = False
             docs_modified = False
 
-            for msg in transcript:
-                if msg.get("type") == "assistant" and "message" in msg:
-                    content = msg["message"].get("content", [])
-                    if isinstance(content, list):
-                        for block in content:
-                            if isinstance(block, dict) and block.get("type") == "tool_use":
-                                tool_name = block.get("name", "")
-                                if tool_name in ["Write", "Edit"]:
-                                    file_path = block.get("input", {}).get("file_path", "")
-
-                                    # Check for code files using class constant
-                                    if any(
-                                        file_path.endswith(ext) for ext in self.CODE_FILE_EXTENSIONS
-                                    ):
-                                        code_modified = True
-
-                                    # Check for doc files using class constant
-                                    if any(
-                                        file_path.endswith(ext)
-                                        if ext.startswith(".")
-                                        else ext in file_path
-                                        for ext in self.DOC_FILE_EXTENSIONS
-                                    ):
-                                        docs_modified = True
+            # Only which paths were touched matters, so visit each once
+            for file_path in dict.fromkeys(self._features(transcript).written_paths()):
+                # Check for code files using class constant
+                if any(file_path.endswith(ext) for ext in self.CODE_FILE_EXTENSIONS):
+                    code_modified = True
+
+                # Check for doc files using class constant
+                if any(
+                    file_path.endswith(ext) if ext.startswith(".") else ext in file_path
+                    for ext in self.DOC_FILE_EXTENSIONS
+                ):
+                    docs_modified = True
 
             # Docs-only session if docs modified but no code files
             return docs_modified and not code_modified
@@ -4159,23 +4111,12 @@ class PowerSteeringChecker:
             True if docs properly organized, False otherwise
         """
         # Check for doc files created in wrong locations
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "Write":
-                                file_path = block.get("input", {}).get("file_path", "")
-
-                                # Check for investigation/session docs in wrong places
-                                if any(
-                                    pattern in file_path.lower()
-                                    for pattern in ["investigation", "session", "log"]
-                                ):
-                                    # Should be in .claude/runtime or .claude/docs
-                                    if ".claude" not in file_path:
-                                        return False
+        for file_path in self._features(transcript).written_paths(("Write",)):
+            # Check for investigation/session docs in wrong places
+            if any(pattern in file_path.lower() for pattern in ["investigation", "session", "log"]):
+                # Should be in .claude/runtime or .claude/docs
+                if ".claude" not in file_path:
+                    return False
 
         return True
 
@@ -4204,32 +4145,23 @@ class PowerSteeringChecker:
             "findings",
         ]
 
+        features = self._features(transcript)
         has_investigation = False
-        for msg in transcript:
-            if msg.get("type") == "user":
-                content = str(msg.get("message", {}).get("content", "")).lower()
-                if any(keyword in content for keyword in investigation_keywords):
-                    has_investigation = True
-                    break
+        for content in features.user_contents:
+            if any(keyword in content for keyword in investigation_keywords):
+                has_investigation = True
+                break
 
         if not has_investigation:
             return True  # No investigation, docs not needed
 
         # Check for documentation of findings
         doc_created = False
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "Write":
-                                file_path = block.get("input", {}).get("file_path", "").lower()
-                                if any(
-                                    pattern in file_path for pattern in [".md", "readme", "doc"]
-                                ):
-                                    doc_created = True
-                                    break
+        for path in features.written_paths(("Write",)):
+            file_path = path.lower()
+            if any(pattern in file_path for pattern in [".md", "readme", "doc"]):
+                doc_created = True
+                break
 
         return doc_created
 
@@ -4254,23 +4186,15 @@ class PowerSteeringChecker:
             r"#.*\bfix\b.*\blater\b",
         ]
 
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            tool_name = block.get("name", "")
-                            if tool_name in ["Write", "Edit"]:
-                                tool_input = block.get("input", {})
-                                content_to_check = str(tool_input.get("content", "")) + str(
-                                    tool_input.get("new_string", "")
-                                )
+        for _, tool_input in self._features(transcript).file_ops:
+            content_to_check = str(tool_input.get("content", "")) + str(
+                tool_input.get("new_string", "")
+            )
 
-                                # Check for shortcut patterns
-                                for pattern in shortcut_patterns:
-                                    if re.search(pattern, content_to_check, re.IGNORECASE):
-                                        return False
+            # Check for shortcut patterns
+            for pattern in shortcut_patterns:
+                if re.search(pattern, content_to_check, re.IGNORECASE):
+                    return False
 
         return True
 
@@ -4300,28 +4224,21 @@ class PowerSteeringChecker:
             "tested with real",
         ]
 
-        for msg in transcript:
-            if msg.get("type") == "assistant":
-                content = msg.get("message", {}).get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "text":
-                            text = str(block.get("text", "")).lower()
-                            if any(keyword in text for keyword in interactive_keywords):
-                                return True
+        features = self._features(transcript)
+        for text in features.assistant_texts:
+            if any(keyword in text for keyword in interactive_keywords):
+                return True
 
         # Also accept if automated tests show a substantial passing count.
         # Use regex to find patterns like "N passed" or "N tests passed"
         # instead of naively counting occurrences of "passed" and "ok".
-        for msg in transcript:
-            if msg.get("type") == "tool_result":
-                output = str(msg.get("message", {}).get("content", ""))
-                # Match pytest-style "N passed" or "N tests passed"
-                match = re.search(r"(\d+)\s+passed", output, re.IGNORECASE)
-                if match:
-                    count = int(match.group(1))
-                    if count >= 10:
-                        return True
+        for output in features.tool_result_outputs:
+            # Match pytest-style "N passed" or "N tests passed"
+            match = re.search(r"(\d+)\s+passed", output, re.IGNORECASE)
+            if match:
+                count = int(match.group(1))
+                if count >= 10:
+                    return True
 
         return False
 
@@ -4349,25 +4266,19 @@ class PowerSteeringChecker:
         top_dirs = set()
         project_root_str = str(self.project_root)
 
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") in ["Write", "Edit"]:
-                                file_path = block.get("input", {}).get("file_path", "")
-                                if not file_path:
-                                    continue
-                                # Convert to project-relative path
-                                try:
-                                    rel = os.path.relpath(file_path, project_root_str)
-                                except ValueError:
-                                    continue  # Different drives on Windows
-                                parts = rel.split(os.sep)
-                                # Skip paths outside project (.. prefix)
-                                if parts and parts[0] != ".." and len(parts) >= 2:
-                                    top_dirs.add(parts[0])
+        # Only which paths were touched matters, so visit each once
+        for file_path in dict.fromkeys(self._features(transcript).written_paths()):
+            if not file_path:
+                continue
+            # Convert to project-relative path
+            try:
+                rel = os.path.relpath(file_path, project_root_str)
+            except ValueError:
+                continue  # Different drives on Windows
+            parts = rel.split(os.sep)
+            # Skip paths outside project (.. prefix)
+            if parts and parts[0] != ".." and len(parts) >= 2:
+                top_dirs.add(parts[0])
 
         # 6+ distinct top-level project directories suggests scattered changes
         if len(top_dirs) >= 6:
@@ -4388,52 +4299,41 @@ class PowerSteeringChecker:
             True if no root pollution, False if new top-level files added
         """
         # Check for new files in project root
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "Write":
-                                file_path = block.get("input", {}).get("file_path", "")
-
-                                # Check if file is in root (only one path component)
-                                path_parts = file_path.strip("/").split("/")
-                                if len(path_parts) == 1:
-                                    # New file in root - check if it's acceptable
-                                    filename = path_parts[0].lower()
-                                    acceptable_root_files = [
-                                        "readme",
-                                        "license",
-                                        "makefile",
-                                        "dockerfile",
-                                        ".gitignore",
-                                        ".gitattributes",
-                                        ".dockerignore",
-                                        ".editorconfig",
-                                        ".env.example",
-                                        "setup.py",
-                                        "setup.cfg",
-                                        "pyproject.toml",
-                                        "requirements.txt",
-                                        "package.json",
-                                        "tsconfig.json",
-                                        "cargo.toml",
-                                        "go.mod",
-                                        "docker-compose",
-                                        "justfile",
-                                        "claude.md",
-                                        ".pre-commit",
-                                        "conftest.py",
-                                        "pytest.ini",
-                                        "manifest.in",
-                                    ]
-
-                                    if not any(
-                                        acceptable in filename
-                                        for acceptable in acceptable_root_files
-                                    ):
-                                        return False
+        for file_path in self._features(transcript).written_paths(("Write",)):
+            # Check if file is in root (only one path component)
+            path_parts = file_path.strip("/").split("/")
+            if len(path_parts) == 1:
+                # New file in root - check if it's acceptable
+                filename = path_parts[0].lower()
+                acceptable_root_files = [
+                    "readme",
+                    "license",
+                    "makefile",
+                    "dockerfile",
+                    ".gitignore",
+                    ".gitattributes",
+                    ".dockerignore",
+                    ".editorconfig",
+                    ".env.example",
+                    "setup.py",
+                    "setup.cfg",
+                    "pyproject.toml",
+                    "requirements.txt",
+                    "package.json",
+                    "tsconfig.json",
+                    "cargo.toml",
+                    "go.mod",
+                    "docker-compose",
+                    "justfile",
+                    "claude.md",
+                    ".pre-commit",
+                    "conftest.py",
+                    "pytest.ini",
+                    "manifest.in",
+                ]
+
+                if not any(acceptable in filename for acceptable in acceptable_root_files):
+                    return False
 
         return True
 
@@ -4453,17 +4353,10 @@ class PowerSteeringChecker:
         pr_created = False
         pr_body = ""
 
-        for msg in transcript:
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "Bash":
-                                command = block.get("input", {}).get("command", "")
-                                if "gh pr create" in command:
-                                    pr_created = True
-                                    pr_body = command.lower()
+        for _, command in self._features(transcript).bash_commands:
+            if "gh pr create" in command:
+                pr_created = True
+                pr_body = command.lower()
 
         if not pr_created:
             return True  # No PR, check not applicable
@@ -4498,46 +4391,33 @@ class PowerSteeringChecker:
             "reviewer comment",
             "review comment",
         ]
+        features = self._features(transcript)
         has_pr_reviews = False
 
-        for msg in transcript:
-            # Check Bash tool calls for PR review commands
-            if msg.get("type") == "assistant" and "message" in msg:
-                content = msg["message"].get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            if block.get("name") == "Bash":
-                                command = block.get("input", {}).get("command", "").lower()
-                                if any(p in command for p in pr_review_command_patterns):
-                                    has_pr_reviews = True
-                                    break
-                                # Narrow gh api match: only review/comment endpoints
-                                if "gh api repos/" in command and (
-                                    "/reviews" in command or "/comments" in command
-                                ):
-                                    has_pr_reviews = True
-                                    break
-            # Check tool results for review-related output
-            if msg.get("type") == "tool_result":
-                output = str(msg.get("message", {}).get("content", "")).lower()
-                if "requested changes" in output or "changes_requested" in output:
-                    has_pr_reviews = True
+        # Check Bash tool calls for PR review commands
+        for _, bash_command in features.bash_commands:
+            command = bash_command.lower()
+            if any(p in command for p in pr_review_command_patterns):
+                has_pr_reviews = True
+                break
+            # Narrow gh api match: only review/comment endpoints
+            if "gh api repos/" in command and ("/reviews" in command or "/comments" in command):
+                has_pr_reviews = True
+                break
+        # Check tool results for review-related output
+        for output in features.tool_result_outputs:
+            if "requested changes" in output or "changes_requested" in output:
+                has_pr_reviews = True
+                break
 
         if not has_pr_reviews:
             return True  # No PR reviews to address
 
         # Look for response indicators showing reviews were handled
         response_keywords = ["addressed", "fixed", "updated", "resolved", "pushed"]
-        for msg in transcript:
-            if msg.get("type") == "assistant":
-                content = msg.get("message", {}).get("content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "text":
-                            text = str(block.get("text", "")).lower()
-                            if any(keyword in text for keyword in response_keywords):
-                                return True
+        for text in features.assistant_texts:
+            if any(keyword in text for keyword in response_keywords):
+                return True
 
         return False
 
@@ -4554,17 +4434,14 @@ class PowerSteeringChecker:
             True if branch is current, False if needs rebase
         """
         # Look for git status or branch checks
-        for msg in transcript:
-            if msg.get("type") == "tool_result":
-                output = str(msg.get("message", {}).get("content", "")).lower()
-
-                # Check for "behind" indicators
-                if "behind" in output or "diverged" in output:
-                    return False
+        for output in self._features(transcript).tool_result_outputs:
+            # Check for "behind" indicators
+            if "behind" in output or "diverged" in output:
+                return False
 
-                # Check for "up to date" indicators
-                if "up to date" in output or "up-to-date" in output:
-                    return True
+            # Check for "up to date" indicators
+            if "up to date" in output or "up-to-date" in output:
+                return True
 
         # Default to satisfied if no information
         return True
@@ -4585,19 +4462,18 @@ class PowerSteeringChecker:
         precommit_passed = False
         ci_failed = False
 
-        for msg in transcript:
-            if msg.get("type") in ["assistant", "tool_result"]:
-                content_str = str(msg.get("message", {})).lower()
-
-                # Check for pre-commit success
-                if "pre-commit" in content_str or "precommit" in content_str:
-                    if "passed" in content_str or "success" in content_str:
-                        precommit_passed = True
-
-                # Check for CI failure
-                if "ci" in content_str or "github actions" in content_str:
-                    if "failed" in content_str or "failing" in content_str:
-                        ci_failed = True
+        for message in self._features(transcript).status_messages:
+            content_str = str(message).lower()
+
+            # Check for pre-commit success
+            if "pre-commit" in content_str or "precommit" in content_str:
+                if "passed" in content_str or "success" in content_str:
+                    precommit_passed = True
+
+            # Check for CI failure
+            if "ci" in content_str or "github actions" in content_str:
+                if "failed" in content_str or "failing" in content_str:
+                    ci_failed = True
 
         # If both conditions met, there's a mismatch
         if precommit_passed and ci_failed:
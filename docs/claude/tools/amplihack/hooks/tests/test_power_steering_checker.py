@@ -12,18 +12,22 @@ Tests Phase 1 (MVP) functionality:
 - Fail-open error handling
 """
 
+import asyncio
 import json
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import power_steering_checker
 from power_steering_checker import (
     CheckerResult,
     ConsiderationAnalysis,
     PowerSteeringChecker,
+    TranscriptFeatures,
 )
 
 
@@ -550,6 +554,102 @@ class TestPowerSteeringChecker(unittest.TestCase):
         )
 
 
+class TestTranscriptFeatures(unittest.TestCase):
+    """Tests for the single-pass features shared by the heuristic checkers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project_root = Path(self.temp_dir)
+        (self.project_root / ".claude").mkdir()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    @staticmethod
+    def _tool_use(tool_id: str, name: str, tool_input: dict) -> dict:
+        return {
+            "type": "assistant",
+            "message": {
+                "content": [{"type": "tool_use", "id": tool_id, "name": name, "input": tool_input}]
+            },
+        }
+
+    def test_features_extracted_once_per_transcript(self):
+        """Test all checkers share one extraction until the transcript grows."""
+        checker = PowerSteeringChecker(self.project_root)
+        transcript = [
+            {"type": "user", "message": {"content": "Add a new feature"}},
+            self._tool_use("t1", "Write", {"file_path": "/proj/src/app.py", "content": "x = 1"}),
+        ]
+
+        with patch.object(
+            TranscriptFeatures, "from_transcript", wraps=TranscriptFeatures.from_transcript
+        ) as extract:
+            checker._check_todos_complete(transcript, "test_session")
+            checker._check_dev_workflow_complete(transcript, "test_session")
+            checker._check_tutorial_needed(transcript, "test_session")
+            self.assertEqual(extract.call_count, 1)
+
+            transcript.append(self._tool_use("t2", "Bash", {"command": "pytest -q"}))
+            self.assertTrue(checker._check_dev_workflow_complete(transcript, "test_session"))
+            self.assertEqual(extract.call_count, 2)
+
+    def test_local_testing_matches_result_by_tool_use_id(self):
+        """Test tool results are matched to their Bash test command by id."""
+        checker = PowerSteeringChecker(self.project_root)
+        passing = [{"type": "tool_result", "content": "3 passed in 0.1s"}]
+        transcript = [
+            self._tool_use("t1", "Bash", {"command": "pytest tests/"}),
+            self._tool_use("t2", "Bash", {"command": "ls"}),
+            {"type": "tool_result", "message": {"tool_use_id": "t2", "content": passing}},
+        ]
+
+        self.assertFalse(checker._check_local_testing(transcript, "test_session"))
+
+        transcript.append(
+            {"type": "tool_result", "message": {"tool_use_id": "t1", "content": passing}}
+        )
+        self.assertTrue(checker._check_local_testing(transcript, "test_session"))
+
+    def test_last_todo_write_skips_empty_input(self):
+        """Test an empty TodoWrite does not hide the previous todo list."""
+        pending = {"todos": [{"content": "Task 1", "status": "pending"}]}
+        transcript = [
+            self._tool_use("t1", "TodoWrite", pending),
+            self._tool_use("t2", "TodoWrite", {}),
+        ]
+
+        features = TranscriptFeatures.from_transcript(transcript)
+
+        self.assertEqual(features.last_todo_write, pending)
+        checker = PowerSteeringChecker(self.project_root)
+        self.assertFalse(checker._check_todos_complete(transcript, "test_session"))
+        self.assertEqual(checker._extract_incomplete_todos(transcript), ["[pending] Task 1"])
+
+    def test_heuristic_check_timings_recorded(self):
+        """Test each heuristic check records how long it took."""
+        checker = PowerSteeringChecker(self.project_root)
+        consideration = {
+            "id": "todos_complete",
+            "checker": "_check_todos_complete",
+            "severity": "blocker",
+            "question": "Were all TODO items completed?",
+        }
+
+        with patch.object(power_steering_checker, "SDK_AVAILABLE", False):
+            result = asyncio.run(
+                checker._check_single_consideration_async(consideration, [], "test_session")
+            )
+
+        self.assertTrue(result.satisfied)
+        self.assertIn("todos_complete", checker._check_timings)
+        self.assertGreaterEqual(checker._check_timings["todos_complete"], 0.0)
+
+
 class TestConsiderationAnalysis(unittest.TestCase):
     """Tests for ConsiderationAnalysis class."""
 
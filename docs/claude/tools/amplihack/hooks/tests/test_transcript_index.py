@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the incremental power-steering transcript index.
+
+Tests tail-only parsing, eviction of the oldest messages, sidecar rebuilds,
+and the checker's use of the index.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import power_steering_checker
+from power_steering_checker import PowerSteeringChecker
+from transcript_index import TranscriptIndex, compact_record
+
+
+def _message(i: int) -> dict:
+    return {
+        "type": "user" if i % 2 else "assistant",
+        "message": {"content": f"message {i}"},
+        "cwd": "/project",
+        "toolUseResult": {"stdout": "x" * 50},
+    }
+
+
+def _write(path: Path, start: int, end: int, mode: str = "a") -> None:
+    with open(path, mode) as f:
+        for i in range(start, end):
+            f.write(json.dumps(_message(i)) + "\n")
+
+
+def _contents(messages: list[dict]) -> list[str]:
+    return [m["message"]["content"] for m in messages]
+
+
+class TestTranscriptIndex:
+    """Test incremental loading through the sidecar."""
+
+    def test_first_load_returns_compact_records(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        _write(transcript, 0, 3)
+
+        messages = TranscriptIndex(tmp_path / "index", max_messages=100).load(transcript)
+
+        assert messages == [compact_record(_message(i)) for i in range(3)]
+        assert "cwd" not in messages[0]
+        assert "toolUseResult" not in messages[0]
+
+    def test_only_appended_tail_is_parsed(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        _write(transcript, 0, 100)
+        index = TranscriptIndex(tmp_path / "index", max_messages=1000)
+        index.load(transcript)
+
+        # Corrupt an already-indexed line past the fingerprinted head, keeping
+        # its length: a full re-parse would raise, the index never re-reads it
+        data = transcript.read_bytes()
+        line_start = data.index(b'{"type": "user", "message": {"content": "message 91"}')
+        data = data[:line_start] + b"#" + data[line_start + 1 :]
+        transcript.write_bytes(data)
+        _write(transcript, 100, 102)
+
+        messages = TranscriptIndex(tmp_path / "index", max_messages=1000).load(transcript)
+
+        assert _contents(messages) == [f"message {i}" for i in range(102)]
+
+    def test_oldest_messages_are_evicted(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        _write(transcript, 0, 5)
+        first = TranscriptIndex(tmp_path / "index", max_messages=3)
+        assert _contents(first.load(transcript)) == ["message 2", "message 3", "message 4"]
+        assert first.evicted == 2
+
+        _write(transcript, 5, 7)
+        second = TranscriptIndex(tmp_path / "index", max_messages=3)
+        assert _contents(second.load(transcript)) == ["message 4", "message 5", "message 6"]
+        assert second.evicted == 4
+
+    def test_evicted_records_are_compacted_away(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        index_dir = tmp_path / "index"
+        _write(transcript, 0, 2)
+        for end in range(3, 40):
+            _write(transcript, end - 1, end)
+            messages = TranscriptIndex(index_dir, max_messages=2).load(transcript)
+            assert _contents(messages) == [f"message {end - 2}", f"message {end - 1}"]
+
+        records = (index_dir / TranscriptIndex.RECORDS_FILE).read_text().splitlines()
+        assert len(records) <= 5
+
+    def test_partial_trailing_line_is_returned_but_not_indexed(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        _write(transcript, 0, 2)
+        with open(transcript, "a") as f:
+            f.write(json.dumps(_message(2)))
+
+        first = TranscriptIndex(tmp_path / "index", max_messages=100).load(transcript)
+        with open(transcript, "a") as f:
+            f.write("\n")
+        _write(transcript, 3, 4)
+        second = TranscriptIndex(tmp_path / "index", max_messages=100).load(transcript)
+
+        assert _contents(first) == ["message 0", "message 1", "message 2"]
+        assert _contents(second) == [f"message {i}" for i in range(4)]
+
+    def test_rewritten_transcript_rebuilds_index(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        _write(transcript, 0, 5)
+        TranscriptIndex(tmp_path / "index", max_messages=100).load(transcript)
+
+        _write(transcript, 10, 12, mode="w")
+        messages = TranscriptIndex(tmp_path / "index", max_messages=100).load(transcript)
+
+        assert _contents(messages) == ["message 10", "message 11"]
+
+    def test_corrupt_sidecar_rebuilds_index(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        index_dir = tmp_path / "index"
+        _write(transcript, 0, 3)
+        TranscriptIndex(index_dir, max_messages=100).load(transcript)
+
+        (index_dir / TranscriptIndex.RECORDS_FILE).write_text("not json\n" * 3)
+        messages = TranscriptIndex(index_dir, max_messages=100).load(transcript)
+
+        assert _contents(messages) == ["message 0", "message 1", "message 2"]
+
+
+class TestCheckerTranscriptLoading:
+    """Test PowerSteeringChecker._load_transcript keeps the newest messages."""
+
+    def test_session_load_uses_index_and_keeps_newest(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(power_steering_checker, "MAX_TRANSCRIPT_LINES", 3)
+        (tmp_path / ".claude").mkdir()
+        checker = PowerSteeringChecker(tmp_path)
+        transcript = tmp_path / "session.jsonl"
+        _write(transcript, 0, 5)
+
+        messages = checker._load_transcript(transcript, "session-1")
+
+        assert _contents(messages) == ["message 2", "message 3", "message 4"]
+        assert checker._transcript_evicted == 2
+        assert (checker.runtime_dir / "session-1" / TranscriptIndex.INDEX_FILE).exists()
+
+    def test_load_without_session_keeps_newest(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(power_steering_checker, "MAX_TRANSCRIPT_LINES", 3)
+        (tmp_path / ".claude").mkdir()
+        checker = PowerSteeringChecker(tmp_path)
+        transcript = tmp_path / "session.jsonl"
+        _write(transcript, 0, 5)
+
+        messages = checker._load_transcript(transcript)
+
+        assert messages == [_message(i) for i in range(2, 5)]
+        assert checker._transcript_evicted == 2
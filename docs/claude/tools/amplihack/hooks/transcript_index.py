@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Incremental transcript index for the power-steering stop hook.
+
+The stop hook runs in a fresh process on every invocation, and used to
+re-read and json-parse the whole session JSONL each time. TranscriptIndex
+keeps a per-session sidecar recording how many transcript bytes have been
+consumed plus compact records of the retained messages, so each invocation
+only parses the lines appended since the previous one. When the session
+grows past max_messages the OLDEST records are evicted - the newest
+messages are the ones the checks care about.
+
+Sidecar layout (in the session's power-steering runtime directory):
+    transcript_index.json    - offsets and the transcript fingerprint
+    transcript_records.jsonl - retained records, one JSON object per line
+
+Records are the transcript messages minus per-line session metadata that
+no power-steering check reads (see DROPPED_KEYS).
+
+Philosophy:
+- Ruthlessly Simple: Single-purpose module with clear contract
+- Fail-Open: A missing, stale or corrupt sidecar is rebuilt from the transcript
+- Zero-BS: No stubs, every function works or doesn't exist
+- Modular: Self-contained brick with standard library only
+
+Public API (the "studs"):
+    TranscriptIndex: Loads a transcript, parsing only the appended tail
+    compact_record: Strip unused session metadata from a transcript message
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+__all__ = [
+    "TranscriptIndex",
+    "compact_record",
+    "DROPPED_KEYS",
+]
+
+# Per-line metadata Claude Code writes on every transcript entry. None of it is
+# read by the checks; toolUseResult duplicates the tool_result content block.
+DROPPED_KEYS = frozenset(
+    {
+        "toolUseResult",
+        "parentUuid",
+        "sessionId",
+        "cwd",
+        "version",
+        "gitBranch",
+        "userType",
+        "requestId",
+        "isSidechain",
+    }
+)
+
+INDEX_VERSION = 1
+
+# Bytes of the transcript head hashed to detect a replaced or rewritten file
+FINGERPRINT_BYTES = 4096
+
+
+def compact_record(message: dict) -> dict:
+    """Return message without DROPPED_KEYS (the message itself if none present)."""
+    if DROPPED_KEYS.isdisjoint(message):
+        return message
+    return {key: value for key, value in message.items() if key not in DROPPED_KEYS}
+
+
+class TranscriptIndex:
+    """Per-session sidecar index over an append-only transcript JSONL.
+
+    Attributes:
+        index_dir: Directory holding the sidecar files
+        max_messages: Maximum retained records (oldest evicted first)
+        log: Optional logging callback
+    """
+
+    INDEX_FILE = "transcript_index.json"
+    RECORDS_FILE = "transcript_records.jsonl"
+
+    def __init__(
+        self,
+        index_dir: Path,
+        max_messages: int,
+        log: Callable[[str, str], None] | None = None,
+    ):
+        """Initialize transcript index.
+
+        Args:
+            index_dir: Session runtime directory for the sidecar files
+            max_messages: Maximum messages to retain (newest kept)
+            log: Optional callback taking (message, level)
+        """
+        self.index_dir = index_dir
+        self.max_messages = max_messages
+        self.log = log or (lambda msg, level="INFO": None)
+        self.evicted = 0  # Messages evicted from the front over the session
+
+    @property
+    def index_path(self) -> Path:
+        return self.index_dir / self.INDEX_FILE
+
+    @property
+    def records_path(self) -> Path:
+        return self.index_dir / self.RECORDS_FILE
+
+    def load(self, transcript_path: Path) -> list[dict]:
+        """Load the newest max_messages messages of transcript_path.
+
+        Parses only the transcript bytes appended since the previous call and
+        persists them to the sidecar. A trailing line without a newline (still
+        being written) is returned but not indexed.
+
+        Args:
+            transcript_path: Path to the session transcript JSONL
+
+        Returns:
+            List of compact message records, oldest first
+
+        Raises:
+            OSError: If the transcript cannot be read
+            json.JSONDecodeError: If an appended line is malformed
+        """
+        state = self._load_state(transcript_path)
+        if state is None:
+            self._reset_records()
+            state = {
+                "version": INDEX_VERSION,
+                "source": str(transcript_path),
+                "offset": 0,
+                "fingerprint": "",
+                "records_start": 0,
+                "records_end": 0,
+                "evicted": 0,
+            }
+
+        with open(transcript_path, "rb") as f:
+            f.seek(state["offset"])
+            tail = f.read()
+
+        complete_end = tail.rfind(b"\n") + 1
+        new_records = [
+            compact_record(json.loads(line))
+            for line in tail[:complete_end].splitlines()
+            if line.strip()
+        ]
+        partial = tail[complete_end:].strip()
+        pending = [compact_record(json.loads(partial))] if partial else []
+
+        try:
+            old_lines = self._read_records(state["records_start"], state["records_end"])
+            excess = len(old_lines) + len(new_records) - self.max_messages
+            if excess > 0:
+                evicted_lines = old_lines[:excess]
+                # Records are ASCII JSON, so len() is the byte length
+                state["records_start"] += sum(len(line) + 1 for line in evicted_lines)
+                old_lines = old_lines[len(evicted_lines) :]
+                new_records = new_records[excess - len(evicted_lines) :]
+                state["evicted"] += excess
+            old_records = [json.loads(line) for line in old_lines]
+        except ValueError as e:
+            self.log(f"Corrupt transcript index records (rebuilding): {e}", "WARNING")
+            self.index_path.unlink(missing_ok=True)
+            return self.load(transcript_path)
+        self.evicted = state["evicted"]
+
+        if complete_end:
+            state["offset"] += complete_end
+            if state["offset"] <= FINGERPRINT_BYTES or not state["fingerprint"]:
+                state["fingerprint"] = self._fingerprint(transcript_path, state["offset"])
+            new_lines = [json.dumps(record, separators=(",", ":")) for record in new_records]
+            self._persist(state, old_lines, new_lines)
+
+        if self.evicted:
+            self.log(
+                f"Transcript index retains newest {len(old_lines) + len(new_records)} "
+                f"messages ({self.evicted} oldest evicted)",
+                "INFO",
+            )
+
+        return old_records + new_records + pending
+
+    def _load_state(self, transcript_path: Path) -> dict | None:
+        """Return the saved index state if it still describes transcript_path."""
+        try:
+            state = json.loads(self.index_path.read_text())
+            if (
+                state.get("version") != INDEX_VERSION
+                or state.get("source") != str(transcript_path)
+                or transcript_path.stat().st_size < state["offset"]
+                or state["fingerprint"] != self._fingerprint(transcript_path, state["offset"])
+                or not self.records_path.exists()
+            ):
+                self.log("Transcript index is stale, rebuilding", "INFO")
+                return None
+            return state
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.log(f"Failed to load transcript index (rebuilding): {e}", "WARNING")
+            return None
+
+    @staticmethod
+    def _fingerprint(transcript_path: Path, offset: int) -> str:
+        with open(transcript_path, "rb") as f:
+            head = f.read(min(offset, FINGERPRINT_BYTES))
+        return hashlib.sha256(head).hexdigest()
+
+    def _read_records(self, start: int, end: int) -> list[str]:
+        if end <= start:
+            return []
+        with open(self.records_path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start).decode("ascii").splitlines()
+
+    def _reset_records(self) -> None:
+        try:
+            self.records_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.log(f"Failed to reset transcript records: {e}", "WARNING")
+
+    def _persist(self, state: dict, old_lines: list[str], new_lines: list[str]) -> None:
+        """Append new records (or rewrite once mostly evicted), then save the state.
+
+        Only bytes up to records_end are ever read, so records appended by an
+        invocation that died before saving its state are overwritten here.
+
+        Fail-open: logs and keeps the previous sidecar on error; the next
+        invocation then re-parses from the last saved offset.
+        """
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            appended = "".join(line + "\n" for line in new_lines)
+            if state["records_start"] > state["records_end"] // 2:
+                # Over half the records file is evicted: rewrite just the live part
+                live = "".join(line + "\n" for line in old_lines) + appended
+                self._atomic_write(self.records_path, live)
+                state["records_start"], state["records_end"] = 0, len(live)
+            elif appended:
+                with open(self.records_path, "a+b") as f:
+                    f.truncate(state["records_end"])
+                    f.write(appended.encode("ascii"))
+                self.records_path.chmod(0o600)  # Owner read/write only for security
+                state["records_end"] += len(appended)
+            self._atomic_write(self.index_path, json.dumps(state))
+        except OSError as e:
+            self.log(f"Failed to save transcript index (fail-open): {e}", "WARNING")
+
+    @staticmethod
+    def _atomic_write(path: Path, data: str) -> None:
+        # mkstemp creates the file owner read/write only
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.stem}_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
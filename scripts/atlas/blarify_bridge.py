@@ -9,17 +9,42 @@ Supported languages: Python, JavaScript, TypeScript, Ruby, C#, Go, PHP, Java.
 Public API:
     BlarifyBridge: Main bridge class
     EXTENSION_TO_LANGUAGE: Extension-to-language mapping
+    load_or_build_graph_data: Shared, fingerprinted graph artifact for all layers
 """
 
+import hashlib
+import json
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(_REPO_ROOT / "src"))
 sys.path.insert(0, str(_REPO_ROOT))
 
-__all__ = ["BlarifyBridge", "EXTENSION_TO_LANGUAGE"]
+__all__ = ["BlarifyBridge", "EXTENSION_TO_LANGUAGE", "load_or_build_graph_data"]
+
+# Common non-source directories skipped by the graph build
+NAMES_TO_SKIP = [
+    "node_modules",
+    "__pycache__",
+    ".git",
+    ".venv",
+    "venv",
+    ".tox",
+    ".mypy_cache",
+    ".pytest_cache",
+    "target",
+    "dist",
+    "build",
+    ".next",
+    ".nuxt",
+    "vendor",
+]
+
+# File name of the shared graph artifact inside the atlas cache directory
+GRAPH_ARTIFACT_NAME = "blarify_graph.json"
 
 # Extension -> human-readable language name
 EXTENSION_TO_LANGUAGE: dict[str, str] = {
@@ -61,27 +86,9 @@ class BlarifyBridge:
         from amplihack.vendor.blarify.project_file_explorer import ProjectFilesIterator
         from amplihack.vendor.blarify.project_graph_creator import ProjectGraphCreator
 
-        # Skip common non-source directories
-        names_to_skip = [
-            "node_modules",
-            "__pycache__",
-            ".git",
-            ".venv",
-            "venv",
-            ".tox",
-            ".mypy_cache",
-            ".pytest_cache",
-            "target",
-            "dist",
-            "build",
-            ".next",
-            ".nuxt",
-            "vendor",
-        ]
-
         iterator = ProjectFilesIterator(
             root_path=str(self.root),
-            names_to_skip=names_to_skip,
+            names_to_skip=list(NAMES_TO_SKIP),
         )
         resolver = HybridReferenceResolver(f"file://{self.root}")
         creator = ProjectGraphCreator(
@@ -260,13 +267,7 @@ class BlarifyBridge:
         if self.graph is None:
             raise RuntimeError("Call build() before get_relationship_summary()")
 
-        rels = self.get_relationships()
-        counts: dict[str, int] = {}
-        for r in rels:
-            rtype = r["type"]
-            counts[rtype] = counts.get(rtype, 0) + 1
-        counts["total"] = len(rels)
-        return counts
+        return summarize_relationships(self.get_relationships())
 
     def get_language_stats(self) -> dict[str, int]:
         """Count definitions per language from the graph.
@@ -376,6 +377,84 @@ class BlarifyBridge:
             return False
 
 
+def summarize_relationships(rels: list[dict]) -> dict[str, int]:
+    """Count relationship dicts by type, plus "total"."""
+    counts: dict[str, int] = {}
+    for r in rels:
+        rtype = r["type"]
+        counts[rtype] = counts.get(rtype, 0) + 1
+    counts["total"] = len(rels)
+    return counts
+
+
+def source_fingerprint(root: Path) -> str:
+    """Hash of every path and file content the graph build would visit."""
+    from amplihack.vendor.blarify.project_file_explorer import ProjectFilesIterator
+
+    entries = []
+    iterator = ProjectFilesIterator(
+        root_path=str(root.resolve()), names_to_skip=list(NAMES_TO_SKIP)
+    )
+    for folder in iterator:
+        entries.append((folder.path, ""))
+        for file in folder.files:
+            try:
+                content_hash = hashlib.sha256(Path(file.path).read_bytes()).hexdigest()
+            except OSError:
+                content_hash = "unreadable"
+            entries.append((file.path, content_hash))
+
+    digest = hashlib.sha256()
+    for path, content_hash in sorted(entries):
+        digest.update(f"{path}\0{content_hash}\n".encode())
+    return digest.hexdigest()
+
+
+def load_or_build_graph_data(root: Path, cache_dir: Path | None = None) -> dict:
+    """Return the atlas view of the blarify graph, building it at most once.
+
+    Layers share one full (LSP) build: the extracted definitions,
+    relationships and language stats are stored in ``cache_dir`` together
+    with a fingerprint of the source tree and reused until any file changes.
+
+    Returns:
+        Dict with fingerprint, definitions (layer 2 schema), relationships,
+        relationship_summary and language_stats.
+    """
+    root = root.resolve()
+    fingerprint = source_fingerprint(root)
+    artifact_path = cache_dir / GRAPH_ARTIFACT_NAME if cache_dir else None
+
+    if artifact_path is not None and artifact_path.exists():
+        try:
+            data = json.loads(artifact_path.read_text())
+            if data.get("fingerprint") == fingerprint:
+                return data
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable graph artifact {artifact_path}: {e}", file=sys.stderr)
+
+    bridge = BlarifyBridge(root).build()
+    relationships = bridge.get_relationships()
+    data = {
+        "fingerprint": fingerprint,
+        "definitions": bridge.to_layer2_definitions(),
+        "relationships": relationships,
+        "relationship_summary": summarize_relationships(relationships),
+        "language_stats": bridge.get_language_stats(),
+    }
+
+    if artifact_path is not None:
+        try:
+            artifact_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=artifact_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, artifact_path)
+        except OSError as e:
+            print(f"Failed to write graph artifact {artifact_path}: {e}", file=sys.stderr)
+    return data
+
+
 if __name__ == "__main__":
     import argparse
 
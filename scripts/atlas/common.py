@@ -8,6 +8,8 @@ Public API:
     detect_languages: Detect languages present in a repository
     load_manifest: Load manifest.json from output directory
     parse_file_safe: Parse Python file safely (None on SyntaxError)
+    FileFactCache: On-disk cache of per-file facts keyed by content hash
+    atlas_cache_dir: Cache directory shared by the layers of one output dir
     walk_definitions: Extract top-level and class-level definitions
     walk_imports: Extract and classify all import statements
     walk_calls: Extract all function/method calls from AST
@@ -18,11 +20,16 @@ Public API:
 """
 
 import ast
+import hashlib
 import json
+import os
 import subprocess
 import sys
+import tempfile
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 __all__ = [
     "build_manifest",
@@ -30,6 +37,8 @@ __all__ = [
     "find_repo_root",
     "load_manifest",
     "parse_file_safe",
+    "FileFactCache",
+    "atlas_cache_dir",
     "walk_definitions",
     "walk_imports",
     "walk_calls",
@@ -436,6 +445,77 @@ def parse_file_safe(path: Path) -> ast.Module | None:
         return None
 
 
+def atlas_cache_dir(output_dir: Path) -> Path:
+    """Return the cache directory shared by all layers writing to output_dir."""
+    return output_dir / ".atlas_cache"
+
+
+class FileFactCache:
+    """Per-file facts derived from a Python AST, cached by file content.
+
+    Entries are keyed by a hash of the file's path and bytes, so unchanged
+    files are never re-parsed. Parsed ASTs themselves are not stored:
+    unpickling a tree costs as much as ast.parse(). Each layer keeps its own
+    namespace file; the whole namespace is dropped when any of ``code_files``
+    (the extractor's source) changes. Facts must survive a JSON round-trip
+    unchanged (no sets, tuples or non-string keys).
+
+    With ``cache_dir=None`` nothing is persisted.
+
+    Usage::
+
+        cache = FileFactCache("layer6_data_flow", atlas_cache_dir(output), [Path(__file__)])
+        facts = cache.get(Path(filepath), extract_file_facts)
+        cache.save()
+    """
+
+    def __init__(self, namespace: str, cache_dir: Path | None, code_files: list[Path]):
+        self.path = cache_dir / f"facts_{namespace}.json" if cache_dir else None
+        self.hits = 0
+        self.misses = 0
+        self._version = _hash_files([*code_files, Path(__file__)])
+        self._entries: dict[str, Any] = {}
+        self._used: dict[str, Any] = {}
+        if self.path is not None and self.path.exists():
+            try:
+                cached = json.loads(self.path.read_text())
+                if cached.get("version") == self._version:
+                    self._entries = cached["entries"]
+            except (OSError, ValueError, KeyError, AttributeError) as e:
+                print(f"Ignoring unreadable fact cache {self.path}: {e}", file=sys.stderr)
+
+    def get(self, path: Path, extract: Callable[[ast.Module, str], Any]) -> Any | None:
+        """Return extract(tree, str(path)), or None if the file does not parse."""
+        try:
+            key = hashlib.sha256(str(path).encode() + b"\0" + path.read_bytes()).hexdigest()
+        except OSError:
+            key = None
+
+        if key is not None and key in self._entries:
+            self.hits += 1
+            facts = self._entries[key]
+        else:
+            self.misses += 1
+            tree = parse_file_safe(path)
+            facts = None if tree is None else extract(tree, str(path))
+        if key is not None:
+            self._used[key] = facts
+        return facts
+
+    def save(self) -> None:
+        """Persist the entries used in this run (entries for stale content are dropped)."""
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": self._version, "entries": self._used}, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Failed to write fact cache {self.path}: {e}", file=sys.stderr)
+
+
 def walk_definitions(tree: ast.Module, filepath: str) -> list[dict]:
     """Extract all top-level and class-level definitions.
 
@@ -728,6 +808,13 @@ def load_layer_json(layer_name: str, output_dir: Path) -> dict:
 # ---------------------------------------------------------------------------
 
 
+def _hash_files(paths: list[Path]) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
 def _git_commit(root: Path) -> str:
     """Get current git commit hash."""
     try:
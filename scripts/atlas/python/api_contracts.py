@@ -14,10 +14,11 @@ from pathlib import Path
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(_REPO_ROOT))
 from scripts.atlas.common import (
+    FileFactCache,
     _resolve_call_name,
+    atlas_cache_dir,
     find_repo_root,
     load_manifest,
-    parse_file_safe,
     write_layer_json,
 )
 
@@ -606,12 +607,24 @@ def _extract_rust_clap_commands(root: Path) -> list[dict]:
     return commands
 
 
-def extract(manifest: dict, repo_root: Path) -> dict:
+def _extract_file_facts(tree: ast.Module, filepath: str) -> dict:
+    """Per-file CLI and HTTP records (cached by FileFactCache)."""
+    parsers, arguments = _extract_cli_commands(tree, filepath)
+    return {
+        "parsers": parsers,
+        "arguments": arguments,
+        "routes": _extract_http_routes(tree, filepath),
+        "click_typer": _extract_click_typer_commands(tree, filepath),
+    }
+
+
+def extract(manifest: dict, repo_root: Path, cache: FileFactCache | None = None) -> dict:
     """Extract layer 5 API contracts data.
 
     Args:
         manifest: Loaded manifest.json.
         repo_root: Repository root directory.
+        cache: Per-file fact cache (default: no persistence).
 
     Returns:
         Layer 5 data dict.
@@ -623,21 +636,18 @@ def extract(manifest: dict, repo_root: Path) -> dict:
     all_routes: list[dict] = []
     all_click_typer: list[dict] = []
 
+    if cache is None:
+        cache = FileFactCache("layer5_api_contracts", None, [Path(__file__)])
     for finfo in py_files:
         filepath = finfo["path"]
-        tree = parse_file_safe(Path(filepath))
-        if tree is None:
+        facts = cache.get(Path(filepath), _extract_file_facts)
+        if facts is None:
             continue
 
-        parsers, arguments = _extract_cli_commands(tree, filepath)
-        all_parsers.extend(parsers)
-        all_arguments.extend(arguments)
-
-        routes = _extract_http_routes(tree, filepath)
-        all_routes.extend(routes)
-
-        click_typer = _extract_click_typer_commands(tree, filepath)
-        all_click_typer.extend(click_typer)
+        all_parsers.extend(facts["parsers"])
+        all_arguments.extend(facts["arguments"])
+        all_routes.extend(facts["routes"])
+        all_click_typer.extend(facts["click_typer"])
 
     # Build CLI command entries with their arguments
     # Group arguments by file proximity to parsers
@@ -719,7 +729,9 @@ def main() -> int:
     repo_root = find_repo_root(root)
 
     manifest = load_manifest(output)
-    data = extract(manifest, repo_root)
+    cache = FileFactCache("layer5_api_contracts", atlas_cache_dir(output), [Path(__file__)])
+    data = extract(manifest, repo_root, cache)
+    cache.save()
     issues = self_check(data, manifest)
 
     out_path = write_layer_json("layer5_api_contracts", data, output)
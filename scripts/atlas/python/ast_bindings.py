@@ -19,7 +19,8 @@ from pathlib import Path
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(_REPO_ROOT))
 from scripts.atlas.common import (
-    parse_file_safe,
+    FileFactCache,
+    atlas_cache_dir,
     resolve_internal_import,
     walk_calls,
     walk_definitions,
@@ -28,11 +29,14 @@ from scripts.atlas.common import (
 )
 
 
-def _extract_blarify_definitions(root: Path) -> tuple[list[dict], list[dict], dict[str, int]]:
+def _extract_blarify_definitions(
+    root: Path, cache_dir: Path | None = None
+) -> tuple[list[dict], list[dict], dict[str, int]]:
     """Extract definitions from all languages using blarify.
 
     Args:
         root: Project root directory.
+        cache_dir: Where the shared graph artifact lives (None = always build).
 
     Returns:
         Tuple of (non_python_definitions, all_relationships, relationship_summary).
@@ -42,19 +46,18 @@ def _extract_blarify_definitions(root: Path) -> tuple[list[dict], list[dict], di
     """
     try:
         sys.path.insert(0, str(_REPO_ROOT / "src"))
-        from scripts.atlas.blarify_bridge import BlarifyBridge
+        from scripts.atlas.blarify_bridge import load_or_build_graph_data
 
-        bridge = BlarifyBridge(root)
-        bridge.build()
+        graph_data = load_or_build_graph_data(root, cache_dir)
 
-        all_defs = bridge.to_layer2_definitions()
-        all_rels = bridge.get_relationships()
-        rel_summary = bridge.get_relationship_summary()
+        all_defs = graph_data["definitions"]
+        all_rels = graph_data["relationships"]
+        rel_summary = graph_data["relationship_summary"]
 
         # Separate: Python defs handled by ast.parse, non-Python from blarify
         non_python_defs = [d for d in all_defs if d.get("language", "python") != "python"]
 
-        stats = bridge.get_language_stats()
+        stats = graph_data["language_stats"]
         lang_summary = ", ".join(f"{lang}={count}" for lang, count in sorted(stats.items()))
         print(f"  Blarify: {len(all_defs)} total defs ({lang_summary})")
         print(f"  Blarify: {len(non_python_defs)} non-Python defs for merge")
@@ -72,7 +75,26 @@ def _extract_blarify_definitions(root: Path) -> tuple[list[dict], list[dict], di
         return [], [], {}
 
 
-def extract(manifest: dict, root: Path) -> dict:
+def _extract_file_facts(tree: ast.Module, filepath: str) -> dict:
+    """Per-file definitions, exports, imports, calls and names (cached by FileFactCache)."""
+    # Fix 2: Collect all Name references (Load context) for intra-file usage
+    # This catches bare name references like `logger.info(...)` where `logger`
+    # is used as an attribute base, and constants used in expressions/assignments.
+    name_refs: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            name_refs.add(node.id)
+
+    return {
+        "definitions": walk_definitions(tree, filepath),
+        "exports": _extract_all_exports(tree, filepath),
+        "imports": walk_imports(tree, filepath),
+        "calls": walk_calls(tree, filepath),
+        "name_refs": sorted(name_refs),
+    }
+
+
+def extract(manifest: dict, root: Path, cache_dir: Path | None = None) -> dict:
     """Extract layer 2 data by parsing all Python files and non-Python via blarify.
 
     Phase 1 (blarify): Extract definitions from ALL languages via tree-sitter.
@@ -83,6 +105,8 @@ def extract(manifest: dict, root: Path) -> dict:
     Args:
         manifest: Loaded manifest dict.
         root: Project root directory.
+        cache_dir: Atlas cache directory for per-file facts and the shared
+            blarify graph (None = no persistence).
 
     Returns:
         Layer 2 data dict matching the spec schema.
@@ -91,7 +115,8 @@ def extract(manifest: dict, root: Path) -> dict:
     py_files = [f for f in manifest["files"] if f["extension"] == ".py"]
 
     # --- Phase 1: Blarify (all languages) ---
-    blarify_defs, blarify_rels, blarify_rel_summary = _extract_blarify_definitions(root)
+    blarify_defs, blarify_rels, blarify_rel_summary = _extract_blarify_definitions(root, cache_dir)
+    cache = FileFactCache("layer2_ast_bindings", cache_dir, [Path(__file__)])
 
     # --- Phase 2: Python ast.parse() ---
     all_definitions = []
@@ -108,8 +133,8 @@ def extract(manifest: dict, root: Path) -> dict:
         filepath = file_entry["path"]
         rel_path = file_entry["rel_path"]
 
-        tree = parse_file_safe(Path(filepath))
-        if tree is None:
+        facts = cache.get(Path(filepath), _extract_file_facts)
+        if facts is None:
             files_failed_parse.append(
                 {
                     "file": filepath,
@@ -123,38 +148,28 @@ def extract(manifest: dict, root: Path) -> dict:
         files_analyzed += 1
 
         # Definitions
-        defs = walk_definitions(tree, filepath)
-        all_definitions.extend(defs)
+        all_definitions.extend(facts["definitions"])
 
         # Exports (__all__)
-        exports_entry = _extract_all_exports(tree, filepath)
+        exports_entry = facts["exports"]
         if exports_entry is not None:
             all_exports.append(exports_entry)
 
-        # Imports
-        file_imports = walk_imports(tree, filepath)
-        for imp in file_imports:
+        # Imports -- resolved on every run, since targets depend on other files
+        for imp in facts["imports"]:
             resolved = None
             if imp["category"] == "internal":
                 module = imp["module"]
                 resolved = resolve_internal_import(
                     module, imp.get("names", []), root, importing_file=filepath
                 )
-            imp["resolved_target"] = resolved
-            all_imports.append(imp)
+            all_imports.append({**imp, "resolved_target": resolved})
 
         # Calls (for intra-file usage detection)
-        file_calls = walk_calls(tree, filepath)
+        file_calls = facts["calls"]
         all_calls_by_file[filepath] = file_calls
 
-        # Fix 2: Collect all Name references (Load context) for intra-file usage
-        # This catches bare name references like `logger.info(...)` where `logger`
-        # is used as an attribute base, and constants used in expressions/assignments.
-        name_refs: set[str] = set()
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                name_refs.add(node.id)
-        all_name_refs_by_file[filepath] = name_refs
+        all_name_refs_by_file[filepath] = set(facts["name_refs"])
 
         # Detect importlib.import_module() calls
         for call in file_calls:
@@ -167,6 +182,8 @@ def extract(manifest: dict, root: Path) -> dict:
                     }
                 )
 
+    cache.save()
+
     # --- Phase 2: Cross-references ---
     # Build: for each definition, which files import it?
     # Index definitions by (file, name)
@@ -540,7 +557,7 @@ def main():
         print(f"Manifest: {manifest['total_files']} files")
 
     # Extract layer 2
-    layer_data = extract(manifest, root)
+    layer_data = extract(manifest, root, atlas_cache_dir(output_dir))
 
     # Write output
     out_path = write_layer_json("layer2_ast_bindings", layer_data, output_dir)
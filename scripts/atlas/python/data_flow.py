@@ -12,10 +12,11 @@ from pathlib import Path
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(_REPO_ROOT))
 from scripts.atlas.common import (
+    FileFactCache,
     _find_enclosing_function,
     _resolve_call_name,
+    atlas_cache_dir,
     load_manifest,
-    parse_file_safe,
     write_layer_json,
 )
 
@@ -364,11 +365,21 @@ def _find_transformation_points(
     return transforms
 
 
-def extract(manifest: dict) -> dict:
+def _extract_file_facts(tree: ast.Module, filepath: str) -> dict:
+    """Per-file I/O records (cached by FileFactCache)."""
+    return {
+        "file_io": _extract_file_io(tree, filepath),
+        "database_ops": _extract_database_ops(tree, filepath),
+        "network_io": _extract_network_io(tree, filepath),
+    }
+
+
+def extract(manifest: dict, cache: FileFactCache | None = None) -> dict:
     """Extract layer 6 data flow information.
 
     Args:
         manifest: Loaded manifest.json.
+        cache: Per-file fact cache (default: no persistence).
 
     Returns:
         Layer 6 data dict.
@@ -380,23 +391,25 @@ def extract(manifest: dict) -> dict:
     all_network_io: list[dict] = []
     files_with_io: set[str] = set()
 
+    if cache is None:
+        cache = FileFactCache("layer6_data_flow", None, [Path(__file__)])
     for finfo in py_files:
         filepath = finfo["path"]
-        tree = parse_file_safe(Path(filepath))
-        if tree is None:
+        facts = cache.get(Path(filepath), _extract_file_facts)
+        if facts is None:
             continue
 
-        fio = _extract_file_io(tree, filepath)
+        fio = facts["file_io"]
         if fio:
             all_file_io.extend(fio)
             files_with_io.add(filepath)
 
-        dbo = _extract_database_ops(tree, filepath)
+        dbo = facts["database_ops"]
         if dbo:
             all_database_ops.extend(dbo)
             files_with_io.add(filepath)
 
-        nio = _extract_network_io(tree, filepath)
+        nio = facts["network_io"]
         if nio:
             all_network_io.extend(nio)
             files_with_io.add(filepath)
@@ -446,7 +459,9 @@ def main() -> int:
     output = Path(args.output).resolve()
 
     manifest = load_manifest(output)
-    data = extract(manifest)
+    cache = FileFactCache("layer6_data_flow", atlas_cache_dir(output), [Path(__file__)])
+    data = extract(manifest, cache)
+    cache.save()
     issues = self_check(data, manifest)
 
     out_path = write_layer_json("layer6_data_flow", data, output)
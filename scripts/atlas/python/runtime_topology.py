@@ -12,11 +12,12 @@ from pathlib import Path
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(_REPO_ROOT))
 from scripts.atlas.common import (
+    FileFactCache,
     _find_enclosing_function,
     _resolve_call_name,
+    atlas_cache_dir,
     find_repo_root,
     load_manifest,
-    parse_file_safe,
     write_layer_json,
 )
 
@@ -332,12 +333,22 @@ def _parse_dockerfile(filepath: Path) -> dict | None:
     return result
 
 
-def extract(manifest: dict, repo_root: Path) -> dict:
+def _extract_file_facts(tree: ast.Module, filepath: str) -> dict:
+    """Per-file runtime records (cached by FileFactCache)."""
+    return {
+        "subprocess_calls": _extract_subprocess_calls(tree, filepath),
+        "port_bindings": _extract_port_bindings(tree, filepath),
+        "env_var_reads": _extract_env_var_reads(tree, filepath),
+    }
+
+
+def extract(manifest: dict, repo_root: Path, cache: FileFactCache | None = None) -> dict:
     """Extract layer 4 runtime topology data.
 
     Args:
         manifest: Loaded manifest.json.
         repo_root: Repository root directory.
+        cache: Per-file fact cache (default: no persistence).
 
     Returns:
         Layer 4 data dict.
@@ -352,22 +363,21 @@ def extract(manifest: dict, repo_root: Path) -> dict:
     env_var_reads: list[dict] = []
     files_with_subprocess: set[str] = set()
 
+    if cache is None:
+        cache = FileFactCache("layer4_runtime_topology", None, [Path(__file__)])
     for finfo in py_files:
         filepath = finfo["path"]
-        tree = parse_file_safe(Path(filepath))
-        if tree is None:
+        facts = cache.get(Path(filepath), _extract_file_facts)
+        if facts is None:
             continue
 
-        sc = _extract_subprocess_calls(tree, filepath)
+        sc = facts["subprocess_calls"]
         if sc:
             subprocess_calls.extend(sc)
             files_with_subprocess.add(filepath)
 
-        pb = _extract_port_bindings(tree, filepath)
-        port_bindings.extend(pb)
-
-        ev = _extract_env_var_reads(tree, filepath)
-        env_var_reads.extend(ev)
+        port_bindings.extend(facts["port_bindings"])
+        env_var_reads.extend(facts["env_var_reads"])
 
     # Docker configs
     docker_configs = []
@@ -430,7 +440,9 @@ def main() -> int:
     repo_root = find_repo_root(root)
 
     manifest = load_manifest(output)
-    data = extract(manifest, repo_root)
+    cache = FileFactCache("layer4_runtime_topology", atlas_cache_dir(output), [Path(__file__)])
+    data = extract(manifest, repo_root, cache)
+    cache.save()
     issues = self_check(data, manifest)
 
     out_path = write_layer_json("layer4_runtime_topology", data, output)
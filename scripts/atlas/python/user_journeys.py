@@ -24,6 +24,8 @@ from pathlib import Path
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(_REPO_ROOT))
 from scripts.atlas.common import (
+    FileFactCache,
+    atlas_cache_dir,
     load_layer_json,
     load_manifest,
     parse_file_safe,
@@ -38,6 +40,7 @@ def extract(
     layer4: dict | None = None,
     layer5: dict | None = None,
     layer6: dict | None = None,
+    cache_dir: Path | None = None,
 ) -> dict:
     """Extract layer 8 user journey data.
 
@@ -48,6 +51,7 @@ def extract(
         layer4: Optional layer4 runtime-topology dict.
         layer5: Optional layer5 api-contracts dict.
         layer6: Optional layer6 data-flow dict.
+        cache_dir: Atlas cache directory holding the shared blarify graph.
 
     Returns:
         Layer 8 data dict.
@@ -64,10 +68,14 @@ def extract(
     blarify_rels = layer2.get("blarify_relationships", {})
     blarify_edges_added = 0
     if blarify_rels.get("calls", 0) > 0:
-        blarify_edges_added = _enrich_call_graph_from_blarify(call_graph, all_functions, root)
+        blarify_edges_added = _enrich_call_graph_from_blarify(
+            call_graph, all_functions, root, cache_dir
+        )
 
     # --- Step 2: Get entry points ---
-    entry_points = _get_entry_points(layer5, root)
+    facts_cache = FileFactCache("layer8_user_journeys", cache_dir, [Path(__file__)])
+    entry_points = _get_entry_points(layer5, root, facts_cache)
+    facts_cache.save()
 
     # --- Step 3: Build outcome classifiers from layer4/layer6 ---
     io_functions = _build_io_function_set(layer4, layer6)
@@ -269,12 +277,13 @@ def _enrich_call_graph_from_blarify(
     call_graph: dict[str, set[str]],
     all_functions: dict[str, dict],
     root: Path,
+    cache_dir: Path | None = None,
 ) -> int:
     """Add non-Python CALLS edges from blarify to the call graph.
 
-    Uses the blarify bridge to get CALLS relationships and adds edges
-    for non-Python source or target functions. This enables cross-language
-    call tracing.
+    Uses the blarify graph shared with layer 2 (built if missing) to get
+    CALLS relationships and adds edges for non-Python source or target
+    functions. This enables cross-language call tracing.
 
     Returns:
         Number of edges added.
@@ -282,11 +291,9 @@ def _enrich_call_graph_from_blarify(
     try:
         import os
 
-        from scripts.atlas.blarify_bridge import EXTENSION_TO_LANGUAGE, BlarifyBridge
+        from scripts.atlas.blarify_bridge import EXTENSION_TO_LANGUAGE, load_or_build_graph_data
 
-        bridge = BlarifyBridge(root)
-        bridge.build()
-        rels = bridge.get_relationships()
+        rels = load_or_build_graph_data(root, cache_dir)["relationships"]
         calls = [r for r in rels if r.get("type") == "CALLS"]
 
         edges_added = 0
@@ -467,7 +474,9 @@ def _resolve_callee(
     return results
 
 
-def _get_entry_points(layer5: dict | None, root: Path) -> list[dict]:
+def _get_entry_points(
+    layer5: dict | None, root: Path, cache: FileFactCache | None = None
+) -> list[dict]:
     """Get entry points from layer5 or extract directly from codebase.
 
     Returns list of dicts with: type, command/path/name, handler_key, file,
@@ -478,7 +487,7 @@ def _get_entry_points(layer5: dict | None, root: Path) -> list[dict]:
 
     # Pre-build set_defaults handler map: file -> {parser_name: handler_func}
     # This resolves the handler_key mismatch where parser_name != actual handler.
-    defaults_map = _build_set_defaults_map(root)
+    defaults_map = _build_set_defaults_map(root, cache)
 
     if layer5:
         # CLI commands
@@ -556,11 +565,15 @@ def _get_entry_points(layer5: dict | None, root: Path) -> list[dict]:
     return entry_points
 
 
-def _build_set_defaults_map(root: Path) -> dict[str, dict[str, str]]:
+def _build_set_defaults_map(
+    root: Path, cache: FileFactCache | None = None
+) -> dict[str, dict[str, str]]:
     """Scan codebase for set_defaults(func=X) near add_parser() calls.
 
     Returns: {filepath: {parser_name: handler_function_name}}
     """
+    if cache is None:
+        cache = FileFactCache("layer8_user_journeys", None, [Path(__file__)])
     result: dict[str, dict[str, str]] = {}
 
     for py_file in root.rglob("*.py"):
@@ -568,53 +581,51 @@ def _build_set_defaults_map(root: Path) -> dict[str, dict[str, str]]:
         if "__pycache__" in filepath_str:
             continue
 
-        tree = parse_file_safe(py_file)
-        if tree is None:
-            continue
-
-        # Collect add_parser names and set_defaults(func=X) in the same file
-        parser_names: list[tuple[str, int]] = []  # (name, lineno)
-        defaults_funcs: list[tuple[str, int]] = []  # (func_name, lineno)
+        file_map = cache.get(py_file, _file_set_defaults_map)
+        if file_map:
+            result[filepath_str] = file_map
 
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
-            if not isinstance(node.func, ast.Attribute):
-                continue
+    return result
 
-            if node.func.attr == "add_parser":
-                if (
-                    node.args
-                    and isinstance(node.args[0], ast.Constant)
-                    and isinstance(node.args[0].value, str)
-                ):
-                    parser_names.append((node.args[0].value, node.lineno))
 
-            elif node.func.attr == "set_defaults":
-                for kw in node.keywords:
-                    if kw.arg == "func" and isinstance(kw.value, ast.Name):
-                        defaults_funcs.append((kw.value.id, node.lineno))
+def _file_set_defaults_map(tree: ast.Module, filepath: str) -> dict[str, str]:
+    """Map each add_parser() name in one file to its set_defaults(func=X) handler."""
+    # Collect add_parser names and set_defaults(func=X) in the same file
+    parser_names: list[tuple[str, int]] = []  # (name, lineno)
+    defaults_funcs: list[tuple[str, int]] = []  # (func_name, lineno)
 
-        if not parser_names or not defaults_funcs:
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        if not isinstance(node.func, ast.Attribute):
             continue
 
-        # Match each parser to the nearest following set_defaults call
-        file_map: dict[str, str] = {}
-        for p_name, p_line in parser_names:
-            best_func = None
-            best_dist = float("inf")
-            for d_func, d_line in defaults_funcs:
-                dist = d_line - p_line
-                if 0 <= dist < best_dist:
-                    best_dist = dist
-                    best_func = d_func
-            if best_func:
-                file_map[p_name] = best_func
-
-        if file_map:
-            result[filepath_str] = file_map
+        if node.func.attr == "add_parser":
+            if (
+                node.args
+                and isinstance(node.args[0], ast.Constant)
+                and isinstance(node.args[0].value, str)
+            ):
+                parser_names.append((node.args[0].value, node.lineno))
 
-    return result
+        elif node.func.attr == "set_defaults":
+            for kw in node.keywords:
+                if kw.arg == "func" and isinstance(kw.value, ast.Name):
+                    defaults_funcs.append((kw.value.id, node.lineno))
+
+    # Match each parser to the nearest following set_defaults call
+    file_map: dict[str, str] = {}
+    for p_name, p_line in parser_names:
+        best_func = None
+        best_dist = float("inf")
+        for d_func, d_line in defaults_funcs:
+            dist = d_line - p_line
+            if 0 <= dist < best_dist:
+                best_dist = dist
+                best_func = d_func
+        if best_func:
+            file_map[p_name] = best_func
+    return file_map
 
 
 def _fuzzy_resolve_handler(handler_key: str, all_functions: dict[str, dict]) -> str | None:
@@ -958,7 +969,9 @@ def main():
         print("Note: layer6 not found, I/O classification will use heuristics", file=sys.stderr)
 
     # Extract
-    layer_data = extract(manifest, layer2, root, layer4, layer5, layer6)
+    layer_data = extract(
+        manifest, layer2, root, layer4, layer5, layer6, cache_dir=atlas_cache_dir(output_dir)
+    )
 
     # Write output
     out_path = write_layer_json("layer8_user_journeys", layer_data, output_dir)
@@ -1,27 +1,97 @@
-"""Orchestrator: run all atlas extraction layers in correct phase order.
+"""Orchestrator: run all atlas extraction layers as a dependency DAG.
 
-Phase 1: manifest (common.build_manifest)
-Phase 2: layer1, layer2, layer4 (parallel-safe, but run sequentially for simplicity)
-Phase 3: layer3, layer5, layer6 (depend on layer2)
-Phase 4: layer7 (depends on 2, 3)
-Phase 5: layer8 (depends on 2, 4, 5, 6)
-Phase 6: cross_layer_checks
+Phase 1: manifest (common.build_manifest), in process.
+Then every layer in LAYERS starts as soon as the layers it reads have
+finished, up to --jobs at a time:
 
-For each script: subprocess.run, check exit code, abort on failure.
+    layer1, layer2, layer4, layer5, layer6   (no layer inputs)
+    layer3  <- layer2
+    layer7  <- layer2, layer3
+    layer8  <- layer2, layer4, layer5, layer6
+    cross_layer_checks <- all layers
+
+Layers share <output>/.atlas_cache: per-file AST facts keyed by content
+hash (common.FileFactCache) and one blarify graph artifact built by layer2
+and reused by layer8 (blarify_bridge.load_or_build_graph_data), so an
+unchanged file is never re-parsed across layers or runs.
+
+For each script: subprocess.run, check exit code; on failure no new layer
+is started and the run aborts once running layers finish.
 Prints timing for each layer and total time.
 """
 
 import argparse
 import json
+import os
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import NamedTuple
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(_REPO_ROOT))
 from scripts.atlas.common import build_manifest
 
+# Serializes layer output so concurrent layers do not interleave lines
+_print_lock = threading.Lock()
+
+
+class Layer(NamedTuple):
+    label: str
+    script: str  # relative to scripts/atlas
+    deps: tuple[str, ...] = ()
+    timeout: int = 120
+    fatal: bool = True
+    # Takes only --output (no --root)
+    output_only: bool = False
+
+
+LAYERS: list[Layer] = [
+    Layer("layer1_repo_surface", "python/repo_surface.py"),
+    # Full build with LSP
+    Layer("layer2_ast_bindings", "python/ast_bindings.py", timeout=600),
+    Layer("layer4_runtime_topology", "python/runtime_topology.py"),
+    Layer("layer5_api_contracts", "python/api_contracts.py"),
+    Layer("layer6_data_flow", "python/data_flow.py"),
+    Layer("layer3_compile_deps", "python/compile_deps.py", deps=("layer2_ast_bindings",)),
+    Layer(
+        "layer7_service_components",
+        "python/service_components.py",
+        deps=("layer2_ast_bindings", "layer3_compile_deps"),
+    ),
+    Layer(
+        "layer8_user_journeys",
+        "python/user_journeys.py",
+        deps=(
+            "layer2_ast_bindings",
+            "layer4_runtime_topology",
+            "layer5_api_contracts",
+            "layer6_data_flow",
+        ),
+        timeout=600,
+    ),
+    Layer(
+        "cross_layer_checks",
+        "cross_layer_checks.py",
+        deps=(
+            "layer1_repo_surface",
+            "layer2_ast_bindings",
+            "layer3_compile_deps",
+            "layer4_runtime_topology",
+            "layer5_api_contracts",
+            "layer6_data_flow",
+            "layer7_service_components",
+            "layer8_user_journeys",
+        ),
+        # Cross-layer check failures are warnings, not fatal
+        fatal=False,
+        output_only=True,
+    ),
+]
+
 
 def run_layer(
     script_path: str, args: list[str], label: str, timeout: int = 120
@@ -39,6 +109,7 @@ def run_layer(
     """
     start = time.monotonic()
     cmd = [sys.executable, script_path] + args
+    lines: list[str] = []
 
     try:
         result = subprocess.run(
@@ -49,31 +120,46 @@ def run_layer(
         )
     except subprocess.TimeoutExpired:
         elapsed = time.monotonic() - start
-        print(f"  TIMEOUT {label} after {elapsed:.1f}s")
+        _print_block([f"  TIMEOUT {label} after {elapsed:.1f}s"])
         return False, elapsed
 
     elapsed = time.monotonic() - start
 
     if result.stdout.strip():
         for line in result.stdout.strip().splitlines():
-            print(f"  {line}")
+            lines.append(f"  {line}")
 
     if result.returncode != 0:
-        print(f"  FAILED {label} (exit {result.returncode}) in {elapsed:.1f}s")
+        lines.append(f"  FAILED {label} (exit {result.returncode}) in {elapsed:.1f}s")
         if result.stderr.strip():
             for line in result.stderr.strip().splitlines()[:10]:
-                print(f"    stderr: {line}")
+                lines.append(f"    stderr: {line}")
+        _print_block(lines)
         return False, elapsed
 
-    print(f"  OK {label} in {elapsed:.1f}s")
+    lines.append(f"  OK {label} in {elapsed:.1f}s")
+    _print_block(lines)
     return True, elapsed
 
 
+def _print_block(lines: list[str]) -> None:
+    with _print_lock:
+        for line in lines:
+            print(line)
+        sys.stdout.flush()
+
+
 def main():
-    """Run all atlas layers in order."""
+    """Run all atlas layers, each as soon as its inputs exist."""
     parser = argparse.ArgumentParser(description="Run all atlas extraction layers")
     parser.add_argument("--root", required=True, help="Project root directory")
     parser.add_argument("--output", required=True, help="Output directory for all JSON files")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Maximum number of layers run concurrently (default: CPU count)",
+    )
     args = parser.parse_args()
 
     root = Path(args.root).resolve()
@@ -81,7 +167,6 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     scripts_dir = Path(__file__).resolve().parent
-    python_dir = scripts_dir / "python"
 
     common_args = ["--root", str(root), "--output", str(output_dir)]
     total_start = time.monotonic()
@@ -97,81 +182,50 @@ def main():
     print(f"  OK manifest ({manifest['total_files']} files) in {manifest_elapsed:.1f}s")
     timings.append(("manifest", manifest_elapsed))
 
-    # --- Phase 2: layer1, layer2, layer4 ---
-    print("\nPhase 2: layer1, layer2, layer4 [full (with LSP)]")
-    layer2_timeout = 600
-
-    # layer1: repo surface
-    ok, elapsed = run_layer(str(python_dir / "repo_surface.py"), common_args, "layer1_repo_surface")
-    timings.append(("layer1_repo_surface", elapsed))
-    if not ok:
-        _abort("layer1_repo_surface", timings, total_start)
-
-    # layer2: ast bindings (full LSP build)
-    ok, elapsed = run_layer(
-        str(python_dir / "ast_bindings.py"),
-        common_args,
-        "layer2_ast_bindings",
-        timeout=layer2_timeout,
-    )
-    timings.append(("layer2_ast_bindings", elapsed))
-    if not ok:
-        _abort("layer2_ast_bindings", timings, total_start)
-
-    # layer4: runtime topology
-    layer4_script = python_dir / "runtime_topology.py"
-    if layer4_script.exists():
-        ok, elapsed = run_layer(str(layer4_script), common_args, "layer4_runtime_topology")
-        timings.append(("layer4_runtime_topology", elapsed))
-        if not ok:
-            _abort("layer4_runtime_topology", timings, total_start)
-
-    # --- Phase 3: layer3, layer5, layer6 ---
-    print("\nPhase 3: layer3, layer5, layer6")
-    phase3_scripts = []
-    phase3_names = [
-        ("compile_deps", "layer3_compile_deps"),
-        ("api_contracts", "layer5_api_contracts"),
-        ("data_flow", "layer6_data_flow"),
-    ]
-    for script_name, label_name in phase3_names:
-        name = label_name
-        script = python_dir / f"{script_name}.py"
-        if script.exists():
-            phase3_scripts.append((str(script), name))
-        else:
-            print(f"  SKIP {name} (script not found)")
-
-    for script, label in phase3_scripts:
-        ok, elapsed = run_layer(script, common_args, label)
-        timings.append((label, elapsed))
-        if not ok:
-            _abort(label, timings, total_start)
-
-    # --- Phase 4: layer7 ---
-    print("\nPhase 4: layer7")
-    layer7_script = str(python_dir / "service_components.py")
-    ok, elapsed = run_layer(layer7_script, common_args, "layer7_service_components")
-    timings.append(("layer7_service_components", elapsed))
-    if not ok:
-        _abort("layer7_service_components", timings, total_start)
-
-    # --- Phase 5: layer8 ---
-    print("\nPhase 5: layer8")
-    layer8_script = str(python_dir / "user_journeys.py")
-    ok, elapsed = run_layer(layer8_script, common_args, "layer8_user_journeys", timeout=600)
-    timings.append(("layer8_user_journeys", elapsed))
-    if not ok:
-        _abort("layer8_user_journeys", timings, total_start)
-
-    # --- Phase 6: cross-layer checks ---
-    print("\nPhase 6: cross_layer_checks")
-    checks_script = str(scripts_dir / "cross_layer_checks.py")
-    ok, elapsed = run_layer(checks_script, ["--output", str(output_dir)], "cross_layer_checks")
-    timings.append(("cross_layer_checks", elapsed))
-    if not ok:
-        # Cross-layer check failures are warnings, not fatal
-        print("  (cross-layer check failures are non-fatal)")
+    # --- Layers, in dependency order ---
+    print(f"\nLayers (up to {args.jobs} concurrent) [full (with LSP)]")
+    pending = list(LAYERS)
+    done: set[str] = set()
+    running: dict[Future, Layer] = {}
+    failed: str | None = None
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        while True:
+            # Start every layer whose inputs exist (none after a failure)
+            ready = _ready_layers(pending, done) if failed is None else []
+            for layer in ready:
+                pending.remove(layer)
+                script = scripts_dir / layer.script
+                if not script.exists():
+                    _print_block([f"  SKIP {layer.label} (script not found)"])
+                    done.add(layer.label)
+                    continue
+                layer_args = ["--output", str(output_dir)] if layer.output_only else common_args
+                future = executor.submit(
+                    run_layer, str(script), layer_args, layer.label, layer.timeout
+                )
+                running[future] = layer
+
+            if not running:
+                # A skipped layer may have unblocked others
+                if failed is None and _ready_layers(pending, done):
+                    continue
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                layer = running.pop(future)
+                ok, elapsed = future.result()
+                timings.append((layer.label, elapsed))
+                if ok or not layer.fatal:
+                    if not ok:
+                        _print_block(["  (cross-layer check failures are non-fatal)"])
+                    done.add(layer.label)
+                elif failed is None:
+                    failed = layer.label
+
+    if failed is not None:
+        _abort(failed, timings, total_start)
 
     # --- Summary ---
     total_elapsed = time.monotonic() - total_start
@@ -193,6 +247,10 @@ def main():
     sys.exit(0)
 
 
+def _ready_layers(pending: list[Layer], done: set[str]) -> list[Layer]:
+    return [layer for layer in pending if all(dep in done for dep in layer.deps)]
+
+
 def _abort(failed_label: str, timings: list, total_start: float):
     """Print summary and abort on failure."""
     total_elapsed = time.monotonic() - total_start
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Code hierarchy build benchmark for blarify's ProjectGraphCreator.
+
+Builds the hierarchy-only graph (folders, files, classes, functions) of a
+source tree with each worker count, checks that every run produces the same
+nodes and relationships as the serial build and reports files per second.
+No language servers are started.
+
+Usage:
+    python scripts/blarify_parse_benchmark.py [--root PATH] [--workers 1 4 8]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from amplihack.vendor.blarify.graph.graph import Graph
+from amplihack.vendor.blarify.graph.node import NodeLabels
+from amplihack.vendor.blarify.project_file_explorer import ProjectFilesIterator
+from amplihack.vendor.blarify.project_graph_creator import ProjectGraphCreator
+
+NAMES_TO_SKIP = ["__pycache__", "node_modules", ".git", "venv", ".venv"]
+
+
+class NoReferences:
+    """Stand-in reference resolver; the hierarchy build only initializes directories."""
+
+    def initialize_directory(self, file) -> None:
+        pass
+
+
+def build(root: str, workers: int) -> tuple[float, Graph]:
+    creator = ProjectGraphCreator(
+        root_path=root,
+        reference_query_helper=NoReferences(),
+        project_files_iterator=ProjectFilesIterator(root_path=root, names_to_skip=NAMES_TO_SKIP),
+        parse_workers=workers,
+    )
+    start = time.perf_counter()
+    graph = creator.build_hierarchy_only()
+    return time.perf_counter() - start, graph
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", default=str(Path(__file__).parent.parent / "src" / "amplihack"))
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    root = str(Path(args.root).resolve())
+    _, reference = build(root, 1)
+    expected_nodes = reference.get_nodes_as_objects()
+    expected_relationships = reference.get_relationships_as_objects()
+    files = len(reference.get_nodes_by_label(NodeLabels.FILE.value))
+    print(f"{files} files, {len(expected_nodes)} nodes")
+
+    print(f"{'workers':>8}{'seconds':>10}{'files/s':>10}")
+    for workers in args.workers:
+        elapsed, graph = build(root, workers)
+        if (
+            graph.get_nodes_as_objects() != expected_nodes
+            or graph.get_relationships_as_objects() != expected_relationships
+        ):
+            sys.exit(f"graph built with {workers} workers differs from the serial build")
+        print(f"{workers:>8}{elapsed:>10.2f}{files / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Federated query latency benchmark for InMemoryHiveGraph trees.
+
+Builds a root hive with --groups group hives (each with --subgroups children)
+whose local queries sleep --latency-ms, standing in for remote backends, then
+times query_federated from the root with each worker count. Every run must
+return the same facts as the sequential walk (--workers 0).
+
+Usage:
+    python scripts/hive_federated_query_benchmark.py [--groups 100] [--workers 0 16 128]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from amplihack.agents.goal_seeking.hive_mind.hive_graph import HiveFact, InMemoryHiveGraph
+
+TOPICS = ["orbit", "tide", "basalt", "enzyme", "lattice", "plasma", "delta", "glacier"]
+
+
+class RemoteHive(InMemoryHiveGraph):
+    """In-memory hive with a fixed per-query latency."""
+
+    def __init__(self, hive_id: str, latency: float, **kwargs) -> None:
+        super().__init__(hive_id, **kwargs)
+        self.latency = latency
+
+    def query_facts(self, query: str, limit: int = 20) -> list[HiveFact]:
+        time.sleep(self.latency)
+        return super().query_facts(query, limit)
+
+
+def build(groups: int, subgroups: int, latency: float, workers: int) -> InMemoryHiveGraph:
+    root = RemoteHive("root", latency, federated_workers=workers, federated_timeout=None)
+    hives = [root]
+    for g in range(groups):
+        group = RemoteHive(f"group-{g}", latency, federated_workers=workers)
+        root.add_child(group)
+        group.set_parent(root)
+        hives.append(group)
+        for s in range(subgroups):
+            sub = RemoteHive(f"group-{g}-{s}", latency, federated_workers=workers)
+            group.add_child(sub)
+            sub.set_parent(group)
+            hives.append(sub)
+    for i, hive in enumerate(hives):
+        topic = TOPICS[i % len(TOPICS)]
+        hive.register_agent(f"{hive.hive_id}-agent", domain=topic)
+        for j in range(5):
+            hive.promote_fact(
+                f"{hive.hive_id}-agent",
+                HiveFact(
+                    fact_id="",
+                    content=f"{topic} measurement {j} from {hive.hive_id}",
+                    concept=topic,
+                    confidence=0.5 + 0.1 * j,
+                ),
+            )
+    return root
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=100)
+    parser.add_argument("--subgroups", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 16, 128])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    hives = 1 + args.groups * (1 + args.subgroups)
+    print(f"{hives} hives, {args.latency_ms:.1f}ms per local query")
+    query = "orbit tide measurement"
+    expected = None
+    print(f"{'workers':>8}{'ms/query':>12}")
+    for workers in args.workers:
+        root = build(args.groups, args.subgroups, args.latency_ms / 1000, workers)
+        answer = [(f.content, f.confidence) for f in root.query_federated(query, limit=50)]
+        if expected is None:
+            expected = answer
+        elif answer != expected:
+            sys.exit(f"workers={workers} returned different facts than workers={args.workers[0]}")
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            root.query_federated(query, limit=50)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        print(f"{workers:>8}{elapsed * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Registration and gossip-round scaling benchmark for UnifiedHiveMind.
+
+For each agent count, registers the agents, promotes facts to the shared hive
+and runs gossip rounds, then repeats the same work the way UnifiedHiveMind
+did before the shared PeerRegistry: a fresh peer list for every orchestrator
+on each join and each round, list-based peer selection and query-based
+duplicate checks. Times are per agent, so flat numbers mean linear scaling.
+
+Usage:
+    python scripts/hive_gossip_scale_benchmark.py [--agents 250 500 1000] [--rounds 3]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from amplihack.agents.goal_seeking.hive_mind.unified import HiveMindConfig, UnifiedHiveMind
+
+
+class QueryOnlyPeer:
+    """Peer proxy without has_content, forcing the query-based duplicate check."""
+
+    def __init__(self, graph) -> None:
+        self._graph = graph
+
+    def __getattr__(self, name: str):
+        if name == "has_content":
+            raise AttributeError(name)
+        return getattr(self._graph, name)
+
+
+def legacy_peers(hive: UnifiedHiveMind, agent_id: str) -> list:
+    return [QueryOnlyPeer(g) for aid, g in hive._local_graphs.items() if aid != agent_id]
+
+
+def run(agents: int, rounds: int, facts: int, legacy: bool) -> tuple[float, float]:
+    random.seed(0)
+    hive = UnifiedHiveMind(HiveMindConfig(gossip_interval_rounds=10**9))
+    start = time.perf_counter()
+    for i in range(agents):
+        hive.register_agent(f"agent-{i}")
+        if legacy:
+            for existing_id, orch in hive._orchestrators.items():
+                orch._peers = legacy_peers(hive, existing_id)
+    register_s = time.perf_counter() - start
+
+    for i in range(facts):
+        hive.promote_fact(f"agent-{i % agents}", f"shared observation {i} about sector {i % 17}")
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if legacy:
+            for agent_id, orch in hive._orchestrators.items():
+                orch._peers = legacy_peers(hive, agent_id)
+        hive.run_gossip_round()
+    gossip_s = (time.perf_counter() - start) / rounds
+    return register_s, gossip_s
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, nargs="+", default=[250, 500, 1000])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--facts", type=int, default=20)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    print(
+        f"{'agents':>7}{'register us/agent':>19}{'gossip us/agent':>17}"
+        f"{'legacy register':>17}{'legacy gossip':>15}"
+    )
+    for agents in args.agents:
+        register_s, gossip_s = run(agents, args.rounds, args.facts, legacy=False)
+        row = f"{agents:>7}{register_s / agents * 1e6:>19.0f}{gossip_s / agents * 1e6:>17.0f}"
+        if not args.skip_legacy:
+            legacy_register_s, legacy_gossip_s = run(agents, args.rounds, args.facts, legacy=True)
+            row += (
+                f"{legacy_register_s / agents * 1e6:>17.0f}{legacy_gossip_s / agents * 1e6:>15.0f}"
+            )
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
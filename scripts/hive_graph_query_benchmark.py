@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Query latency benchmark for InMemoryHiveGraph's edge and embedding indexes.
+
+Builds a hive with random facts, embeddings and edges, then times vector
+queries, get_edges and check_contradictions against a reference linear scan
+(the pre-index algorithm: cosine in Python and a full edge scan per fact)
+after checking both return the same results. Needs numpy.
+
+Usage:
+    python scripts/hive_graph_query_benchmark.py [--facts 10000] [--edges 50000]
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from amplihack.agents.goal_seeking.hive_mind.constants import DEFAULT_CONTRADICTION_OVERLAP
+from amplihack.agents.goal_seeking.hive_mind.hive_graph import (
+    HiveEdge,
+    HiveFact,
+    InMemoryHiveGraph,
+    _word_overlap,
+)
+from amplihack.agents.goal_seeking.hive_mind.reranker import hybrid_score_weighted
+
+EDGE_TYPES = ["CONFIRMED_BY", "CONTRADICTS", "PROMOTED"]
+
+
+class HashEmbedder:
+    """Deterministic random unit-free vectors seeded by the text."""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+
+    def embed(self, text: str) -> np.ndarray:
+        seed = int.from_bytes(text.encode()[:8].ljust(8, b"\0"), "little") ^ len(text)
+        return np.random.default_rng(seed).standard_normal(self.dimension).astype(np.float32)
+
+
+def build(facts: int, edges: int, dimension: int) -> InMemoryHiveGraph:
+    rng = random.Random(0)
+    hive = InMemoryHiveGraph("bench", embedding_generator=HashEmbedder(dimension))
+    for agent in range(20):
+        hive.register_agent(f"agent-{agent}", domain="bench", trust=rng.uniform(0.5, 2.0))
+    fact_ids = [
+        hive.promote_fact(
+            f"agent-{i % 20}",
+            HiveFact(
+                fact_id=f"f{i}",
+                content=f"fact {i} about topic{i % 50} detail{i % 7}",
+                concept=f"concept{i % 100}",
+                confidence=rng.choice([0.6, 0.8, 0.9]),
+            ),
+        )
+        for i in range(facts)
+    ]
+    for _ in range(edges):
+        hive.add_edge(HiveEdge(rng.choice(fact_ids), rng.choice(fact_ids), rng.choice(EDGE_TYPES)))
+    return hive
+
+
+def reference_vector_query(hive: InMemoryHiveGraph, query: str, limit: int) -> list[HiveFact]:
+    query_vec = hive._embedding_generator.embed(query).tolist()
+    scored = []
+    for fact in hive._facts.values():
+        if fact.status == "retracted" or fact.fact_id not in hive._embeddings:
+            continue
+        fact_vec = hive._embeddings[fact.fact_id]
+        dot = sum(x * y for x, y in zip(query_vec, fact_vec, strict=True))
+        norms = math.sqrt(sum(x * x for x in query_vec)) * math.sqrt(sum(x * x for x in fact_vec))
+        confirmations = sum(
+            1 for e in hive._edges if e.target_id == fact.fact_id and e.edge_type == "CONFIRMED_BY"
+        )
+        score = hybrid_score_weighted(
+            semantic_similarity=dot / norms if norms else 0.0,
+            confirmation_count=confirmations,
+            source_trust=hive._agents[fact.source_agent].trust,
+        )
+        scored.append((score, fact))
+    scored.sort(key=lambda x: (-x[0], -x[1].confidence))
+    return [f for _, f in scored[:limit]]
+
+
+def reference_get_edges(hive: InMemoryHiveGraph, node_id: str) -> list[HiveEdge]:
+    return [e for e in hive._edges if node_id in (e.source_id, e.target_id)]
+
+
+def reference_contradictions(hive: InMemoryHiveGraph, content: str, concept: str) -> list:
+    return [
+        f
+        for f in hive._facts.values()
+        if f.concept.lower() == concept.lower()
+        and f.status != "retracted"
+        and f.content != content
+        and _word_overlap(content, f.content) > DEFAULT_CONTRADICTION_OVERLAP
+    ]
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--facts", type=int, default=10_000)
+    parser.add_argument("--edges", type=int, default=50_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--reference-repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    hive = build(args.facts, args.edges, args.dimension)
+    print(
+        f"{args.facts} facts, {args.edges} edges, dim {args.dimension} "
+        f"(built in {time.perf_counter() - start:.1f}s)"
+    )
+
+    query, content, concept = "fact about topic7 detail3", "fact 7 about topic7 detail0", "concept7"
+    cases = [
+        (
+            "vector query (top 10)",
+            lambda: hive.query_facts(query, limit=10),
+            lambda: reference_vector_query(hive, query, 10),
+        ),
+        ("get_edges", lambda: hive.get_edges("f7"), lambda: reference_get_edges(hive, "f7")),
+        (
+            "check_contradictions",
+            lambda: hive.check_contradictions(content, concept),
+            lambda: reference_contradictions(hive, content, concept),
+        ),
+    ]
+
+    print(f"{'operation':<24}{'indexed ms':>12}{'scan ms':>12}{'speedup':>10}")
+    for name, indexed, reference in cases:
+        if [id(x) for x in indexed()] != [id(x) for x in reference()]:
+            sys.exit(f"{name}: indexed result differs from the reference scan")
+        indexed_s = timed(indexed, 20)
+        reference_s = timed(reference, args.reference_repeat)
+        print(
+            f"{name:<24}{indexed_s * 1000:>12.3f}{reference_s * 1000:>12.1f}"
+            f"{reference_s / indexed_s:>10.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Throughput and tail-latency benchmark for RerankService.
+
+Runs --agents threads that each issue --requests rerank calls drawn from a
+pool of --queries queries with overlapping candidate sets, once through
+CrossEncoderReranker directly and once through a shared RerankService. The
+model is a stub whose predict holds one device lock for a fixed overhead plus
+a per-pair cost, like a single GPU. Both paths must rank every request the
+same way before anything is timed.
+
+Usage:
+    python scripts/hive_rerank_service_benchmark.py [--agents 16] [--requests 50]
+"""
+
+import argparse
+import hashlib
+import random
+import statistics
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from amplihack.agents.goal_seeking.hive_mind.reranker import CrossEncoderReranker, RerankService
+
+
+@dataclass
+class Fact:
+    content: str
+    confidence: float = 0.5
+
+
+class StubModel:
+    """predict costs overhead + per-pair time under a single device lock."""
+
+    def __init__(self, overhead: float, per_pair: float) -> None:
+        self.overhead = overhead
+        self.per_pair = per_pair
+        self.device = threading.Lock()
+
+    def predict(self, pairs):
+        with self.device:
+            time.sleep(self.overhead + self.per_pair * len(pairs))
+        return [
+            int.from_bytes(hashlib.md5(f"{q}|{c}".encode()).digest()[:4], "little") / 2**32
+            for q, c in pairs
+        ]
+
+
+def make_reranker(model: StubModel) -> CrossEncoderReranker:
+    reranker = CrossEncoderReranker.__new__(CrossEncoderReranker)
+    reranker._model = model
+    reranker._model_name = "stub"
+    return reranker
+
+
+def workload(queries: int, candidates: int, corpus: int, seed: int) -> list[tuple[str, list]]:
+    rng = random.Random(seed)
+    facts = [Fact(f"fact {i} about topic {i % 40}") for i in range(corpus)]
+    return [(f"query {q}", rng.sample(facts, candidates)) for q in range(queries)]
+
+
+def run(rerank, agents: int, requests: int, pool: list) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def agent(seed: int) -> None:
+        rng = random.Random(seed)
+        local = []
+        for _ in range(requests):
+            query, facts = rng.choice(pool)
+            start = time.perf_counter()
+            rerank(query, facts, limit=10)
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=agent, args=(i,)) for i in range(agents)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--candidates", type=int, default=50)
+    parser.add_argument("--corpus", type=int, default=500)
+    parser.add_argument("--overhead-ms", type=float, default=5.0)
+    parser.add_argument("--per-pair-ms", type=float, default=0.05)
+    args = parser.parse_args()
+
+    pool = workload(args.queries, args.candidates, args.corpus, seed=0)
+
+    def model() -> StubModel:
+        return StubModel(args.overhead_ms / 1000, args.per_pair_ms / 1000)
+
+    for query, facts in pool[:10]:
+        direct = make_reranker(model()).rerank(query, facts, limit=10)
+        shared = RerankService(make_reranker(model())).rerank(query, facts, limit=10)
+        if [(id(s.fact), s.score) for s in direct] != [(id(s.fact), s.score) for s in shared]:
+            sys.exit(f"RerankService ranked {query!r} differently from CrossEncoderReranker")
+
+    service = RerankService(make_reranker(model()))
+    cases = [
+        ("direct", make_reranker(model()).rerank),
+        ("service", service.rerank),
+    ]
+    total = args.agents * args.requests
+    print(f"{args.agents} agents x {args.requests} requests, {args.candidates} candidates each")
+    print(f"{'path':<10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, rerank in cases:
+        elapsed, latencies = run(rerank, args.agents, args.requests, pool)
+        cuts = statistics.quantiles(latencies, n=100)
+        print(f"{name:<10}{total / elapsed:>10.0f}{cuts[49] * 1000:>10.1f}{cuts[98] * 1000:>10.1f}")
+    stats = service.get_stats()
+    print(
+        f"service: {stats['predict_calls']} predict calls, "
+        f"cache hit rate {stats['cache_hit_rate']:.0%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Multi-threaded retrieval benchmark for MemoryDatabase.
+
+Populates a temporary database, then has N threads issue retrieve_memories
+and get_memory_by_id calls for a fixed time and reports queries per second
+for each thread count. Run it on two checkouts to compare implementations.
+
+Usage:
+    python scripts/memory_database_benchmark.py [--memories N] [--seconds S]
+        [--threads 1 2 4 8]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from amplihack.memory.database import MemoryDatabase
+from amplihack.memory.models import MemoryEntry, MemoryQuery, MemoryType
+
+SESSIONS = [f"bench-session-{i}" for i in range(20)]
+
+
+def populate(db: MemoryDatabase, count: int) -> list[str]:
+    ids = []
+    now = datetime.now()
+    for i in range(count):
+        memory = MemoryEntry(
+            id=str(uuid.uuid4()),
+            session_id=SESSIONS[i % len(SESSIONS)],
+            agent_id=f"agent-{i % 5}",
+            memory_type=MemoryType.CONTEXT if i % 2 else MemoryType.LEARNING,
+            title=f"Memory {i}",
+            content=f"Benchmark memory {i} about topic {i % 37} " * 8,
+            metadata={"index": i},
+            importance=i % 10 + 1,
+            created_at=now - timedelta(minutes=i),
+            accessed_at=now - timedelta(minutes=i),
+        )
+        db.store_memory(memory)
+        ids.append(memory.id)
+    return ids
+
+
+def measure(db: MemoryDatabase, ids: list[str], threads: int, seconds: float) -> float:
+    counts = [0] * threads
+    stop = threading.Event()
+
+    def worker(slot: int) -> None:
+        rng = random.Random(slot)
+        while not stop.is_set():
+            if rng.random() < 0.5:
+                query = MemoryQuery(session_id=rng.choice(SESSIONS), min_importance=5, limit=20)
+                db.retrieve_memories(query)
+            else:
+                db.get_memory_by_id(rng.choice(ids))
+            counts[slot] += 1
+
+    workers = [threading.Thread(target=worker, args=(slot,)) for slot in range(threads)]
+    for thread in workers:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in workers:
+        thread.join()
+    return sum(counts) / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--memories", type=int, default=5000)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = MemoryDatabase(Path(temp_dir) / "bench.db")
+        ids = populate(db, args.memories)
+        print(f"{'threads':>8}{'queries/s':>12}")
+        for threads in args.threads:
+            print(f"{threads:>8}{measure(db, ids, threads, args.seconds):>12.0f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
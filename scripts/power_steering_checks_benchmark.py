@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Per-check timing benchmark for the power-steering heuristic checkers.
+
+Runs every heuristic _check_* method named in considerations.yaml against each
+transcript twice: once with the transcript features extracted a single time
+and shared by all checks (how a stop runs them), and once with the features
+cache dropped before every check, so each check pays for its own pass over
+the messages. Both runs must reach the same verdicts before timings are
+printed. Transcripts are recorded session JSONL files, or a synthetic session
+of --messages messages when none are given.
+
+Usage:
+    python scripts/power_steering_checks_benchmark.py [session.jsonl ...] [--messages 20000]
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HOOKS_DIR = Path(__file__).parent.parent / "docs" / "claude" / "tools" / "amplihack" / "hooks"
+sys.path.insert(0, str(HOOKS_DIR))
+
+from power_steering_checker import PowerSteeringChecker
+
+# Delegate to the SDK / compaction validator rather than reading the transcript
+SKIPPED_CHECKERS = {"_check_workflow_invocation", "_check_compaction_handling"}
+
+COMMANDS = [
+    "git status",
+    "pytest -q tests/",
+    "ruff check .",
+    "git commit -m 'wip'",
+    "git push -u origin feat/thing",
+    "gh pr create --title 'Summary' --body 'Test plan'",
+    "ls -la",
+]
+PATHS = ["src/app.py", "tests/test_app.py", "docs/guide.md", "README.md", ".claude/commands/x.md"]
+TEXTS = [
+    "Running the tests now.",
+    "CI is passing and the PR is mergeable.",
+    "Next steps:\n- wait for review",
+    "Implemented the change successfully.",
+]
+RESULTS = ["12 passed in 0.4s", "On branch feat/thing", "Your branch is up to date", "OK"]
+
+
+def synthetic_session(messages: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    transcript: list[dict] = [{"type": "user", "message": {"content": "Add a new feature"}}]
+    while len(transcript) < messages:
+        tool_id = f"toolu_{len(transcript)}"
+        kind = rng.random()
+        if kind < 0.4:
+            block = {
+                "type": "tool_use",
+                "id": tool_id,
+                "name": "Bash",
+                "input": {"command": rng.choice(COMMANDS)},
+            }
+        elif kind < 0.7:
+            block = {
+                "type": "tool_use",
+                "id": tool_id,
+                "name": rng.choice(["Write", "Edit"]),
+                "input": {"file_path": rng.choice(PATHS), "content": "x = 1\n" * 20},
+            }
+        elif kind < 0.8:
+            statuses = ["completed", "completed", "in_progress"]
+            block = {
+                "type": "tool_use",
+                "id": tool_id,
+                "name": "TodoWrite",
+                "input": {"todos": [{"content": "step", "status": s} for s in statuses]},
+            }
+        else:
+            block = {"type": "text", "text": rng.choice(TEXTS)}
+        transcript.append({"type": "assistant", "message": {"content": [block]}})
+        if block["type"] == "tool_use":
+            result = [{"type": "tool_result", "content": rng.choice(RESULTS)}]
+            transcript.append(
+                {"type": "tool_result", "message": {"tool_use_id": tool_id, "content": result}}
+            )
+    return transcript
+
+
+def load_session(path: Path) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def run_checks(
+    checker: PowerSteeringChecker, checkers: list[str], transcript: list[dict], shared: bool
+) -> tuple[dict[str, bool], dict[str, float]]:
+    verdicts: dict[str, bool] = {}
+    timings: dict[str, float] = {}
+    checker._features_cache = None
+    for name in checkers:
+        if not shared:
+            checker._features_cache = None
+        start = time.perf_counter()
+        verdicts[name] = getattr(checker, name)(transcript, "benchmark")
+        timings[name] = time.perf_counter() - start
+    return verdicts, timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("transcripts", nargs="*", type=Path)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    project_root = Path(tempfile.mkdtemp())
+    try:
+        amplihack_dir = project_root / ".claude" / "tools" / "amplihack"
+        amplihack_dir.mkdir(parents=True)
+        shutil.copy(HOOKS_DIR.parent / "considerations.yaml", amplihack_dir)
+        checker = PowerSteeringChecker(project_root)
+        checkers = sorted(
+            {
+                c["checker"]
+                for c in checker.considerations
+                if c["checker"] not in SKIPPED_CHECKERS and hasattr(checker, c["checker"])
+            }
+        )
+
+        sessions = [(str(p), load_session(p)) for p in args.transcripts] or [
+            (f"synthetic ({args.messages} messages)", synthetic_session(args.messages, seed=0))
+        ]
+        for label, transcript in sessions:
+            shared_verdicts, _ = run_checks(checker, checkers, transcript, shared=True)
+            rescan_verdicts, _ = run_checks(checker, checkers, transcript, shared=False)
+            if shared_verdicts != rescan_verdicts:
+                sys.exit(f"{label}: shared features changed a verdict")
+
+            shared = dict.fromkeys(checkers, float("inf"))
+            rescan = dict.fromkeys(checkers, float("inf"))
+            for _ in range(args.repeat):
+                for best, is_shared in ((shared, True), (rescan, False)):
+                    _, timings = run_checks(checker, checkers, transcript, shared=is_shared)
+                    for name, elapsed in timings.items():
+                        best[name] = min(best[name], elapsed)
+
+            print(f"{label}: {len(transcript)} messages, {len(checkers)} checks")
+            print(f"{'check':<38}{'verdict':>8}{'shared ms':>11}{'rescan ms':>11}")
+            for name in checkers:
+                print(
+                    f"{name:<38}{shared_verdicts[name]!s:>8}"
+                    f"{shared[name] * 1000:>11.2f}{rescan[name] * 1000:>11.2f}"
+                )
+            print(
+                f"{'total':<46}{sum(shared.values()) * 1000:>11.2f}"
+                f"{sum(rescan.values()) * 1000:>11.2f}"
+            )
+    finally:
+        shutil.rmtree(project_root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
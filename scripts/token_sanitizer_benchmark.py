@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for TokenSanitizer.
+
+Compares the prefiltered sanitizer with the naive loop that runs every
+pattern over every input, on three workloads: clean log lines, secret-dense
+text and a large nested JSON payload (via sanitize_dict). Outputs of the two
+implementations are checked for equality before timing.
+
+Usage:
+    python scripts/token_sanitizer_benchmark.py [--repeat N]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from amplihack.utils.token_sanitizer import TokenSanitizer
+
+_NAIVE_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in TokenSanitizer.PATTERNS
+]
+
+
+class NaiveSanitizer(TokenSanitizer):
+    """Reference implementation: every pattern over every string."""
+
+    @classmethod
+    def sanitize(cls, text):
+        if not isinstance(text, str):
+            return text
+        for compiled, replacement in _NAIVE_PATTERNS:
+            text = compiled.sub(replacement, text)
+        return text
+
+
+def clean_lines(count: int) -> list[str]:
+    return [
+        f"2026-01-01T00:00:{i % 60:02d} INFO worker-{i % 8} processed batch {i} in {i % 97}ms"
+        for i in range(count)
+    ]
+
+
+def secret_lines(count: int) -> list[str]:
+    templates = [
+        "Authorization: Bearer sk-proj-{i:020d}abcdef",
+        'payload {{"api_key": "key-{i}", "password": "hunter{i}"}}',
+        "using ghp_{i:030d} and AKIA{i:016d}",
+        "X-API-Key: secret{i}; token eyJhbGci{i}.eyJzdWIi{i}.sig{i}",
+    ]
+    return [templates[i % len(templates)].format(i=i) for i in range(count)]
+
+
+def json_payload(count: int) -> dict:
+    return {
+        "sessions": [
+            {
+                "id": f"session-{i}",
+                "messages": [
+                    {"role": "user", "content": f"step {j} of task {i}"} for j in range(5)
+                ],
+                "config": {"token": f"ghp_{i:030d}"} if i % 50 == 0 else {"retries": i % 3},
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(repeat: int) -> None:
+    workloads = {
+        "clean text (20k lines)": ("lines", clean_lines(20000)),
+        "secret-dense text (20k lines)": ("lines", secret_lines(20000)),
+        "large JSON payload (2k sessions)": ("dict", json_payload(2000)),
+    }
+
+    print(f"{'workload':<36}{'naive':>10}{'current':>10}{'speedup':>10}")
+    for name, (kind, data) in workloads.items():
+        if kind == "lines":
+
+            def call(cls, data=data):
+                return [cls.sanitize(line) for line in data]
+        else:
+
+            def call(cls, data=data):
+                return cls.sanitize_dict(data)
+
+        expected = json.dumps(call(NaiveSanitizer))
+        if json.dumps(call(TokenSanitizer)) != expected:
+            raise SystemExit(f"Output mismatch on workload: {name}")
+
+        naive = _time(lambda: call(NaiveSanitizer), repeat)
+        current = _time(lambda: call(TokenSanitizer), repeat)
+        print(f"{name:<36}{naive * 1000:>8.1f}ms{current * 1000:>8.1f}ms{naive / current:>9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per workload")
+    args = parser.parse_args()
+    run(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
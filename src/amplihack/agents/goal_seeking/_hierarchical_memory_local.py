@@ -817,8 +817,8 @@ class HierarchicalMemory:
         """Retrieve a knowledge subgraph relevant to a query.
 
         Algorithm:
-        1. Keyword search for seed nodes (CONTAINS on content/concept)
-        2. Expand via SIMILAR_TO edges (1-2 hops)
+        1. Keyword search for seed nodes (one query, capped per keyword)
+        2. Expand via SIMILAR_TO edges (1-2 hops, one query for all seeds)
         3. Rank by confidence * keyword_relevance
         4. Return subgraph with nodes and edges
 
@@ -850,122 +850,92 @@ class HierarchicalMemory:
                 seen_ids.add(node.node_id)
                 seed_nodes.append(node)
 
-        for keyword in keywords:
-            if len(keyword) <= 2:
-                continue
+        # One query for all keywords instead of one per keyword. Matches are
+        # capped per keyword, as the former per-keyword LIMIT did, so a frequent
+        # keyword cannot crowd out the matches for a rare one.
+        search_keywords = list(dict.fromkeys(kw for kw in keywords if len(kw) > 2))
+        if search_keywords:
             try:
                 result = self.connection.execute(
                     """
+                    UNWIND $keywords AS kw
                     MATCH (m:SemanticMemory)
                     WHERE m.agent_id = $agent_id
-                      AND (LOWER(m.content) CONTAINS $keyword
-                           OR LOWER(m.concept) CONTAINS $keyword)
+                      AND (LOWER(m.content) CONTAINS kw OR LOWER(m.concept) CONTAINS kw)
+                    WITH kw, collect(m) AS matches
+                    UNWIND matches[1:$limit] AS m
                     RETURN m.memory_id, m.concept, m.content, m.confidence,
-                           m.source_id, m.tags, m.metadata, m.created_at
-                    LIMIT $limit
+                           m.source_id, m.tags, m.metadata, m.created_at, kw
                     """,
                     {
                         "agent_id": self.agent_name,
-                        "keyword": keyword,
+                        "keywords": search_keywords,
                         "limit": keyword_limit,
                     },
                 )
 
+                rows = []
                 while result.has_next():
-                    row = result.get_next()
-                    nid = row[0]
-                    if nid not in seen_ids:
-                        seen_ids.add(nid)
-                        tags = json.loads(row[5]) if row[5] else []
-                        metadata = json.loads(row[6]) if row[6] else {}
-                        node = KnowledgeNode(
-                            node_id=nid,
-                            category=MemoryCategory.SEMANTIC,
-                            content=row[2],
-                            concept=row[1],
-                            confidence=row[3],
-                            source_id=row[4] or "",
-                            created_at=row[7] or "",
-                            tags=tags,
-                            metadata=metadata,
-                        )
-                        seed_nodes.append(node)
+                    rows.append(result.get_next())
+                # Seed in keyword order, as the per-keyword queries did
+                rows.sort(key=lambda row: search_keywords.index(row[8]))
+                for row in rows:
+                    if row[0] not in seen_ids:
+                        seen_ids.add(row[0])
+                        seed_nodes.append(self._semantic_node_from_row(row))
             except Exception as e:
-                logger.debug("Keyword search failed for '%s': %s", keyword, e)
+                logger.debug("Keyword search failed for %s: %s", search_keywords, e)
 
-        # Step 2: Expand via SIMILAR_TO edges
+        # Step 2: Expand via SIMILAR_TO edges (one query over the whole seed set)
         expanded_nodes: list[KnowledgeNode] = []
         edges: list[KnowledgeEdge] = []
 
+        rows_by_seed = self._fetch_similar_neighbours(
+            [seed.node_id for seed in seed_nodes] if len(seen_ids) < max_nodes else [],
+            max_depth,
+        )
+
         for seed in seed_nodes:
             if len(seen_ids) >= max_nodes:
                 break
-            try:
-                hop_query = """
-                    MATCH (a:SemanticMemory {memory_id: $sid})-[r:SIMILAR_TO]->(b:SemanticMemory)
-                    WHERE b.agent_id = $agent_id
-                    RETURN b.memory_id, b.concept, b.content, b.confidence,
-                           b.source_id, b.tags, b.created_at, r.weight, b.metadata,
-                           r.metadata
-                """
-                if max_depth >= 2:
-                    # Also get 2-hop neighbors
-                    hop_query += """
-                    UNION ALL
-                    MATCH (a:SemanticMemory {memory_id: $sid})-[:SIMILAR_TO]->()-[r2:SIMILAR_TO]->(c:SemanticMemory)
-                    WHERE c.agent_id = $agent_id AND c.memory_id <> $sid
-                    RETURN c.memory_id, c.concept, c.content, c.confidence,
-                           c.source_id, c.tags, c.created_at, r2.weight, c.metadata,
-                           r2.metadata
-                    """
-
-                result = self.connection.execute(
-                    hop_query,
-                    {"sid": seed.node_id, "agent_id": self.agent_name},
-                )
+            for row in rows_by_seed.get(seed.node_id, []):
+                nid = row[0]
+                weight = row[7]
 
-                while result.has_next():
-                    row = result.get_next()
-                    nid = row[0]
-                    weight = row[7]
-
-                    if nid not in seen_ids and len(seen_ids) < max_nodes:
-                        seen_ids.add(nid)
-                        tags = json.loads(row[5]) if row[5] else []
-                        metadata = json.loads(row[8]) if len(row) > 8 and row[8] else {}
-                        node = KnowledgeNode(
-                            node_id=nid,
-                            category=MemoryCategory.SEMANTIC,
-                            content=row[2],
-                            concept=row[1],
-                            confidence=row[3],
-                            source_id=row[4] or "",
-                            created_at=row[6] or "",
-                            tags=tags,
-                            metadata=metadata,
-                        )
-                        expanded_nodes.append(node)
+                if nid not in seen_ids and len(seen_ids) < max_nodes:
+                    seen_ids.add(nid)
+                    tags = json.loads(row[5]) if row[5] else []
+                    metadata = json.loads(row[8]) if len(row) > 8 and row[8] else {}
+                    node = KnowledgeNode(
+                        node_id=nid,
+                        category=MemoryCategory.SEMANTIC,
+                        content=row[2],
+                        concept=row[1],
+                        confidence=row[3],
+                        source_id=row[4] or "",
+                        created_at=row[6] or "",
+                        tags=tags,
+                        metadata=metadata,
+                    )
+                    expanded_nodes.append(node)
 
-                    # Parse edge metadata for contradiction info
-                    edge_meta = {}
-                    if len(row) > 9 and row[9]:
-                        try:
-                            edge_meta = json.loads(row[9])
-                        except (json.JSONDecodeError, TypeError):
-                            pass
+                # Parse edge metadata for contradiction info
+                edge_meta = {}
+                if len(row) > 9 and row[9]:
+                    try:
+                        edge_meta = json.loads(row[9])
+                    except (json.JSONDecodeError, TypeError):
+                        pass
 
-                    edges.append(
-                        KnowledgeEdge(
-                            source_id=seed.node_id,
-                            target_id=nid,
-                            relationship="SIMILAR_TO",
-                            weight=weight,
-                            metadata=edge_meta,
-                        )
+                edges.append(
+                    KnowledgeEdge(
+                        source_id=seed.node_id,
+                        target_id=nid,
+                        relationship="SIMILAR_TO",
+                        weight=weight,
+                        metadata=edge_meta,
                     )
-
-            except Exception as e:
-                logger.debug("Similarity expansion failed for %s: %s", seed.node_id, e)
+                )
 
         # Step 3: Combine and rank by confidence * keyword relevance
         all_nodes = seed_nodes + expanded_nodes
@@ -999,6 +969,79 @@ class HierarchicalMemory:
 
         return subgraph
 
+    @staticmethod
+    def _semantic_node_from_row(row: list[Any]) -> KnowledgeNode:
+        """Build a KnowledgeNode from a standard SemanticMemory projection.
+
+        Expects columns in the order: memory_id, concept, content, confidence,
+        source_id, tags, metadata, created_at.
+        """
+        return KnowledgeNode(
+            node_id=row[0],
+            category=MemoryCategory.SEMANTIC,
+            content=row[2],
+            concept=row[1],
+            confidence=row[3],
+            source_id=row[4] or "",
+            created_at=row[7] or "",
+            tags=json.loads(row[5]) if row[5] else [],
+            metadata=json.loads(row[6]) if row[6] else {},
+        )
+
+    def _fetch_similar_neighbours(
+        self, seed_ids: list[str], max_depth: int
+    ) -> dict[str, list[list[Any]]]:
+        """Fetch SIMILAR_TO neighbours for a whole seed set in one query.
+
+        Args:
+            seed_ids: Seed node IDs to expand from
+            max_depth: 1 for direct neighbours, >= 2 to include 2-hop neighbours
+
+        Returns:
+            Mapping of seed ID to neighbour rows (memory_id, concept, content,
+            confidence, source_id, tags, created_at, weight, metadata,
+            edge_metadata), 1-hop rows before 2-hop rows.
+        """
+        rows_by_seed: dict[str, list[list[Any]]] = {}
+        if not seed_ids:
+            return rows_by_seed
+
+        hop_query = """
+            MATCH (a:SemanticMemory)-[r:SIMILAR_TO]->(b:SemanticMemory)
+            WHERE a.memory_id IN $sids AND b.agent_id = $agent_id
+            RETURN a.memory_id, 1 AS hop, b.memory_id, b.concept, b.content,
+                   b.confidence, b.source_id, b.tags, b.created_at, r.weight,
+                   b.metadata, r.metadata
+        """
+        if max_depth >= 2:
+            # Also get 2-hop neighbors
+            hop_query += """
+            UNION ALL
+            MATCH (a:SemanticMemory)-[:SIMILAR_TO]->()-[r2:SIMILAR_TO]->(c:SemanticMemory)
+            WHERE a.memory_id IN $sids AND c.agent_id = $agent_id
+              AND c.memory_id <> a.memory_id
+            RETURN a.memory_id, 2 AS hop, c.memory_id, c.concept, c.content,
+                   c.confidence, c.source_id, c.tags, c.created_at, r2.weight,
+                   c.metadata, r2.metadata
+            """
+
+        try:
+            result = self.connection.execute(
+                hop_query, {"sids": seed_ids, "agent_id": self.agent_name}
+            )
+            hop_rows: list[list[Any]] = []
+            while result.has_next():
+                hop_rows.append(result.get_next())
+        except Exception as e:
+            logger.debug("Similarity expansion failed for %d seeds: %s", len(seed_ids), e)
+            return rows_by_seed
+
+        # Stable sort keeps each seed's 1-hop neighbours ahead of its 2-hop ones
+        hop_rows.sort(key=lambda r: r[1])
+        for row in hop_rows:
+            rows_by_seed.setdefault(row[0], []).append(row[2:])
+        return rows_by_seed
+
     def _expand_transition_chains(
         self, nodes: list[KnowledgeNode], seen_ids: set[str]
     ) -> tuple[list[KnowledgeNode], list[KnowledgeEdge]]:
@@ -1006,7 +1049,8 @@ class HierarchicalMemory:
 
         For any node that participates in a transition chain, walks both
         directions (newer→older and older→newer) to pull in all chain
-        members not already in the result set.
+        members not already in the result set. Each direction, and the
+        final edge collection, is a single query over the whole node set.
 
         Args:
             nodes: Current result nodes to check for chain membership
@@ -1017,105 +1061,82 @@ class HierarchicalMemory:
         """
         new_nodes: list[KnowledgeNode] = []
         new_edges: list[KnowledgeEdge] = []
+        if not nodes:
+            return new_nodes, new_edges
 
-        for node in nodes:
-            try:
-                # Walk forward: this node → older nodes in chain
-                result = self.connection.execute(
-                    """
-                    MATCH (start:SemanticMemory {memory_id: $nid})-[r:TRANSITIONED_TO*1..10]->(older:SemanticMemory)
-                    RETURN older.memory_id, older.concept, older.content, older.confidence,
-                           older.source_id, older.tags, older.metadata, older.created_at,
-                           r
-                    """,
-                    {"nid": node.node_id},
-                )
-                while result.has_next():
-                    row = result.get_next()
-                    nid = row[0]
-                    if nid not in seen_ids:
-                        seen_ids.add(nid)
-                        tags = json.loads(row[5]) if row[5] else []
-                        metadata = json.loads(row[6]) if row[6] else {}
-                        new_nodes.append(
-                            KnowledgeNode(
-                                node_id=nid,
-                                category=MemoryCategory.SEMANTIC,
-                                content=row[2],
-                                concept=row[1],
-                                confidence=row[3],
-                                source_id=row[4] or "",
-                                created_at=row[7] or "",
-                                tags=tags,
-                                metadata=metadata,
-                            )
-                        )
+        node_ids = [n.node_id for n in nodes]
+        forward: dict[str, list[list[Any]]] = {}
+        backward: dict[str, list[list[Any]]] = {}
+        try:
+            # Walk forward: these nodes → older nodes in chain
+            result = self.connection.execute(
+                """
+                MATCH (start:SemanticMemory)-[r:TRANSITIONED_TO*1..10]->(older:SemanticMemory)
+                WHERE start.memory_id IN $nids
+                RETURN start.memory_id, older.memory_id, older.concept, older.content,
+                       older.confidence, older.source_id, older.tags, older.metadata,
+                       older.created_at
+                """,
+                {"nids": node_ids},
+            )
+            while result.has_next():
+                row = result.get_next()
+                forward.setdefault(row[0], []).append(row[1:])
 
-                # Walk backward: newer nodes → this node
-                result = self.connection.execute(
-                    """
-                    MATCH (newer:SemanticMemory)-[r:TRANSITIONED_TO*1..10]->(target:SemanticMemory {memory_id: $nid})
-                    RETURN newer.memory_id, newer.concept, newer.content, newer.confidence,
-                           newer.source_id, newer.tags, newer.metadata, newer.created_at,
-                           r
-                    """,
-                    {"nid": node.node_id},
-                )
-                while result.has_next():
-                    row = result.get_next()
-                    nid = row[0]
-                    if nid not in seen_ids:
-                        seen_ids.add(nid)
-                        tags = json.loads(row[5]) if row[5] else []
-                        metadata = json.loads(row[6]) if row[6] else {}
-                        new_nodes.append(
-                            KnowledgeNode(
-                                node_id=nid,
-                                category=MemoryCategory.SEMANTIC,
-                                content=row[2],
-                                concept=row[1],
-                                confidence=row[3],
-                                source_id=row[4] or "",
-                                created_at=row[7] or "",
-                                tags=tags,
-                                metadata=metadata,
-                            )
-                        )
+            # Walk backward: newer nodes → these nodes
+            result = self.connection.execute(
+                """
+                MATCH (newer:SemanticMemory)-[r:TRANSITIONED_TO*1..10]->(target:SemanticMemory)
+                WHERE target.memory_id IN $nids
+                RETURN target.memory_id, newer.memory_id, newer.concept, newer.content,
+                       newer.confidence, newer.source_id, newer.tags, newer.metadata,
+                       newer.created_at
+                """,
+                {"nids": node_ids},
+            )
+            while result.has_next():
+                row = result.get_next()
+                backward.setdefault(row[0], []).append(row[1:])
+        except Exception as e:
+            logger.debug("Transition chain expansion failed: %s", e)
 
-            except Exception as e:
-                logger.debug("Transition chain expansion failed for %s: %s", node.node_id[:8], e)
+        for node_id in node_ids:
+            for row in forward.get(node_id, []) + backward.get(node_id, []):
+                if row[0] not in seen_ids:
+                    seen_ids.add(row[0])
+                    new_nodes.append(self._semantic_node_from_row(row))
 
         # Collect TRANSITIONED_TO edges between all chain members
         all_ids = seen_ids
-        for node in nodes + new_nodes:
-            try:
-                result = self.connection.execute(
-                    """
-                    MATCH (a:SemanticMemory {memory_id: $nid})-[r:TRANSITIONED_TO]->(b:SemanticMemory)
-                    RETURN a.memory_id, b.memory_id, r.from_value, r.to_value,
-                           r.turn, r.transition_type
-                    """,
-                    {"nid": node.node_id},
-                )
-                while result.has_next():
-                    row = result.get_next()
-                    if row[0] in all_ids and row[1] in all_ids:
-                        new_edges.append(
-                            KnowledgeEdge(
-                                source_id=row[0],
-                                target_id=row[1],
-                                relationship="TRANSITIONED_TO",
-                                weight=1.0,
-                                metadata={
-                                    "from_value": row[2] or "",
-                                    "to_value": row[3] or "",
-                                    "turn": row[4] if row[4] is not None else 0,
-                                    "transition_type": row[5] or "",
-                                },
-                            )
+        try:
+            result = self.connection.execute(
+                """
+                MATCH (a:SemanticMemory)-[r:TRANSITIONED_TO]->(b:SemanticMemory)
+                WHERE a.memory_id IN $nids
+                RETURN a.memory_id, b.memory_id, r.from_value, r.to_value,
+                       r.turn, r.transition_type
+                """,
+                {"nids": node_ids + [n.node_id for n in new_nodes]},
+            )
+            while result.has_next():
+                row = result.get_next()
+                if row[0] in all_ids and row[1] in all_ids:
+                    new_edges.append(
+                        KnowledgeEdge(
+                            source_id=row[0],
+                            target_id=row[1],
+                            relationship="TRANSITIONED_TO",
+                            weight=1.0,
+                            metadata={
+                                "from_value": row[2] or "",
+                                "to_value": row[3] or "",
+                                "turn": row[4] if row[4] is not None else 0,
+                                "transition_type": row[5] or "",
+                            },
                         )
-            except Exception as e:
-                logger.debug("Failed to collect transition edges for %s: %s", node.node_id[:8], e)
+                    )
+        except Exception as e:
+            logger.debug("Failed to collect transition edges: %s", e)
 
         return new_nodes, new_edges
 
@@ -1150,50 +1171,43 @@ class HierarchicalMemory:
             words = query.lower().split()
             entity_candidates = [w.strip("'s") for w in words if len(w) > 3]
 
-        seen: set[str] = set()
-        for candidate in entity_candidates:
-            candidate_lower = candidate.lower()
-            if len(candidate_lower) <= 2:
-                continue
-            try:
-                result = self.connection.execute(
-                    """
-                    MATCH (m:SemanticMemory)
-                    WHERE m.agent_id = $agent_id
-                      AND LOWER(m.entity_name) CONTAINS $entity
-                    RETURN m.memory_id, m.concept, m.content, m.confidence,
-                           m.source_id, m.tags, m.metadata, m.created_at
-                    LIMIT $limit
-                    """,
-                    {
-                        "agent_id": self.agent_name,
-                        "entity": candidate_lower,
-                        "limit": limit,
-                    },
-                )
+        candidates = list(dict.fromkeys(c.lower() for c in entity_candidates if len(c) > 2))
+        if not candidates:
+            return nodes
 
-                while result.has_next():
-                    row = result.get_next()
-                    nid = row[0]
-                    if nid not in seen:
-                        seen.add(nid)
-                        tags = json.loads(row[5]) if row[5] else []
-                        metadata = json.loads(row[6]) if row[6] else {}
-                        nodes.append(
-                            KnowledgeNode(
-                                node_id=nid,
-                                category=MemoryCategory.SEMANTIC,
-                                content=row[2],
-                                concept=row[1],
-                                confidence=row[3],
-                                source_id=row[4] or "",
-                                created_at=row[7] or "",
-                                tags=tags,
-                                metadata=metadata,
-                            )
-                        )
-            except Exception as e:
-                logger.debug("Entity seed search failed for '%s': %s", candidate, e)
+        # One query for all candidates, capped per candidate like the former
+        # per-candidate LIMIT, so a common entity cannot crowd out the others
+        try:
+            result = self.connection.execute(
+                """
+                UNWIND $entities AS entity
+                MATCH (m:SemanticMemory)
+                WHERE m.agent_id = $agent_id
+                  AND LOWER(m.entity_name) CONTAINS entity
+                WITH entity, collect(m) AS matches
+                UNWIND matches[1:$limit] AS m
+                RETURN m.memory_id, m.concept, m.content, m.confidence,
+                       m.source_id, m.tags, m.metadata, m.created_at, entity
+                """,
+                {
+                    "agent_id": self.agent_name,
+                    "entities": candidates,
+                    "limit": limit,
+                },
+            )
+
+            rows = []
+            while result.has_next():
+                rows.append(result.get_next())
+            # Candidate order decides which matches survive the final cap
+            rows.sort(key=lambda row: candidates.index(row[8]))
+            seen: set[str] = set()
+            for row in rows:
+                if row[0] not in seen:
+                    seen.add(row[0])
+                    nodes.append(self._semantic_node_from_row(row))
+        except Exception as e:
+            logger.debug("Entity seed search failed for %s: %s", candidates, e)
 
         return nodes[:limit]
 
@@ -1213,15 +1227,18 @@ class HierarchicalMemory:
         try:
             # Batch query for all source labels at once
             label_map: dict[str, str] = {}
-            for sid in source_ids:
-                result = self.connection.execute(
-                    "MATCH (e:EpisodicMemory {memory_id: $eid}) RETURN e.memory_id, e.source_label",
-                    {"eid": sid},
-                )
-                if result.has_next():
-                    row = result.get_next()
-                    if row[1]:
-                        label_map[row[0]] = row[1]
+            result = self.connection.execute(
+                """
+                MATCH (e:EpisodicMemory)
+                WHERE e.memory_id IN $eids
+                RETURN e.memory_id, e.source_label
+                """,
+                {"eids": source_ids},
+            )
+            while result.has_next():
+                row = result.get_next()
+                if row[1]:
+                    label_map[row[0]] = row[1]
 
             # Apply labels to nodes
             for node in nodes:
@@ -1251,62 +1268,64 @@ class HierarchicalMemory:
             return
 
         for node in nodes:
-            try:
-                if node.metadata is None:
-                    node.metadata = {}
-
-                # Check if something newer supersedes this node (incoming edge)
-                has_newer = False
-                newer_id = ""
-                supersede_reason = ""
-                result = self.connection.execute(
-                    """
-                    MATCH (newer:SemanticMemory)-[r:SUPERSEDES]->(old:SemanticMemory {memory_id: $nid})
-                    RETURN newer.memory_id, r.reason, r.temporal_delta
-                    LIMIT 1
-                    """,
-                    {"nid": node.node_id},
-                )
-                if result.has_next():
-                    row = result.get_next()
-                    has_newer = True
-                    newer_id = row[0]
-                    supersede_reason = row[1] or ""
+            if node.metadata is None:
+                node.metadata = {}
+
+        node_ids = [n.node_id for n in nodes]
+        # newer_by_old: node_id -> (newer_id, reason) for incoming SUPERSEDES edges
+        newer_by_old: dict[str, tuple[str, str]] = {}
+        # has_older: node_ids with an outgoing SUPERSEDES edge
+        has_older: set[str] = set()
+        try:
+            result = self.connection.execute(
+                """
+                MATCH (newer:SemanticMemory)-[r:SUPERSEDES]->(old:SemanticMemory)
+                WHERE old.memory_id IN $nids
+                RETURN old.memory_id, newer.memory_id, r.reason
+                """,
+                {"nids": node_ids},
+            )
+            while result.has_next():
+                row = result.get_next()
+                newer_by_old.setdefault(row[0], (row[1], row[2] or ""))
 
-                # Check if this node supersedes something older (outgoing edge)
-                has_older = False
-                result = self.connection.execute(
-                    """
-                    MATCH (cur:SemanticMemory {memory_id: $nid})-[:SUPERSEDES]->(older:SemanticMemory)
-                    RETURN older.memory_id
-                    LIMIT 1
-                    """,
-                    {"nid": node.node_id},
-                )
-                if result.has_next():
-                    has_older = True
-
-                # Determine chain position
-                if has_newer and has_older:
-                    node.metadata["chain_position"] = "intermediate"
-                elif has_newer and not has_older:
-                    node.metadata["chain_position"] = "first"
-                elif not has_newer and has_older:
-                    node.metadata["chain_position"] = "latest"
-                # else: no chain involvement, no tag needed
-
-                if has_newer:
-                    node.metadata["superseded"] = True
-                    node.metadata["superseded_by"] = newer_id
-                    node.metadata["supersede_reason"] = supersede_reason
-                    # Slightly lower confidence for non-latest, but keep retrievable
-                    if node.metadata.get("chain_position") == "intermediate":
-                        node.confidence = max(0.3, node.confidence * 0.7)
-                    elif node.metadata.get("chain_position") == "first":
-                        node.confidence = max(0.2, node.confidence * 0.6)
+            result = self.connection.execute(
+                """
+                MATCH (cur:SemanticMemory)-[:SUPERSEDES]->(older:SemanticMemory)
+                WHERE cur.memory_id IN $nids
+                RETURN DISTINCT cur.memory_id
+                """,
+                {"nids": node_ids},
+            )
+            while result.has_next():
+                has_older.add(result.get_next()[0])
+        except Exception as e:
+            logger.debug("SUPERSEDES check skipped (table may not exist): %s", e)
+            return
 
-            except Exception as e:
-                logger.debug("SUPERSEDES check skipped (table may not exist): %s", e)
+        for node in nodes:
+            has_newer = node.node_id in newer_by_old
+            node_has_older = node.node_id in has_older
+
+            # Determine chain position
+            if has_newer and node_has_older:
+                node.metadata["chain_position"] = "intermediate"
+            elif has_newer and not node_has_older:
+                node.metadata["chain_position"] = "first"
+            elif not has_newer and node_has_older:
+                node.metadata["chain_position"] = "latest"
+            # else: no chain involvement, no tag needed
+
+            if has_newer:
+                newer_id, supersede_reason = newer_by_old[node.node_id]
+                node.metadata["superseded"] = True
+                node.metadata["superseded_by"] = newer_id
+                node.metadata["supersede_reason"] = supersede_reason
+                # Slightly lower confidence for non-latest, but keep retrievable
+                if node.metadata.get("chain_position") == "intermediate":
+                    node.confidence = max(0.3, node.confidence * 0.7)
+                elif node.metadata.get("chain_position") == "first":
+                    node.confidence = max(0.2, node.confidence * 0.6)
 
     @staticmethod
     def _extract_entity_name(content: str, concept: str) -> str:
@@ -57,6 +57,10 @@ CONFIRMATION_NORMALIZATION_DIVISOR = 5.0
 
 FEDERATED_QUERY_LIMIT_MULTIPLIER = 10
 FEDERATED_QUERY_MIN_LIMIT = 200
+FEDERATED_QUERY_MAX_WORKERS = 16  # Threads running federated branches, shared by all hives
+FEDERATED_QUERY_TIMEOUT_SECONDS = 30.0
+FEDERATED_QUERY_HOP_SLACK_SECONDS = 0.05  # Each hop's branches must answer this much earlier
+FEDERATED_ROUTE_CACHE_SIZE = 256  # Query fingerprints with cached child routing
 DOMAIN_ROUTING_PRIORITY_MULTIPLIER = 3
 RRF_K = 60
 FACT_ID_HEX_LENGTH = 12
@@ -78,6 +82,23 @@ DEFAULT_GOSSIP_TOP_K = 10
 DEFAULT_GOSSIP_FANOUT = 2
 GOSSIP_RELAY_AGENT_PREFIX = "__gossip_"
 
+# ---------------------------------------------------------------------------
+# Query expansion
+# ---------------------------------------------------------------------------
+
+QUERY_EXPANSION_CACHE_SIZE = 1024  # Normalized queries with cached LLM expansions
+QUERY_EXPANSION_CACHE_TTL_SECONDS = 3600.0
+QUERY_EXPANSION_BACKGROUND_WORKERS = 2
+
+# ---------------------------------------------------------------------------
+# Cross-encoder rerank service
+# ---------------------------------------------------------------------------
+
+RERANK_CACHE_SIZE = 50_000  # Cached (model, query, content) pair scores
+RERANK_BATCH_WINDOW_SECONDS = 0.002  # How long a batch waits for concurrent requests
+RERANK_MAX_BATCH_PAIRS = 256  # Pairs per model.predict call
+RERANK_MAX_CANDIDATES = 100  # Facts per request sent to the cross-encoder
+
 # ---------------------------------------------------------------------------
 # Models
 # ---------------------------------------------------------------------------
@@ -129,13 +150,24 @@ __all__ = [
     "DOMAIN_ROUTING_PRIORITY_MULTIPLIER",
     "ESCALATION_TAG_PREFIX",
     "FACT_ID_HEX_LENGTH",
+    "FEDERATED_QUERY_HOP_SLACK_SECONDS",
     "FEDERATED_QUERY_LIMIT_MULTIPLIER",
+    "FEDERATED_QUERY_MAX_WORKERS",
     "FEDERATED_QUERY_MIN_LIMIT",
+    "FEDERATED_QUERY_TIMEOUT_SECONDS",
+    "FEDERATED_ROUTE_CACHE_SIZE",
     "GOSSIP_MIN_CONFIDENCE",
     "GOSSIP_RELAY_AGENT_PREFIX",
     "GOSSIP_TAG_PREFIX",
     "MAX_TRUST_SCORE",
     "PEER_CONFIDENCE_DISCOUNT",
+    "QUERY_EXPANSION_BACKGROUND_WORKERS",
+    "QUERY_EXPANSION_CACHE_SIZE",
+    "QUERY_EXPANSION_CACHE_TTL_SECONDS",
+    "RERANK_BATCH_WINDOW_SECONDS",
+    "RERANK_CACHE_SIZE",
+    "RERANK_MAX_BATCH_PAIRS",
+    "RERANK_MAX_CANDIDATES",
     "RRF_K",
     "SECONDS_PER_HOUR",
     "TRUST_NORMALIZATION_DIVISOR",
@@ -11,6 +11,8 @@ Philosophy:
 
 Public API (the "studs"):
     GossipProtocol: Configurable gossip engine
+    PeerRegistry: Shared, versioned peer list with precomputed trust weights
+    PeerView: One hive's view of a PeerRegistry (excluding itself)
     run_gossip_round: Execute one round of gossip between peers
     convergence_check: Measure knowledge overlap across hives
 """
@@ -19,6 +21,7 @@ from __future__ import annotations
 
 import logging
 import random
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -48,6 +51,222 @@ class GossipProtocol:
     min_confidence: float = GOSSIP_MIN_CONFIDENCE
 
 
+def _peer_weight(peer: Any) -> float:
+    """Selection weight of a peer: sum of its agents' trust, floored at 0.1."""
+    agents = peer.list_agents()
+    if agents:
+        total_trust = sum(getattr(a, "trust", 1.0) for a in agents)
+        return max(0.1, total_trust)  # floor at 0.1 to avoid zero
+    return 1.0  # default weight for empty peers
+
+
+class _WeightTree:
+    """Fenwick tree over peer weights: O(log n) update and weighted draw."""
+
+    def __init__(self) -> None:
+        self._weights: list[float] = []
+        self._tree: list[float] = [0.0]  # 1-based partial sums
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    @property
+    def total(self) -> float:
+        total, i = 0.0, len(self._weights)
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def weight(self, index: int) -> float:
+        return self._weights[index]
+
+    def append(self, weight: float) -> None:
+        self._weights.append(weight)
+        i = len(self._weights)
+        # Node i covers (i - lowbit(i), i]: its own weight plus the child nodes
+        node, child = weight, i - 1
+        while child > i - (i & -i):
+            node += self._tree[child]
+            child -= child & -child
+        self._tree.append(node)
+
+    def update(self, index: int, weight: float) -> None:
+        delta = weight - self._weights[index]
+        self._weights[index] = weight
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def find(self, target: float) -> int:
+        """Smallest index whose prefix sum reaches target (cumulative >= target)."""
+        pos, remaining = 0, target
+        step = 1 << (len(self._weights).bit_length() - 1) if self._weights else 0
+        while step:
+            nxt = pos + step
+            if nxt < len(self._tree) and self._tree[nxt] < remaining:
+                pos = nxt
+                remaining -= self._tree[nxt]
+            step >>= 1
+        return min(pos, len(self._weights) - 1)
+
+
+class PeerRegistry:
+    """Shared, versioned list of gossip peers with precomputed trust weights.
+
+    Many hives gossiping among the same peers (e.g. every agent of a
+    UnifiedHiveMind) share one registry instead of each holding a copy, so a
+    join is O(1) rather than a rebuild of every peer list. Each peer's
+    selection weight is computed once and kept in a Fenwick tree; it is
+    recomputed when the peer is drawn or gossiped to and its
+    ``_registry_version`` changed, or on refresh(). Weighted selection of
+    ``fanout`` peers is then O(fanout * log n) draws with rejection.
+
+    Example:
+        >>> registry = PeerRegistry([hive_a, hive_b])
+        >>> view = registry.view(exclude_hive_id=hive_a.hive_id)
+        >>> run_gossip_round(source, view)
+    """
+
+    def __init__(self, peers: Iterable[Any] = ()) -> None:
+        self._peers: list[Any] = []
+        self._positions: dict[str, list[int]] = {}  # hive_id -> positions in _peers
+        self._weights = _WeightTree()
+        self._weight_versions: list[Any] = []  # peer _registry_version behind each weight
+        self._version = 0
+        for peer in peers:
+            self.add(peer)
+
+    @property
+    def version(self) -> int:
+        """Incremented on every add(); lets holders detect membership changes."""
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._peers)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._peers)
+
+    def add(self, peer: Any) -> None:
+        """Append a peer (duplicates are kept, as with a plain peer list)."""
+        self._positions.setdefault(peer.hive_id, []).append(len(self._peers))
+        self._peers.append(peer)
+        self._weight_versions.append(getattr(peer, "_registry_version", None))
+        self._weights.append(_peer_weight(peer))
+        self._version += 1
+
+    def count(self, hive_id: str | None) -> int:
+        """Number of registered peers with this hive_id."""
+        return len(self._positions.get(hive_id, ())) if hive_id is not None else 0
+
+    def view(self, exclude_hive_id: str | None = None) -> PeerView:
+        """Return a live view of this registry without ``exclude_hive_id``."""
+        return PeerView(self, exclude_hive_id)
+
+    def refresh(self, peer: Any | None = None) -> None:
+        """Recompute the trust weight of one peer (all peers if None) if it changed."""
+        if peer is None:
+            positions: Iterable[int] = range(len(self._peers))
+        else:
+            positions = [i for i in self._positions.get(peer.hive_id, ()) if self._peers[i] is peer]
+        for i in positions:
+            self._refresh_weight(i)
+
+    def _refresh_weight(self, index: int) -> bool:
+        """Recompute one weight if its peer changed; return True if the weight moved."""
+        peer = self._peers[index]
+        version = getattr(peer, "_registry_version", None)
+        if version is not None and version == self._weight_versions[index]:
+            return False
+        self._weight_versions[index] = version
+        weight = _peer_weight(peer)
+        if weight == self._weights.weight(index):
+            return False
+        self._weights.update(index, weight)
+        return True
+
+    def select(self, fanout: int, exclude_hive_ids: Iterable[str | None] = ()) -> list[Any]:
+        """Trust-weighted selection without replacement, like _select_peers.
+
+        Draws from the full weight tree and rejects excluded or already chosen
+        peers, which samples each pick in proportion to the remaining weights.
+        A drawn peer whose trust changed since its weight was computed is
+        reweighted and the draw is repeated, so no pick is accepted on a stale
+        weight. Peers that are not drawn keep their stored weight until they
+        are drawn, gossiped to or refresh()ed. Falls back to _select_peers'
+        linear scan, over refreshed weights, if rejections pile up (e.g. an
+        excluded peer holds most of the weight).
+        """
+        excluded = {hive_id for hive_id in exclude_hive_ids if hive_id is not None}
+        candidate_count = len(self._peers) - sum(self.count(hive_id) for hive_id in excluded)
+        if candidate_count <= 0:
+            return []
+        if candidate_count <= fanout:
+            return [p for p in self._peers if p.hive_id not in excluded]
+
+        chosen: list[int] = []
+        attempts = 8 * fanout + 16
+        while len(chosen) < fanout and attempts:
+            attempts -= 1
+            index = self._weights.find(random.random() * self._weights.total)
+            if index in chosen or self._peers[index].hive_id in excluded:
+                continue
+            if self._refresh_weight(index):
+                continue  # Drawn on a stale weight: draw again from the corrected tree
+            chosen.append(index)
+        if len(chosen) < fanout:
+            remaining = [
+                i
+                for i, p in enumerate(self._peers)
+                if i not in chosen and p.hive_id not in excluded
+            ]
+            for i in remaining:
+                self._refresh_weight(i)
+            while len(chosen) < fanout and remaining:
+                r = random.random() * sum(self._weights.weight(i) for i in remaining)
+                cumulative = 0.0
+                for pos, i in enumerate(remaining):
+                    cumulative += self._weights.weight(i)
+                    if cumulative >= r:
+                        chosen.append(remaining.pop(pos))
+                        break
+                else:
+                    break
+        return [self._peers[i] for i in chosen]
+
+
+class PeerView:
+    """A hive's window onto a shared PeerRegistry, without the hive itself.
+
+    Iterates, sizes and selects like the peer list it replaces, but reads
+    the registry live, so peers added to the registry are seen immediately.
+    """
+
+    def __init__(self, registry: PeerRegistry, exclude_hive_id: str | None = None) -> None:
+        self._registry = registry
+        self._exclude_hive_id = exclude_hive_id
+
+    @property
+    def registry(self) -> PeerRegistry:
+        return self._registry
+
+    def __len__(self) -> int:
+        return len(self._registry) - self._registry.count(self._exclude_hive_id)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (p for p in self._registry if p.hive_id != self._exclude_hive_id)
+
+    def add(self, peer: Any) -> None:
+        """Add a peer to the underlying registry, visible to every view of it."""
+        self._registry.add(peer)
+
+    def select(self, source_hive_id: str, fanout: int) -> list[Any]:
+        """Select up to ``fanout`` peers other than the source and excluded hive."""
+        return self._registry.select(fanout, (source_hive_id, self._exclude_hive_id))
+
+
 def _select_peers(
     all_peers: list[Any],
     source_hive_id: str,
@@ -74,14 +293,7 @@ def _select_peers(
         return list(candidates)
 
     # Compute trust-based weights: sum of agent trust scores per peer
-    weights: list[float] = []
-    for peer in candidates:
-        agents = peer.list_agents()
-        if agents:
-            total_trust = sum(getattr(a, "trust", 1.0) for a in agents)
-            weights.append(max(0.1, total_trust))  # floor at 0.1 to avoid zero
-        else:
-            weights.append(1.0)  # default weight for empty peers
+    weights = [_peer_weight(peer) for peer in candidates]
 
     # Weighted random selection without replacement
     selected: list[Any] = []
@@ -129,17 +341,20 @@ def _get_top_facts(hive: Any, top_k: int, min_confidence: float) -> list[Any]:
 
 def run_gossip_round(
     source_hive: Any,
-    peers: list[Any],
+    peers: list[Any] | PeerView | PeerRegistry,
     protocol: GossipProtocol | None = None,
 ) -> dict[str, list[str]]:
     """Execute one round of gossip from source_hive to selected peers.
 
     Shares top-K facts from the source to a random subset of peers.
-    Facts are promoted into peer hives via a relay agent.
+    Facts are promoted into peer hives via a relay agent. Peers that expose
+    has_content (InMemoryHiveGraph) are checked for an existing copy in O(1);
+    others via a keyword query.
 
     Args:
         source_hive: The hive initiating the gossip.
-        peers: All available peer hives.
+        peers: All available peer hives, or a PeerView/PeerRegistry whose
+            precomputed weights are used for selection.
         protocol: Gossip configuration (uses defaults if None).
 
     Returns:
@@ -148,7 +363,12 @@ def run_gossip_round(
     if protocol is None:
         protocol = GossipProtocol()
 
-    selected = _select_peers(peers, source_hive.hive_id, protocol.fanout)
+    if isinstance(peers, PeerView):
+        selected = peers.select(source_hive.hive_id, protocol.fanout)
+    elif isinstance(peers, PeerRegistry):
+        selected = peers.select(protocol.fanout, (source_hive.hive_id,))
+    else:
+        selected = _select_peers(peers, source_hive.hive_id, protocol.fanout)
     if not selected:
         return {}
 
@@ -165,10 +385,14 @@ def run_gossip_round(
         if peer.get_agent(relay_id) is None:
             peer.register_agent(relay_id, domain="gossip_relay")
 
+        has_content = getattr(peer, "has_content", None)
         for fact in facts_to_share:
             # Skip if peer already has a fact with the same content
-            existing = peer.query_facts(fact.content, limit=5)
-            already_present = any(getattr(e, "content", "") == fact.content for e in existing)
+            if has_content is not None:
+                already_present = has_content(fact.content)
+            else:
+                existing = peer.query_facts(fact.content, limit=5)
+                already_present = any(getattr(e, "content", "") == fact.content for e in existing)
             if already_present:
                 continue
 
@@ -189,6 +413,9 @@ def run_gossip_round(
             shared_ids.append(new_id)
 
         result[peer.hive_id] = shared_ids
+        if isinstance(peers, PeerView | PeerRegistry):
+            # The relay agent may be new, which changes the peer's weight
+            (peers.registry if isinstance(peers, PeerView) else peers).refresh(peer)
         logger.debug(
             "Gossip: %s -> %s shared %d facts",
             source_hive.hive_id,
@@ -244,6 +471,8 @@ def convergence_check(hives: list[Any]) -> float:
 
 __all__ = [
     "GossipProtocol",
+    "PeerRegistry",
+    "PeerView",
     "run_gossip_round",
     "convergence_check",
 ]
@@ -10,6 +10,11 @@ the tree.
 Philosophy:
 - Single responsibility: define the graph contract and provide a working
   in-memory implementation
+- Queries stay sublinear in the edge count: InMemoryHiveGraph keeps edge
+  adjacency indexes, confirmation counters, a concept index and a
+  pre-normalized embedding matrix (numpy) next to its dicts
+- Federated queries fan out to parent and children concurrently and return
+  whatever the branches answered before the deadline
 - Runtime-checkable Protocol so any backend can be validated with isinstance()
 - Federation is core, not optional -- trees of hive minds from day one
 
@@ -24,32 +29,53 @@ Public API (the "studs"):
 
 from __future__ import annotations
 
+import heapq
 import logging
 import sys
 import threading
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
 from .constants import (
     BROADCAST_TAG_PREFIX,
     CONFIDENCE_SCORE_BOOST,
+    CONFIRMATION_NORMALIZATION_DIVISOR,
     DEFAULT_BROADCAST_THRESHOLD,
+    DEFAULT_CONFIRMATION_WEIGHT,
     DEFAULT_CONTRADICTION_OVERLAP,
+    DEFAULT_SEMANTIC_WEIGHT,
     DEFAULT_TRUST_SCORE,
+    DEFAULT_TRUST_WEIGHT,
     DOMAIN_ROUTING_PRIORITY_MULTIPLIER,
     ESCALATION_TAG_PREFIX,
     FACT_ID_HEX_LENGTH,
+    FEDERATED_QUERY_HOP_SLACK_SECONDS,
     FEDERATED_QUERY_LIMIT_MULTIPLIER,
+    FEDERATED_QUERY_MAX_WORKERS,
     FEDERATED_QUERY_MIN_LIMIT,
+    FEDERATED_QUERY_TIMEOUT_SECONDS,
+    FEDERATED_ROUTE_CACHE_SIZE,
     GOSSIP_TAG_PREFIX,
     MAX_TRUST_SCORE,
     SECONDS_PER_HOUR,
+    TRUST_NORMALIZATION_DIVISOR,
 )
 
 logger = logging.getLogger(__name__)
 
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    _HAS_NUMPY = False
+    print("WARNING: numpy not available", file=sys.stderr)
+
 # Graceful imports for retrieval pipeline modules
 try:
     from .reranker import hybrid_score_weighted, rrf_merge
@@ -293,6 +319,76 @@ def _federated_keyword_score(fact: Any, keywords: set[str]) -> float:
     return hits + fact.confidence * CONFIDENCE_SCORE_BOOST
 
 
+# Guards check-and-add on the _visited set shared by concurrent federated branches
+_visited_lock = threading.Lock()
+# One executor runs the federated branches of every hive, so a tree of any
+# size holds at most FEDERATED_QUERY_MAX_WORKERS threads
+_federated_executor_lock = threading.Lock()
+_federated_executor: ThreadPoolExecutor | None = None
+# Set on the threads running federated branches
+_federated_worker = threading.local()
+
+
+def _get_federated_executor() -> ThreadPoolExecutor:
+    """Return the shared executor for federated branches, creating it on first use."""
+    global _federated_executor
+    with _federated_executor_lock:
+        if _federated_executor is None:
+            _federated_executor = ThreadPoolExecutor(
+                max_workers=FEDERATED_QUERY_MAX_WORKERS,
+                thread_name_prefix="hive-federated",
+            )
+        return _federated_executor
+
+
+def _claim_hive(visited: set[str], hive_id: str) -> bool:
+    """Mark hive_id as queried. Returns False if another branch got there first."""
+    with _visited_lock:
+        if hive_id in visited:
+            return False
+        visited.add(hive_id)
+        return True
+
+
+def _top_k(items: list[Any], limit: int, key: Any) -> list[Any]:
+    """Equivalent to sorted(items, key=key)[:limit], via a bounded heap when possible."""
+    if 0 < limit < len(items):
+        return heapq.nsmallest(limit, items, key=key)
+    return sorted(items, key=key)[:limit]
+
+
+def _run_branch_on_worker(
+    hive: HiveGraph,
+    query: str,
+    limit: int,
+    visited: set[str],
+    deadline: float | None,
+) -> list[HiveFact]:
+    """_query_branch as submitted to the federated executor."""
+    _federated_worker.active = True
+    return _query_branch(hive, query, limit, visited, deadline)
+
+
+def _query_branch(
+    hive: HiveGraph,
+    query: str,
+    limit: int,
+    visited: set[str],
+    deadline: float | None,
+) -> list[HiveFact]:
+    """Run one federated branch; only InMemoryHiveGraph takes the deadline."""
+    if isinstance(hive, InMemoryHiveGraph):
+        return hive.query_federated(query, limit=limit, _visited=visited, _deadline=deadline)
+    return hive.query_federated(query, limit=limit, _visited=visited)
+
+
+def _grow_rows(array: Any) -> Any:
+    """Return a copy of a numpy array with twice the rows (new rows zeroed)."""
+    grown = np.zeros((2 * len(array), *array.shape[1:]), dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
 def _word_overlap(a: str, b: str) -> float:
     """Compute Jaccard word overlap between two strings."""
     words_a = _tokenize(a)
@@ -312,6 +408,14 @@ class InMemoryHiveGraph:
 
     Args:
         hive_id: Unique identifier for this hive instance.
+        federated_workers: Parent/child branches of this hive that
+            query_federated submits to the executor shared by all hives (at
+            most FEDERATED_QUERY_MAX_WORKERS threads). The other branches run
+            on the caller's thread; 0 queries them all there, one after
+            another.
+        federated_timeout: Seconds a federated query may take end to end.
+            Branches that have not answered by then are left out of the
+            result. None waits for every branch.
 
     Example:
         >>> hive = InMemoryHiveGraph("test-hive")
@@ -329,19 +433,51 @@ class InMemoryHiveGraph:
         embedding_generator: Any | None = None,
         enable_gossip: bool = False,
         enable_ttl: bool = False,
+        federated_workers: int = FEDERATED_QUERY_MAX_WORKERS,
+        federated_timeout: float | None = FEDERATED_QUERY_TIMEOUT_SECONDS,
     ) -> None:
         self._hive_id = hive_id
         self._broadcast_threshold = max(0.0, min(1.0, broadcast_threshold))
         self._agents: dict[str, HiveAgent] = {}
         self._facts: dict[str, HiveFact] = {}
         self._edges: list[HiveEdge] = []
+        # Adjacency indexes over _edges: node_id -> edge_type -> [(position, edge)]
+        # in insertion order, so get_edges never scans the edge list
+        self._edges_by_source: dict[str, dict[str, list[tuple[int, HiveEdge]]]] = {}
+        self._edges_by_target: dict[str, dict[str, list[tuple[int, HiveEdge]]]] = {}
+        self._confirmations: dict[str, int] = {}  # fact_id -> CONFIRMED_BY edges into it
+        # Lowercased concept -> fact_ids (ordered), for contradiction checks
+        self._facts_by_concept: dict[str, dict[str, None]] = {}
+        # Exact content -> fact_ids, for has_content (gossip de-duplication)
+        self._facts_by_content: dict[str, dict[str, None]] = {}
         self._parent: HiveGraph | None = None
         self._children: list[HiveGraph] = []
         self._lock = threading.RLock()
+        # Federated fan-out: route_query results of each child per query fingerprint (its keyword set),
+        # valid while the child's _registry_version is unchanged
+        self._federated_workers = max(0, federated_workers)
+        self._federated_timeout = federated_timeout
+        self._route_cache: OrderedDict[frozenset[str], dict[str, tuple[int, bool]]] = OrderedDict()
+        # Bumped when agents or their trust change (routing, gossip peer weights)
+        self._registry_version = 0
         # Embedding support: when provided, promote_fact generates embeddings
         # and query_facts uses vector search as primary signal
         self._embedding_generator = embedding_generator
         self._embeddings: dict[str, list[float]] = {}  # fact_id -> embedding vector
+        # The same embeddings as L2-normalized rows of one contiguous matrix, so
+        # a vector query is a single matrix-vector product. Per-row arrays carry
+        # the other hybrid-score inputs. Rows are never removed; retracted facts
+        # are masked out. Unused (pure-Python scoring) without numpy or when
+        # embedding dimensions disagree.
+        self._embedding_matrix: Any = None
+        self._embedding_rows: dict[str, int] = {}  # fact_id -> row
+        self._embedding_row_ids: list[str] = []  # row -> fact_id
+        self._row_active: Any = None  # bool per row: fact not retracted
+        self._row_confirmations: Any = None  # CONFIRMED_BY count per row
+        self._row_agent_slots: Any = None  # index into _agent_slot_ids per row
+        self._agent_slots: dict[str, int] = {}  # source agent_id -> slot
+        self._agent_slot_ids: list[str] = []
+        self._embedding_matrix_usable = _HAS_NUMPY
 
         # CRDT backing stores (graceful: no-op if crdt module unavailable)
         if _HAS_CRDT:
@@ -390,6 +526,7 @@ class InMemoryHiveGraph:
                 fact_count=0,
                 status="active",
             )
+            self._registry_version += 1
             if _HAS_CRDT:
                 reg = LWWRegister()
                 reg.set(clamped_trust, time.time())
@@ -408,6 +545,7 @@ class InMemoryHiveGraph:
             if agent_id not in self._agents:
                 raise KeyError(f"Agent '{agent_id}' not found")
             del self._agents[agent_id]
+            self._registry_version += 1
             if _HAS_CRDT:
                 self._trust_registers.pop(agent_id, None)
 
@@ -437,6 +575,7 @@ class InMemoryHiveGraph:
                 raise KeyError(f"Agent '{agent_id}' not found")
             clamped = max(0.0, min(MAX_TRUST_SCORE, trust))
             agent.trust = clamped
+            self._registry_version += 1
             if _HAS_CRDT:
                 if agent_id not in self._trust_registers:
                     self._trust_registers[agent_id] = LWWRegister()
@@ -473,6 +612,7 @@ class InMemoryHiveGraph:
 
             fact.source_agent = agent_id
             fact.confidence = max(0.0, min(1.0, fact.confidence))
+            self._index_fact(fact)
             self._facts[fact.fact_id] = fact
             self._agents[agent_id].fact_count += 1
             fact_id = fact.fact_id
@@ -499,6 +639,7 @@ class InMemoryHiveGraph:
                         self._embeddings[fact.fact_id] = (
                             emb.tolist() if hasattr(emb, "tolist") else list(emb)
                         )
+                        self._store_embedding_row(fact, self._embeddings[fact.fact_id])
                 except Exception:
                     logger.debug("Failed to generate embedding for fact %s", fact.fact_id)
 
@@ -540,6 +681,15 @@ class InMemoryHiveGraph:
         with self._lock:
             return self._facts.get(fact_id)
 
+    def has_content(self, content: str) -> bool:
+        """Return True if a non-retracted fact has exactly this content."""
+        with self._lock:
+            # Re-check each candidate: facts may have been edited in place
+            return any(
+                (fact := self._facts[fact_id]).status != "retracted" and fact.content == content
+                for fact_id in self._facts_by_content.get(content, ())
+            )
+
     def query_facts(self, query: str, limit: int = 20) -> list[HiveFact]:
         """Search facts by keyword query, with optional vector search.
 
@@ -603,6 +753,9 @@ class InMemoryHiveGraph:
             return self._keyword_query(query, limit)
         query_vec = query_emb.tolist() if hasattr(query_emb, "tolist") else list(query_emb)
 
+        if self._embedding_matrix_usable and self._embedding_matrix is not None:
+            return self._matrix_vector_query(query_vec, limit)
+
         scored: list[tuple[float, HiveFact]] = []
         for fact in self._facts.values():
             if fact.status == "retracted":
@@ -611,17 +764,11 @@ class InMemoryHiveGraph:
             if fact_emb is None:
                 continue
             sim = self._cosine_sim(query_vec, fact_emb)
-            # Count confirmations from edges
-            conf_count = sum(
-                1
-                for e in self._edges
-                if e.target_id == fact.fact_id and e.edge_type == "CONFIRMED_BY"
-            )
             agent = self._agents.get(fact.source_agent)
             trust = agent.trust if agent else DEFAULT_TRUST_SCORE
             score = hybrid_score_weighted(
                 semantic_similarity=sim,
-                confirmation_count=conf_count,
+                confirmation_count=self._confirmations.get(fact.fact_id, 0),
                 source_trust=trust,
             )
             scored.append((score, fact))
@@ -629,6 +776,134 @@ class InMemoryHiveGraph:
         scored.sort(key=lambda x: (-x[0], -x[1].confidence))
         return [f for _, f in scored[:limit]]
 
+    def _matrix_vector_query(self, query_vec: list[float], limit: int) -> list[HiveFact]:
+        """_vector_query over the embedding matrix: one product, partial sort.
+
+        Scores every row with the vectorized hybrid_score_weighted, takes the
+        top ``limit`` with argpartition (keeping rows tied with the last one)
+        and orders only those like the scalar path: score, then confidence,
+        then promotion order. Must be called under lock.
+        """
+        dim = self._embedding_matrix.shape[1]
+        if len(query_vec) != dim:
+            raise ValueError(
+                f"Vector dimension mismatch: {dim} vs {len(query_vec)}. "
+                "Embeddings from the same model must have identical dimensions."
+            )
+        rows = len(self._embedding_row_ids)
+        query_arr = np.asarray(query_vec, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query_arr))
+        if query_norm == 0.0:
+            sims = np.zeros(rows)
+        else:
+            sims = self._embedding_matrix[:rows] @ (query_arr / query_norm)
+
+        slot_trust = np.array(
+            [
+                agent.trust if (agent := self._agents.get(agent_id)) else DEFAULT_TRUST_SCORE
+                for agent_id in self._agent_slot_ids
+            ]
+            or [DEFAULT_TRUST_SCORE]
+        )
+        trust = slot_trust[self._row_agent_slots[:rows]]
+        confirmations = self._row_confirmations[:rows]
+        scores = (
+            DEFAULT_SEMANTIC_WEIGHT * sims.astype(np.float64)
+            + DEFAULT_CONFIRMATION_WEIGHT
+            * np.minimum(1.0, confirmations / CONFIRMATION_NORMALIZATION_DIVISOR)
+            + DEFAULT_TRUST_WEIGHT * np.minimum(1.0, trust / TRUST_NORMALIZATION_DIVISOR)
+        )
+
+        active = self._row_active[:rows]
+        while True:
+            candidates = np.flatnonzero(active)
+            if 0 < limit < len(candidates):
+                top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+                cutoff = scores[candidates[top]].min()
+                candidates = candidates[scores[candidates] >= cutoff]
+            facts = [self._facts.get(self._embedding_row_ids[row]) for row in candidates]
+            # Facts retracted without going through retract_fact
+            stale = [
+                row
+                for row, fact in zip(candidates, facts, strict=True)
+                if fact is None or fact.status == "retracted"
+            ]
+            if not stale:
+                break
+            active[stale] = False
+
+        ranked = sorted(
+            zip(candidates.tolist(), facts, strict=True),
+            key=lambda item: (-scores[item[0]], -item[1].confidence, item[0]),
+        )
+        return [fact for _, fact in ranked[:limit]]
+
+    def _agent_slot(self, agent_id: str) -> int:
+        slot = self._agent_slots.get(agent_id)
+        if slot is None:
+            slot = len(self._agent_slot_ids)
+            self._agent_slots[agent_id] = slot
+            self._agent_slot_ids.append(agent_id)
+        return slot
+
+    def _store_embedding_row(self, fact: HiveFact, embedding: list[float]) -> None:
+        """Write a fact's normalized embedding into the matrix. Must be called under lock."""
+        if not self._embedding_matrix_usable:
+            return
+        vec = np.asarray(embedding, dtype=np.float32)
+        if self._embedding_matrix is None:
+            if vec.ndim != 1 or vec.size == 0:
+                self._embedding_matrix_usable = False
+                return
+            self._embedding_matrix = np.zeros((64, vec.size), dtype=np.float32)
+            self._row_active = np.zeros(64, dtype=bool)
+            self._row_confirmations = np.zeros(64, dtype=np.int64)
+            self._row_agent_slots = np.zeros(64, dtype=np.int64)
+        elif vec.shape != (self._embedding_matrix.shape[1],):
+            # Mixed dimensions: the scalar path raises on them as before
+            self._embedding_matrix_usable = False
+            return
+
+        row = self._embedding_rows.get(fact.fact_id)
+        if row is None:
+            row = len(self._embedding_row_ids)
+            if row == len(self._embedding_matrix):
+                self._embedding_matrix = _grow_rows(self._embedding_matrix)
+                self._row_active = _grow_rows(self._row_active)
+                self._row_confirmations = _grow_rows(self._row_confirmations)
+                self._row_agent_slots = _grow_rows(self._row_agent_slots)
+            self._embedding_rows[fact.fact_id] = row
+            self._embedding_row_ids.append(fact.fact_id)
+
+        norm = float(np.linalg.norm(vec))
+        self._embedding_matrix[row] = vec / norm if norm else 0.0
+        self._row_active[row] = fact.status != "retracted"
+        self._row_confirmations[row] = self._confirmations.get(fact.fact_id, 0)
+        self._row_agent_slots[row] = self._agent_slot(fact.source_agent)
+
+    def _index_fact(self, fact: HiveFact) -> None:
+        """Update the concept/content indexes and matrix row flags for a (re)stored fact.
+
+        Must be called under lock, before the fact is stored in _facts.
+        """
+        previous = self._facts.get(fact.fact_id)
+        if previous is not None and previous.concept.lower() != fact.concept.lower():
+            self._facts_by_concept.get(previous.concept.lower(), {}).pop(fact.fact_id, None)
+        if previous is not None and previous.content != fact.content:
+            self._facts_by_content.get(previous.content, {}).pop(fact.fact_id, None)
+        self._facts_by_concept.setdefault(fact.concept.lower(), {})[fact.fact_id] = None
+        self._facts_by_content.setdefault(fact.content, {})[fact.fact_id] = None
+
+        row = self._embedding_rows.get(fact.fact_id)
+        if row is not None:
+            self._row_active[row] = fact.status != "retracted"
+            self._row_agent_slots[row] = self._agent_slot(fact.source_agent)
+
+    def _set_row_active(self, fact_id: str, active: bool) -> None:
+        row = self._embedding_rows.get(fact_id)
+        if row is not None:
+            self._row_active[row] = active
+
     def _keyword_query(self, query: str, limit: int) -> list[HiveFact]:
         """Keyword-based search. Must be called under lock."""
         keywords = _tokenize(query)
@@ -655,6 +930,7 @@ class InMemoryHiveGraph:
             if fact is None:
                 return False
             fact.status = "retracted"
+            self._set_row_active(fact_id, False)
             if _HAS_CRDT:
                 self._fact_set.remove(fact_id)
             return True
@@ -664,20 +940,41 @@ class InMemoryHiveGraph:
     def add_edge(self, edge: HiveEdge) -> None:
         """Add an edge to the graph."""
         with self._lock:
+            entry = (len(self._edges), edge)
             self._edges.append(edge)
+            by_source = self._edges_by_source.setdefault(edge.source_id, {})
+            by_source.setdefault(edge.edge_type, []).append(entry)
+            by_target = self._edges_by_target.setdefault(edge.target_id, {})
+            by_target.setdefault(edge.edge_type, []).append(entry)
+            if edge.edge_type == "CONFIRMED_BY":
+                count = self._confirmations.get(edge.target_id, 0) + 1
+                self._confirmations[edge.target_id] = count
+                row = self._embedding_rows.get(edge.target_id)
+                if row is not None:
+                    self._row_confirmations[row] = count
 
     def get_edges(self, node_id: str, edge_type: str | None = None) -> list[HiveEdge]:
         """Get edges for a node, optionally filtered by type.
 
-        Returns edges where node_id is either source or target.
+        Returns edges where node_id is either source or target, in the
+        order they were added.
         """
         with self._lock:
+            indexes = (
+                self._edges_by_source.get(node_id, {}),
+                self._edges_by_target.get(node_id, {}),
+            )
+            if edge_type is None:
+                entries = [entry for index in indexes for entry in index.values()]
+            else:
+                entries = [index[edge_type] for index in indexes if edge_type in index]
             results: list[HiveEdge] = []
-            for e in self._edges:
-                if (e.source_id == node_id or e.target_id == node_id) and (
-                    edge_type is None or e.edge_type == edge_type
-                ):
-                    results.append(e)
+            last_position = -1
+            for position, edge in heapq.merge(*entries, key=lambda entry: entry[0]):
+                # A self-loop is indexed under both source and target
+                if position != last_position:
+                    results.append(edge)
+                    last_position = position
             return results
 
     # -- Contradiction detection -----------------------------------------------
@@ -704,7 +1001,8 @@ class InMemoryHiveGraph:
             contradictions: list[HiveFact] = []
             concept_lower = concept.lower()
 
-            for fact in self._facts.values():
+            for fact_id in self._facts_by_concept.get(concept_lower, ()):
+                fact = self._facts[fact_id]
                 if fact.status == "retracted":
                     continue
                 if fact.concept.lower() != concept_lower:
@@ -845,6 +1143,7 @@ class InMemoryHiveGraph:
         query: str,
         limit: int = 20,
         _visited: set[str] | None = None,
+        _deadline: float | None = None,
     ) -> list[HiveFact]:
         """Query the entire federation tree for facts matching query.
 
@@ -857,28 +1156,38 @@ class InMemoryHiveGraph:
         domains get 3x the internal limit, ensuring domain-relevant groups
         contribute more facts to the global pool.
 
+        The parent and children are queried concurrently on the shared
+        federated executor (up to federated_workers of them) while the local
+        query runs, so a tree answers in about the time of its slowest
+        branch. A hop that itself runs on the executor takes back branches
+        still queued when its local query ends and runs them on its own
+        thread, so executor threads only wait on running branches and the
+        bounded pool cannot deadlock. Each hop hands its branches a slightly earlier
+        deadline; branches that miss it or fail are dropped and the facts
+        that did arrive are returned. Branch results are merged in the same
+        order as a sequential walk (local, parent, children) so content
+        de-duplication does not depend on which branch finished first.
+
         Args:
             query: Space-separated keywords.
             limit: Maximum results.
             _visited: Internal — hive_ids already queried (prevents loops).
+            _deadline: Internal — time.monotonic() by which this hop must answer.
 
         Returns:
             Merged, deduplicated list of HiveFact sorted by keyword relevance.
         """
         if _visited is None:
             _visited = set()
-        if self._hive_id in _visited:
+        if not _claim_hive(_visited, self._hive_id):
             return []
-        _visited.add(self._hive_id)
+        if _deadline is None and self._federated_timeout is not None:
+            _deadline = time.monotonic() + self._federated_timeout
 
         # Proposal 1: Remove the 2000 cap. Use uncapped 10x multiplier so
         # global re-ranking sees ALL candidates from each hive.
         internal_limit = max(limit * FEDERATED_QUERY_LIMIT_MULTIPLIER, FEDERATED_QUERY_MIN_LIMIT)
 
-        # Phase 1: Collect from local hive
-        results = list(self.query_facts(query, limit=internal_limit))
-        seen_content: set[str] = {f.content for f in results}
-
         # Snapshot parent/children under lock for thread safety
         with self._lock:
             parent = self._parent
@@ -887,38 +1196,44 @@ class InMemoryHiveGraph:
         # Proposal 3: Query routing — identify which children have agents
         # whose domains match the query. Give those children 3x the limit.
         keywords = _tokenize(query)
-        priority_child_ids: set[str] = set()
-        if keywords:
-            for child in children:
-                routed = child.route_query(query)
-                if routed:
-                    priority_child_ids.add(child.hive_id)
+        priority_child_ids = self._route_children(children, query, keywords) if keywords else set()
 
-        # Parent (recursive, with visited set to prevent loops)
+        # Parent first, then children (with routing-based limits); hives
+        # already claimed by another branch are skipped up front
+        branches: list[tuple[HiveGraph, int]] = []
         if parent is not None:
-            parent_results = parent.query_federated(
-                query,
-                limit=internal_limit,
-                _visited=_visited,
-            )
-            for f in parent_results:
-                if f.content not in seen_content:
-                    seen_content.add(f.content)
-                    results.append(f)
-
-        # Children (recursive, with routing-based limits)
+            branches.append((parent, internal_limit))
         for child in children:
-            child_limit = (
-                internal_limit * DOMAIN_ROUTING_PRIORITY_MULTIPLIER
-                if child.hive_id in priority_child_ids
-                else internal_limit
-            )
-            child_results = child.query_federated(
-                query,
-                limit=child_limit,
-                _visited=_visited,
+            branches.append(
+                (
+                    child,
+                    internal_limit * DOMAIN_ROUTING_PRIORITY_MULTIPLIER
+                    if child.hive_id in priority_child_ids
+                    else internal_limit,
+                )
             )
-            for f in child_results:
+        branches = [(hive, lim) for hive, lim in branches if hive.hive_id not in _visited]
+        branch_deadline = (
+            _deadline - FEDERATED_QUERY_HOP_SLACK_SECONDS if _deadline is not None else None
+        )
+
+        futures: list[Future | None] = [None] * len(branches)
+        if branches and self._federated_workers:
+            executor = _get_federated_executor()
+            for i, (hive, lim) in enumerate(branches[: self._federated_workers]):
+                futures[i] = executor.submit(
+                    _run_branch_on_worker, hive, query, lim, _visited, branch_deadline
+                )
+
+        # Phase 1: Collect from local hive (while the branches run)
+        results = list(self.query_facts(query, limit=internal_limit))
+        seen_content: set[str] = {f.content for f in results}
+
+        branch_results = self._collect_branches(
+            branches, futures, query, _visited, branch_deadline, _deadline
+        )
+        for facts in branch_results:
+            for f in facts:
                 if f.content not in seen_content:
                     seen_content.add(f.content)
                     results.append(f)
@@ -939,16 +1254,104 @@ class InMemoryHiveGraph:
                     key="fact_id",
                     limit=len(results),
                 )
-                results = [sf.fact for sf in scored_facts]
+                return [sf.fact for sf in scored_facts][:limit]
             except Exception:
                 logger.debug("RRF merge failed, falling back to keyword re-ranking")
-                results.sort(key=lambda f: (-_federated_keyword_score(f, keywords), -f.confidence))
+                return _top_k(
+                    results,
+                    limit,
+                    key=lambda f: (-_federated_keyword_score(f, keywords), -f.confidence),
+                )
         elif keywords:
-            results.sort(key=lambda f: (-_federated_keyword_score(f, keywords), -f.confidence))
-        else:
-            results.sort(key=lambda f: -f.confidence)
+            return _top_k(
+                results,
+                limit,
+                key=lambda f: (-_federated_keyword_score(f, keywords), -f.confidence),
+            )
+        return _top_k(results, limit, key=lambda f: -f.confidence)
 
-        return results[:limit]
+    def _route_children(
+        self, children: list[HiveGraph], query: str, keywords: set[str]
+    ) -> set[str]:
+        """Return the hive_ids of children with agents whose domain matches the query.
+
+        route_query results are cached per keyword set for InMemoryHiveGraph
+        children and reused until that child registers or removes an agent.
+        """
+        fingerprint = frozenset(keywords)
+        with self._lock:
+            routes = self._route_cache.get(fingerprint)
+            if routes is None:
+                routes = self._route_cache[fingerprint] = {}
+                if len(self._route_cache) > FEDERATED_ROUTE_CACHE_SIZE:
+                    self._route_cache.popitem(last=False)
+            else:
+                self._route_cache.move_to_end(fingerprint)
+
+        priority_child_ids: set[str] = set()
+        for child in children:
+            # Read the version before routing so a concurrent registration
+            # can only make the cached entry stale, never wrongly fresh
+            version = child._registry_version if isinstance(child, InMemoryHiveGraph) else None
+            cached = routes.get(child.hive_id)
+            if version is not None and cached is not None and cached[0] == version:
+                routed = cached[1]
+            else:
+                routed = bool(child.route_query(query))
+                if version is not None:
+                    routes[child.hive_id] = (version, routed)
+            if routed:
+                priority_child_ids.add(child.hive_id)
+        return priority_child_ids
+
+    def _collect_branches(
+        self,
+        branches: list[tuple[HiveGraph, int]],
+        futures: list[Future | None],
+        query: str,
+        visited: set[str],
+        branch_deadline: float | None,
+        deadline: float | None,
+    ) -> list[list[HiveFact]]:
+        """Answers of every branch that made the deadline, in branch order.
+
+        Branches without a future run on this thread first, as do branches
+        not yet started when this thread is an executor thread; then the
+        remaining futures are awaited.
+        """
+        on_worker = getattr(_federated_worker, "active", False)
+        answers: list[list[HiveFact] | None] = [None] * len(branches)
+        for i, ((hive, lim), future) in enumerate(zip(branches, futures, strict=True)):
+            if future is not None and not (on_worker and future.cancel()):
+                continue
+            futures[i] = None
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.debug(
+                    "Federated query in %s skipped %s: deadline", self._hive_id, hive.hive_id
+                )
+                continue
+            try:
+                answers[i] = _query_branch(hive, query, lim, visited, branch_deadline)
+            except Exception:
+                logger.warning("Federated query branch %s failed", hive.hive_id, exc_info=True)
+
+        running = [future for future in futures if future is not None]
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        _, not_done = wait(running, timeout=timeout)
+        for i, ((hive, _), future) in enumerate(zip(branches, futures, strict=True)):
+            if future is None:
+                continue
+            if future in not_done:
+                future.cancel()
+                logger.debug(
+                    "Federated query in %s dropped %s: deadline", self._hive_id, hive.hive_id
+                )
+                continue
+            try:
+                answers[i] = future.result()
+            except Exception:
+                logger.warning("Federated query branch %s failed", hive.hive_id, exc_info=True)
+        return [answer for answer in answers if answer is not None]
 
     # -- TTL decay (private) ---------------------------------------------------
 
@@ -986,6 +1389,8 @@ class InMemoryHiveGraph:
             # Copy HiveFact objects from other that we don't have yet
             for fact_id, fact in other._facts.items():
                 if fact_id not in self._facts:
+                    self._facts_by_concept.setdefault(fact.concept.lower(), {})[fact_id] = None
+                    self._facts_by_content.setdefault(fact.content, {})[fact_id] = None
                     self._facts[fact_id] = HiveFact(
                         fact_id=fact.fact_id,
                         content=fact.content,
@@ -1004,8 +1409,10 @@ class InMemoryHiveGraph:
             for fact_id, fact in self._facts.items():
                 if fact_id not in live_ids and fact.status != "retracted":
                     fact.status = "retracted"
+                    self._set_row_active(fact_id, False)
                 elif fact_id in live_ids and fact.status == "retracted":
                     fact.status = "promoted"
+                    self._set_row_active(fact_id, True)
 
             # Merge trust LWWRegisters and sync agent trust values
             for agent_id, reg in other._trust_registers.items():
@@ -1015,6 +1422,7 @@ class InMemoryHiveGraph:
                 merged_trust = self._trust_registers[agent_id].get()
                 if merged_trust is not None and agent_id in self._agents:
                     self._agents[agent_id].trust = max(0.0, min(MAX_TRUST_SCORE, merged_trust))
+                    self._registry_version += 1
 
     # -- Gossip ----------------------------------------------------------------
 
@@ -1072,7 +1480,12 @@ class InMemoryHiveGraph:
             }
 
     def close(self) -> None:
-        """Release resources (no-op for in-memory)."""
+        """Release resources (the cached federated routes).
+
+        The federated executor is shared by every hive and outlives this one.
+        """
+        with self._lock:
+            self._route_cache.clear()
 
 
 # ---------------------------------------------------------------------------
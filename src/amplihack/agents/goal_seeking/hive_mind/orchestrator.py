@@ -45,7 +45,10 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 try:
-    from .gossip import GossipProtocol  # noqa: F401 (used in docstrings)
+    from .gossip import (
+        GossipProtocol,  # noqa: F401 (used in docstrings)
+        PeerView,
+    )
     from .gossip import run_gossip_round as _run_gossip_round
 
     _HAS_GOSSIP = True
@@ -145,7 +148,10 @@ class HiveMindOrchestrator:
         agent_id: Unique ID for this agent in the hive.
         hive_graph: Layer 1 storage backend. Must satisfy HiveGraph protocol.
         event_bus: Layer 2 transport. Must satisfy EventBus protocol.
-        peers: Optional list of HiveGraph peers for Layer 3 gossip.
+        peers: Optional list of HiveGraph peers for Layer 3 gossip, or a
+            PeerView of a PeerRegistry shared with other orchestrators. A
+            list is private to this orchestrator; a PeerView is not (see
+            add_peer).
         policy: Pluggable PromotionPolicy. Defaults to DefaultPromotionPolicy.
         gossip_protocol: Optional GossipProtocol configuration.
 
@@ -176,14 +182,18 @@ class HiveMindOrchestrator:
         agent_id: str,
         hive_graph: HiveGraph,
         event_bus: EventBus,
-        peers: list[HiveGraph] | None = None,
+        peers: list[HiveGraph] | PeerView | None = None,
         policy: PromotionPolicy | None = None,
         gossip_protocol: Any | None = None,
     ) -> None:
         self._agent_id = agent_id
         self._hive_graph = hive_graph
         self._event_bus = event_bus
-        self._peers: list[HiveGraph] = list(peers or [])
+        # A PeerView is kept by reference: it reads a registry shared with
+        # other orchestrators, so peers joining later are seen without copies
+        self._peers: list[HiveGraph] | PeerView = (
+            peers if _HAS_GOSSIP and isinstance(peers, PeerView) else list(peers or [])
+        )
         self._policy: PromotionPolicy = policy or DefaultPromotionPolicy()
         self._gossip_protocol = gossip_protocol
 
@@ -202,10 +212,18 @@ class HiveMindOrchestrator:
     def add_peer(self, peer: HiveGraph) -> None:
         """Register a new gossip peer for Layer 3 dissemination.
 
+        With a peer list, only this orchestrator gossips to the new peer.
+        When the orchestrator was given a PeerView, the peer is added to the
+        PeerRegistry behind it instead, so every orchestrator viewing that
+        registry (e.g. every agent of a UnifiedHiveMind) gossips to it too.
+
         Args:
             peer: A HiveGraph instance to include in gossip rounds.
         """
-        self._peers.append(peer)
+        if isinstance(self._peers, list):
+            self._peers.append(peer)
+        else:
+            self._peers.add(peer)
 
     # -- Core operations -------------------------------------------------------
 
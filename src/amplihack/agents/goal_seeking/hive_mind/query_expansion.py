@@ -7,11 +7,13 @@ expansion when the API is unavailable.
 Philosophy:
 - Single responsibility: expand queries, search with expanded queries
 - Graceful degradation: works without API access via local expansion
-- No persistent state: each call is independent
+- Bounded state only: an LRU/TTL cache of LLM expansions keyed by the
+  normalized query, and one reused API client per key
 
 Public API (the "studs"):
     expand_query: Expand a query into multiple search variants
     search_expanded: Search with expanded queries and merge results
+    clear_expansion_cache: Drop cached expansions and clients
     HAS_ANTHROPIC: Feature flag for API availability
 """
 
@@ -20,7 +22,11 @@ from __future__ import annotations
 import logging
 import os
 import re
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +34,12 @@ logger = logging.getLogger(__name__)
 # Optional dependency: anthropic SDK
 # ---------------------------------------------------------------------------
 
-from .constants import DEFAULT_EXPANSION_MODEL
+from .constants import (
+    DEFAULT_EXPANSION_MODEL,
+    QUERY_EXPANSION_BACKGROUND_WORKERS,
+    QUERY_EXPANSION_CACHE_SIZE,
+    QUERY_EXPANSION_CACHE_TTL_SECONDS,
+)
 
 try:
     import anthropic  # type: ignore[import-untyped]
@@ -43,6 +54,13 @@ except ImportError:
 if os.environ.get("ANTHROPIC_DISABLED", "").lower() == "true":
     HAS_ANTHROPIC = False
 
+try:
+    from .reranker import rrf_merge
+
+    _HAS_RERANKER = True
+except ImportError:
+    _HAS_RERANKER = False
+
 # Backward-compatible alias
 EXPANSION_MODEL = DEFAULT_EXPANSION_MODEL
 _MAX_EXPANSIONS = 4
@@ -87,6 +105,96 @@ def _local_expand(query: str) -> list[str]:
     return expansions
 
 
+# ---------------------------------------------------------------------------
+# Expansion cache and client reuse
+# ---------------------------------------------------------------------------
+
+_cache_lock = threading.Lock()
+# (normalized query, max_expansions) -> (expires_at, LLM alternatives), LRU order
+_expansion_cache: OrderedDict[tuple[str, int], tuple[float, list[str]]] = OrderedDict()
+# Keys whose LLM expansion is running in the background
+_pending_expansions: set[tuple[str, int]] = set()
+# (Anthropic class, api_key) -> client; keyed on the class so a reloaded or
+# patched SDK never reuses a stale client
+_clients: dict[tuple[Any, str | None], Any] = {}
+_background_executor: ThreadPoolExecutor | None = None
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def _cache_get(key: tuple[str, int]) -> list[str] | None:
+    with _cache_lock:
+        entry = _expansion_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _expansion_cache[key]
+            return None
+        _expansion_cache.move_to_end(key)
+        return entry[1]
+
+
+def _cache_put(key: tuple[str, int], alternatives: list[str]) -> None:
+    with _cache_lock:
+        _expansion_cache[key] = (time.monotonic() + QUERY_EXPANSION_CACHE_TTL_SECONDS, alternatives)
+        _expansion_cache.move_to_end(key)
+        while len(_expansion_cache) > QUERY_EXPANSION_CACHE_SIZE:
+            _expansion_cache.popitem(last=False)
+
+
+def clear_expansion_cache() -> None:
+    """Drop all cached LLM expansions and API clients."""
+    with _cache_lock:
+        _expansion_cache.clear()
+        _clients.clear()
+
+
+def _get_client(api_key: str | None) -> Any:
+    """Return the shared Anthropic client for api_key, creating it once."""
+    key = (anthropic.Anthropic, api_key)
+    with _cache_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = anthropic.Anthropic(**({"api_key": api_key} if api_key else {}))
+            _clients[key] = client
+        return client
+
+
+def _with_alternatives(query: str, alternatives: list[str], max_expansions: int) -> list[str]:
+    expansions = [query] + [line for line in alternatives if line and line != query]
+    return expansions[:max_expansions]
+
+
+def _fill_cache(key: tuple[str, int], query: str, max_expansions: int, api_key: str | None):
+    """Background task: run the LLM expansion and cache it."""
+    try:
+        _cache_put(key, _llm_alternatives(query, max_expansions, api_key))
+    except Exception:
+        logger.debug("Background LLM expansion failed for %r", query, exc_info=True)
+    finally:
+        with _cache_lock:
+            _pending_expansions.discard(key)
+
+
+def _expand_in_background(
+    key: tuple[str, int], query: str, max_expansions: int, api_key: str | None
+) -> None:
+    global _background_executor
+    with _cache_lock:
+        if key in _pending_expansions:
+            return
+        _pending_expansions.add(key)
+        if _background_executor is None:
+            _background_executor = ThreadPoolExecutor(
+                max_workers=QUERY_EXPANSION_BACKGROUND_WORKERS,
+                thread_name_prefix="query-expansion",
+            )
+        executor = _background_executor
+    executor.submit(_fill_cache, key, query, max_expansions, api_key)
+
+
 # ---------------------------------------------------------------------------
 # LLM-based expansion
 # ---------------------------------------------------------------------------
@@ -96,6 +204,7 @@ def expand_query(
     query: str,
     max_expansions: int = _MAX_EXPANSIONS,
     api_key: str | None = None,
+    background: bool = False,
 ) -> list[str]:
     """Expand a query into semantically richer search variants.
 
@@ -103,10 +212,17 @@ def expand_query(
     different aspects of the user's intent. Falls back to local
     synonym expansion when the API is unavailable.
 
+    LLM expansions are cached by normalized query (case and whitespace
+    insensitive) for QUERY_EXPANSION_CACHE_TTL_SECONDS, so repeated queries
+    skip the API round trip.
+
     Args:
         query: Original search query.
         max_expansions: Maximum number of expanded queries (including original).
         api_key: Optional Anthropic API key (uses env var if not provided).
+        background: On a cache miss, return the local synonym expansion
+            immediately and run the LLM expansion in the background; later
+            calls for the same query get the LLM variants from the cache.
 
     Returns:
         List of query strings, original first, then expansions.
@@ -120,40 +236,47 @@ def expand_query(
         logger.debug("Anthropic SDK unavailable, using local expansion")
         return _local_expand(query)[:max_expansions]
 
-    try:
-        client_kwargs: dict[str, str] = {}
-        if api_key:
-            client_kwargs["api_key"] = api_key
-
-        client = anthropic.Anthropic(**client_kwargs)
-        response = client.messages.create(
-            model=EXPANSION_MODEL,
-            max_tokens=200,
-            messages=[
-                {
-                    "role": "user",
-                    "content": (
-                        f"Generate {max_expansions - 1} alternative search queries "
-                        f"for: '{query}'\n\n"
-                        "Each should capture a different aspect or phrasing. "
-                        "Return ONLY the queries, one per line, no numbering."
-                    ),
-                }
-            ],
-        )
-
-        text = response.content[0].text.strip()
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
-        # Remove any numbering prefixes (e.g., "1. ", "- ")
-        lines = [re.sub(r"^[\d]+[.)]\s*", "", line) for line in lines]
-        lines = [re.sub(r"^[-*]\s*", "", line) for line in lines]
-
-        expansions = [query] + [line for line in lines if line and line != query]
-        return expansions[:max_expansions]
+    key = (_normalize_query(query), max_expansions)
+    cached = _cache_get(key)
+    if cached is not None:
+        return _with_alternatives(query, cached, max_expansions)
+
+    if background:
+        _expand_in_background(key, query, max_expansions, api_key)
+        return _local_expand(query)[:max_expansions]
 
+    try:
+        alternatives = _llm_alternatives(query, max_expansions, api_key)
     except Exception:
         logger.debug("LLM expansion failed, falling back to local", exc_info=True)
         return _local_expand(query)[:max_expansions]
+    _cache_put(key, alternatives)
+    return _with_alternatives(query, alternatives, max_expansions)
+
+
+def _llm_alternatives(query: str, max_expansions: int, api_key: str | None) -> list[str]:
+    """Ask the LLM for alternative phrasings of query (one per line, cleaned)."""
+    response = _get_client(api_key).messages.create(
+        model=EXPANSION_MODEL,
+        max_tokens=200,
+        messages=[
+            {
+                "role": "user",
+                "content": (
+                    f"Generate {max_expansions - 1} alternative search queries "
+                    f"for: '{query}'\n\n"
+                    "Each should capture a different aspect or phrasing. "
+                    "Return ONLY the queries, one per line, no numbering."
+                ),
+            }
+        ],
+    )
+
+    text = response.content[0].text.strip()
+    lines = [line.strip() for line in text.split("\n") if line.strip()]
+    # Remove any numbering prefixes (e.g., "1. ", "- ")
+    lines = [re.sub(r"^[\d]+[.)]\s*", "", line) for line in lines]
+    return [re.sub(r"^[-*]\s*", "", line) for line in lines]
 
 
 # ---------------------------------------------------------------------------
@@ -161,46 +284,77 @@ def expand_query(
 # ---------------------------------------------------------------------------
 
 
+class _KeyedResult(NamedTuple):
+    """Search result paired with its de-duplication key, for rrf_merge."""
+
+    content: str
+    item: Any
+
+
+def _search_variants(variants: list[str], search_fn: Any, limit: int) -> list[list[Any]]:
+    """Run search_fn for every variant concurrently; results in variant order."""
+
+    def search(variant: str) -> list[Any]:
+        try:
+            return list(search_fn(variant, limit=limit))
+        except Exception:
+            logger.debug("Search failed for expanded query: %s", variant, exc_info=True)
+            return []
+
+    if len(variants) <= 1:
+        return [search(variant) for variant in variants]
+    with ThreadPoolExecutor(
+        max_workers=len(variants), thread_name_prefix="query-expansion-search"
+    ) as executor:
+        return list(executor.map(search, variants))
+
+
 def search_expanded(
     query: str,
     search_fn: Any,
     limit: int = 20,
     api_key: str | None = None,
+    background: bool = False,
 ) -> list[Any]:
     """Search with expanded queries and merge results.
 
-    Expands the query, runs search_fn for each variant, and merges
-    results by deduplicating on content.
+    Expands the query, runs search_fn for all variants concurrently, and
+    merges the ranked lists with reciprocal rank fusion, deduplicating on
+    content. Without the reranker, results are concatenated in variant
+    order instead.
 
     Args:
         query: Original search query.
         search_fn: Callable(query, limit) -> list[facts]. The search function.
+            Must be safe to call from several threads at once.
         limit: Maximum total results.
         api_key: Optional Anthropic API key.
+        background: Passed to expand_query (local expansion now, LLM later).
 
     Returns:
         Merged, deduplicated list of facts.
     """
-    expanded = expand_query(query, api_key=api_key)
+    expanded = expand_query(query, api_key=api_key, background=background)
+    ranked_lists = [
+        [_KeyedResult(getattr(fact, "content", str(fact)), fact) for fact in facts]
+        for facts in _search_variants(expanded, search_fn, limit)
+    ]
+
+    if _HAS_RERANKER and len(ranked_lists) > 1:
+        return [sf.fact.item for sf in rrf_merge(*ranked_lists, key="content", limit=limit)]
 
     seen_content: set[str] = set()
     results: list[Any] = []
-
-    for variant in expanded:
-        try:
-            facts = search_fn(variant, limit=limit)
-            for fact in facts:
-                content = getattr(fact, "content", str(fact))
-                if content not in seen_content:
-                    seen_content.add(content)
-                    results.append(fact)
-        except Exception:
-            logger.debug("Search failed for expanded query: %s", variant, exc_info=True)
-
+    for ranked in ranked_lists:
+        for keyed in ranked:
+            if keyed.content not in seen_content:
+                seen_content.add(keyed.content)
+                results.append(keyed.item)
     return results[:limit]
 
 
 __all__ = [
+    "clear_expansion_cache",
     "expand_query",
     "search_expanded",
     "HAS_ANTHROPIC",
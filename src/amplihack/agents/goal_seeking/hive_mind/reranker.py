@@ -12,6 +12,7 @@ Philosophy:
 
 Public API (the "studs"):
     CrossEncoderReranker: Rerank facts using cross-encoder model
+    RerankService: Shared cross-encoder reranking with pair cache and micro-batching
     hybrid_score: Combine keyword and vector scores
     hybrid_score_weighted: Multi-signal scoring (semantic + confirmation + trust)
     trust_weighted_score: Score combining similarity, trust, and confidence
@@ -21,9 +22,13 @@ Public API (the "studs"):
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import importlib.util
 import logging
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
@@ -37,6 +42,10 @@ from .constants import (
     DEFAULT_SEMANTIC_WEIGHT,
     DEFAULT_TRUST_WEIGHT,
     DEFAULT_VECTOR_WEIGHT,
+    RERANK_BATCH_WINDOW_SECONDS,
+    RERANK_CACHE_SIZE,
+    RERANK_MAX_BATCH_PAIRS,
+    RERANK_MAX_CANDIDATES,
     RRF_K,
     TRUST_NORMALIZATION_DIVISOR,
 )
@@ -324,8 +333,250 @@ def hybrid_score_weighted(
     return w_semantic * semantic_similarity + w_confirmation * conf_score + w_trust * trust_score
 
 
+# ---------------------------------------------------------------------------
+# Rerank service
+# ---------------------------------------------------------------------------
+
+_PairKey = tuple[str, bytes, bytes]  # (model name, query hash, content hash)
+
+
+def _text_hash(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _keyword_overlap(query_words: set[str], content: str) -> float:
+    if not query_words:
+        return 0.0
+    return len(query_words & set(content.lower().split())) / len(query_words)
+
+
+class _RerankRequest:
+    """Uncached pairs one rerank call is waiting on."""
+
+    __slots__ = ("done", "error", "keys", "pairs", "scores")
+
+    def __init__(self, keys: list[_PairKey], pairs: list[tuple[str, str]]) -> None:
+        self.keys = keys
+        self.pairs = pairs
+        self.scores: dict[_PairKey, float] = {}
+        self.error: Exception | None = None
+        self.done = threading.Event()
+
+
+class RerankService:
+    """Cross-encoder reranking shared by many agents.
+
+    - Pair scores are cached (LRU) by (model, query hash, content hash), so
+      repeated and overlapping queries only score facts not seen before.
+    - Rerank calls arriving within ``batch_window`` seconds of each other
+      are coalesced into one ``predict`` call (split at ``max_batch_pairs``).
+    - At most ``max_candidates`` facts per call reach the model. Longer
+      candidate lists are pre-ranked with hybrid_score, using query keyword
+      overlap and the candidate's position in the incoming retrieval order.
+
+    Falls back to CrossEncoderReranker's confidence ranking when the model
+    is unavailable. Safe to call from many threads.
+
+    Args:
+        reranker: Reranker whose model to use (created from model_name if None).
+        model_name: Cross-encoder model identifier, used when reranker is None.
+        cache_size: Maximum cached pair scores.
+        batch_window: Seconds a batch waits for concurrent requests to join.
+        max_batch_pairs: Maximum pairs per predict call.
+        max_candidates: Maximum facts per rerank call sent to the model.
+
+    Example:
+        >>> service = RerankService()
+        >>> scored = service.rerank("DNA info", [fact1, fact2])
+    """
+
+    def __init__(
+        self,
+        reranker: CrossEncoderReranker | None = None,
+        model_name: str = DEFAULT_CROSS_ENCODER_MODEL,
+        *,
+        cache_size: int = RERANK_CACHE_SIZE,
+        batch_window: float = RERANK_BATCH_WINDOW_SECONDS,
+        max_batch_pairs: int = RERANK_MAX_BATCH_PAIRS,
+        max_candidates: int = RERANK_MAX_CANDIDATES,
+    ) -> None:
+        self._reranker = reranker if reranker is not None else CrossEncoderReranker(model_name)
+        self._cache_size = cache_size
+        self._batch_window = batch_window
+        self._max_batch_pairs = max(1, max_batch_pairs)
+        self._max_candidates = max(1, max_candidates)
+        self._cache: OrderedDict[_PairKey, float] = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes predict calls; requests queue up for the next batch meanwhile
+        self._predict_lock = threading.Lock()
+        self._queue: list[_RerankRequest] = []
+        self._collecting = False
+        self._stats = {
+            "requests": 0,
+            "pairs": 0,
+            "cache_hits": 0,
+            "predict_calls": 0,
+            "predicted_pairs": 0,
+            "prerank_dropped": 0,
+        }
+
+    @property
+    def available(self) -> bool:
+        """Whether the cross-encoder model is loaded and ready."""
+        return self._reranker.available
+
+    def rerank(self, query: str, facts: list[Any], limit: int = 20) -> list[ScoredFact]:
+        """Rerank facts by cross-encoder relevance to query.
+
+        Same contract as CrossEncoderReranker.rerank, except that only the
+        top ``max_candidates`` pre-ranked facts are scored and returned.
+        """
+        if not facts:
+            return []
+        if not self.available:
+            return self._reranker.rerank(query, facts, limit)
+
+        candidates = self._prerank(query, facts)
+        model_name = self._reranker._model_name
+        query_hash = _text_hash(query)
+        contents = [getattr(f, "content", str(f)) for f in candidates]
+        keys = [(model_name, query_hash, _text_hash(c)) for c in contents]
+
+        scores: dict[_PairKey, float] = {}
+        missing: dict[_PairKey, tuple[str, str]] = {}
+        with self._lock:
+            for key, content in zip(keys, contents, strict=True):
+                if key in scores or key in missing:
+                    continue
+                score = self._cache.get(key)
+                if score is None:
+                    missing[key] = (query, content)
+                else:
+                    self._cache.move_to_end(key)
+                    scores[key] = score
+            self._stats["requests"] += 1
+            self._stats["pairs"] += len(scores) + len(missing)
+            self._stats["cache_hits"] += len(scores)
+
+        if missing:
+            scores.update(
+                self._score_batched(_RerankRequest(list(missing), list(missing.values())))
+            )
+
+        scored = [
+            ScoredFact(fact=f, score=scores[key], source="cross_encoder")
+            for f, key in zip(candidates, keys, strict=True)
+        ]
+        scored.sort(key=lambda sf: -sf.score)
+        return scored[:limit]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return request, cache and batching counters."""
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["cache_size"] = len(self._cache)
+        stats["cache_hit_rate"] = stats["cache_hits"] / stats["pairs"] if stats["pairs"] else 0.0
+        return stats
+
+    def clear_cache(self) -> None:
+        """Drop all cached pair scores."""
+        with self._lock:
+            self._cache.clear()
+
+    def _prerank(self, query: str, facts: list[Any]) -> list[Any]:
+        """Keep the max_candidates facts with the best cheap hybrid score."""
+        if len(facts) <= self._max_candidates:
+            return facts
+        query_words = set(query.lower().split())
+        total = len(facts)
+        ranked = sorted(
+            range(total),
+            key=lambda i: (
+                -hybrid_score(
+                    _keyword_overlap(query_words, getattr(facts[i], "content", str(facts[i]))),
+                    1.0 - i / total,
+                )
+            ),
+        )
+        with self._lock:
+            self._stats["prerank_dropped"] += total - self._max_candidates
+        return [facts[i] for i in ranked[: self._max_candidates]]
+
+    def _score_batched(self, request: _RerankRequest) -> dict[_PairKey, float]:
+        """Score request's pairs in a batch shared with concurrent callers.
+
+        The first caller to find no open batch becomes its leader: it waits
+        batch_window for others to join, then runs predict for everyone.
+        """
+        with self._lock:
+            self._queue.append(request)
+            leader = not self._collecting
+            self._collecting = True
+
+        if leader:
+            if self._batch_window > 0:
+                time.sleep(self._batch_window)
+            with self._predict_lock:
+                with self._lock:
+                    batch, self._queue = self._queue, []
+                    self._collecting = False
+                self._run_batch(batch)
+        else:
+            request.done.wait()
+
+        if request.error is not None:
+            raise request.error
+        return request.scores
+
+    def _run_batch(self, batch: list[_RerankRequest]) -> None:
+        known: dict[_PairKey, float] = {}
+        pending: dict[_PairKey, tuple[str, str]] = {}
+        with self._lock:
+            # Pairs scored by the previous batch while this one was waiting
+            for request in batch:
+                for key, pair in zip(request.keys, request.pairs, strict=True):
+                    if key in known or key in pending:
+                        continue
+                    score = self._cache.get(key)
+                    if score is None:
+                        pending[key] = pair
+                    else:
+                        known[key] = score
+
+        keys, pairs = list(pending), list(pending.values())
+        error: Exception | None = None
+        predict_calls = 0
+        try:
+            for start in range(0, len(pairs), self._max_batch_pairs):
+                end = start + self._max_batch_pairs
+                chunk_scores = self._reranker._model.predict(pairs[start:end])
+                known.update(zip(keys[start:end], (float(s) for s in chunk_scores), strict=True))
+                predict_calls += 1
+        except Exception as exc:
+            logger.warning("Cross-encoder predict failed for %d pairs", len(pairs), exc_info=True)
+            error = exc
+
+        with self._lock:
+            for key in keys:
+                if key in known:
+                    self._cache[key] = known[key]
+                    self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+            self._stats["predict_calls"] += predict_calls
+            self._stats["predicted_pairs"] += sum(1 for key in keys if key in known)
+
+        for request in batch:
+            if error is not None:
+                request.error = error
+            else:
+                request.scores = {key: known[key] for key in request.keys}
+            request.done.set()
+
+
 __all__ = [
     "CrossEncoderReranker",
+    "RerankService",
     "ScoredFact",
     "hybrid_score",
     "hybrid_score_weighted",
@@ -22,14 +22,13 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from .event_bus import LocalEventBus
-from .hive_graph import HiveFact
-from .in_memory_hive import InMemoryHiveGraph
+from .hive_graph import HiveFact, InMemoryHiveGraph
 from .orchestrator import DefaultPromotionPolicy, HiveMindOrchestrator
 
 logger = logging.getLogger(__name__)
 
 try:
-    from .gossip import GossipProtocol, run_gossip_round
+    from .gossip import GossipProtocol, PeerRegistry, run_gossip_round
 
     _HAS_GOSSIP = True
 except ImportError:
@@ -86,6 +85,9 @@ class UnifiedHiveMind:
 
     Each agent gets its own InMemoryHiveGraph (local store) plus access to a
     shared hive graph. The event bus propagates promotions between agents.
+    All local graphs live in one PeerRegistry; each orchestrator gossips
+    through a view of it that hides the agent's own graph, so registering an
+    agent does not rebuild every other agent's peer list.
     """
 
     def __init__(self, config: HiveMindConfig | None = None) -> None:
@@ -99,6 +101,8 @@ class UnifiedHiveMind:
         self._local_graphs: dict[str, InMemoryHiveGraph] = {}
         # Per-agent orchestrators
         self._orchestrators: dict[str, HiveMindOrchestrator] = {}
+        # Gossip peers (every local graph), shared by all orchestrators
+        self._peer_registry: PeerRegistry | None = PeerRegistry() if _HAS_GOSSIP else None
         # Shared event bus (Layer 2)
         self._event_bus = LocalEventBus()
         # Per-agent learning counters (for gossip interval)
@@ -118,6 +122,8 @@ class UnifiedHiveMind:
         local_graph = InMemoryHiveGraph(hive_id=f"local-{agent_id}")
         local_graph.register_agent(agent_id)
         self._local_graphs[agent_id] = local_graph
+        if self._peer_registry is not None:
+            self._peer_registry.add(local_graph)
 
         # Register agent in shared hive graph
         self._graph.register_agent(agent_id)
@@ -126,7 +132,10 @@ class UnifiedHiveMind:
         policy = DefaultPromotionPolicy(
             promote_threshold=self._config.promotion_confidence_threshold,
         )
-        peers = [g for aid, g in self._local_graphs.items() if aid != agent_id]
+        if self._peer_registry is not None:
+            peers: Any = self._peer_registry.view(exclude_hive_id=local_graph.hive_id)
+        else:
+            peers = [g for aid, g in self._local_graphs.items() if aid != agent_id]
         orch = HiveMindOrchestrator(
             agent_id=agent_id,
             hive_graph=self._graph,
@@ -136,13 +145,6 @@ class UnifiedHiveMind:
         )
         self._orchestrators[agent_id] = orch
 
-        # Update all existing orchestrators with the new agent's graph
-        for existing_id, existing_orch in self._orchestrators.items():
-            if existing_id != agent_id:
-                existing_orch._peers = [
-                    g for aid, g in self._local_graphs.items() if aid != existing_id
-                ]
-
         # Subscribe to event bus
         self._event_bus.subscribe(agent_id)
 
@@ -261,12 +263,10 @@ class UnifiedHiveMind:
         if not _HAS_GOSSIP or not self._config.enable_gossip:
             return {"skipped": "gossip disabled or unavailable"}
 
-        all_graphs = list(self._local_graphs.values()) + [self._graph]
         results: dict[str, Any] = {}
 
         for agent_id, orch in self._orchestrators.items():
-            # Update peers to include all other local graphs
-            orch._peers = [g for aid, g in self._local_graphs.items() if aid != agent_id]
+            # Peers are a live view of the shared registry: no rebuild needed
             round_result = orch.run_gossip_round()
             results[agent_id] = round_result
 
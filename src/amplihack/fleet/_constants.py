@@ -14,6 +14,7 @@ from pathlib import Path
 DEFAULT_FLEET_DIR = Path.home() / ".amplihack" / "fleet"
 DEFAULT_PROJECTS_PATH = DEFAULT_FLEET_DIR / "projects.toml"
 DEFAULT_LAST_SCOUT_PATH = DEFAULT_FLEET_DIR / "last_scout.json"
+DEFAULT_TRANSCRIPT_CACHE_PATH = DEFAULT_FLEET_DIR / "transcript_cache.json"
 
 # ── Confidence Thresholds ──────────────────────────────────────────────
 MIN_CONFIDENCE_SEND = 0.6  # Minimum confidence to inject a send_input action
@@ -34,6 +35,8 @@ SUBPROCESS_TIMEOUT_KILL_SECONDS = 30  # Shorter timeout for kill operations
 SSH_ACTION_TIMEOUT_SECONDS = 30  # Timeout for send_input/restart SSH actions
 AZ_CLI_TIMEOUT_SECONDS = 30  # az vm list is fast (no Bastion tunnel)
 CLI_WATCH_TIMEOUT_SECONDS = 60  # fleet watch tmux capture timeout
+GATHER_CACHE_TTL_SECONDS = 300  # gh PR/objective lookups reused by session gathering
+OBSERVE_TIMEOUT_SECONDS = 30  # Per-VM deadline for one pane-capture round trip
 DEFAULT_TUI_REFRESH_SECONDS = 60  # Simple TUI refresh interval
 DEFAULT_DASHBOARD_REFRESH_SECONDS = 30  # Interactive dashboard refresh
 
@@ -44,6 +47,7 @@ MAX_CAPTURE_LINES = 10000  # Upper bound for capture_lines parameter
 DEFAULT_RECENT_MESSAGE_COUNT = 500  # Recent transcript entries for rich context
 DEFAULT_MAX_AGENTS_PER_VM = 3  # Max concurrent agents per VM
 DEFAULT_MAX_TURNS = 20  # Default task max turns
+DEFAULT_OBSERVE_CONCURRENCY = 8  # VMs observed in parallel by FleetObserver.observe_all
 
 # ── LLM ──────────────────────────────────────────────────────────────
 DEFAULT_LLM_MAX_TOKENS = 128000  # Max output tokens for admiral reasoning
@@ -88,6 +92,9 @@ __all__ = [
     "SSH_ACTION_TIMEOUT_SECONDS",
     "AZ_CLI_TIMEOUT_SECONDS",
     "CLI_WATCH_TIMEOUT_SECONDS",
+    "OBSERVE_TIMEOUT_SECONDS",
+    "GATHER_CACHE_TTL_SECONDS",
+    "DEFAULT_OBSERVE_CONCURRENCY",
     "MAX_CAPTURE_LINES",
     "DEFAULT_LLM_MAX_TOKENS",
     "TRANSCRIPT_MAX_TOKENS",
@@ -95,4 +102,5 @@ __all__ = [
     "DEFAULT_FLEET_DIR",
     "DEFAULT_PROJECTS_PATH",
     "DEFAULT_LAST_SCOUT_PATH",
+    "DEFAULT_TRANSCRIPT_CACHE_PATH",
 ]
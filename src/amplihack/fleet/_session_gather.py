@@ -2,9 +2,23 @@
 
 Gathers all context for a session via a single compound SSH command.
 
+Gathering is incremental. A per-session cursor, kept on the admiral side and
+sent with each command, records the tmux history size and the transcript
+byte offset already seen. The remote script ships only the pane lines that
+scrolled into history since the last call (plus the visible screen) and
+only the transcript messages appended since the last offset. Full and delta
+transcript reads alike are capped on the remote to the first
+TRANSCRIPT_EARLY_LINES and last TRANSCRIPT_RECENT_LINES messages. The local
+side stitches them onto what it already has. The slow `gh pr list` and
+`gh issue list` calls are skipped while their cached answer is younger than
+GATHER_CACHE_TTL_SECONDS and the branch/remote they were keyed on is
+unchanged. Any mismatch (pane replaced or resized, history trimmed,
+transcript rotated or truncated) makes the remote fall back to a full read.
+
 Public API:
     gather_context: Gather SessionContext for a single session.
     parse_context_output: Parse compound SSH output into SessionContext.
+    reset_gather_state: Drop all incremental cursors and cached sections.
 """
 
 from __future__ import annotations
@@ -13,12 +27,64 @@ import logging
 import re
 import shlex
 import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
 
-from amplihack.fleet._constants import SUBPROCESS_TIMEOUT_SECONDS
+from amplihack.fleet._constants import GATHER_CACHE_TTL_SECONDS, SUBPROCESS_TIMEOUT_SECONDS
 from amplihack.fleet._session_context import SessionContext
 from amplihack.fleet._status import infer_agent_status
 
-__all__ = ["gather_context", "parse_context_output"]
+__all__ = ["gather_context", "parse_context_output", "reset_gather_state"]
+
+# Transcript window shipped to the reasoner: first N + last M message lines
+TRANSCRIPT_EARLY_LINES = 50
+TRANSCRIPT_RECENT_LINES = 200
+
+# Cached branch value that can never match a real branch (forces a gh refresh)
+_FORCE_REFRESH = " "
+
+
+@dataclass
+class _GatherCursor:
+    """What the admiral already knows about one session."""
+
+    pane_key: str = ""  # "<pane_id>:<pane_width>:<history_limit>"
+    history: list[str] = field(default_factory=list)  # Lines already in tmux history
+    transcript_path: str = ""
+    transcript_offset: int = 0
+    transcript_early: list[str] = field(default_factory=list)
+    transcript_recent: deque[str] = field(
+        default_factory=lambda: deque(maxlen=TRANSCRIPT_RECENT_LINES)
+    )
+    pr_branch: str = ""
+    pr_url: str = ""
+    pr_fetched_at: float = 0.0
+    objectives_remote: str = ""
+    objectives: list[dict] = field(default_factory=list)
+    objectives_fetched_at: float = 0.0
+
+    def history_limit(self) -> int:
+        try:
+            return int(self.pane_key.rsplit(":", 1)[1])
+        except (IndexError, ValueError):
+            return 0
+
+
+_cursors: dict[tuple[str, str], _GatherCursor] = {}
+_cursors_lock = threading.Lock()
+
+
+def _get_cursor(vm_name: str, session_name: str) -> _GatherCursor:
+    with _cursors_lock:
+        return _cursors.setdefault((vm_name, session_name), _GatherCursor())
+
+
+def reset_gather_state() -> None:
+    """Forget all cursors and cached sections (next gather is a full read)."""
+    with _cursors_lock:
+        _cursors.clear()
 
 
 def _match_project(repo_url: str) -> tuple[str, list[dict]]:
@@ -51,8 +117,7 @@ def gather_context(
     Args:
         cached_tmux_capture: Pre-collected tmux output from Phase 1 (scout discovery).
             When provided, the SSH call still runs to collect git/transcript context,
-            but the tmux capture section is replaced with the cached version,
-            avoiding a redundant SSH poll of the same pane content.
+            but the pane is not captured again and the cached version is used.
     """
     context = SessionContext(
         vm_name=vm_name,
@@ -61,49 +126,140 @@ def gather_context(
         project_priorities=project_priorities,
     )
 
-    # Single compound SSH command — semicolons at statement boundaries
-    # so the script works even when newlines are stripped by SSH.
+    cursor = _get_cursor(vm_name, session_name)
+    gather_cmd = _build_gather_cmd(
+        session_name, cursor, capture_pane=not cached_tmux_capture, now=time.monotonic()
+    )
+
+    try:
+        result = subprocess.run(
+            [azlin_path, "connect", vm_name, "--no-tmux", "--yes", "--", gather_cmd],
+            capture_output=True,
+            text=True,
+            timeout=SUBPROCESS_TIMEOUT_SECONDS,
+        )
+
+        if "===TMUX===" in result.stdout or "===END===" in result.stdout or result.returncode == 0:
+            _parse_sections(result.stdout, context)
+            _apply_incremental_sections(result.stdout, context, cursor, time.monotonic())
+            _merge_local_objectives(context)
+
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError) as exc:
+        logging.getLogger(__name__).warning(
+            "Context gathering failed for %s/%s: %s", vm_name, session_name, exc
+        )
+        context.agent_status = "unreachable"
+
+    # Override with cached tmux capture from Phase 1 discovery (avoids double-poll)
+    if cached_tmux_capture:
+        context.tmux_capture = cached_tmux_capture
+        context.agent_status = infer_agent_status(cached_tmux_capture)
+
+    return context
+
+
+def _build_gather_cmd(
+    session_name: str, cursor: _GatherCursor, capture_pane: bool, now: float
+) -> str:
+    """Build the compound SSH script for one session.
+
+    Semicolons at statement boundaries so the script works even when
+    newlines are stripped by SSH.
+    """
     sess = shlex.quote(session_name)
-    gather_cmd = (
-        # Full tmux scrollback capture (no line limit)
-        f'echo "===TMUX==="; '
-        f"tmux capture-pane -t {sess} -p -S - 2>/dev/null || echo 'NO_SESSION'; "
+
+    # Pane: the remote compares the cursor's pane key and history size with
+    # the live pane. A delta capture starts one line above the new history
+    # so the local side can check the overlap before stitching. The
+    # history_size printed by the same tmux invocation as the capture
+    # detects lines that scrolled in between.
+    prev = len(cursor.history)
+    if cursor.pane_key and prev < cursor.history_limit():
+        pane_key, overlap = shlex.quote(cursor.pane_key), 1 if prev else 0
+    else:
+        pane_key, overlap = "''", 0
+    history_size = f"display-message -t {sess} -p '#{{history_size}}'"
+    tmux_delta = f"tmux capture-pane -t {sess} -p -S -$N \\; {history_size}"
+    tmux_full = f"tmux capture-pane -t {sess} -p -S - \\; {history_size}"
+    pane_cmd = (
+        'echo "===PANE==="; '
+        f"META=$(tmux display-message -t {sess} -p '#{{pane_id}}:#{{pane_width}}:#{{history_limit}}' 2>/dev/null); "
+        'if [ -z "$META" ]; then echo "NO_SESSION"; else '
+        f"H=$(tmux display-message -t {sess} -p '#{{history_size}}'); "
+        f'LIMIT="${{META##*:}}"; N=-1; '
+        f'if [ "$META" = {pane_key} ] && [ "$H" -ge {prev} ] && [ "$H" -lt "$LIMIT" ]; then '
+        f"N=$((H - {prev} + {overlap})); fi; "
+        f"if [ $N -ge 0 ]; then OUT=$({tmux_delta} 2>/dev/null); "
+        'H2=$(printf "%s\\n" "$OUT" | tail -1); '
+        'if [ "$H2" != "$H" ]; then N=-1; fi; fi; '
+        f"if [ $N -lt 0 ]; then OUT=$({tmux_full} 2>/dev/null); fi; "
+        'H2=$(printf "%s\\n" "$OUT" | tail -1); '
+        'echo "$META $H2"; '
+        'if [ $N -ge 0 ]; then echo "DELTA"; else echo "FULL"; fi; '
+        "printf '%s\\n' \"$OUT\" | sed '$d'; "
+        "fi; "
+        if capture_pane
+        else ""
+    )
+
+    # PR lookup: gh is only called when the branch changed or the TTL expired
+    pr_fresh = cursor.pr_fetched_at and now - cursor.pr_fetched_at < GATHER_CACHE_TTL_SECONDS
+    cached_branch = shlex.quote(cursor.pr_branch if pr_fresh else _FORCE_REFRESH)
+    objectives_fresh = (
+        cursor.objectives_fetched_at
+        and now - cursor.objectives_fetched_at < GATHER_CACHE_TTL_SECONDS
+    )
+    cached_remote = shlex.quote(cursor.objectives_remote if objectives_fresh else _FORCE_REFRESH)
+
+    # Transcript: only bytes after the cursor offset, cut at the last
+    # complete line so a half-written JSONL record is read next time.
+    transcript_path = shlex.quote(cursor.transcript_path)
+    transcript_offset = cursor.transcript_offset
+
+    return (
+        pane_cmd
         # Working directory
-        f'echo "===CWD==="; '
+        + 'echo "===CWD==="; '
         f'CWD=$(tmux display-message -t {sess} -p "#{{pane_current_path}}" 2>/dev/null); '
-        f'echo "$CWD"; '
+        'echo "$CWD"; '
         # Git state
-        f'echo "===GIT==="; '
-        f'if [ -n "$CWD" ] && [ -d "$CWD/.git" ]; then '
-        f'cd "$CWD"; '
-        f'echo "BRANCH:$(git branch --show-current 2>/dev/null)"; '
-        f'echo "REMOTE:$(git remote get-url origin 2>/dev/null)"; '
-        f"echo \"MODIFIED:$(git diff --name-only HEAD 2>/dev/null | head -10 | tr '\\n' ',')\"; "
+        'echo "===GIT==="; '
+        'if [ -n "$CWD" ] && [ -d "$CWD/.git" ]; then '
+        'cd "$CWD"; '
+        "BR=$(git branch --show-current 2>/dev/null); "
+        'echo "BRANCH:$BR"; '
+        'echo "REMOTE:$(git remote get-url origin 2>/dev/null)"; '
+        "echo \"MODIFIED:$(git diff --name-only HEAD 2>/dev/null | head -10 | tr '\\n' ',')\"; "
         # PR URL detection via gh CLI (more reliable than parsing git log)
-        f'PRURL=$(gh pr list --head "$(git branch --show-current 2>/dev/null)" --json url --jq ".[0].url" 2>/dev/null); '
-        f'if [ -n "$PRURL" ]; then echo "PR_URL:$PRURL"; fi; '
-        f"fi; "
-        # Transcript: first 50 + last 200 lines of user/assistant messages
-        # from the most recent JSONL in ~/.claude/projects/<project-key>/
-        f'echo "===TRANSCRIPT==="; '
-        f'if [ -n "$CWD" ]; then '
-        f'PKEY=$(echo "$CWD" | sed "s|/|-|g"); '
-        f'JSONL=$(ls -t "$HOME/.claude/projects/$PKEY/"*.jsonl 2>/dev/null | head -1); '
-        f'if [ -n "$JSONL" ]; then '
+        f'if [ "$BR" = {cached_branch} ]; then echo "PR_CACHED"; else '
+        'PRURL=$(gh pr list --head "$BR" --json url --jq ".[0].url" 2>/dev/null); '
+        'echo "PR_CHECKED:$BR"; '
+        'if [ -n "$PRURL" ]; then echo "PR_URL:$PRURL"; fi; fi; '
+        "fi; "
+        # Transcript: user/assistant text lines appended to the most recent
+        # JSONL in ~/.claude/projects/<project-key>/ since the cursor
+        'echo "===TRANSCRIPT_DELTA==="; '
+        'if [ -n "$CWD" ]; then '
+        'PKEY=$(echo "$CWD" | sed "s|/|-|g"); '
+        'JSONL=$(ls -t "$HOME/.claude/projects/$PKEY/"*.jsonl 2>/dev/null | head -1); '
+        'if [ -n "$JSONL" ]; then '
+        'SIZE=$(wc -c < "$JSONL"); '
+        f'if [ "$JSONL" = {transcript_path} ] && [ "$SIZE" -ge {transcript_offset} ]; then '
+        f"OFF={transcript_offset}; MODE=DELTA; else OFF=0; MODE=FULL; fi; "
+        'NL=$(tail -c +$((OFF + 1)) "$JSONL" | head -c $((SIZE - OFF)) | wc -l); '
+        'USED=$(tail -c +$((OFF + 1)) "$JSONL" | head -n "$NL" | wc -c); '
+        'printf \'%s\\t%s\\t%s\\n\' "$JSONL" $((OFF + USED)) "$MODE"; '
         # Extract user/assistant text lines via grep + sed (no python needed)
-        f'MSGS=$(grep -E \'"type":"(user|assistant)"\' "$JSONL" 2>/dev/null '
-        f'| grep -oP \'"text":"[^"]*"\' '
-        f'| sed \'s/"text":"//;s/"$//\' '
-        f"| grep -v '^$'); "
-        f'TOTAL=$(echo "$MSGS" | wc -l); '
-        f'echo "TRANSCRIPT_LINES:$TOTAL"; '
-        # First 50 lines (early context — what the user asked for)
-        f'echo "---EARLY---"; '
-        f'echo "$MSGS" | head -50; '
-        # Last 200 lines (recent activity)
-        f'echo "---RECENT---"; '
-        f'echo "$MSGS" | tail -200; '
-        f"fi; fi; "
+        'tail -c +$((OFF + 1)) "$JSONL" | head -n "$NL" '
+        '| grep -E \'"type":"(user|assistant)"\' 2>/dev/null '
+        '| grep -oP \'"text":"[^"]*"\' '
+        '| sed \'s/"text":"//;s/"$//\' '
+        "| grep -v '^$' "
+        # Ship at most the first N + last M messages; the local side keeps no more
+        f"| awk -v h={TRANSCRIPT_EARLY_LINES} -v t={TRANSCRIPT_RECENT_LINES} "
+        "'NR<=h{print;next}{buf[NR%t]=$0}"
+        "END{for(i=(NR-t>h?NR-t+1:h+1);i<=NR;i++)print buf[i%t]}'; "
+        "fi; fi; "
         # Lightweight VM health (memory + disk) for reasoning context
         'echo "===HEALTH==="; '
         "MEM=$(free -m 2>/dev/null | grep Mem | awk '{printf \"%.0f\", $3/$2*100}'); "
@@ -111,43 +267,168 @@ def gather_context(
         "LOAD=$(cat /proc/loadavg 2>/dev/null | awk '{print $1}'); "
         'echo "mem=${MEM:-?}% disk=${DISK:-?}% load=${LOAD:-?}"; '
         # Fleet objectives from GitHub issues (if gh is available and repo has the label)
-        'echo "===OBJECTIVES==="; '
+        'REMOTE=""; '
         'if [ -n "$CWD" ] && command -v gh >/dev/null 2>&1; then '
-        'REMOTE=$(cd "$CWD" 2>/dev/null && git remote get-url origin 2>/dev/null); '
+        'REMOTE=$(cd "$CWD" 2>/dev/null && git remote get-url origin 2>/dev/null); fi; '
+        f'if [ -n "$REMOTE" ] && [ "$REMOTE" = {cached_remote} ]; then '
+        'echo "===OBJECTIVES_CACHED==="; else '
+        'echo "===OBJECTIVES==="; '
         'if [ -n "$REMOTE" ]; then '
+        'echo "OBJECTIVES_REMOTE:$REMOTE"; '
         'gh issue list --repo "$REMOTE" --label fleet-objective '
         "--json number,title,state --jq '.[]|[.number,.title,.state]|@tsv' 2>/dev/null; "
         "fi; fi; "
         'echo "===END==="'
     )
 
-    try:
-        result = subprocess.run(
-            [azlin_path, "connect", vm_name, "--no-tmux", "--yes", "--", gather_cmd],
-            capture_output=True,
-            text=True,
-            timeout=SUBPROCESS_TIMEOUT_SECONDS,
-        )
 
-        if "===TMUX===" in result.stdout or "===END===" in result.stdout or result.returncode == 0:
-            parse_context_output(result.stdout, context)
+def _marker_sections(output: str) -> dict[str, list[str]]:
+    """Split output into {label: lines} on whole-line ===LABEL=== markers."""
+    sections: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    for line in output.split("\n"):
+        if line.startswith("===") and line.endswith("===") and len(line) > 6:
+            current = sections.setdefault(line[3:-3], [])
+        elif current is not None:
+            current.append(line)
+    return sections
+
+
+def _apply_incremental_sections(
+    output: str, context: SessionContext, cursor: _GatherCursor, now: float
+) -> None:
+    """Fold the delta sections into the cursor and fill the context from it."""
+    sections = _marker_sections(output)
+
+    if "PANE" in sections:
+        _apply_pane(sections["PANE"], context, cursor)
+
+    git_lines = sections.get("GIT", [])
+    for line in git_lines:
+        if line.startswith("PR_CHECKED:"):
+            cursor.pr_branch = line[len("PR_CHECKED:") :]
+            cursor.pr_url = context.pr_url
+            cursor.pr_fetched_at = now
+    if "PR_CACHED" in git_lines:
+        context.pr_url = cursor.pr_url
+
+    if "TRANSCRIPT_DELTA" in sections:
+        _apply_transcript(sections["TRANSCRIPT_DELTA"], context, cursor)
+
+    if "OBJECTIVES" in sections:
+        remote = ""
+        for line in sections["OBJECTIVES"]:
+            if line.startswith("OBJECTIVES_REMOTE:"):
+                remote = line[len("OBJECTIVES_REMOTE:") :]
+        if remote:
+            cursor.objectives_remote = remote
+            cursor.objectives = [dict(o) for o in context.project_objectives]
+            cursor.objectives_fetched_at = now
+    elif "OBJECTIVES_CACHED" in sections:
+        context.project_objectives.extend(dict(o) for o in cursor.objectives)
+
+
+def _apply_pane(lines: list[str], context: SessionContext, cursor: _GatherCursor) -> None:
+    if not lines or lines[0] == "NO_SESSION" or len(lines) < 2:
+        cursor.pane_key, cursor.history = "", []
+        context.agent_status = "no_session"
+        return
+
+    meta, _, size = lines[0].rpartition(" ")
+    mode = lines[1]
+    captured = lines[2:]
+    if captured and captured[-1] == "":
+        captured.pop()  # Trailing newline of the last captured line
 
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError) as exc:
-        logging.getLogger(__name__).warning(
-            "Context gathering failed for %s/%s: %s", vm_name, session_name, exc
+    try:
+        history_size = int(size)
+    except ValueError:
+        cursor.pane_key, cursor.history = "", []
+        return
+
+    full = captured
+    if mode == "DELTA" and cursor.history:
+        if captured and captured[0] == cursor.history[-1]:
+            full = cursor.history[:-1] + captured
+        else:
+            # History was rewritten under us (e.g. clear-history): use what
+            # was shipped this time and start over on the next gather.
+            meta = ""
+
+    cursor.pane_key = meta
+    cursor.history = full[:history_size] if meta else []
+
+    tmux_text = "\n".join(full).strip()
+    context.tmux_capture = tmux_text
+    context.agent_status = infer_agent_status(tmux_text)
+
+
+def _apply_transcript(lines: list[str], context: SessionContext, cursor: _GatherCursor) -> None:
+    if not lines or not lines[0]:
+        cursor.transcript_path, cursor.transcript_offset = "", 0
+        cursor.transcript_early, cursor.transcript_recent = (
+            [],
+            deque(maxlen=TRANSCRIPT_RECENT_LINES),
         )
-        context.agent_status = "unreachable"
-
-    # Override with cached tmux capture from Phase 1 discovery (avoids double-poll)
-    if cached_tmux_capture:
-        context.tmux_capture = cached_tmux_capture
-        context.agent_status = infer_agent_status(cached_tmux_capture)
+        return
 
-    return context
+    try:
+        path, offset, mode = lines[0].split("\t")
+        new_offset = int(offset)
+    except ValueError:
+        return
+
+    if mode != "DELTA" or path != cursor.transcript_path:
+        cursor.transcript_early = []
+        cursor.transcript_recent = deque(maxlen=TRANSCRIPT_RECENT_LINES)
+    for message in lines[1:]:
+        if not message:
+            continue
+        if len(cursor.transcript_early) < TRANSCRIPT_EARLY_LINES:
+            cursor.transcript_early.append(message)
+        cursor.transcript_recent.append(message)
+    cursor.transcript_path, cursor.transcript_offset = path, new_offset
+
+    summary = _format_transcript(
+        "\n".join(cursor.transcript_early).strip(),
+        "\n".join(cursor.transcript_recent).strip(),
+    )
+    if summary:
+        context.transcript_summary = summary
+        _scan_transcript_for_pr(context)
+
+
+def _format_transcript(early: str, recent: str) -> str:
+    """Combine early context + separator + recent activity."""
+    transcript_parts = []
+    if early:
+        transcript_parts.append("=== Session start ===")
+        transcript_parts.append(early)
+    if recent:
+        if early:
+            transcript_parts.append("\n=== Recent activity ===")
+        transcript_parts.append(recent)
+    return "\n".join(transcript_parts)
+
+
+def _scan_transcript_for_pr(context: SessionContext) -> None:
+    """Check for PR links in the transcript summary."""
+    for line in context.transcript_summary.split("\n"):
+        if "PR_CREATED:" in line:
+            context.pr_url = line.split("PR_CREATED:")[-1].strip()
+        elif "pull/" in line and "github.com" in line:
+            pr_match = re.search(r'https://github\.com/[^\s"]+/pull/\d+', line)
+            if pr_match:
+                context.pr_url = pr_match.group(0)
 
 
 def parse_context_output(output: str, context: SessionContext) -> None:
     """Parse the compound SSH output into SessionContext."""
+    _parse_sections(output, context)
+    _merge_local_objectives(context)
+
+
+def _parse_sections(output: str, context: SessionContext) -> None:
     sections = output.split("===")
 
     for i, section in enumerate(sections):
@@ -191,26 +472,8 @@ def parse_context_output(output: str, context: SessionContext) -> None:
                 elif parts_text:
                     recent = parts_text
 
-                # Combine: early context + separator + recent activity
-                transcript_parts = []
-                if early:
-                    transcript_parts.append("=== Session start ===")
-                    transcript_parts.append(early)
-                if recent:
-                    if early:
-                        transcript_parts.append("\n=== Recent activity ===")
-                    transcript_parts.append(recent)
-
-                context.transcript_summary = "\n".join(transcript_parts)
-
-                # Check for PR links in transcript
-                for line in context.transcript_summary.split("\n"):
-                    if "PR_CREATED:" in line:
-                        context.pr_url = line.split("PR_CREATED:")[-1].strip()
-                    elif "pull/" in line and "github.com" in line:
-                        pr_match = re.search(r'https://github\.com/[^\s"]+/pull/\d+', line)
-                        if pr_match:
-                            context.pr_url = pr_match.group(0)
+                context.transcript_summary = _format_transcript(early, recent)
+                _scan_transcript_for_pr(context)
 
         elif label == "HEALTH" and i + 1 < len(sections):
             health_text = sections[i + 1].strip()
@@ -240,6 +503,8 @@ def parse_context_output(output: str, context: SessionContext) -> None:
                         except (ValueError, IndexError):
                             continue
 
+
+def _merge_local_objectives(context: SessionContext) -> None:
     # Enrich with local project data after parsing repo_url
     if context.repo_url:
         proj_name, local_objs = _match_project(context.repo_url)
@@ -0,0 +1,280 @@
+"""Per-file transcript analysis with an offset-indexed result cache.
+
+Extracted from transcript_analyzer.py to keep it under 300 LOC.
+
+Each transcript is reduced to a TranscriptPartial (counters, message count,
+workflow steps seen). Partials merge associatively, so a file's result is
+the merge of its segments and a report is the merge of its files, in order.
+TranscriptCache remembers, per path, the partial for every complete line up
+to a byte offset together with the file's inode and a fingerprint of the
+first and last bytes before the offset. An appended file only has its new
+tail parsed; a replaced or rewritten file is parsed again from the start.
+
+Public API:
+    TranscriptPartial: Mergeable per-file analysis counters
+    TranscriptCache: Persistent {path: (inode, offset, partial)} cache
+    analyze_segment: Parse a file from a byte offset (process-pool friendly)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from amplihack.fleet._transcript_report import (
+    AGENT_RE,
+    SKILL_INVOKE_RE,
+    SKILL_RE,
+    STRATEGY_KEYWORDS,
+    WORKFLOW_STEP_RE,
+)
+
+__all__ = ["TranscriptPartial", "TranscriptCache", "analyze_segment"]
+
+logger = logging.getLogger(__name__)
+
+# Bytes at each end of the cached range that must be unchanged to trust the entry
+FINGERPRINT_BYTES = 256
+
+
+@dataclass
+class TranscriptPartial:
+    """Analysis counters for one transcript, or one byte range of it."""
+
+    tool_usage: Counter = field(default_factory=Counter)
+    skill_invocations: Counter = field(default_factory=Counter)
+    agent_types: Counter = field(default_factory=Counter)
+    strategy_patterns: Counter = field(default_factory=Counter)
+    messages: int = 0
+    steps: set[str] = field(default_factory=set)
+
+    def merge(self, other: TranscriptPartial) -> TranscriptPartial:
+        """Return self + other (counters add, steps union). Associative."""
+        merged = TranscriptPartial(
+            tool_usage=self.tool_usage.copy(),
+            skill_invocations=self.skill_invocations.copy(),
+            agent_types=self.agent_types.copy(),
+            strategy_patterns=self.strategy_patterns.copy(),
+            messages=self.messages,
+            steps=set(self.steps),
+        )
+        merged.tool_usage.update(other.tool_usage)
+        merged.skill_invocations.update(other.skill_invocations)
+        merged.agent_types.update(other.agent_types)
+        merged.strategy_patterns.update(other.strategy_patterns)
+        merged.messages += other.messages
+        merged.steps |= other.steps
+        return merged
+
+    def to_dict(self) -> dict:
+        return {
+            "tool_usage": dict(self.tool_usage),
+            "skill_invocations": dict(self.skill_invocations),
+            "agent_types": dict(self.agent_types),
+            "strategy_patterns": dict(self.strategy_patterns),
+            "messages": self.messages,
+            "steps": sorted(self.steps),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TranscriptPartial:
+        return cls(
+            tool_usage=Counter(data.get("tool_usage", {})),
+            skill_invocations=Counter(data.get("skill_invocations", {})),
+            agent_types=Counter(data.get("agent_types", {})),
+            strategy_patterns=Counter(data.get("strategy_patterns", {})),
+            messages=int(data.get("messages", 0)),
+            steps=set(data.get("steps", [])),
+        )
+
+
+def analyze_segment(
+    path: str, start: int = 0
+) -> tuple[TranscriptPartial, int, TranscriptPartial] | None:
+    """Analyze ``path`` from byte offset ``start`` to EOF.
+
+    Returns (complete, end, trailing): ``complete`` covers every line that
+    ends with a newline and ``end`` is the offset just past the last one.
+    ``trailing`` covers a final unterminated line (possibly a record still
+    being written), which callers use for this run but must not cache.
+    Returns None if the file cannot be read.
+    """
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(start)
+            data = fh.read()
+    except OSError as exc:
+        logger.warning("Cannot read transcript file %s: %s", path, exc)
+        return None
+
+    cut = max(data.rfind(b"\n"), data.rfind(b"\r")) + 1
+    return _analyze_lines(data[:cut]), start + cut, _analyze_lines(data[cut:])
+
+
+def _analyze_lines(data: bytes) -> TranscriptPartial:
+    partial = TranscriptPartial()
+    # bytes.splitlines() splits on \n, \r and \r\n only -- the same line
+    # boundaries as iterating a text-mode file.
+    for raw in data.splitlines():
+        line = raw.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        partial.messages += 1
+        entry_type = entry.get("type", "")
+        if entry_type == "assistant":
+            _extract_assistant_patterns(entry, partial)
+        elif entry_type == "user":
+            _extract_user_patterns(entry, partial)
+    return partial
+
+
+def _extract_assistant_patterns(entry: dict, partial: TranscriptPartial) -> None:
+    """Extract patterns from an assistant message entry."""
+    message = entry.get("message", {})
+    content = message.get("content")
+    if not isinstance(content, list):
+        return
+    for block in content:
+        if not isinstance(block, dict):
+            continue
+        block_type = block.get("type", "")
+        if block_type == "tool_use":
+            tool_name = block.get("name", "unknown")
+            partial.tool_usage[tool_name] += 1
+            tool_input = block.get("input", {})
+            input_str = json.dumps(tool_input) if isinstance(tool_input, dict) else str(tool_input)
+            _scan_for_skills(input_str, partial)
+            _scan_for_agents(input_str, partial)
+        elif block_type == "text":
+            text = block.get("text", "")
+            _scan_for_skills(text, partial)
+            _scan_for_agents(text, partial)
+            _scan_for_strategies(text, partial)
+            _scan_for_workflow_steps(text, partial)
+
+
+def _extract_user_patterns(entry: dict, partial: TranscriptPartial) -> None:
+    """Extract patterns from a user message entry."""
+    message = entry.get("message", {})
+    content = message.get("content", "")
+    if isinstance(content, list):
+        text = " ".join(b.get("text", "") if isinstance(b, dict) else str(b) for b in content)
+    else:
+        text = str(content)
+    _scan_for_strategies(text, partial)
+
+
+def _scan_for_skills(text: str, partial: TranscriptPartial) -> None:
+    for match in SKILL_RE.finditer(text):
+        partial.skill_invocations[match.group(1)] += 1
+    for match in SKILL_INVOKE_RE.finditer(text):
+        partial.skill_invocations[match.group(1)] += 1
+
+
+def _scan_for_agents(text: str, partial: TranscriptPartial) -> None:
+    for match in AGENT_RE.finditer(text):
+        partial.agent_types[match.group(1)] += 1
+
+
+def _scan_for_strategies(text: str, partial: TranscriptPartial) -> None:
+    text_lower = text.lower()
+    for keyword, strategy_name in STRATEGY_KEYWORDS.items():
+        if keyword in text_lower:
+            partial.strategy_patterns[strategy_name] += 1
+
+
+def _scan_for_workflow_steps(text: str, partial: TranscriptPartial) -> None:
+    for match in WORKFLOW_STEP_RE.finditer(text):
+        partial.steps.add(f"step_{match.group(1)}")
+
+
+def _fingerprint(path: str, offset: int) -> str:
+    """Hash of the first and last FINGERPRINT_BYTES before ``offset``."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as fh:
+        digest.update(fh.read(min(offset, FINGERPRINT_BYTES)))
+        tail_start = max(0, offset - FINGERPRINT_BYTES)
+        fh.seek(tail_start)
+        digest.update(fh.read(offset - tail_start))
+    return digest.hexdigest()
+
+
+class TranscriptCache:
+    """Per-file analysis results keyed by path, inode and byte offset.
+
+    With ``path=None`` the cache lives only as long as the object.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path) if path else None
+        self._entries: dict[str, dict] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            self._entries = {}
+            if self.path is not None and self.path.is_file():
+                try:
+                    self._entries = json.loads(self.path.read_text())["files"]
+                except (OSError, ValueError, KeyError, TypeError) as exc:
+                    logger.warning("Ignoring unreadable transcript cache %s: %s", self.path, exc)
+        return self._entries
+
+    def lookup(self, path: str) -> tuple[TranscriptPartial, int]:
+        """Return (cached partial, offset to resume from) for ``path``.
+
+        Returns an empty partial and offset 0 when nothing reusable is cached.
+        """
+        entry = self._load().get(path)
+        if entry is not None:
+            try:
+                st = os.stat(path)
+                offset = entry["offset"]
+                if (
+                    st.st_ino == entry["inode"]
+                    and st.st_size >= offset
+                    and _fingerprint(path, offset) == entry["fingerprint"]
+                ):
+                    return TranscriptPartial.from_dict(entry["partial"]), offset
+            except (OSError, KeyError, TypeError):
+                pass
+        return TranscriptPartial(), 0
+
+    def store(self, path: str, partial: TranscriptPartial, offset: int) -> None:
+        try:
+            inode = os.stat(path).st_ino
+            fingerprint = _fingerprint(path, offset)
+        except OSError:
+            return
+        self._load()[path] = {
+            "inode": inode,
+            "offset": offset,
+            "fingerprint": fingerprint,
+            "partial": partial.to_dict(),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk (atomic replace), dropping vanished files."""
+        if self.path is None or not self._dirty:
+            return
+        entries = {p: e for p, e in self._load().items() if os.path.exists(p)}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as fh:
+                json.dump({"files": entries}, fh)
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError as exc:
+            logger.warning("Failed to write transcript cache %s: %s", self.path, exc)
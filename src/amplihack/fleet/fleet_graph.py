@@ -1,5 +1,13 @@
 """Fleet knowledge graph -- lightweight JSON adjacency graph for fleet relationships.
 
+Edges are indexed by (source, type) and (target, type), so neighbor and
+project queries touch only the matching edges. Persistence is a JSON
+snapshot plus an append-only JSONL mutation log next to it: each mutation
+(or each batch) appends its records to the log, and the log is folded into
+a fresh snapshot once it outgrows the graph. Loading reads the snapshot and
+replays the log, so its cost is bounded by the graph size rather than by
+the number of mutations ever made.
+
 Public API: FleetGraph, GraphNode, GraphEdge, NodeType, EdgeType
 """
 
@@ -17,6 +25,9 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["FleetGraph", "GraphNode", "GraphEdge", "NodeType", "EdgeType"]
 
+# Mutation log records tolerated before compaction, however small the graph
+COMPACT_MIN_LOG_ENTRIES = 1000
+
 
 class NodeType(Enum):
     """Types of entities in the fleet graph."""
@@ -78,9 +89,25 @@ class FleetGraph:
     edges: list[GraphEdge] = field(default_factory=list)
     persist_path: Path | None = None
     _batching: bool = field(default=False, repr=False)
+    # Position in self.edges of each (source, target, type) edge key
+    _edge_index: dict[tuple[str, str, EdgeType], int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Edge positions by (source, type) and (target, type), in ascending order
+    _outgoing: dict[tuple[str, EdgeType], list[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _incoming: dict[tuple[str, EdgeType], list[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _pending: list[dict] = field(default_factory=list, init=False, repr=False, compare=False)
+    _log_entries: int = field(default=0, init=False, repr=False, compare=False)
+    # Log ends mid-line (crash during an append); next append starts a new line
+    _log_truncated: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if self.persist_path and self.persist_path.exists():
+        self._reindex()
+        if self.persist_path and (self.persist_path.exists() or self._log_path.exists()):
             self.load()
 
     class _BatchContext:
@@ -112,7 +139,7 @@ class FleetGraph:
             updated_at=datetime.now(),
         )
         self.nodes[node_id] = node
-        self._save()
+        self._record(self._node_record(node))
         return node
 
     def get_node(self, node_id: str) -> GraphNode | None:
@@ -126,62 +153,72 @@ class FleetGraph:
     def add_edge(
         self, source_id: str, target_id: str, edge_type: EdgeType, **metadata
     ) -> GraphEdge:
-        """Add a relationship. Deduplicates by (source, target, type)."""
-        # Remove existing edge of same type between same nodes
-        self.edges = [
-            e
-            for e in self.edges
-            if not (
-                e.source_id == source_id and e.target_id == target_id and e.edge_type == edge_type
-            )
-        ]
+        """Add a relationship. Deduplicates by (source, target, type).
+
+        Re-adding an existing edge replaces its metadata in place.
+        """
         edge = GraphEdge(
             source_id=source_id,
             target_id=target_id,
             edge_type=edge_type,
             metadata=metadata,
         )
-        self.edges.append(edge)
-        self._save()
+        self._insert_edge(edge)
+        self._record(self._edge_record(edge))
         return edge
 
     def neighbors(self, node_id: str, edge_type: EdgeType | None = None) -> list[str]:
         """Get IDs of connected nodes."""
+        types = list(EdgeType) if edge_type is None else [edge_type]
+        positions: set[int] = set()
+        for t in types:
+            positions.update(self._outgoing.get((node_id, t), ()))
+            positions.update(self._incoming.get((node_id, t), ()))
         result = []
-        for edge in self.edges:
-            if edge.source_id == node_id:
-                if edge_type is None or edge.edge_type == edge_type:
-                    result.append(edge.target_id)
-            elif edge.target_id == node_id:
-                if edge_type is None or edge.edge_type == edge_type:
-                    result.append(edge.source_id)
+        for pos in sorted(positions):
+            edge = self.edges[pos]
+            result.append(edge.target_id if edge.source_id == node_id else edge.source_id)
         return result
 
     def edges_from(self, node_id: str, edge_type: EdgeType | None = None) -> list[GraphEdge]:
         """Get outgoing edges from a node."""
-        return [
-            e
-            for e in self.edges
-            if e.source_id == node_id and (edge_type is None or e.edge_type == edge_type)
-        ]
+        if edge_type is not None:
+            return [self.edges[pos] for pos in self._outgoing.get((node_id, edge_type), ())]
+        positions = sorted(pos for t in EdgeType for pos in self._outgoing.get((node_id, t), ()))
+        return [self.edges[pos] for pos in positions]
+
+    def _insert_edge(self, edge: GraphEdge) -> None:
+        """Add edge to the list and indexes, replacing an edge with the same key."""
+        key = (edge.source_id, edge.target_id, edge.edge_type)
+        pos = self._edge_index.get(key)
+        if pos is not None:
+            self.edges[pos] = edge
+            return
+        pos = len(self.edges)
+        self.edges.append(edge)
+        self._edge_index[key] = pos
+        self._outgoing.setdefault((edge.source_id, edge.edge_type), []).append(pos)
+        self._incoming.setdefault((edge.target_id, edge.edge_type), []).append(pos)
+
+    def _reindex(self) -> None:
+        """Rebuild the edge indexes from self.edges (dropping duplicate keys)."""
+        edges, self.edges = self.edges, []
+        self._edge_index, self._outgoing, self._incoming = {}, {}, {}
+        for edge in edges:
+            self._insert_edge(edge)
 
     # --- Fleet-specific queries ---
 
     def detect_conflicts(self, task_id: str) -> list[str]:
         """Find tasks that modify the same files as the given task."""
-        my_files = set(self.neighbors(task_id, EdgeType.MODIFIES))
-        if not my_files:
-            return []
-
-        conflicts = []
-        for node in self.nodes_of_type(NodeType.TASK):
-            if node.id == task_id:
-                continue
-            their_files = set(self.neighbors(node.id, EdgeType.MODIFIES))
-            if my_files & their_files:
-                conflicts.append(node.id)
+        conflicts: dict[str, None] = {}
+        for file_id in dict.fromkeys(self.neighbors(task_id, EdgeType.MODIFIES)):
+            for other_id in self.neighbors(file_id, EdgeType.MODIFIES):
+                node = self.nodes.get(other_id)
+                if other_id != task_id and node and node.node_type == NodeType.TASK:
+                    conflicts[other_id] = None
 
-        return conflicts
+        return list(conflicts)
 
     def task_dependencies(self, task_id: str) -> list[str]:
         """Get tasks that must complete before this one."""
@@ -189,11 +226,7 @@ class FleetGraph:
 
     def project_tasks(self, project_id: str) -> list[str]:
         """Get all task IDs for a project."""
-        return [
-            e.target_id
-            for e in self.edges
-            if e.source_id == project_id and e.edge_type == EdgeType.CONTAINS
-        ]
+        return [e.target_id for e in self.edges_from(project_id, EdgeType.CONTAINS)]
 
     def project_prs(self, project_id: str) -> list[str]:
         """Get all PR IDs produced by tasks in a project."""
@@ -228,7 +261,38 @@ class FleetGraph:
 
     # --- Persistence ---
 
+    @property
+    def _log_path(self) -> Path:
+        assert self.persist_path is not None
+        return self.persist_path.with_name(self.persist_path.name + ".log")
+
+    @staticmethod
+    def _node_record(node: GraphNode) -> dict:
+        return {
+            "op": "node",
+            "id": node.id,
+            "type": node.node_type.value,
+            "label": node.label,
+            "metadata": node.metadata,
+        }
+
+    @staticmethod
+    def _edge_record(edge: GraphEdge) -> dict:
+        return {
+            "op": "edge",
+            "source": edge.source_id,
+            "target": edge.target_id,
+            "type": edge.edge_type.value,
+            "metadata": edge.metadata,
+        }
+
+    def _record(self, record: dict) -> None:
+        if self.persist_path:
+            self._pending.append(record)
+        self._save()
+
     def _save(self) -> None:
+        """Append pending mutations to the log, compacting it once it outgrows the graph."""
         if self._batching:
             return
         if not self.persist_path:
@@ -238,6 +302,29 @@ class FleetGraph:
                 "Refusing to save — load failed for %s. Fix the .bak file manually.",
                 self.persist_path,
             )
+            self._pending.clear()
+            return
+        if not self._pending:
+            return
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        pending, self._pending = self._pending, []
+        with open(self._log_path, "a") as f:
+            f.write(
+                ("\n" if self._log_truncated else "")
+                + "".join(json.dumps(record) + "\n" for record in pending)
+            )
+        self._log_truncated = False
+        self._log_entries += len(pending)
+        if self._log_entries > max(COMPACT_MIN_LOG_ENTRIES, len(self.nodes) + len(self.edges)):
+            self.compact()
+
+    def compact(self) -> None:
+        """Write a full snapshot and truncate the mutation log.
+
+        Replaying log records is idempotent, so a crash between writing the
+        snapshot and truncating the log loses nothing.
+        """
+        if not self.persist_path or getattr(self, "_load_failed", False):
             return
         self.persist_path.parent.mkdir(parents=True, exist_ok=True)
         data = {
@@ -263,18 +350,23 @@ class FleetGraph:
         tmp = self.persist_path.with_suffix(".tmp")
         tmp.write_text(json.dumps(data, indent=2))
         tmp.rename(self.persist_path)
+        self._log_path.write_text("")
+        self._log_entries = 0
+        self._log_truncated = False
 
     def load(self) -> None:
-        if not self.persist_path or not self.persist_path.exists():
-            return
-        try:
-            data = json.loads(self.persist_path.read_text())
-        except json.JSONDecodeError:
-            logger.warning(f"Corrupt graph file: {self.persist_path} — creating backup")
-            backup = self.persist_path.with_suffix(".json.bak")
-            shutil.copy2(self.persist_path, backup)
-            self._load_failed = True
+        if not self.persist_path:
             return
+        data: dict = {}
+        if self.persist_path.exists():
+            try:
+                data = json.loads(self.persist_path.read_text())
+            except json.JSONDecodeError:
+                logger.warning(f"Corrupt graph file: {self.persist_path} — creating backup")
+                backup = self.persist_path.with_suffix(".json.bak")
+                shutil.copy2(self.persist_path, backup)
+                self._load_failed = True
+                return
         self.nodes = {}
         for nid, ndata in data.get("nodes", {}).items():
             try:
@@ -287,15 +379,45 @@ class FleetGraph:
             except (KeyError, TypeError, ValueError) as e:
                 logger.warning(f"Skipping corrupt graph node {nid}: {e}")
         self.edges = []
+        self._reindex()
         for edata in data.get("edges", []):
             try:
-                self.edges.append(
-                    GraphEdge(
-                        source_id=edata["source"],
-                        target_id=edata["target"],
-                        edge_type=EdgeType(edata["type"]),
-                        metadata=edata.get("metadata", {}),
-                    )
-                )
+                self._insert_edge(self._edge_from_record(edata))
             except (KeyError, TypeError, ValueError) as e:
                 logger.warning(f"Skipping corrupt graph edge: {e}")
+        self._replay_log()
+
+    def _replay_log(self) -> None:
+        """Apply mutation log records written since the last snapshot."""
+        self._log_entries = 0
+        if not self._log_path.exists():
+            return
+        text = self._log_path.read_text()
+        self._log_truncated = bool(text) and not text.endswith("\n")
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            self._log_entries += 1
+            try:
+                record = json.loads(line)
+                if record["op"] == "node":
+                    self.nodes[record["id"]] = GraphNode(
+                        id=record["id"],
+                        node_type=NodeType(record["type"]),
+                        label=record.get("label", record["id"]),
+                        metadata=record.get("metadata", {}),
+                    )
+                elif record["op"] == "edge":
+                    self._insert_edge(self._edge_from_record(record))
+            except (KeyError, TypeError, ValueError) as e:
+                # A truncated last line is expected after a crash mid-append
+                logger.warning(f"Skipping corrupt graph log record: {e}")
+
+    @staticmethod
+    def _edge_from_record(record: dict) -> GraphEdge:
+        return GraphEdge(
+            source_id=record["source"],
+            target_id=record["target"],
+            edge_type=EdgeType(record["type"]),
+            metadata=record.get("metadata", {}),
+        )
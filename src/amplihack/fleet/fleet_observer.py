@@ -8,6 +8,11 @@ Uses tmux capture-pane to read agent output and classify state:
 - ERROR: error messages detected in output
 - WAITING_INPUT: agent waiting for user input
 
+observe_all() groups sessions by VM and captures every pane of a VM in a
+single `azlin connect` round trip (one Bastion tunnel per VM instead of one
+per session). VMs are captured concurrently in a bounded thread pool, each
+with its own deadline, so one hung VM cannot stall the rest of the fleet.
+
 Public API:
     FleetObserver: Observes and classifies agent state in tmux sessions
 """
@@ -16,8 +21,11 @@ from __future__ import annotations
 
 import logging
 import re
+import secrets
+import shlex
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -29,7 +37,9 @@ from amplihack.fleet._constants import (
     CONFIDENCE_RUNNING,
     CONFIDENCE_UNKNOWN,
     DEFAULT_CAPTURE_LINES,
+    DEFAULT_OBSERVE_CONCURRENCY,
     DEFAULT_STUCK_THRESHOLD_SECONDS,
+    OBSERVE_TIMEOUT_SECONDS,
 )
 from amplihack.fleet._defaults import get_azlin_path
 from amplihack.fleet._validation import validate_vm_name
@@ -114,6 +124,8 @@ class FleetObserver:
     _previous_captures: dict[str, str] = field(default_factory=dict)
     _last_change_time: dict[str, float] = field(default_factory=dict)
     stuck_threshold_seconds: float = DEFAULT_STUCK_THRESHOLD_SECONDS
+    capture_timeout: float = OBSERVE_TIMEOUT_SECONDS
+    max_workers: int = DEFAULT_OBSERVE_CONCURRENCY
 
     def observe_session(self, vm_name: str, session_name: str) -> ObservationResult:
         """Observe a single tmux session and classify agent state.
@@ -125,8 +137,51 @@ class FleetObserver:
         Returns:
             ObservationResult with classified status
         """
-        pane_content = self._capture_pane(vm_name, session_name)
+        return self._build_result(vm_name, session_name, self._capture_pane(vm_name, session_name))
 
+    def observe_all(
+        self,
+        sessions: list[TmuxSessionInfo],
+    ) -> list[ObservationResult]:
+        """Observe multiple sessions and return classified results.
+
+        Sessions are grouped per VM and each VM is captured in one round
+        trip; VMs run concurrently (at most ``max_workers`` at a time).
+        Results are returned in the order of ``sessions``. Sessions on a VM
+        that fails or misses its deadline are reported as UNKNOWN.
+        """
+        by_vm: dict[str, list[str]] = {}
+        for sess in sessions:
+            validate_vm_name(sess.vm_name)
+            names = by_vm.setdefault(sess.vm_name, [])
+            if sess.session_name and sess.session_name not in names:
+                names.append(sess.session_name)
+
+        captures: dict[str, dict[str, str]] = {}
+        if by_vm:
+            workers = max(1, min(self.max_workers, len(by_vm)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    vm_name: pool.submit(self._capture_vm_panes, vm_name, names)
+                    for vm_name, names in by_vm.items()
+                }
+                captures = {vm_name: future.result() for vm_name, future in futures.items()}
+
+        # Classification mutates the stuck-tracking dicts, so it stays on
+        # the calling thread; only the SSH round trips run in parallel.
+        return [
+            self._build_result(
+                sess.vm_name,
+                sess.session_name,
+                captures.get(sess.vm_name, {}).get(sess.session_name),
+            )
+            for sess in sessions
+        ]
+
+    def _build_result(
+        self, vm_name: str, session_name: str, pane_content: str | None
+    ) -> ObservationResult:
+        """Classify captured pane content into an ObservationResult."""
         if pane_content is None:
             return ObservationResult(
                 session_name=session_name,
@@ -151,21 +206,8 @@ class FleetObserver:
             observed_at=datetime.now(),
         )
 
-    def observe_all(
-        self,
-        sessions: list[TmuxSessionInfo],
-    ) -> list[ObservationResult]:
-        """Observe multiple sessions and return classified results."""
-        results = []
-        for sess in sessions:
-            result = self.observe_session(sess.vm_name, sess.session_name)
-            results.append(result)
-        return results
-
     def _capture_pane(self, vm_name: str, session_name: str) -> str | None:
         """Capture tmux pane content from a remote VM."""
-        import shlex
-
         validate_vm_name(vm_name)
         # shlex.quote handles safety for the session name in the SSH command.
         # Don't use validate_session_name here — tmux reports names like "(none)"
@@ -179,7 +221,7 @@ class FleetObserver:
                 [self.azlin_path, "connect", vm_name, "--no-tmux", "--", cmd],
                 capture_output=True,
                 text=True,
-                timeout=30,
+                timeout=self.capture_timeout,
             )
             if result.returncode == 0:
                 return result.stdout
@@ -187,6 +229,44 @@ class FleetObserver:
             logger.warning("Capture pane failed for %s/%s: %s", vm_name, session_name, exc)
         return None
 
+    def _capture_vm_panes(self, vm_name: str, session_names: list[str]) -> dict[str, str]:
+        """Capture several tmux panes on one VM in a single SSH round trip.
+
+        Each capture is framed by ===OBSERVE:<nonce>:<index>:...=== marker
+        lines. The per-call nonce keeps pane text that happens to contain
+        marker-like lines from being mistaken for a frame, and the trailing
+        marker carries capture-pane's exit status so a missing session is
+        reported as failed rather than empty.
+
+        Returns {session_name: pane_content} for the panes captured
+        successfully; a VM-level failure or timeout returns {}.
+        """
+        if not session_names:
+            return {}
+
+        nonce = secrets.token_hex(8)
+        parts = []
+        for i, name in enumerate(session_names):
+            parts.append(
+                f"echo '===OBSERVE:{nonce}:{i}:BEGIN==='; "
+                f"tmux capture-pane -t {shlex.quote(name)} -p -S -{self.capture_lines} 2>/dev/null; "
+                f'echo "===OBSERVE:{nonce}:{i}:END:$?==="'
+            )
+        cmd = "; ".join(parts)
+
+        try:
+            result = subprocess.run(
+                [self.azlin_path, "connect", vm_name, "--no-tmux", "--", cmd],
+                capture_output=True,
+                text=True,
+                timeout=self.capture_timeout,
+            )
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError) as exc:
+            logger.warning("Capture panes failed for %s: %s", vm_name, exc)
+            return {}
+
+        return _parse_framed_captures(result.stdout or "", nonce, session_names)
+
     def _classify_output(
         self,
         lines: list[str],
@@ -252,3 +332,29 @@ class FleetObserver:
             return AgentStatus.RUNNING, CONFIDENCE_DEFAULT_RUNNING, "has_output"
 
         return AgentStatus.UNKNOWN, CONFIDENCE_UNKNOWN, ""
+
+
+def _parse_framed_captures(output: str, nonce: str, session_names: list[str]) -> dict[str, str]:
+    """Split the output of _capture_vm_panes into per-session pane content."""
+    prefix = f"===OBSERVE:{nonce}:"
+    captures: dict[str, str] = {}
+    current: int | None = None
+    buf: list[str] = []
+
+    for line in output.splitlines(keepends=True):
+        stripped = line.rstrip("\r\n")
+        if stripped.startswith(prefix) and stripped.endswith("==="):
+            index, _, marker = stripped[len(prefix) : -len("===")].partition(":")
+            if not index.isdigit() or int(index) >= len(session_names):
+                continue
+            if marker == "BEGIN":
+                current, buf = int(index), []
+            elif marker.startswith("END:") and current == int(index):
+                if marker == "END:0":
+                    captures[session_names[current]] = "".join(buf)
+                current = None
+            continue
+        if current is not None:
+            buf.append(line)
+
+    return captures
@@ -8,6 +8,9 @@ Testing pyramid:
 
 from __future__ import annotations
 
+import json
+
+from amplihack.fleet import fleet_graph
 from amplihack.fleet.fleet_graph import EdgeType, FleetGraph, NodeType
 
 # ────────────────────────────────────────────
@@ -100,6 +103,15 @@ class TestGraphEdges:
         assert g.neighbors("a", EdgeType.CONTAINS) == ["b"]
         assert g.neighbors("a", EdgeType.DEPENDS_ON) == ["c"]
 
+    def test_add_edge_duplicate_replaces_metadata_in_place(self):
+        g = FleetGraph()
+        g.add_edge("a", "b", EdgeType.MODIFIES, lines=1)
+        g.add_edge("a", "c", EdgeType.MODIFIES)
+        g.add_edge("a", "b", EdgeType.MODIFIES, lines=2)
+        assert [e.target_id for e in g.edges] == ["b", "c"]
+        assert g.edges[0].metadata == {"lines": 2}
+        assert g.neighbors("a", EdgeType.MODIFIES) == ["b", "c"]
+
     def test_edges_from(self):
         g = FleetGraph()
         g.add_edge("a", "b", EdgeType.MODIFIES)
@@ -185,6 +197,80 @@ class TestGraphPersistence:
         assert g.edges == []
 
 
+class TestGraphMutationLog:
+    """Integration tests for snapshot + append-only log persistence."""
+
+    def test_mutations_append_to_log_without_snapshot_rewrite(self, tmp_path):
+        path = tmp_path / "graph.json"
+        g = FleetGraph(persist_path=path)
+        g.add_node("t1", NodeType.TASK)
+        g.add_edge("t1", "f1", EdgeType.MODIFIES)
+
+        assert not path.exists()
+        records = [json.loads(line) for line in g._log_path.read_text().splitlines()]
+        assert [r["op"] for r in records] == ["node", "edge"]
+
+    def test_batch_appends_once(self, tmp_path):
+        path = tmp_path / "graph.json"
+        g = FleetGraph(persist_path=path)
+        with g.batch():
+            g.add_node("t1", NodeType.TASK)
+            assert not g._log_path.exists()
+            g.add_edge("t1", "f1", EdgeType.MODIFIES)
+        assert len(g._log_path.read_text().splitlines()) == 2
+
+    def test_log_is_compacted_into_snapshot(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fleet_graph, "COMPACT_MIN_LOG_ENTRIES", 5)
+        path = tmp_path / "graph.json"
+        g = FleetGraph(persist_path=path)
+        g.add_node("t1", NodeType.TASK)
+        for _ in range(5):  # 6th log record crosses the threshold
+            g.add_edge("t1", "f1", EdgeType.MODIFIES)
+
+        assert path.exists()
+        assert g._log_path.read_text() == ""
+        g.add_edge("t1", "f2", EdgeType.MODIFIES)
+
+        g2 = FleetGraph(persist_path=path)
+        assert set(g2.nodes) == {"t1"}
+        assert g2.neighbors("t1", EdgeType.MODIFIES) == ["f1", "f2"]
+
+    def test_truncated_log_line_is_skipped(self, tmp_path):
+        path = tmp_path / "graph.json"
+        g = FleetGraph(persist_path=path)
+        g.add_node("t1", NodeType.TASK)
+        with open(g._log_path, "a") as f:
+            f.write('{"op": "node", "id": "t2"')
+
+        g2 = FleetGraph(persist_path=path)
+        assert set(g2.nodes) == {"t1"}
+
+    def test_append_after_truncated_line_is_not_lost(self, tmp_path):
+        path = tmp_path / "graph.json"
+        g = FleetGraph(persist_path=path)
+        g.add_node("t1", NodeType.TASK)
+        g.add_node("t2", NodeType.TASK)
+        with open(g._log_path, "a") as f:
+            f.write('{"op": "node", "id": "t3", "ty')
+
+        FleetGraph(persist_path=path).add_node("t4", NodeType.TASK)
+
+        assert set(FleetGraph(persist_path=path).nodes) == {"t1", "t2", "t4"}
+
+    def test_legacy_snapshot_without_log_loads(self, tmp_path):
+        path = tmp_path / "graph.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "nodes": {"p": {"type": "project", "label": "P", "metadata": {}}},
+                    "edges": [{"source": "p", "target": "t", "type": "contains"}],
+                }
+            )
+        )
+        g = FleetGraph(persist_path=path)
+        assert g.project_tasks("p") == ["t"]
+
+
 class TestGraphQueries:
     """Integration tests for fleet-specific queries."""
 
@@ -208,6 +294,18 @@ class TestGraphQueries:
         prs = g.project_prs("proj")
         assert "pr-1" in prs
 
+    def test_detect_conflicts_ignores_non_task_nodes(self):
+        g = FleetGraph()
+        for task_id in ("t1", "t2", "t3"):
+            g.add_node(task_id, NodeType.TASK)
+        g.add_node("pr-1", NodeType.PR)
+        g.add_edge("t1", "a.py", EdgeType.MODIFIES)
+        g.add_edge("t1", "b.py", EdgeType.MODIFIES)
+        g.add_edge("t2", "b.py", EdgeType.MODIFIES)
+        g.add_edge("t3", "c.py", EdgeType.MODIFIES)
+        g.add_edge("pr-1", "a.py", EdgeType.MODIFIES)
+        assert g.detect_conflicts("t1") == ["t2"]
+
     def test_task_dependencies(self):
         g = FleetGraph()
         g.add_node("t1", NodeType.TASK)
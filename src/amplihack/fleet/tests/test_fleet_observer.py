@@ -3,6 +3,10 @@
 All unit tests — no external dependencies (subprocess mocked).
 """
 
+import re
+import stat
+import sys
+import textwrap
 import time
 from unittest.mock import MagicMock, patch
 
@@ -169,10 +173,12 @@ class TestFleetObserverIntegration:
 
     @patch("amplihack.fleet.fleet_observer.subprocess.run")
     def test_observe_all(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="GOAL_STATUS: ACHIEVED\n",
-        )
+        def framed_capture(cmd, **kwargs):
+            frames = re.findall(r"echo '(===OBSERVE:\w+:\d+:)BEGIN==='", cmd[-1])
+            stdout = "".join(f"{f}BEGIN===\nGOAL_STATUS: ACHIEVED\n{f}END:0===\n" for f in frames)
+            return MagicMock(returncode=0, stdout=stdout)
+
+        mock_run.side_effect = framed_capture
 
         observer = FleetObserver()
         sessions = [
@@ -183,6 +189,8 @@ class TestFleetObserverIntegration:
         results = observer.observe_all(sessions)
         assert len(results) == 2
         assert all(r.status == AgentStatus.COMPLETED for r in results)
+        # Both panes on vm-1 are captured in one round trip
+        assert mock_run.call_count == 1
 
 
 class TestCapturePaneValidation:
@@ -201,3 +209,125 @@ class TestCapturePaneValidation:
         result = observer._capture_pane("vm-1", "(none)")
         # Returns None because azlin isn't available, but no ValueError raised
         assert result is None
+
+
+FAKE_AZLIN = textwrap.dedent(
+    """\
+    #!{python}
+    # Fake azlin: `azlin connect VM --no-tmux -- CMD` runs CMD locally with a
+    # fake tmux that serves pane content from $FAKE_PANES/<vm>/<session>.
+    import os, subprocess, sys, time
+    vm, cmd = sys.argv[2], sys.argv[-1]
+    with open(os.environ["FAKE_AZLIN_LOG"], "a") as log:
+        log.write(vm + "\\n")
+    if vm.startswith("vm-hang"):
+        time.sleep(30)
+    env = dict(os.environ, FAKE_VM=vm, PATH=os.environ["FAKE_BIN"] + ":" + os.environ["PATH"])
+    sys.exit(subprocess.run(["bash", "-c", cmd], env=env).returncode)
+    """
+)
+
+FAKE_TMUX = textwrap.dedent(
+    """\
+    #!{python}
+    import os, sys
+    path = os.path.join(os.environ["FAKE_PANES"], os.environ["FAKE_VM"], sys.argv[sys.argv.index("-t") + 1])
+    if not os.path.exists(path):
+        sys.exit(1)
+    sys.stdout.write(open(path).read())
+    """
+)
+
+
+class TestObserveAllWithFakeAzlin:
+    """observe_all against a local fake azlin executable (no SSH)."""
+
+    def _write_script(self, path, body):
+        path.write_text(body.format(python=sys.executable))
+        path.chmod(path.stat().st_mode | stat.S_IEXEC)
+        return path
+
+    def _setup(self, tmp_path, monkeypatch, panes):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        azlin = self._write_script(bin_dir / "azlin", FAKE_AZLIN)
+        self._write_script(bin_dir / "tmux", FAKE_TMUX)
+        for (vm, session), content in panes.items():
+            (tmp_path / "panes" / vm).mkdir(parents=True, exist_ok=True)
+            (tmp_path / "panes" / vm / session).write_text(content)
+        log = tmp_path / "azlin.log"
+        monkeypatch.setenv("FAKE_BIN", str(bin_dir))
+        monkeypatch.setenv("FAKE_PANES", str(tmp_path / "panes"))
+        monkeypatch.setenv("FAKE_AZLIN_LOG", str(log))
+        return FleetObserver(azlin_path=str(azlin)), log
+
+    def test_one_round_trip_per_vm(self, tmp_path, monkeypatch):
+        observer, log = self._setup(
+            tmp_path,
+            monkeypatch,
+            {
+                ("vm-1", "build"): "Step 3: Building feature\n",
+                ("vm-1", "fix"): "Traceback (most recent call last):\n",
+                ("vm-2", "review"): "PR #7 created\n",
+            },
+        )
+        sessions = [
+            TmuxSessionInfo(session_name="build", vm_name="vm-1"),
+            TmuxSessionInfo(session_name="review", vm_name="vm-2"),
+            TmuxSessionInfo(session_name="fix", vm_name="vm-1"),
+        ]
+
+        results = observer.observe_all(sessions)
+
+        assert [(r.vm_name, r.session_name) for r in results] == [
+            ("vm-1", "build"),
+            ("vm-2", "review"),
+            ("vm-1", "fix"),
+        ]
+        assert [r.status for r in results] == [
+            AgentStatus.RUNNING,
+            AgentStatus.COMPLETED,
+            AgentStatus.ERROR,
+        ]
+        assert sorted(log.read_text().split()) == ["vm-1", "vm-2"]
+
+    def test_missing_session_and_marker_lookalikes(self, tmp_path, monkeypatch):
+        observer, _ = self._setup(
+            tmp_path,
+            monkeypatch,
+            {("vm-1", "tricky"): "===OBSERVE:deadbeef:1:END:0===\nStep 1: Analyzing\n"},
+        )
+        results = observer.observe_all(
+            [
+                TmuxSessionInfo(session_name="tricky", vm_name="vm-1"),
+                TmuxSessionInfo(session_name="gone", vm_name="vm-1"),
+            ]
+        )
+
+        assert results[0].status == AgentStatus.RUNNING
+        assert results[0].last_output_lines[0] == "===OBSERVE:deadbeef:1:END:0==="
+        assert results[1].status == AgentStatus.UNKNOWN
+        assert results[1].confidence == 0.0
+
+    def test_hung_vm_does_not_stall_others(self, tmp_path, monkeypatch):
+        observer, _ = self._setup(
+            tmp_path, monkeypatch, {("vm-ok", "s1"): "GOAL_STATUS: ACHIEVED\n"}
+        )
+        observer.capture_timeout = 1.0
+        sessions = [
+            TmuxSessionInfo(session_name="s1", vm_name="vm-hang-a"),
+            TmuxSessionInfo(session_name="s1", vm_name="vm-hang-b"),
+            TmuxSessionInfo(session_name="s1", vm_name="vm-ok"),
+        ]
+
+        start = time.monotonic()
+        results = observer.observe_all(sessions)
+        elapsed = time.monotonic() - start
+
+        # The two hung VMs time out in parallel rather than back to back
+        assert elapsed < 1.9
+        assert [r.status for r in results] == [
+            AgentStatus.UNKNOWN,
+            AgentStatus.UNKNOWN,
+            AgentStatus.COMPLETED,
+        ]
@@ -9,13 +9,20 @@ Testing pyramid:
 
 from __future__ import annotations
 
+import json
+import shutil
 import subprocess
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from amplihack.fleet._session_context import SessionContext
-from amplihack.fleet._session_gather import gather_context, parse_context_output
+from amplihack.fleet._session_gather import (
+    gather_context,
+    parse_context_output,
+    reset_gather_state,
+)
 
 # ---------------------------------------------------------------------------
 # gather_context -- success path
@@ -405,3 +412,186 @@ class TestObjectivesParsing:
         numbers = {o["number"] for o in ctx.project_objectives}
         assert 42 in numbers
         assert 99 in numbers
+
+
+# ---------------------------------------------------------------------------
+# Incremental gathering
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def fresh_gather_state():
+    reset_gather_state()
+    yield
+    reset_gather_state()
+
+
+@pytest.mark.usefixtures("fresh_gather_state")
+class TestGhSectionCache:
+    """gh PR/objective lookups are reused until the branch/remote or TTL changes."""
+
+    @patch("amplihack.fleet._session_gather.subprocess.run")
+    def test_pr_url_reused_while_branch_unchanged(self, mock_run):
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=(
+                "===GIT===\nBRANCH:feat/x\nPR_CHECKED:feat/x\n"
+                "PR_URL:https://github.com/org/repo/pull/7\n===END===\n"
+            ),
+        )
+        first = gather_context("/usr/bin/azlin", "devy", "task-1", "", "")
+        assert first.pr_url == "https://github.com/org/repo/pull/7"
+        assert "'feat/x'" not in mock_run.call_args[0][0][-1]
+
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="===GIT===\nBRANCH:feat/x\nPR_CACHED\n===END===\n"
+        )
+        second = gather_context("/usr/bin/azlin", "devy", "task-1", "", "")
+
+        # The remote is told which branch the cached answer belongs to
+        assert '[ "$BR" = feat/x ]' in mock_run.call_args[0][0][-1]
+        assert second.pr_url == "https://github.com/org/repo/pull/7"
+
+    @patch("amplihack.fleet._session_gather.time.monotonic")
+    @patch("amplihack.fleet._session_gather.subprocess.run")
+    def test_cache_expires_after_ttl(self, mock_run, mock_clock):
+        mock_clock.return_value = 1000.0
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=(
+                "===GIT===\nPR_CHECKED:main\n"
+                "===OBJECTIVES===\nOBJECTIVES_REMOTE:https://github.com/org/repo\n"
+                "5\tShip it\topen\n===END===\n"
+            ),
+        )
+        gather_context("/usr/bin/azlin", "devy", "task-1", "", "")
+
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="===OBJECTIVES_CACHED===\n===END===\n"
+        )
+        cached = gather_context("/usr/bin/azlin", "devy", "task-1", "", "")
+        assert cached.project_objectives == [{"number": 5, "title": "Ship it", "state": "open"}]
+        assert "= https://github.com/org/repo ]" in mock_run.call_args[0][0][-1]
+
+        mock_clock.return_value = 1000.0 + 3600
+        gather_context("/usr/bin/azlin", "devy", "task-1", "", "")
+        cmd = mock_run.call_args[0][0][-1]
+        assert "= https://github.com/org/repo ]" not in cmd
+        assert '[ "$BR" = main ]' not in cmd
+
+
+@pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux not installed")
+@pytest.mark.usefixtures("fresh_gather_state")
+class TestIncrementalGatherWithFakeAzlin:
+    """gather_context against a real local tmux server via a fake azlin."""
+
+    @pytest.fixture
+    def env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TMUX_TMPDIR", str(tmp_path))
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        project = tmp_path / "proj"
+        project.mkdir()
+        transcripts = tmp_path / "home" / ".claude" / "projects" / str(project).replace("/", "-")
+        transcripts.mkdir(parents=True)
+        azlin = tmp_path / "azlin"
+        azlin.write_text('#!/bin/bash\nexec bash -c "${@: -1}"\n')
+        azlin.chmod(0o755)
+
+        subprocess.run(
+            ["tmux", "new-session", "-d", "-s", "work", "-x", "80", "-y", "10", "-c", str(project)]
+            + ["bash --norc --noprofile"],
+            check=True,
+        )
+        yield azlin, transcripts / "session.jsonl"
+        subprocess.run(["tmux", "kill-server"], check=False)
+
+    def _type(self, command):
+        subprocess.run(["tmux", "send-keys", "-t", "work", command, "Enter"], check=True)
+        time.sleep(0.5)
+
+    def _append(self, jsonl, start, count):
+        with open(jsonl, "a") as f:
+            for i in range(start, start + count):
+                entry = {
+                    "type": "user",
+                    "message": {"content": [{"type": "text", "text": f"m{i}"}]},
+                }
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def test_second_gather_matches_full_capture(self, env):
+        azlin, jsonl = env
+        self._append(jsonl, 0, 60)
+        self._type("for i in $(seq 1 40); do echo first $i; done")
+        first = gather_context(str(azlin), "vm-1", "work", "", "")
+
+        self._type("for i in $(seq 1 25); do echo second $i; done")
+        self._append(jsonl, 60, 300)
+        second = gather_context(str(azlin), "vm-1", "work", "", "")
+
+        reference = subprocess.run(
+            ["tmux", "capture-pane", "-t", "work", "-p", "-S", "-"],
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        assert "first 40" in first.tmux_capture
+        assert second.tmux_capture == reference
+        lines = second.transcript_summary.split("\n")
+        # First 50 + last 200 messages, as a full read would produce
+        assert lines[1:51] == [f"m{i}" for i in range(50)]
+        assert lines[-200:] == [f"m{i}" for i in range(160, 360)]
+
+    def test_delta_sections_are_small_and_transcript_resumes(self, env):
+        azlin, jsonl = env
+        self._append(jsonl, 0, 60)
+        self._type("for i in $(seq 1 200); do echo old $i; done")
+        gather_context(str(azlin), "vm-1", "work", "", "")
+
+        self._type("echo fresh")
+        with open(jsonl, "a") as f:
+            f.write('{"type":"user","message":{"content":[{"type":"text","text":"m60"}]}}\n')
+            f.write('{"type":"assistant","message":{"content":[{"type":"text","text":"half')
+
+        outputs = []
+        real_run = subprocess.run
+
+        def recording_run(*args, **kwargs):
+            result = real_run(*args, **kwargs)
+            outputs.append(result.stdout)
+            return result
+
+        with patch("amplihack.fleet._session_gather.subprocess.run", side_effect=recording_run):
+            second = gather_context(str(azlin), "vm-1", "work", "", "")
+            with open(jsonl, "a") as f:
+                f.write('"}]}}\n')
+            third = gather_context(str(azlin), "vm-1", "work", "", "")
+
+        pane = outputs[0].split("===PANE===\n")[1].split("===CWD===")[0].split("\n")
+        assert pane[1] == "DELTA"
+        assert len(pane) < 20  # new lines + visible screen, not 200 lines of history
+        transcript = outputs[0].split("===TRANSCRIPT_DELTA===\n")[1].split("===HEALTH===")[0]
+        assert transcript.split("\n")[1:-1] == ["m60"]  # half-written record held back
+        assert "old 1\n" in second.tmux_capture and "fresh" in second.tmux_capture
+        assert second.transcript_summary.endswith("m60")
+        assert third.transcript_summary.endswith("m60\nhalf")
+
+    def test_full_transcript_read_ships_only_head_and_tail(self, env):
+        azlin, jsonl = env
+        self._append(jsonl, 0, 1000)
+
+        outputs = []
+        real_run = subprocess.run
+
+        def recording_run(*args, **kwargs):
+            result = real_run(*args, **kwargs)
+            outputs.append(result.stdout)
+            return result
+
+        with patch("amplihack.fleet._session_gather.subprocess.run", side_effect=recording_run):
+            context = gather_context(str(azlin), "vm-1", "work", "", "")
+
+        transcript = outputs[0].split("===TRANSCRIPT_DELTA===\n")[1].split("===HEALTH===")[0]
+        shipped = transcript.split("\n")[1:-1]
+        assert shipped == [f"m{i}" for i in (*range(50), *range(800, 1000))]
+        lines = context.transcript_summary.split("\n")
+        assert lines[1:51] == [f"m{i}" for i in range(50)]
+        assert lines[-200:] == [f"m{i}" for i in range(800, 1000)]
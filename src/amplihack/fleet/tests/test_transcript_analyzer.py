@@ -397,6 +397,65 @@ class TestAnalyzeMultipleFiles:
         assert report.tool_usage["Bash"] == 2
 
 
+class TestIncrementalCache:
+    def _report_dict(self, report: AnalysisReport) -> dict:
+        data = report.to_dict()
+        data.pop("analysis_timestamp")
+        return data
+
+    def test_appended_file_parses_only_new_tail(self, tmp_path: Path):
+        f = tmp_path / "s.jsonl"
+        f.write_text(_make_jsonl([SAMPLE_ASSISTANT_TOOL_USE, SAMPLE_USER]))
+        cache_path = tmp_path / "cache.json"
+        TranscriptAnalyzer(cache_path=cache_path).analyze([f])
+        offset = f.stat().st_size
+
+        with f.open("a") as fh:
+            fh.write(_make_jsonl([SAMPLE_ASSISTANT_SKILL]))
+            fh.write(json.dumps(SAMPLE_ASSISTANT_TOOL_USE))  # no newline yet
+
+        from amplihack.fleet import transcript_analyzer as mod
+
+        with patch.object(mod, "analyze_segment", wraps=mod.analyze_segment) as spy:
+            report = TranscriptAnalyzer(cache_path=cache_path).analyze([f])
+        assert spy.call_args.args == (str(f), offset)
+
+        fresh = TranscriptAnalyzer().analyze([f])
+        assert self._report_dict(report) == self._report_dict(fresh)
+        assert report.total_messages == 4
+        assert report.tool_usage["Bash"] == 2
+
+    def test_rewritten_file_is_reparsed(self, tmp_path: Path):
+        f = tmp_path / "s.jsonl"
+        f.write_text(_make_jsonl([SAMPLE_ASSISTANT_TOOL_USE] * 3))
+        analyzer = TranscriptAnalyzer()
+        analyzer.analyze([f])
+
+        # Same size class, different content: cached prefix must not be trusted
+        with f.open("r+") as fh:
+            fh.write(_make_jsonl([SAMPLE_USER] * 3)[: f.stat().st_size])
+        report = analyzer.analyze([f])
+
+        assert self._report_dict(report) == self._report_dict(TranscriptAnalyzer().analyze([f]))
+
+    def test_process_pool_matches_serial(self, tmp_path: Path, monkeypatch):
+        from amplihack.fleet import transcript_analyzer as mod
+
+        files = []
+        samples = [SAMPLE_ASSISTANT_TOOL_USE, SAMPLE_ASSISTANT_SKILL, SAMPLE_USER, SAMPLE_PROGRESS]
+        for i in range(6):
+            f = tmp_path / f"s{i}.jsonl"
+            f.write_text(_make_jsonl(samples[i % 4 :] + samples[: i % 4]))
+            files.append(f)
+
+        monkeypatch.setattr(mod, "PARALLEL_MIN_BYTES", 0)
+        parallel = TranscriptAnalyzer(max_workers=2).analyze(files)
+        serial = TranscriptAnalyzer(max_workers=1).analyze(files)
+
+        assert self._report_dict(parallel) == self._report_dict(serial)
+        assert list(parallel.tool_usage) == list(serial.tool_usage)
+
+
 # ── E2E Tests (10%) ──────────────────────────────────────────────────
 
 
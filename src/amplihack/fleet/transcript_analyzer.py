@@ -15,19 +15,18 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+from amplihack.fleet._transcript_cache import TranscriptCache, TranscriptPartial, analyze_segment
 from amplihack.fleet._transcript_report import (
-    AGENT_RE,
     ALL_EXPECTED_STEPS,
-    SKILL_INVOKE_RE,
-    SKILL_RE,
-    STRATEGY_KEYWORDS,
-    WORKFLOW_STEP_RE,
     AnalysisReport,
     format_report,
 )
@@ -41,6 +40,9 @@ __all__ = [
     "format_report",
 ]
 
+# Below this many unparsed bytes a process pool costs more than it saves
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
 
 def gather_local_transcripts() -> list[Path]:
     """Find local JSONL transcript files under ~/.claude/projects/.
@@ -96,36 +98,77 @@ def gather_remote_transcripts(
 
 
 def _build_remote_summary_script() -> str:
-    """Return a self-contained Python script that summarises JSONL files remotely."""
+    """Return a self-contained Python script that summarises JSONL files remotely.
+
+    The script keeps its own per-file cache on the VM (keyed by path and
+    inode, resuming at the last complete line), so each run only parses
+    bytes appended since the previous one.
+    """
     return (
-        "import json, pathlib, collections, sys\n"
+        "import json, pathlib, collections, sys, os\n"
         "base = pathlib.Path.home() / '.claude' / 'projects'\n"
         "if not base.is_dir():\n"
         "    print('[]'); sys.exit(0)\n"
-        "summaries = []\n"
-        "for f in sorted(base.rglob('*.jsonl'), key=lambda p: p.stat().st_mtime, reverse=True):\n"
-        "    tools = collections.Counter()\n"
+        "cache_path = pathlib.Path.home() / '.cache' / 'amplihack' / 'transcript_summaries.json'\n"
+        "try:\n"
+        "    cache = json.loads(cache_path.read_text())\n"
+        "except Exception:\n"
+        "    cache = {}\n"
+        "new_cache = {}\n"
+        "def parse(data, tools):\n"
         "    msgs = 0\n"
-        "    for line in f.open():\n"
+        "    for line in data.splitlines():\n"
         "        try:\n"
         "            obj = json.loads(line)\n"
-        "        except json.JSONDecodeError:\n"
+        "        except ValueError:\n"
         "            continue\n"
         "        msgs += 1\n"
         "        if obj.get('type') == 'assistant':\n"
         "            for blk in (obj.get('message',{}).get('content',None) or []):\n"
         "                if isinstance(blk, dict) and blk.get('type') == 'tool_use':\n"
         "                    tools[blk.get('name','')] += 1\n"
+        "    return msgs\n"
+        "summaries = []\n"
+        "for f in sorted(base.rglob('*.jsonl'), key=lambda p: p.stat().st_mtime, reverse=True):\n"
+        "    st = f.stat()\n"
+        "    c = cache.get(str(f))\n"
+        "    if not c or c['ino'] != st.st_ino or c['offset'] > st.st_size:\n"
+        "        c = {'ino': st.st_ino, 'offset': 0, 'messages': 0, 'tools': {}}\n"
+        "    with f.open('rb') as fh:\n"
+        "        fh.seek(c['offset'])\n"
+        "        data = fh.read()\n"
+        "    cut = max(data.rfind(b'\\n'), data.rfind(b'\\r')) + 1\n"
+        "    tools = collections.Counter(c['tools'])\n"
+        "    msgs = c['messages'] + parse(data[:cut], tools)\n"
+        "    new_cache[str(f)] = {'ino': st.st_ino, 'offset': c['offset'] + cut,\n"
+        "                         'messages': msgs, 'tools': dict(tools)}\n"
+        "    msgs += parse(data[cut:], tools)\n"
         "    summaries.append({'file': str(f), 'messages': msgs, 'tools': dict(tools)})\n"
+        "try:\n"
+        "    cache_path.parent.mkdir(parents=True, exist_ok=True)\n"
+        "    tmp = cache_path.with_suffix('.tmp')\n"
+        "    tmp.write_text(json.dumps(new_cache))\n"
+        "    os.replace(tmp, cache_path)\n"
+        "except OSError:\n"
+        "    pass\n"
         "print(json.dumps(summaries))\n"
     )
 
 
 class TranscriptAnalyzer:
-    """Analyzes Claude Code JSONL transcripts for patterns and metrics."""
+    """Analyzes Claude Code JSONL transcripts for patterns and metrics.
+
+    Args:
+        cache_path: Where to persist per-file results between runs
+            (e.g. DEFAULT_TRANSCRIPT_CACHE_PATH). None keeps them in memory
+            for the lifetime of the analyzer.
+        max_workers: Process pool size for parsing; 1 disables the pool.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_path: Path | None = None, max_workers: int | None = None) -> None:
         self._report: AnalysisReport | None = None
+        self._cache = TranscriptCache(cache_path)
+        self.max_workers = max_workers
 
     def gather_local(self) -> list[Path]:
         """Find local JSONL transcript files."""
@@ -143,8 +186,20 @@ class TranscriptAnalyzer:
         workflow_steps_seen: dict[str, int] = {}
         workflow_steps_total: dict[str, int] = {}
 
-        for path in transcripts:
-            self._analyze_single(path, report, workflow_steps_seen, workflow_steps_total)
+        # Merge in input order so Counter tie order matches a serial walk
+        for partial in self._analyze_files([str(p) for p in transcripts]):
+            if partial is None:
+                continue
+            report.total_messages += partial.messages
+            report.tool_usage.update(partial.tool_usage)
+            report.skill_invocations.update(partial.skill_invocations)
+            report.agent_types.update(partial.agent_types)
+            report.strategy_patterns.update(partial.strategy_patterns)
+            for step in partial.steps:
+                workflow_steps_seen[step] = workflow_steps_seen.get(step, 0) + 1
+            for i in ALL_EXPECTED_STEPS:
+                step_key = f"step_{i}"
+                workflow_steps_total[step_key] = workflow_steps_total.get(step_key, 0) + 1
 
         for step, total in workflow_steps_total.items():
             seen = workflow_steps_seen.get(step, 0)
@@ -153,90 +208,41 @@ class TranscriptAnalyzer:
         self._report = report
         return report
 
-    def _analyze_single(self, path, report, steps_seen, steps_total):
-        """Analyze a single JSONL transcript file."""
-        transcript_has_step: set[str] = set()
-        try:
-            with path.open() as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    report.total_messages += 1
-                    entry_type = entry.get("type", "")
-                    if entry_type == "assistant":
-                        self._extract_assistant_patterns(entry, report, transcript_has_step)
-                    elif entry_type == "user":
-                        self._extract_user_patterns(entry, report)
-        except (OSError, PermissionError) as exc:
-            logger.warning("Cannot read transcript file %s: %s", path, exc)
-            return
-
-        for step in transcript_has_step:
-            steps_seen[step] = steps_seen.get(step, 0) + 1
-        for i in ALL_EXPECTED_STEPS:
-            step_key = f"step_{i}"
-            steps_total[step_key] = steps_total.get(step_key, 0) + 1
-
-    def _extract_assistant_patterns(self, entry, report, transcript_steps):
-        """Extract patterns from an assistant message entry."""
-        message = entry.get("message", {})
-        content = message.get("content")
-        if not isinstance(content, list):
-            return
-        for block in content:
-            if not isinstance(block, dict):
+    def _analyze_files(self, paths: list[str]) -> list[TranscriptPartial | None]:
+        """Return one partial per path (None if unreadable), reusing the cache."""
+        cached = [self._cache.lookup(p) for p in paths]
+        segments = self._parse_segments(
+            [(p, offset) for p, (_, offset) in zip(paths, cached, strict=True)]
+        )
+
+        results: list[TranscriptPartial | None] = []
+        for path, (prefix, _), segment in zip(paths, cached, segments, strict=True):
+            if segment is None:
+                results.append(None)
                 continue
-            block_type = block.get("type", "")
-            if block_type == "tool_use":
-                tool_name = block.get("name", "unknown")
-                report.tool_usage[tool_name] += 1
-                tool_input = block.get("input", {})
-                input_str = (
-                    json.dumps(tool_input) if isinstance(tool_input, dict) else str(tool_input)
-                )
-                self._scan_for_skills(input_str, report)
-                self._scan_for_agents(input_str, report)
-            elif block_type == "text":
-                text = block.get("text", "")
-                self._scan_for_skills(text, report)
-                self._scan_for_agents(text, report)
-                self._scan_for_strategies(text, report)
-                self._scan_for_workflow_steps(text, transcript_steps)
-
-    def _extract_user_patterns(self, entry, report):
-        """Extract patterns from a user message entry."""
-        message = entry.get("message", {})
-        content = message.get("content", "")
-        if isinstance(content, list):
-            text = " ".join(b.get("text", "") if isinstance(b, dict) else str(b) for b in content)
-        else:
-            text = str(content)
-        self._scan_for_strategies(text, report)
-
-    def _scan_for_skills(self, text, report):
-        for match in SKILL_RE.finditer(text):
-            report.skill_invocations[match.group(1)] += 1
-        for match in SKILL_INVOKE_RE.finditer(text):
-            report.skill_invocations[match.group(1)] += 1
-
-    def _scan_for_agents(self, text, report):
-        for match in AGENT_RE.finditer(text):
-            report.agent_types[match.group(1)] += 1
-
-    def _scan_for_strategies(self, text, report):
-        text_lower = text.lower()
-        for keyword, strategy_name in STRATEGY_KEYWORDS.items():
-            if keyword in text_lower:
-                report.strategy_patterns[strategy_name] += 1
-
-    def _scan_for_workflow_steps(self, text, steps):
-        for match in WORKFLOW_STEP_RE.finditer(text):
-            steps.add(f"step_{match.group(1)}")
+            complete, end, trailing = segment
+            complete = prefix.merge(complete)
+            self._cache.store(path, complete, end)
+            results.append(complete.merge(trailing))
+        self._cache.save()
+        return results
+
+    def _parse_segments(self, jobs: list[tuple[str, int]]) -> list:
+        """Run analyze_segment over jobs, in a process pool when worthwhile."""
+        pending = 0
+        for path, offset in jobs:
+            try:
+                pending += max(0, os.path.getsize(path) - offset)
+            except OSError:
+                pass
+
+        if self.max_workers != 1 and len(jobs) > 1 and pending >= PARALLEL_MIN_BYTES:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    return list(pool.map(analyze_segment, *zip(*jobs, strict=True)))
+            except (OSError, BrokenProcessPool) as exc:
+                logger.warning("Transcript process pool unavailable, parsing serially: %s", exc)
+        return [analyze_segment(path, offset) for path, offset in jobs]
 
     def report(self) -> str:
         """Produce a human-readable report from the most recent analysis."""
@@ -0,0 +1,70 @@
+"""Persistent answer cache for knowledge acquisition."""
+
+import hashlib
+import json
+from pathlib import Path
+
+
+def answer_key(topic: str, question_text: str) -> str:
+    """Return the cache key for a (topic, question) pair."""
+    return hashlib.sha256(f"{topic}\0{question_text}".encode()).hexdigest()
+
+
+class AnswerCache:
+    """Append-only JSONL store of answers keyed by (topic, question) hash.
+
+    Every answer is appended and flushed as soon as it is received, so the
+    cache doubles as the checkpoint of an in-progress build: an interrupted
+    build resumes by skipping every question already in the cache.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize answer cache.
+
+        Args:
+            path: JSONL file holding cached answers (created on first write)
+        """
+        self.path = path
+        self._answers: dict[str, tuple[str, list[str]]] | None = None
+        self._truncated = False  # File ends mid-line; next append starts a new line
+
+    def _load(self) -> dict[str, tuple[str, list[str]]]:
+        if self._answers is None:
+            self._answers = {}
+            try:
+                text = self.path.read_text(encoding="utf-8")
+                self._truncated = bool(text) and not text.endswith("\n")
+                for line in text.splitlines():
+                    try:
+                        entry = json.loads(line)
+                        self._answers[entry["key"]] = (entry["answer"], entry["sources"])
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Line cut short by an interrupted build
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"    Warning: could not read answer cache {self.path}: {e}")
+        return self._answers
+
+    def get(self, topic: str, question_text: str) -> tuple[str, list[str]] | None:
+        """Return the cached (answer, sources) for a question, or None."""
+        return self._load().get(answer_key(topic, question_text))
+
+    def put(self, topic: str, question_text: str, answer: str, sources: list[str]) -> None:
+        """Cache an answer and append it to the cache file."""
+        key = answer_key(topic, question_text)
+        self._load()[key] = (answer, sources)
+        entry = {
+            "key": key,
+            "topic": topic,
+            "question": question_text,
+            "answer": answer,
+            "sources": sources,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(("\n" if self._truncated else "") + json.dumps(entry) + "\n")
+            self._truncated = False
+        except OSError as e:
+            print(f"    Warning: could not write answer cache {self.path}: {e}")
@@ -2,8 +2,12 @@
 
 import os
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
 from amplihack.knowledge_builder.kb_types import Question
+from amplihack.knowledge_builder.modules.answer_cache import AnswerCache
 
 
 def _build_agent_cmd(agent_cmd: str, prompt: str) -> list[str]:
@@ -17,13 +21,31 @@ def _build_agent_cmd(agent_cmd: str, prompt: str) -> list[str]:
 class KnowledgeAcquirer:
     """Acquires knowledge by answering questions via web search."""
 
-    def __init__(self, agent_cmd: str = "claude"):
+    def __init__(
+        self,
+        agent_cmd: str = "claude",
+        max_workers: int = 4,
+        timeout: float = 300,
+        retries: int = 2,
+        retry_delay: float = 2.0,
+        cache_path: Path | None = None,
+    ):
         """Initialize knowledge acquirer.
 
         Args:
             agent_cmd: Agent command to use (default: "claude")
+            max_workers: Maximum questions answered concurrently
+            timeout: Seconds allowed per agent call before it is killed
+            retries: Extra attempts for a question whose agent call failed
+            retry_delay: Base delay in seconds between attempts (doubles each retry)
+            cache_path: JSONL answer cache/checkpoint file (no caching if None)
         """
         self.agent_cmd = agent_cmd
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.cache = AnswerCache(cache_path) if cache_path is not None else None
 
     def answer_question(self, question: Question, topic: str) -> tuple[str, list[str]]:
         """Answer a question using web search.
@@ -35,6 +57,33 @@ class KnowledgeAcquirer:
         Returns:
             Tuple of (answer_text, list_of_source_urls)
         """
+        try:
+            return self._query_agent(question, topic)
+        except (RuntimeError, subprocess.TimeoutExpired):
+            return f"Unable to answer: {question.text}", []
+
+    def _answer_with_retries(self, question: Question, topic: str) -> tuple[str, list[str]] | None:
+        """Answer a question, retrying failed or timed-out agent calls.
+
+        Returns:
+            Tuple of (answer_text, list_of_source_urls), or None if every attempt failed
+        """
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                return self._query_agent(question, topic)
+            except (RuntimeError, subprocess.TimeoutExpired) as e:
+                print(f"    Attempt {attempt + 1} failed for: {question.text[:60]} ({e})")
+        return None
+
+    def _query_agent(self, question: Question, topic: str) -> tuple[str, list[str]]:
+        """Run the agent once and parse its answer.
+
+        Raises:
+            RuntimeError: If the agent exits non-zero or its output holds no answer
+            subprocess.TimeoutExpired: If the agent runs longer than self.timeout
+        """
         prompt = f"""Using web search, answer this question about {topic}:
 
 "{question.text}"
@@ -56,10 +105,11 @@ Requirements:
             capture_output=True,
             text=True,
             check=False,
+            timeout=self.timeout,
         )
 
         if result.returncode != 0:
-            return f"Unable to answer: {question.text}", []
+            raise RuntimeError(f"agent exited with code {result.returncode}")
 
         # Parse output
         output = result.stdout.strip()
@@ -89,11 +139,19 @@ Requirements:
                 elif line.startswith("http"):
                     sources.append(line)
 
-        return answer or "Unable to provide answer", sources
+        if not answer:
+            raise RuntimeError("agent output contained no answer")
+        return answer, sources
 
     def answer_all_questions(self, questions: list[Question], topic: str) -> list[Question]:
         """Answer all questions via web search.
 
+        Questions are answered by a pool of max_workers concurrent agent
+        calls. Cached answers are reused without calling the agent, and each
+        new answer is cached as soon as it arrives, so re-running an
+        interrupted build only asks the questions that were still unanswered.
+        Failed answers are not cached.
+
         Args:
             questions: List of questions to answer
             topic: Main topic
@@ -104,16 +162,51 @@ Requirements:
         print(f"Answering {len(questions)} questions...")
         all_sources = set()
 
-        for i, question in enumerate(questions, 1):
-            print(f"  [{i}/{len(questions)}] Answering: {question.text[:60]}...")
-
-            answer, sources = self.answer_question(question, topic)
-            question.answer = answer
-            all_sources.update(sources)
-
-            # Progress feedback every 10 questions
-            if i % 10 == 0:
-                print(f"    Progress: {i}/{len(questions)} questions answered")
+        # Identical question texts are asked once
+        pending: dict[str, list[Question]] = {}
+        reused = 0
+        for question in questions:
+            cached = self.cache.get(topic, question.text) if self.cache is not None else None
+            if cached is not None:
+                question.answer = cached[0]
+                all_sources.update(cached[1])
+                reused += 1
+            else:
+                pending.setdefault(question.text, []).append(question)
+
+        if reused:
+            print(f"  Reusing {reused} cached answers")
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(self._answer_with_retries, same[0], topic): text
+                    for text, same in pending.items()
+                }
+                try:
+                    for i, future in enumerate(as_completed(futures), 1):
+                        text = futures[future]
+                        print(f"  [{i}/{len(futures)}] Answered: {text[:60]}...")
+
+                        result = future.result()
+                        if result is None:
+                            answer, sources = f"Unable to answer: {text}", []
+                        else:
+                            answer, sources = result
+                            if self.cache is not None:
+                                self.cache.put(topic, text, answer, sources)
+                        for question in pending[text]:
+                            question.answer = answer
+                        all_sources.update(sources)
+
+                        # Progress feedback every 10 questions
+                        if i % 10 == 0:
+                            print(f"    Progress: {i}/{len(futures)} questions answered")
+                except BaseException:
+                    # Interrupted: don't start queued questions, answers so far are cached
+                    for future in futures:
+                        future.cancel()
+                    raise
 
         print(f"Answered all questions. Found {len(all_sources)} unique sources")
         return questions
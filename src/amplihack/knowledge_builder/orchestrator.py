@@ -36,7 +36,10 @@ class KnowledgeBuilder:
 
         # Initialize modules
         self.question_gen = QuestionGenerator(self.agent_cmd)
-        self.knowledge_acq = KnowledgeAcquirer(self.agent_cmd)
+        # Answer cache is shared by every topic built under output_base
+        self.knowledge_acq = KnowledgeAcquirer(
+            self.agent_cmd, cache_path=output_base / ".knowledge_cache" / "answers.jsonl"
+        )
         self.artifact_gen = ArtifactGenerator(self.output_dir)
 
         # Initialize knowledge graph
@@ -6,8 +6,12 @@ Routes LLM queries to the appropriate SDK based on launcher detection:
 
 Public API:
     completion: Async LLM completion with auto-detected backend
+    session_pool: Async context manager keeping warm SDK clients
+    get_metrics: Per-provider latency and call metrics
+    ResponseCache: Content-addressed response cache (completion(cache=True))
 """
 
-from amplihack.llm.client import completion
+from amplihack.llm.cache import ResponseCache
+from amplihack.llm.client import completion, get_metrics, get_response_cache, session_pool
 
-__all__ = ["completion"]
+__all__ = ["ResponseCache", "completion", "get_metrics", "get_response_cache", "session_pool"]
@@ -0,0 +1,123 @@
+"""Content-addressed response cache for amplihack.llm.
+
+Deterministic callers (graders, intent detection) often send the exact same
+prompt many times. ResponseCache memoizes completions keyed by a hash of
+(provider, model, temperature, max_tokens, prompt). Entries live in a bounded
+in-memory LRU and, when a directory is configured, on disk so repeated runs
+share results.
+
+Opt-in only: completion(..., cache=True). Empty responses are never cached
+because they signal a failed call (completion() is fail-open).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+
+__all__ = ["ResponseCache", "cache_key"]
+
+
+def cache_key(
+    provider: str,
+    prompt: str,
+    model: str | None = None,
+    temperature: float | None = None,
+    max_tokens: int | None = None,
+) -> str:
+    """Return the content address for a completion request."""
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "prompt": prompt,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Bounded LRU of completion responses with optional on-disk persistence."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, directory: Path | None = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path | None:
+        return self.directory / f"{key}.json" if self.directory else None
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        path = self._path(key)
+        if path is not None and path.exists():
+            try:
+                response = json.loads(path.read_text())["response"]
+            except (OSError, ValueError, KeyError) as e:
+                logger.debug("Ignoring unreadable LLM cache entry %s: %s", path, e)
+            else:
+                self._remember(key, response)
+                with self._lock:
+                    self.hits += 1
+                return response
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, response: str) -> None:
+        if not response:
+            return
+        self._remember(key, response)
+
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"response": response}, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug("Failed to persist LLM cache entry %s: %s", path, e)
+
+    def _remember(self, key: str, response: str) -> None:
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop in-memory entries and counters (on-disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
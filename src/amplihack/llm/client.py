@@ -7,14 +7,32 @@ Follows the same pattern as power_steering_sdk.py but exposes a
 completion() interface matching the eval/fleet calling convention.
 
 Fail-open: if neither SDK is available, completion() returns "".
+
+Performance features:
+  - Launcher detection is memoized per process.
+  - Calls are bounded by AMPLIHACK_LLM_MAX_CONCURRENCY per event loop.
+  - Inside ``async with session_pool():`` Copilot calls reuse warm,
+    already-started clients instead of spawning one per request.
+  - ``completion(..., cache=True)`` serves identical requests from a
+    content-addressed ResponseCache and coalesces concurrent duplicates.
+  - Per-provider latency metrics are available from get_metrics().
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import os
 import sys
+import time
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Any
+
+from amplihack.llm.cache import ResponseCache, cache_key
 
 # --- Claude Agent SDK ---------------------------------------------------------
 
@@ -44,6 +62,11 @@ _detector_cache: str | None = None
 
 QUERY_TIMEOUT = int(os.environ.get("AMPLIHACK_LLM_TIMEOUT", "60"))
 
+MAX_CONCURRENCY = int(os.environ.get("AMPLIHACK_LLM_MAX_CONCURRENCY", "8"))
+
+# Latency samples kept per provider for percentile metrics
+_METRICS_WINDOW = 1000
+
 SDK_AVAILABLE = _CLAUDE_SDK_OK or _COPILOT_SDK_OK
 
 # Env vars that explicitly select an LLM provider, in priority order.
@@ -58,7 +81,167 @@ _PROVIDER_ENV_VARS = (
     "SIMARD_LLM_PROVIDER",
 )
 
-__all__ = ["completion", "SDK_AVAILABLE"]
+__all__ = [
+    "completion",
+    "get_metrics",
+    "get_response_cache",
+    "reset_metrics",
+    "session_pool",
+    "SDK_AVAILABLE",
+]
+
+_response_cache = ResponseCache(
+    directory=Path(os.environ["AMPLIHACK_LLM_CACHE_DIR"])
+    if os.environ.get("AMPLIHACK_LLM_CACHE_DIR")
+    else None
+)
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache used by completion(cache=True)."""
+    return _response_cache
+
+
+# --- Metrics ------------------------------------------------------------------
+
+
+class _ProviderMetrics:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.latencies: deque[float] = deque(maxlen=_METRICS_WINDOW)
+
+    def snapshot(self) -> dict[str, Any]:
+        ordered = sorted(self.latencies)
+
+        def pct(q: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "mean_ms": (sum(ordered) / len(ordered) * 1000) if ordered else 0.0,
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+        }
+
+
+_metrics: dict[str, _ProviderMetrics] = {}
+
+
+def _provider_metrics(provider: str) -> _ProviderMetrics:
+    return _metrics.setdefault(provider, _ProviderMetrics())
+
+
+def get_metrics() -> dict[str, dict[str, Any]]:
+    """Per-provider call counts, errors, cache hits and latency percentiles."""
+    return {provider: m.snapshot() for provider, m in _metrics.items()}
+
+
+def reset_metrics() -> None:
+    _metrics.clear()
+
+
+# --- Per-loop state (concurrency limit, in-flight dedupe) ---------------------
+
+
+class _LoopState:
+    def __init__(self) -> None:
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        self.inflight: dict[str, asyncio.Future[str]] = {}
+
+
+# asyncio primitives are bound to one event loop, and callers frequently use
+# a fresh asyncio.run() per request, so state is kept per running loop.
+_loop_states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _loop_state() -> _LoopState:
+    loop = asyncio.get_running_loop()
+    state = _loop_states.get(loop)
+    if state is None:
+        state = _loop_states[loop] = _LoopState()
+    return state
+
+
+# --- Warm Copilot client pool -------------------------------------------------
+
+
+class _CopilotClientPool:
+    """Bounded pool of started CopilotClients, scoped to one session_pool()."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._idle: asyncio.LifoQueue[Any] = asyncio.LifoQueue()
+        self._all: list[Any] = []
+
+    @contextlib.asynccontextmanager
+    async def client(self) -> AsyncIterator[Any]:
+        if self._idle.empty() and len(self._all) < self.size:
+            client = CopilotClient()
+            self._all.append(client)
+            try:
+                await client.start()
+            except BaseException:
+                self._all.remove(client)
+                raise
+        else:
+            client = await self._idle.get()
+        try:
+            yield client
+        except BaseException:
+            # A failed or cancelled call may leave the client wedged; replace
+            # it next time. BaseException so cancellation cannot leak a slot.
+            self._all.remove(client)
+            await _stop_copilot_client(client)
+            raise
+        else:
+            self._idle.put_nowait(client)
+
+    async def close(self) -> None:
+        clients, self._all = self._all, []
+        for client in clients:
+            await _stop_copilot_client(client)
+
+
+async def _stop_copilot_client(client: Any) -> None:
+    try:
+        await client.stop()
+    except Exception:
+        try:
+            await client.force_stop()
+        except Exception:
+            pass
+
+
+_copilot_pool: ContextVar[_CopilotClientPool | None] = ContextVar(
+    "amplihack_llm_copilot_pool", default=None
+)
+
+
+@contextlib.asynccontextmanager
+async def session_pool(size: int = MAX_CONCURRENCY) -> AsyncIterator[None]:
+    """Keep warm SDK clients for completion() calls made inside this block.
+
+    Without a pool, every Copilot completion starts and stops its own CLI
+    client. Inside the block, up to ``size`` started clients are reused and
+    stopped on exit; each call still gets a fresh session so no
+    conversation state leaks between independent completions.
+    """
+    pool = _CopilotClientPool(size)
+    token = _copilot_pool.set(pool)
+    try:
+        yield
+    finally:
+        _copilot_pool.reset(token)
+        await pool.close()
 
 
 def _provider_from_env() -> str | None:
@@ -122,6 +305,7 @@ async def completion(
     model: str | None = None,
     temperature: float | None = None,
     max_tokens: int | None = None,
+    cache: bool = False,
 ) -> str:
     """Send a completion request via the detected SDK.
 
@@ -133,50 +317,100 @@ async def completion(
         model: Model name (informational — actual model depends on SDK session).
         temperature: Sampling temperature (passed as hint in prompt if relevant).
         max_tokens: Max tokens (passed as hint in prompt if relevant).
+        cache: Serve identical (provider, prompt, model, temperature,
+            max_tokens) requests from the response cache. Only for
+            deterministic callers such as graders.
 
     Returns:
         Response text, or "" on any failure (fail-open).
     """
     project_root = _get_project_root()
-    launcher = _detect_launcher(project_root)
-    explicit_override = _provider_from_env()
+    provider = _select_provider(_detect_launcher(project_root), _provider_from_env())
+    if provider is None:
+        return ""
 
     # Build a single prompt from the messages list
     prompt = _messages_to_prompt(messages)
 
+    if not cache:
+        return await _timed_query(provider, prompt, project_root)
+
+    key = cache_key(provider, prompt, model, temperature, max_tokens)
+    cached = _response_cache.get(key)
+    if cached is not None:
+        _provider_metrics(provider).cache_hits += 1
+        return cached
+
+    # Coalesce identical requests already in flight on this loop
+    state = _loop_state()
+    pending = state.inflight.get(key)
+    if pending is not None:
+        _provider_metrics(provider).cache_hits += 1
+        return await asyncio.shield(pending)
+
+    future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+    state.inflight[key] = future
     try:
-        if explicit_override == "copilot":
-            if not _COPILOT_SDK_OK:
-                print(
-                    "WARNING: AMPLIHACK_LLM_PROVIDER/SIMARD_LLM_PROVIDER=copilot but "
-                    "the copilot SDK is not importable. Refusing to silently fall back "
-                    "to Claude.",
-                    file=sys.stderr,
-                )
-                return ""
-            return await _query_copilot(prompt, project_root)
-        if explicit_override == "claude":
-            if not _CLAUDE_SDK_OK:
-                print(
-                    "WARNING: AMPLIHACK_LLM_PROVIDER/SIMARD_LLM_PROVIDER=claude but "
-                    "the claude SDK is not importable. Refusing to silently fall back "
-                    "to Copilot.",
-                    file=sys.stderr,
-                )
-                return ""
-            return await _query_claude(prompt, project_root)
+        response = await _timed_query(provider, prompt, project_root)
+        _response_cache.put(key, response)
+        future.set_result(response)
+        return response
+    except BaseException:
+        future.set_result("")
+        raise
+    finally:
+        state.inflight.pop(key, None)
+
+
+def _select_provider(launcher: str, explicit_override: str | None) -> str | None:
+    """Pick the SDK to use, or None when no usable SDK is available."""
+    if explicit_override == "copilot":
+        if not _COPILOT_SDK_OK:
+            print(
+                "WARNING: AMPLIHACK_LLM_PROVIDER/SIMARD_LLM_PROVIDER=copilot but "
+                "the copilot SDK is not importable. Refusing to silently fall back "
+                "to Claude.",
+                file=sys.stderr,
+            )
+            return None
+        return "copilot"
+    if explicit_override == "claude":
+        if not _CLAUDE_SDK_OK:
+            print(
+                "WARNING: AMPLIHACK_LLM_PROVIDER/SIMARD_LLM_PROVIDER=claude but "
+                "the claude SDK is not importable. Refusing to silently fall back "
+                "to Copilot.",
+                file=sys.stderr,
+            )
+            return None
+        return "claude"
+
+    # No explicit override — use detected launcher with cross-SDK fallback.
+    if launcher == "copilot" and _COPILOT_SDK_OK:
+        return "copilot"
+    if _CLAUDE_SDK_OK:
+        return "claude"
+    if _COPILOT_SDK_OK:
+        return "copilot"
+    return None
 
-        # No explicit override — use detected launcher with cross-SDK fallback.
-        if launcher == "copilot" and _COPILOT_SDK_OK:
-            return await _query_copilot(prompt, project_root)
-        if _CLAUDE_SDK_OK:
-            return await _query_claude(prompt, project_root)
-        if _COPILOT_SDK_OK:
-            return await _query_copilot(prompt, project_root)
-    except Exception as e:
-        print(f"WARNING: LLM completion failed: {e}", file=sys.stderr)
 
-    return ""
+async def _timed_query(provider: str, prompt: str, project_root: Path) -> str:
+    """Run one SDK query under the concurrency limit, recording metrics."""
+    metrics = _provider_metrics(provider)
+    async with _loop_state().semaphore:
+        metrics.calls += 1
+        started = time.monotonic()
+        try:
+            if provider == "copilot":
+                return await _query_copilot(prompt, project_root)
+            return await _query_claude(prompt, project_root)
+        except Exception as e:
+            metrics.errors += 1
+            print(f"WARNING: LLM completion failed: {e}", file=sys.stderr)
+            return ""
+        finally:
+            metrics.latencies.append(time.monotonic() - started)
 
 
 def _messages_to_prompt(messages: list[dict[str, str]]) -> str:
@@ -220,27 +454,38 @@ async def _query_claude(prompt: str, project_root: Path) -> str:
 
 
 async def _query_copilot(prompt: str, project_root: Path) -> str:
-    """Query via GitHub Copilot SDK (copilot >= 0.1.0)."""
-    async with CopilotClient() as client:
-        session = await client.create_session(
-            on_permission_request=PermissionHandler.approve_all,
-            working_directory=str(project_root),
-        )
+    """Query via GitHub Copilot SDK (copilot >= 0.1.0).
+
+    Reuses a warm client when called inside session_pool().
+    """
+    pool = _copilot_pool.get()
+    if pool is None:
+        async with CopilotClient() as client:
+            return await _copilot_session_query(client, prompt, project_root)
+    async with pool.client() as client:
+        return await _copilot_session_query(client, prompt, project_root)
+
+
+async def _copilot_session_query(client: Any, prompt: str, project_root: Path) -> str:
+    session = await client.create_session(
+        on_permission_request=PermissionHandler.approve_all,
+        working_directory=str(project_root),
+    )
+    try:
+        async with asyncio.timeout(QUERY_TIMEOUT):
+            event = await session.send_and_wait(
+                prompt,
+                timeout=float(QUERY_TIMEOUT),
+            )
+        if event is None:
+            return ""
+        data = getattr(event, "data", None)
+        if data is None:
+            return ""
+        content = getattr(data, "content", None)
+        return content or ""
+    finally:
         try:
-            async with asyncio.timeout(QUERY_TIMEOUT):
-                event = await session.send_and_wait(
-                    prompt,
-                    timeout=float(QUERY_TIMEOUT),
-                )
-            if event is None:
-                return ""
-            data = getattr(event, "data", None)
-            if data is None:
-                return ""
-            content = getattr(data, "content", None)
-            return content or ""
-        finally:
-            try:
-                await session.destroy()
-            except Exception:
-                pass
+            await session.destroy()
+        except Exception:
+            pass
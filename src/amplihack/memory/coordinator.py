@@ -234,10 +234,12 @@ class MemoryCoordinator:
 
             # NOTE: Don't use content_search in SQL - SQL LIKE '%query%' requires
             # exact substring match which fails for "How to fix CI?" vs "To fix CI...".
-            # Instead, retrieve all and rank in Python using word-based scoring.
+            # relevance_query instead has the backend order candidates by BM25 over
+            # the words of the query (non-matching memories follow by recency), so
+            # the 100 candidates ranked below are the most relevant ones.
             db_query = MemoryQuery(
                 session_id=self.session_id,
-                # content_search=query.query_text,  # Disabled - rank in Python instead
+                relevance_query=query.query_text,
                 limit=100,  # Fetch more, then trim by budget
             )
 
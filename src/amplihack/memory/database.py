@@ -4,8 +4,13 @@ import hashlib
 import json
 import logging
 import os
+import re
 import sqlite3
 import threading
+import time
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -14,6 +19,19 @@ from .models import MemoryEntry, MemoryQuery, MemoryType, SessionInfo
 
 logger = logging.getLogger(__name__)
 
+# Buffered access-time updates are flushed once this old (seconds) or this many
+ACCESS_FLUSH_INTERVAL = 5.0
+ACCESS_FLUSH_MAX_PENDING = 500
+
+# BM25 column weights for (title, content): a title hit counts double
+FTS_COLUMN_WEIGHTS = (2.0, 1.0)
+
+_MEMORY_COLUMNS = """
+    id, session_id, agent_id, memory_type, title, content,
+    metadata, tags, importance, created_at, accessed_at,
+    expires_at, parent_id
+"""
+
 
 def _sanitize_error(error: Exception, operation: str) -> str:
     """Sanitize error messages to prevent information leakage.
@@ -33,8 +51,30 @@ def _sanitize_error(error: Exception, operation: str) -> str:
     return f"Database operation failed: {operation} ({error_type})"
 
 
+class _ThreadReader:
+    """One thread's read-only connection.
+
+    Only the thread's local storage holds it, so the connection is closed
+    when the thread ends (or earlier through ``close``).
+    """
+
+    __slots__ = ("__weakref__", "close", "connection")
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.close = weakref.finalize(self, connection.close)
+
+
 class MemoryDatabase:
-    """Thread-safe SQLite database for agent memory storage."""
+    """Thread-safe SQLite database for agent memory storage.
+
+    Writes go through one writer connection guarded by ``_lock``. Reads use
+    one connection per thread and never take that lock, so under WAL they
+    run concurrently with each other and with the writer. Reads do not write
+    access times directly: they are buffered and flushed in one batched
+    UPDATE every ACCESS_FLUSH_INTERVAL seconds, after ACCESS_FLUSH_MAX_PENDING
+    distinct entries, or on flush_access_times()/close().
+    """
 
     def __init__(self, db_path: Path | str | None = None):
         """Initialize database connection.
@@ -48,8 +88,18 @@ class MemoryDatabase:
             db_path = Path(db_path)
 
         self.db_path = db_path
+        self._in_memory = str(db_path) == ":memory:"
         self._lock = threading.RLock()
         self._connection: sqlite3.Connection | None = None
+        # This thread's _ThreadReader, and every live one (for close())
+        self._local = threading.local()
+        self._readers: weakref.WeakSet[_ThreadReader] = weakref.WeakSet()
+        self._readers_lock = threading.Lock()
+        # {memory_id: (latest accessed_at, reads since last flush)}
+        self._pending_access: dict[str, tuple[str, int]] = {}
+        self._access_lock = threading.Lock()
+        self._last_access_flush = time.monotonic()
+        self._fts_available = False
         self._init_database()
 
     def _init_database(self) -> None:
@@ -69,6 +119,7 @@ class MemoryDatabase:
         self._create_tables(conn)
         self._migrate_schema(conn)
         self._create_indexes(conn)
+        self._create_fulltext_index(conn)
 
     def initialize(self) -> None:
         """Public method to initialize database (alias for _init_database)."""
@@ -108,10 +159,60 @@ class MemoryDatabase:
             conn.execute("PRAGMA temp_store=MEMORY")  # Use memory for temp tables
             conn.execute("PRAGMA mmap_size=268435456")  # 256MB memory map
             conn.execute("PRAGMA foreign_keys=ON")  # Enable foreign key constraints
+            # INSERT OR REPLACE only fires the full-text delete trigger with this on
+            conn.execute("PRAGMA recursive_triggers=ON")
 
             self._connection = conn
             return conn
 
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Connection for a read-only query.
+
+        An in-memory database exists only inside the writer connection, so
+        reads share it under the writer lock.
+        """
+        if self._in_memory:
+            with self._lock:
+                yield self._get_connection()
+        else:
+            yield self._get_reader()
+
+    def _get_reader(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection, creating it on first use.
+
+        Reader connections run in autocommit mode, so each query is its own
+        WAL read snapshot and sees every write committed before it started.
+        The connection is closed when the thread ends.
+        """
+        reader = getattr(self._local, "reader", None)
+        if reader is None or not reader.close.alive:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=30.0,
+                check_same_thread=False,  # close() may run on another thread
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA query_only=ON")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            reader = self._local.reader = _ThreadReader(conn)
+            with self._readers_lock:
+                self._readers.add(reader)
+        return reader.connection
+
+    def _discard_reader(self) -> None:
+        """Drop this thread's reader so the next read reconnects."""
+        if self._in_memory:
+            return
+        reader = getattr(self._local, "reader", None)
+        self._local.reader = None
+        if reader is not None:
+            try:
+                reader.close()
+            except Exception:
+                pass
+
     def _create_tables(self, conn: sqlite3.Connection) -> None:
         """Create database tables."""
         # Main memory entries table
@@ -131,6 +232,7 @@ class MemoryDatabase:
                 accessed_at TEXT NOT NULL,
                 expires_at TEXT DEFAULT NULL,
                 parent_id TEXT DEFAULT NULL,
+                access_count INTEGER NOT NULL DEFAULT 0,
                 FOREIGN KEY (parent_id) REFERENCES memory_entries(id) ON DELETE SET NULL
             )
         """)
@@ -162,7 +264,8 @@ class MemoryDatabase:
     def _migrate_schema(self, conn: sqlite3.Connection) -> None:
         """Migrate existing schema to add new columns.
 
-        Adds content_hash column if it doesn't exist and computes hashes for existing entries.
+        Adds content_hash column if it doesn't exist and computes hashes for existing entries,
+        and the access_count column.
         """
         # Check if content_hash column exists
         cursor = conn.execute("PRAGMA table_info(memory_entries)")
@@ -186,6 +289,13 @@ class MemoryDatabase:
             logger.info("Schema migration complete")
             conn.commit()
 
+        if "access_count" not in columns:
+            logger.info("Migrating schema: adding access_count column")
+            conn.execute(
+                "ALTER TABLE memory_entries ADD COLUMN access_count INTEGER NOT NULL DEFAULT 0"
+            )
+            conn.commit()
+
     def _create_indexes(self, conn: sqlite3.Connection) -> None:
         """Create indexes for efficient queries."""
         indexes = [
@@ -211,6 +321,75 @@ class MemoryDatabase:
 
         conn.commit()
 
+    def _create_fulltext_index(self, conn: sqlite3.Connection) -> None:
+        """Create the FTS5 index over title/content and the triggers that sync it.
+
+        The index is an external-content table, so it stores only the token
+        index and reads text back from memory_entries. Databases created before
+        the index existed are backfilled once. If this SQLite build lacks FTS5,
+        relevance queries fall back to the default ordering.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_fts'"
+        ).fetchone()
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(
+                    title, content,
+                    content='memory_entries', content_rowid='rowid',
+                    tokenize='porter unicode61'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable, using default ordering: {e}")
+            self._fts_available = False
+            return
+
+        triggers = [
+            """
+            CREATE TRIGGER IF NOT EXISTS memory_fts_insert AFTER INSERT ON memory_entries BEGIN
+                INSERT INTO memory_fts(rowid, title, content)
+                VALUES (new.rowid, new.title, new.content);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS memory_fts_delete AFTER DELETE ON memory_entries BEGIN
+                INSERT INTO memory_fts(memory_fts, rowid, title, content)
+                VALUES ('delete', old.rowid, old.title, old.content);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS memory_fts_update
+            AFTER UPDATE OF title, content ON memory_entries BEGIN
+                INSERT INTO memory_fts(memory_fts, rowid, title, content)
+                VALUES ('delete', old.rowid, old.title, old.content);
+                INSERT INTO memory_fts(rowid, title, content)
+                VALUES (new.rowid, new.title, new.content);
+            END
+            """,
+        ]
+        for trigger_sql in triggers:
+            conn.execute(trigger_sql)
+
+        if not exists:
+            logger.info("Migrating schema: backfilling full-text index")
+            conn.execute("INSERT INTO memory_fts(memory_fts) VALUES ('rebuild')")
+
+        conn.commit()
+        self._fts_available = True
+
+    @staticmethod
+    def _fts_match_expression(text: str) -> str | None:
+        """Build an FTS5 MATCH expression that ORs the words of free text.
+
+        Each word is quoted so user input can never be parsed as FTS5 syntax.
+        Returns None if the text contains no words.
+        """
+        words = re.findall(r"\w+", text.lower())
+        if not words:
+            return None
+        return " OR ".join(f'"{word}"' for word in dict.fromkeys(words))
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -221,7 +400,8 @@ class MemoryDatabase:
         return False
 
     def close(self) -> None:
-        """Close database connection and cleanup resources."""
+        """Flush buffered access times and close all connections."""
+        self.flush_access_times()
         with self._lock:
             if self._connection is not None:
                 try:
@@ -231,6 +411,65 @@ class MemoryDatabase:
                 finally:
                     self._connection = None
 
+        with self._readers_lock:
+            readers = list(self._readers)
+            self._readers.clear()
+        for reader in readers:
+            try:
+                reader.close()
+            except Exception:
+                pass
+
+    def _record_access(self, memory_ids: list[str]) -> None:
+        """Buffer an access-time update for memories that were just read."""
+        now = datetime.now().isoformat()
+        with self._access_lock:
+            for memory_id in memory_ids:
+                _, count = self._pending_access.get(memory_id, (now, 0))
+                self._pending_access[memory_id] = (now, count + 1)
+            due = (
+                len(self._pending_access) >= ACCESS_FLUSH_MAX_PENDING
+                or time.monotonic() - self._last_access_flush >= ACCESS_FLUSH_INTERVAL
+            )
+        # Readers never wait for the writer: if it is busy, a later read flushes
+        if due and self._lock.acquire(blocking=False):
+            try:
+                self._flush_access_locked()
+            finally:
+                self._lock.release()
+
+    def flush_access_times(self) -> None:
+        """Write buffered access times and counts in one batched UPDATE."""
+        with self._lock:
+            self._flush_access_locked()
+
+    def _flush_access_locked(self) -> None:
+        with self._access_lock:
+            pending = self._pending_access
+            self._pending_access = {}
+            self._last_access_flush = time.monotonic()
+        if not pending:
+            return
+
+        conn = None
+        try:
+            conn = self._get_connection()
+            # MAX() keeps a newer accessed_at written by store_memory meanwhile
+            conn.executemany(
+                """
+                UPDATE memory_entries
+                SET accessed_at = MAX(accessed_at, ?), access_count = access_count + ?
+                WHERE id = ?
+            """,
+                [(ts, count, memory_id) for memory_id, (ts, count) in pending.items()],
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            if conn:
+                conn.rollback()
+            sanitized_msg = _sanitize_error(e, "flush_access_times")
+            logger.error(sanitized_msg)
+
     @staticmethod
     def _compute_content_hash(content: str) -> str:
         """Compute SHA256 hash of content for O(1) duplicate detection.
@@ -268,8 +507,9 @@ class MemoryDatabase:
                     INSERT OR REPLACE INTO memory_entries (
                         id, session_id, agent_id, memory_type, title, content, content_hash,
                         metadata, tags, importance, created_at, accessed_at,
-                        expires_at, parent_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        expires_at, parent_id, access_count
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                        COALESCE((SELECT access_count FROM memory_entries WHERE id = ?), 0))
                 """,
                     (
                         memory.id,
@@ -286,6 +526,7 @@ class MemoryDatabase:
                         memory.accessed_at.isoformat(),
                         memory.expires_at.isoformat() if memory.expires_at else None,
                         memory.parent_id,
+                        memory.id,
                     ),
                 )
 
@@ -309,20 +550,38 @@ class MemoryDatabase:
         Returns:
             List of matching memory entries
         """
-        with self._lock:
-            conn = None
-            try:
-                conn = self._get_connection()
+        try:
+            with self._read_connection() as conn:
                 where_clause, params = query.to_sql_where()
 
-                sql = f"""
-                    SELECT id, session_id, agent_id, memory_type, title, content,
-                           metadata, tags, importance, created_at, accessed_at,
-                           expires_at, parent_id
-                    FROM memory_entries
-                    WHERE {where_clause}
-                    ORDER BY accessed_at DESC, importance DESC NULLS LAST
-                """
+                match = (
+                    self._fts_match_expression(query.relevance_query)
+                    if query.relevance_query and self._fts_available
+                    else None
+                )
+                if match:
+                    # Rank in SQL so only the top rows leave SQLite: BM25 matches
+                    # first (lower is better), then everything else by recency.
+                    sql = f"""
+                        SELECT {_MEMORY_COLUMNS}
+                        FROM memory_entries
+                        LEFT JOIN (
+                            SELECT rowid AS fts_rowid, bm25(memory_fts, ?, ?) AS fts_rank
+                            FROM memory_fts
+                            WHERE memory_fts MATCH ?
+                        ) ON fts_rowid = memory_entries.rowid
+                        WHERE {where_clause}
+                        ORDER BY fts_rank IS NULL, fts_rank,
+                                 accessed_at DESC, importance DESC NULLS LAST
+                    """
+                    params = [*FTS_COLUMN_WEIGHTS, match, *params]
+                else:
+                    sql = f"""
+                        SELECT {_MEMORY_COLUMNS}
+                        FROM memory_entries
+                        WHERE {where_clause}
+                        ORDER BY accessed_at DESC, importance DESC NULLS LAST
+                    """
 
                 if query.limit:
                     sql += " LIMIT ?"
@@ -340,28 +599,17 @@ class MemoryDatabase:
                     if memory:
                         memories.append(memory)
 
-                # Update access times for retrieved memories
+                # Access times are buffered and written in batches
                 if memories:
-                    memory_ids = [m.id for m in memories]
-                    placeholders = ",".join(["?"] * len(memory_ids))
-                    conn.execute(
-                        f"""
-                        UPDATE memory_entries
-                        SET accessed_at = ?
-                        WHERE id IN ({placeholders})
-                    """,
-                        [datetime.now().isoformat()] + memory_ids,
-                    )
-                    conn.commit()
+                    self._record_access([m.id for m in memories])
 
                 return memories
 
-            except sqlite3.Error as e:
-                if conn:
-                    conn.rollback()
-                sanitized_msg = _sanitize_error(e, "retrieve_memories")
-                logger.error(sanitized_msg)
-                return []
+        except sqlite3.Error as e:
+            self._discard_reader()
+            sanitized_msg = _sanitize_error(e, "retrieve_memories")
+            logger.error(sanitized_msg)
+            return []
 
     def get_memory_by_id(self, memory_id: str) -> MemoryEntry | None:
         """Get a specific memory by ID.
@@ -372,18 +620,10 @@ class MemoryDatabase:
         Returns:
             Memory entry if found, None otherwise
         """
-        with self._lock:
-            conn = None
-            try:
-                conn = self._get_connection()
+        try:
+            with self._read_connection() as conn:
                 cursor = conn.execute(
-                    """
-                    SELECT id, session_id, agent_id, memory_type, title, content,
-                           metadata, tags, importance, created_at, accessed_at,
-                           expires_at, parent_id
-                    FROM memory_entries
-                    WHERE id = ?
-                """,
+                    f"SELECT {_MEMORY_COLUMNS} FROM memory_entries WHERE id = ?",
                     (memory_id,),
                 )
 
@@ -391,23 +631,13 @@ class MemoryDatabase:
                 if row:
                     memory = self._row_to_memory(row)
                     if memory:
-                        # Update access time
-                        conn.execute(
-                            """
-                            UPDATE memory_entries
-                            SET accessed_at = ?
-                            WHERE id = ?
-                        """,
-                            (datetime.now().isoformat(), memory_id),
-                        )
-                        conn.commit()
+                        self._record_access([memory_id])
                     return memory
 
-            except sqlite3.Error as e:
-                if conn:
-                    conn.rollback()
-                sanitized_msg = _sanitize_error(e, "get_memory_by_id")
-                logger.error(sanitized_msg)
+        except sqlite3.Error as e:
+            self._discard_reader()
+            sanitized_msg = _sanitize_error(e, "get_memory_by_id")
+            logger.error(sanitized_msg)
 
         return None
 
@@ -471,10 +701,8 @@ class MemoryDatabase:
         Returns:
             Session information if found
         """
-        with self._lock:
-            conn = None
-            try:
-                conn = self._get_connection()
+        try:
+            with self._read_connection() as conn:
                 # Get session basic info
                 cursor = conn.execute(
                     """
@@ -517,11 +745,10 @@ class MemoryDatabase:
                     metadata=json.loads(session_row[3]),
                 )
 
-            except sqlite3.Error as e:
-                if conn:
-                    conn.rollback()
-                sanitized_msg = _sanitize_error(e, "get_session_info")
-                logger.error(sanitized_msg)
+        except sqlite3.Error as e:
+            self._discard_reader()
+            sanitized_msg = _sanitize_error(e, "get_session_info")
+            logger.error(sanitized_msg)
 
         return None
 
@@ -534,10 +761,8 @@ class MemoryDatabase:
         Returns:
             List of session information
         """
-        with self._lock:
-            conn = None
-            try:
-                conn = self._get_connection()
+        try:
+            with self._read_connection() as conn:
                 sql = """
                     SELECT session_id, created_at, last_accessed, metadata
                     FROM sessions
@@ -588,12 +813,11 @@ class MemoryDatabase:
 
                 return sessions
 
-            except sqlite3.Error as e:
-                if conn:
-                    conn.rollback()
-                sanitized_msg = _sanitize_error(e, "list_sessions")
-                logger.error(sanitized_msg)
-                return []
+        except sqlite3.Error as e:
+            self._discard_reader()
+            sanitized_msg = _sanitize_error(e, "list_sessions")
+            logger.error(sanitized_msg)
+            return []
 
     def delete_session(self, session_id: str) -> bool:
         """Delete a session and all its associated memories.
@@ -645,10 +869,8 @@ class MemoryDatabase:
         Returns:
             Dictionary with database statistics
         """
-        with self._lock:
-            conn = None
-            try:
-                conn = self._get_connection()
+        try:
+            with self._read_connection() as conn:
                 stats = {}
 
                 # Total memory count
@@ -682,12 +904,11 @@ class MemoryDatabase:
 
                 return stats
 
-            except sqlite3.Error as e:
-                if conn:
-                    conn.rollback()
-                sanitized_msg = _sanitize_error(e, "get_stats")
-                logger.error(sanitized_msg)
-                return {}
+        except sqlite3.Error as e:
+            self._discard_reader()
+            sanitized_msg = _sanitize_error(e, "get_stats")
+            logger.error(sanitized_msg)
+            return {}
 
     def _update_session(self, conn: sqlite3.Connection, session_id: str, agent_id: str) -> None:
         """Update session and agent tracking."""
@@ -17,6 +17,7 @@ Public API:
 
 import json
 import logging
+import os
 import subprocess
 import sys
 import threading
@@ -1269,6 +1270,7 @@ def run_blarify(
                 ".venv",
                 "vendor",
             ],
+            parse_workers=min(8, os.cpu_count() or 1),
         )
 
         # Build and save graph directly to Kuzu
@@ -148,6 +148,7 @@ class MemoryQuery:
     memory_type: MemoryType | None = None
     tags: list[str] | None = None
     content_search: str | None = None
+    relevance_query: str | None = None  # Order by BM25 full-text relevance (never filters)
     min_importance: int | None = None
     created_after: datetime | None = None
     created_before: datetime | None = None
@@ -1,5 +1,6 @@
 """Public recovery workflow API."""
 
+from .collect_cache import CollectOnlyCache
 from .coordinator import run_recovery, run_stage1
 from .models import (
     RecoveryBlocker,
@@ -17,6 +18,7 @@ from .stage2 import (
     build_collect_only_command,
     build_error_signatures,
     cluster_signatures,
+    collect_error_signatures,
     detect_pytest_config_divergence,
     determine_delta_verdict,
     run_stage2,
@@ -31,6 +33,7 @@ from .stage4 import determine_atlas_target, run_code_atlas, run_stage4
 
 __all__ = [
     "RECOVERY_AUDIT_PHASES",
+    "CollectOnlyCache",
     "RecoveryBlocker",
     "RecoveryRun",
     "Stage1Result",
@@ -43,6 +46,7 @@ __all__ = [
     "build_collect_only_command",
     "build_error_signatures",
     "cluster_signatures",
+    "collect_error_signatures",
     "detect_pytest_config_divergence",
     "determine_atlas_target",
     "determine_delta_verdict",
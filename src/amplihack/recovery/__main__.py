@@ -25,6 +25,12 @@ def _add_run_arguments(parser: argparse.ArgumentParser) -> None:
     )
     parser.add_argument("--min-audit-cycles", type=int, default=3)
     parser.add_argument("--max-audit-cycles", type=int, default=6)
+    parser.add_argument(
+        "--collect-workers",
+        type=int,
+        default=1,
+        help="Parallel pytest processes for collect-only re-validation",
+    )
 
 
 def add_recovery_subcommand(
@@ -53,6 +59,7 @@ def run_from_args(args: argparse.Namespace) -> int:
         worktree_path=args.worktree,
         min_audit_cycles=args.min_audit_cycles,
         max_audit_cycles=args.max_audit_cycles,
+        collect_workers=args.collect_workers,
     )
     print(json.dumps(recovery_run_to_json(run), indent=2, sort_keys=True))
     return 0
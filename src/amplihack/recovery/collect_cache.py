@@ -0,0 +1,532 @@
+"""Per-module collect-only results for incremental Stage 2/3 validation.
+
+Stage 2 collects the whole suite for its baseline and again after fixes, and
+Stage 3 repeats collect-only on the repo and the worktree in every cycle.
+Most of those runs see the same files. CollectOnlyCache remembers the error
+signatures of each test module keyed by a fingerprint of everything its
+collection depends on in the repository:
+
+- the pytest configuration files,
+- the module itself,
+- the conftest.py and __init__.py files between the rootdir and the module,
+- the repository files reachable through its imports (and theirs),
+- every repository .py file, when that closure is open: at import time one
+  of its files edits sys.path and one imports a name that the search roots
+  do not resolve, that is not installed, but that names a repository module
+  (e.g. ``sys.path.insert(0, tools_dir)`` then ``import analyzer``). Which
+  file such an import loads is unknown, so the module is re-collected
+  whenever any Python file changes.
+
+A later run re-collects only the modules whose fingerprint is new, passing
+them to pytest explicitly, and merges the result with the cached signatures
+of the rest. Fingerprints include the checkout path: the repo and the
+isolated worktree are validated separately.
+
+Discovery follows pytest.ini (testpaths, python_files, norecursedirs). Trees
+whose conftests change how files are collected are not cached. Modules under
+a conftest that ignores paths are always collected with the full suite.
+"""
+
+from __future__ import annotations
+
+import ast
+import configparser
+import fnmatch
+import hashlib
+import importlib.util
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from .models import Stage2ErrorSignature
+
+# pytest defaults when pytest.ini does not override them
+_DEFAULT_PYTHON_FILES = ("test_*.py", "*_test.py")
+_DEFAULT_NORECURSEDIRS = (
+    "*.egg",
+    ".*",
+    "_darcs",
+    "build",
+    "CVS",
+    "dist",
+    "node_modules",
+    "venv",
+    "{arch}",
+)
+_CONFIG_FILES = ("pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini")
+# Conftest hooks that collect files other than the discovered modules
+_CUSTOM_COLLECTION_HOOKS = (
+    "pytest_collect_file",
+    "pytest_collect_directory",
+    "pytest_pycollect_makemodule",
+)
+# Conftest names that hide paths from the full run but not from explicit arguments
+_IGNORE_HOOKS = ("collect_ignore", "pytest_ignore_collect")
+# addopts that make explicit module arguments collect differently
+_UNSAFE_ADDOPTS = ("--ignore", "--pyargs")
+# Directories never searched for modules an import could reach via sys.path
+_UNSCANNED_DIRS = frozenset({".git", "__pycache__", "node_modules"})
+# Calls that import a module the closure walk cannot follow
+_DYNAMIC_IMPORT_CALLS = frozenset(
+    {"spec_from_file_location", "exec_module", "import_module", "__import__"}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CollectSnapshot:
+    """Test modules of a checkout and the fingerprint of each one."""
+
+    repo_path: Path
+    modules: dict[str, str]
+    untargetable: frozenset[str]
+    # Fingerprint of the whole suite
+    digest: str
+
+
+def _ini_list(section: configparser.SectionProxy | dict[str, str], key: str) -> list[str]:
+    return section.get(key, "").split()
+
+
+def _matches(name: str, patterns: list[str] | tuple[str, ...]) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+@dataclass(frozen=True, slots=True)
+class _ModuleImports:
+    """Imports of one file as (relative level, dotted name) pairs."""
+
+    # Every import, including ``from`` targets and imports inside functions
+    names: list[tuple[int, str]]
+    # The imports and sys.path access that run when the file is imported
+    import_time: frozenset[tuple[int, str]]
+    edits_sys_path: bool
+    # Calls one of _DYNAMIC_IMPORT_CALLS when the file is imported
+    imports_dynamically: bool
+
+
+def _scan_imports(tree: ast.AST) -> _ModuleImports:
+    names: list[tuple[int, str]] = []
+    import_time: set[tuple[int, str]] = set()
+    edits_sys_path = False
+    imports_dynamically = False
+    pending: list[tuple[ast.AST, bool]] = [(tree, False)]
+    while pending:
+        node, in_function = pending.pop()
+        found: list[tuple[int, str]] = []
+        if isinstance(node, ast.Import):
+            found = [(0, alias.name) for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if base:
+                found.append((node.level, base))
+            for alias in node.names:
+                if alias.name != "*":
+                    found.append((node.level, f"{base}.{alias.name}" if base else alias.name))
+        elif (
+            not in_function
+            and isinstance(node, ast.Attribute)
+            and node.attr == "path"
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "sys"
+        ):
+            edits_sys_path = True
+        elif not in_function and isinstance(node, ast.Call):
+            func = node.func
+            called = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+            imports_dynamically = imports_dynamically or called in _DYNAMIC_IMPORT_CALLS
+        names.extend(found)
+        if not in_function:
+            import_time.update(found)
+        in_body = in_function or isinstance(
+            node, ast.FunctionDef | ast.AsyncFunctionDef | ast.Lambda
+        )
+        pending.extend((child, in_body) for child in ast.iter_child_nodes(node))
+    edits_sys_path = edits_sys_path or (0, "sys.path") in import_time
+    return _ModuleImports(names, frozenset(import_time), edits_sys_path, imports_dynamically)
+
+
+class _SnapshotBuilder:
+    """Fingerprints the test modules of one checkout.
+
+    Files are tracked as absolute path strings; pathlib is too slow for the
+    hundreds of thousands of lookups an import closure walk makes.
+    """
+
+    def __init__(self, repo_path: Path, imports: dict[str, _ModuleImports]):
+        self.repo_path = repo_path
+        self._root = str(repo_path)
+        self._imports = imports
+        self._digests: dict[str, str | None] = {}
+        self._texts: dict[str, str] = {}
+        self._deps: dict[str, list[str]] = {}
+        self._resolved: dict[tuple[str, str], list[str]] = {}
+        self._search_roots: list[str] = []
+        # Files that edit sys.path, and files importing a name that only a
+        # sys.path edit could resolve, when they are imported
+        self._edits_sys_path: set[str] = set()
+        self._unresolved: set[str] = set()
+        # Files that import a module by path or name when they are imported
+        self._imports_dynamically: set[str] = set()
+        self._python_files: list[str] | None = None
+        self._module_names: set[str] = set()
+        self._installed: dict[str, bool] = {}
+        self._repo_digest: str | None = None
+
+    def digest(self, path: str) -> str | None:
+        if path not in self._digests:
+            try:
+                with open(path, "rb") as file:
+                    self._digests[path] = hashlib.sha1(file.read()).hexdigest()
+            except OSError:
+                self._digests[path] = None
+        return self._digests[path]
+
+    def build(self) -> CollectSnapshot | None:
+        pytest_ini = self.repo_path / "pytest.ini"
+        if not pytest_ini.is_file():
+            return None
+        parser = configparser.ConfigParser(interpolation=None)
+        try:
+            parser.read(pytest_ini)
+        except configparser.Error:
+            return None
+        ini = parser["pytest"] if parser.has_section("pytest") else {}
+        addopts = ini.get("addopts", "")
+        if any(option in addopts for option in _UNSAFE_ADDOPTS):
+            return None
+
+        python_files = _ini_list(ini, "python_files") or list(_DEFAULT_PYTHON_FILES)
+        norecursedirs = _ini_list(ini, "norecursedirs") or list(_DEFAULT_NORECURSEDIRS)
+        self._search_roots = [
+            os.path.normpath(os.path.join(self._root, entry))
+            for entry in _ini_list(ini, "pythonpath")
+        ]
+        self._search_roots.append(self._root)
+
+        testpaths: list[Path] = []
+        for entry in _ini_list(ini, "testpaths") or ["."]:
+            if any(char in entry for char in "*?["):
+                testpaths.extend(sorted(self.repo_path.glob(entry)))
+            elif (self.repo_path / entry).exists():
+                testpaths.append(self.repo_path / entry)
+        if not testpaths:
+            return None
+
+        modules: set[str] = set()
+        for testpath in testpaths:
+            if testpath.is_file():
+                modules.add(os.path.normpath(testpath))
+                continue
+            for dirpath, dirnames, filenames in os.walk(os.path.normpath(testpath)):
+                dirnames[:] = sorted(
+                    name
+                    for name in dirnames
+                    if not _matches(name, norecursedirs)
+                    and not os.path.exists(os.path.join(dirpath, name, "pyvenv.cfg"))
+                )
+                modules.update(
+                    os.path.join(dirpath, name)
+                    for name in filenames
+                    if name.endswith(".py") and _matches(name, python_files)
+                )
+        if not modules:
+            return None
+
+        config_digest = hashlib.sha1(f"{self._root}\n".encode())
+        for name in _CONFIG_FILES:
+            path = os.path.join(self._root, name)
+            config_digest.update(f"{name}:{self.digest(path)}\n".encode())
+
+        fingerprints: dict[str, str] = {}
+        untargetable: set[str] = set()
+        suite_digest = hashlib.sha1()
+        for module in sorted(modules):
+            chain = self._collection_chain(module)
+            conftests = [self._text(path) for path in chain if path.endswith("conftest.py")]
+            if any(hook in text for text in conftests for hook in _CUSTOM_COLLECTION_HOOKS):
+                return None
+            relpath = self._relative(module)
+            if any(hook in text for text in conftests for hook in _IGNORE_HOOKS):
+                untargetable.add(relpath)
+
+            digest = hashlib.sha1(config_digest.digest())
+            closure = self._closure([module, *chain])
+            for path in sorted(closure):
+                digest.update(f"{self._relative(path)}:{self.digest(path)}\n".encode())
+            if not self._imports_dynamically.isdisjoint(closure) or not (
+                self._edits_sys_path.isdisjoint(closure) or self._unresolved.isdisjoint(closure)
+            ):
+                # Open closure: some import resolves through a sys.path edit or a
+                # dynamic import
+                digest.update(f"*:{self._python_files_digest()}\n".encode())
+            fingerprints[relpath] = digest.hexdigest()
+            suite_digest.update(f"{relpath}:{fingerprints[relpath]}\n".encode())
+
+        return CollectSnapshot(
+            repo_path=self.repo_path,
+            modules=fingerprints,
+            untargetable=frozenset(untargetable),
+            digest=suite_digest.hexdigest(),
+        )
+
+    def _repository_python_files(self) -> list[str]:
+        """Every .py file in the repository, including hidden dirs, outside venvs."""
+        if self._python_files is None:
+            self._python_files = []
+            for dirpath, dirnames, filenames in os.walk(self._root):
+                dirnames[:] = [
+                    name
+                    for name in dirnames
+                    if name not in _UNSCANNED_DIRS
+                    and not os.path.exists(os.path.join(dirpath, name, "pyvenv.cfg"))
+                ]
+                names = [name for name in filenames if name.endswith(".py")]
+                if names:
+                    self._module_names.add(os.path.basename(dirpath))
+                    self._module_names.update(name[:-3] for name in names)
+                    self._python_files.extend(os.path.join(dirpath, name) for name in names)
+        return self._python_files
+
+    def _python_files_digest(self) -> str:
+        if self._repo_digest is None:
+            digest = hashlib.sha1()
+            for path in sorted(self._repository_python_files()):
+                digest.update(f"{self._relative(path)}:{self.digest(path)}\n".encode())
+            self._repo_digest = digest.hexdigest()
+        return self._repo_digest
+
+    def _may_reach_repository(self, name: str) -> bool:
+        """Whether an unresolved import could load a repository file via sys.path.
+
+        True when no installed or standard-library module has the top-level
+        name but some repository file or directory does.
+        """
+        top = name.split(".", 1)[0]
+        installed = self._installed.get(top)
+        if installed is None:
+            installed = top in sys.stdlib_module_names or top in sys.builtin_module_names
+            if not installed:
+                try:
+                    spec = importlib.util.find_spec(top)
+                except (ImportError, ValueError):
+                    spec = None
+                if spec is not None:
+                    locations = list(spec.submodule_search_locations or [])
+                    origin = spec.origin if spec.has_location else next(iter(locations), "")
+                    installed = not (origin or "").startswith(self._root + os.sep)
+            self._installed[top] = installed
+        self._repository_python_files()
+        return not installed and top in self._module_names
+
+    def _relative(self, path: str) -> str:
+        return os.path.relpath(path, self._root).replace(os.sep, "/")
+
+    def _text(self, path: str) -> str:
+        text = self._texts.get(path)
+        if text is None:
+            try:
+                with open(path, errors="replace") as file:
+                    text = file.read()
+            except OSError:
+                text = ""
+            self._texts[path] = text
+        return text
+
+    def _collection_chain(self, module: str) -> list[str]:
+        """conftest.py and __init__.py files pytest loads before importing ``module``."""
+        chain: list[str] = []
+        directory = os.path.dirname(module)
+        while True:
+            for name in ("conftest.py", "__init__.py"):
+                if os.path.isfile(os.path.join(directory, name)):
+                    chain.append(os.path.join(directory, name))
+            if directory == self._root or directory == os.path.dirname(directory):
+                return chain
+            directory = os.path.dirname(directory)
+
+    def _closure(self, seeds: list[str]) -> set[str]:
+        seen = set(seeds)
+        pending = list(seeds)
+        while pending:
+            for dep in self._dependencies(pending.pop()):
+                if dep not in seen:
+                    seen.add(dep)
+                    pending.append(dep)
+        return seen
+
+    def _dependencies(self, path: str) -> list[str]:
+        deps = self._deps.get(path)
+        if deps is not None:
+            return deps
+
+        digest = self.digest(path)
+        scanned = self._imports.get(digest) if digest else None
+        if scanned is None:
+            try:
+                with open(path, "rb") as file:
+                    scanned = _scan_imports(ast.parse(file.read()))
+            except (OSError, SyntaxError, ValueError):
+                scanned = _ModuleImports([], frozenset(), False, False)
+            if digest:
+                self._imports[digest] = scanned
+        if scanned.edits_sys_path:
+            self._edits_sys_path.add(path)
+        if scanned.imports_dynamically:
+            self._imports_dynamically.add(path)
+
+        # Same rootdir-relative basedir that pytest's prepend import mode inserts
+        basedir = os.path.dirname(path)
+        while basedir != self._root and os.path.isfile(os.path.join(basedir, "__init__.py")):
+            basedir = os.path.dirname(basedir)
+        deps = []
+        for level, name in scanned.names:
+            if level:
+                package = os.path.dirname(path)
+                for _ in range(level - 1):
+                    package = os.path.dirname(package)
+                deps.extend(self._resolve(package, name))
+                continue
+            for root in (basedir, *self._search_roots):
+                resolved = self._resolve(root, name)
+                if resolved:
+                    deps.extend(resolved)
+                    break
+            else:
+                if (level, name) in scanned.import_time and self._may_reach_repository(name):
+                    self._unresolved.add(path)
+        self._deps[path] = deps
+        return deps
+
+    def _resolve(self, root: str, name: str) -> list[str]:
+        """Repository files executed by importing ``name`` from ``root``."""
+        key = (root, name)
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+            return resolved
+
+        resolved = []
+        base = root
+        for part in name.split(".") if name else []:
+            package = os.path.join(base, part)
+            if os.path.isfile(os.path.join(package, "__init__.py")):
+                resolved.append(os.path.join(package, "__init__.py"))
+            elif os.path.isfile(package + ".py"):
+                resolved.append(package + ".py")
+                break
+            elif not os.path.isdir(package):
+                break
+            base = package
+        prefix = self._root + os.sep
+        resolved = [path for path in resolved if path.startswith(prefix)]
+        self._resolved[key] = resolved
+        return resolved
+
+
+class CollectOnlyCache:
+    """Collect-only error signatures per test module, keyed by fingerprint.
+
+    ``workers`` > 1 lets re-collection split the changed modules into
+    independent subtrees and collect them in parallel pytest processes.
+    """
+
+    def __init__(self, *, workers: int = 1):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self._results: dict[tuple[str, str], list[Stage2ErrorSignature]] = {}
+        # Whole-suite results that could not be split per module
+        self._suites: dict[str, list[Stage2ErrorSignature]] = {}
+        # Import names per file content digest, shared by all checkouts
+        self._imports: dict[str, _ModuleImports] = {}
+
+    def snapshot(self, repo_path: Path) -> CollectSnapshot | None:
+        """Fingerprint the test modules of ``repo_path``, or None if it cannot be cached."""
+        return _SnapshotBuilder(repo_path.resolve(), self._imports).build()
+
+    def suite_signatures(self, snapshot: CollectSnapshot) -> list[Stage2ErrorSignature] | None:
+        """Signatures of a full run over exactly this suite, if one was stored."""
+        return self._suites.get(snapshot.digest)
+
+    def store_suite(
+        self, snapshot: CollectSnapshot, signatures: list[Stage2ErrorSignature]
+    ) -> None:
+        """Record a full run, split per module when every signature can be attributed."""
+        if not self.store(snapshot, list(snapshot.modules), signatures):
+            self._suites[snapshot.digest] = list(signatures)
+
+    def stale_modules(self, snapshot: CollectSnapshot) -> list[str]:
+        return [
+            module
+            for module, fingerprint in snapshot.modules.items()
+            if (module, fingerprint) not in self._results
+        ]
+
+    def signatures(self, snapshot: CollectSnapshot) -> list[Stage2ErrorSignature]:
+        """Cached signatures of every module in ``snapshot`` (all must be stored)."""
+        return [
+            signature
+            for module, fingerprint in snapshot.modules.items()
+            for signature in self._results[(module, fingerprint)]
+        ]
+
+    def store(
+        self,
+        snapshot: CollectSnapshot,
+        modules: list[str],
+        signatures: list[Stage2ErrorSignature],
+    ) -> bool:
+        """Record the result of collecting ``modules``.
+
+        Returns False, storing nothing, when a signature cannot be attributed
+        to one of them (conftest or configuration errors).
+        """
+        by_module: dict[str, list[Stage2ErrorSignature]] = {module: [] for module in modules}
+        for signature in signatures:
+            if signature.normalized_location not in by_module:
+                return False
+            by_module[signature.normalized_location].append(signature)
+        for module, module_signatures in by_module.items():
+            self._results[(module, snapshot.modules[module])] = module_signatures
+        return True
+
+    def batches(self, snapshot: CollectSnapshot, stale: list[str]) -> list[list[str]]:
+        """Split ``stale`` into at most ``workers`` batches of independent subtrees.
+
+        Modules sharing a basename are collected in one process, as in the
+        full run, so pytest's import-file-mismatch errors still surface.
+        """
+        by_basename: dict[str, list[str]] = {}
+        for module in snapshot.modules:
+            by_basename.setdefault(module.rsplit("/", 1)[-1], []).append(module)
+
+        # Union-find over subtree keys (top two directories)
+        parent: dict[str, str] = {}
+
+        def find(key: str) -> str:
+            while parent.setdefault(key, key) != key:
+                key = parent[key]
+            return key
+
+        def subtree(module: str) -> str:
+            return "/".join(module.split("/")[:-1][:2])
+
+        selected: set[str] = set()
+        for module in stale:
+            peers = by_basename[module.rsplit("/", 1)[-1]]
+            selected.update(peers)
+            for peer in peers:
+                parent[find(subtree(peer))] = find(subtree(module))
+
+        groups: dict[str, list[str]] = {}
+        for module in sorted(selected):
+            groups.setdefault(find(subtree(module)), []).append(module)
+
+        # Largest group first onto the least loaded batch
+        batches: list[list[str]] = [[] for _ in range(min(self.workers, len(groups)))]
+        for group in sorted(groups.values(), key=len, reverse=True):
+            min(batches, key=len).extend(group)
+        return [sorted(batch) for batch in batches]
+
+
+__all__ = ["CollectOnlyCache", "CollectSnapshot"]
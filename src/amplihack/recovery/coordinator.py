@@ -8,6 +8,7 @@ from pathlib import Path
 
 from amplihack.staging_safety import capture_protected_staged_files, require_isolated_worktree
 
+from .collect_cache import CollectOnlyCache
 from .models import RecoveryBlocker, RecoveryRun, Stage1Result
 from .results import write_recovery_ledger
 from .stage2 import run_stage2
@@ -90,8 +91,13 @@ def run_recovery(
     min_audit_cycles: int = 3,
     max_audit_cycles: int = 6,
     started_at: datetime | None = None,
+    collect_workers: int = 1,
 ) -> RecoveryRun:
-    """Run the complete Stage 1-4 recovery sequence and emit one ledger."""
+    """Run the complete Stage 1-4 recovery sequence and emit one ledger.
+
+    Stages 2 and 3 share one collect-only cache; ``collect_workers`` > 1
+    collects independent test subtrees in parallel pytest processes.
+    """
     resolved_repo = repo_path.resolve()
     resolved_worktree, worktree_blockers = _resolve_recovery_worktree(
         repo_path=resolved_repo,
@@ -99,10 +105,12 @@ def run_recovery(
     )
     started = started_at or datetime.now(UTC)
 
+    collect_cache = CollectOnlyCache(workers=collect_workers)
     stage1 = run_stage1(resolved_repo)
     stage2 = run_stage2(
         resolved_repo,
         protected_staged_files=stage1.protected_staged_files,
+        collect_cache=collect_cache,
     )
     stage3 = run_stage3(
         stage2,
@@ -111,6 +119,7 @@ def run_recovery(
         min_cycles=min_audit_cycles,
         max_cycles=max_audit_cycles,
         initial_blockers=worktree_blockers,
+        collect_cache=collect_cache,
     )
     stage4 = run_stage4(
         repo_path=resolved_repo,
@@ -7,7 +7,8 @@ import hashlib
 import re
 import subprocess
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -19,10 +20,14 @@ except ImportError:  # pragma: no cover - Python 3.11+ in supported environments
 from amplihack.staging_safety import validate_fix_batch
 from amplihack.utils.process import run_command_with_timeout
 
+from .collect_cache import CollectOnlyCache, CollectSnapshot
 from .models import DeltaVerdict, RecoveryBlocker, Stage2ErrorSignature, Stage2Result, StageStatus
 
 _LOCATION_WITH_LINE_RE = re.compile(r"^(?P<path>.+?)(?::\d+)?$")
 _NORMALIZED_MESSAGE_PATH_RE = re.compile(r"(/[^:\s]+)+:\d+")
+# pytest exit codes (ok, interrupted by errors, nothing collected) after which
+# a targeted collect-only output lists every collection error of its modules
+_TARGETED_COLLECT_EXIT_CODES = frozenset({0, 2, 5})
 
 
 def build_collect_only_command(repo_path: Path) -> list[str]:
@@ -212,6 +217,10 @@ def build_error_signatures(output: str) -> list[Stage2ErrorSignature]:
         )
         for (error_type, headline, location, normalized_message), occurrences in aggregated.items()
     ]
+    return _sort_signatures(signatures)
+
+
+def _sort_signatures(signatures: list[Stage2ErrorSignature]) -> list[Stage2ErrorSignature]:
     return sorted(
         signatures,
         key=lambda signature: (
@@ -273,8 +282,8 @@ def determine_delta_verdict(
     return "replaced"
 
 
-def _candidate_collect_commands(repo_path: Path) -> list[list[str]]:
-    base_command = build_collect_only_command(repo_path)
+def _candidate_collect_commands(repo_path: Path, paths: Sequence[str] = ()) -> list[list[str]]:
+    base_command = [*build_collect_only_command(repo_path), *paths]
     return [
         base_command,
         [sys.executable, "-m", *base_command],
@@ -282,9 +291,11 @@ def _candidate_collect_commands(repo_path: Path) -> list[list[str]]:
     ]
 
 
-def _run_collect_only(repo_path: Path, *, timeout: int) -> tuple[int, str]:
+def _run_collect_only(
+    repo_path: Path, *, timeout: int, paths: Sequence[str] = ()
+) -> tuple[int, str]:
     last_error: Exception | None = None
-    for command in _candidate_collect_commands(repo_path):
+    for command in _candidate_collect_commands(repo_path, paths):
         try:
             result = run_command_with_timeout(command, cwd=repo_path, timeout=timeout)
         except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
@@ -298,6 +309,74 @@ def _run_collect_only(repo_path: Path, *, timeout: int) -> tuple[int, str]:
     raise last_error
 
 
+def _collect_modules(
+    repo_path: Path,
+    snapshot: CollectSnapshot,
+    stale: list[str],
+    *,
+    cache: CollectOnlyCache,
+    timeout: int,
+) -> bool:
+    """Collect ``stale`` modules (one pytest process per batch) into ``cache``."""
+    batches = cache.batches(snapshot, stale)
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        runs = list(
+            executor.map(
+                lambda batch: _run_collect_only(repo_path, timeout=timeout, paths=batch),
+                batches,
+            )
+        )
+
+    signatures: list[Stage2ErrorSignature] = []
+    for returncode, output in runs:
+        if returncode not in _TARGETED_COLLECT_EXIT_CODES:
+            return False
+        signatures.extend(build_error_signatures(output))
+    return cache.store(snapshot, [module for batch in batches for module in batch], signatures)
+
+
+def collect_error_signatures(
+    repo_path: Path,
+    *,
+    timeout: int,
+    cache: CollectOnlyCache | None = None,
+    run_full: Callable[..., tuple[int, str]] | None = None,
+) -> list[Stage2ErrorSignature]:
+    """Collect-only error signatures for ``repo_path``.
+
+    With a ``cache``, only the test modules whose fingerprint is not cached
+    are collected again and the result is merged with the cached signatures
+    of the rest. The full-suite run goes through ``run_full`` (default
+    ``_run_collect_only``), which is also the fallback whenever the changed
+    modules cannot be collected on their own.
+    """
+    run_full = run_full or _run_collect_only
+    snapshot = cache.snapshot(repo_path) if cache is not None else None
+    if cache is None or snapshot is None:
+        _returncode, output = run_full(repo_path, timeout=timeout)
+        return build_error_signatures(output)
+
+    suite_signatures = cache.suite_signatures(snapshot)
+    if suite_signatures is not None:
+        return list(suite_signatures)
+
+    stale = cache.stale_modules(snapshot)
+    targeted = (
+        bool(stale)
+        and snapshot.untargetable.isdisjoint(stale)
+        and (cache.workers > 1 or len(stale) < len(snapshot.modules))
+    )
+    if not stale or (
+        targeted and _collect_modules(repo_path, snapshot, stale, cache=cache, timeout=timeout)
+    ):
+        return _sort_signatures(cache.signatures(snapshot))
+
+    _returncode, output = run_full(repo_path, timeout=timeout)
+    signatures = build_error_signatures(output)
+    cache.store_suite(snapshot, signatures)
+    return signatures
+
+
 def _extract_candidate_paths(fix: dict[str, Any]) -> list[str]:
     for key in ("candidate_paths", "files", "paths"):
         value = fix.get(key)
@@ -335,15 +414,21 @@ def run_stage2(
     *,
     timeout: int = 300,
     fixer: Callable[[list[dict[str, Any]], list[str]], list[dict[str, Any]]] | None = None,
+    collect_cache: CollectOnlyCache | None = None,
 ) -> Stage2Result:
-    """Execute Stage 2 collect-only recovery."""
+    """Execute Stage 2 collect-only recovery.
+
+    The post-fix collection re-collects only the test modules the fixes
+    touched (through ``collect_cache``, a fresh one by default).
+    """
+    cache = collect_cache or CollectOnlyCache()
     blockers: list[RecoveryBlocker] = []
     diagnostics: list[dict[str, Any]] = []
     if diagnostic := detect_pytest_config_divergence(repo_path):
         diagnostics.append(diagnostic)
 
     try:
-        _returncode, baseline_output = _run_collect_only(repo_path, timeout=timeout)
+        baseline_signatures = collect_error_signatures(repo_path, timeout=timeout, cache=cache)
     except FileNotFoundError as exc:
         blockers.append(
             RecoveryBlocker(
@@ -381,7 +466,6 @@ def run_stage2(
             blockers=blockers,
         )
 
-    baseline_signatures = build_error_signatures(baseline_output)
     clusters = cluster_signatures(baseline_signatures)
     applied_fixes: list[dict[str, Any]] = []
 
@@ -425,7 +509,7 @@ def run_stage2(
     final_signatures = baseline_signatures
     if applied_fixes:
         try:
-            _returncode, final_output = _run_collect_only(repo_path, timeout=timeout)
+            final_signatures = collect_error_signatures(repo_path, timeout=timeout, cache=cache)
         except FileNotFoundError as exc:
             blockers.append(
                 RecoveryBlocker(
@@ -462,7 +546,6 @@ def run_stage2(
                 diagnostics=diagnostics,
                 blockers=blockers,
             )
-        final_signatures = build_error_signatures(final_output)
 
     return _stage2_result(
         status="blocked" if blockers else "completed",
@@ -479,6 +562,7 @@ __all__ = [
     "build_collect_only_command",
     "build_error_signatures",
     "cluster_signatures",
+    "collect_error_signatures",
     "detect_pytest_config_divergence",
     "determine_delta_verdict",
     "run_stage2",
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from amplihack.staging_safety import require_isolated_worktree
 
+from .collect_cache import CollectOnlyCache
 from .models import (
     FixVerifyMode,
     RecoveryBlocker,
@@ -15,7 +16,7 @@ from .models import (
     Stage3Result,
     Stage3ValidatorResult,
 )
-from .stage2 import _run_collect_only, build_error_signatures, cluster_signatures
+from .stage2 import _run_collect_only, cluster_signatures, collect_error_signatures
 
 RECOVERY_AUDIT_PHASES = [
     "scope/setup",
@@ -91,7 +92,7 @@ def _build_cycle_findings(
 
 
 def _collect_only_validation(
-    repo_path: Path, stage2_result: Stage2Result
+    repo_path: Path, stage2_result: Stage2Result, collect_cache: CollectOnlyCache
 ) -> tuple[
     Stage3ValidatorResult,
     list,
@@ -99,7 +100,12 @@ def _collect_only_validation(
     RecoveryBlocker | None,
 ]:
     try:
-        _returncode, output = _run_collect_only(repo_path, timeout=_COLLECT_ONLY_TIMEOUT)
+        signatures = collect_error_signatures(
+            repo_path,
+            timeout=_COLLECT_ONLY_TIMEOUT,
+            cache=collect_cache,
+            run_full=_run_collect_only,
+        )
     except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
         blocker = _collect_only_execution_blocker(scope="baseline", exc=exc)
         result = Stage3ValidatorResult(
@@ -109,7 +115,6 @@ def _collect_only_validation(
         )
         return result, stage2_result.signatures, list(stage2_result.clusters), blocker
 
-    signatures = build_error_signatures(output)
     clusters = cluster_signatures(signatures)
     current_count = sum(signature.occurrences for signature in signatures)
     status = "passed" if current_count <= stage2_result.final_collection_errors else "failed"
@@ -158,6 +163,7 @@ def _fix_verify_validation(
     worktree_path: Path | None,
     blockers: list[RecoveryBlocker],
     stage2_result: Stage2Result,
+    collect_cache: CollectOnlyCache,
 ) -> tuple[Stage3ValidatorResult, RecoveryBlocker | None]:
     if _has_invalid_worktree_blocker(blockers):
         invalid_message = next(
@@ -199,7 +205,12 @@ def _fix_verify_validation(
         )
 
     try:
-        _returncode, output = _run_collect_only(validated_worktree, timeout=_COLLECT_ONLY_TIMEOUT)
+        signatures = collect_error_signatures(
+            validated_worktree,
+            timeout=_COLLECT_ONLY_TIMEOUT,
+            cache=collect_cache,
+            run_full=_run_collect_only,
+        )
     except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
         blocker = _collect_only_execution_blocker(scope="FIX+VERIFY", exc=exc)
         return (
@@ -212,7 +223,6 @@ def _fix_verify_validation(
             blocker,
         )
 
-    signatures = build_error_signatures(output)
     current_count = sum(signature.occurrences for signature in signatures)
     status = "passed" if current_count <= stage2_result.final_collection_errors else "failed"
     return (
@@ -237,9 +247,16 @@ def run_stage3(
     min_cycles: int = 3,
     max_cycles: int = 6,
     initial_blockers: list[RecoveryBlocker] | None = None,
+    collect_cache: CollectOnlyCache | None = None,
 ) -> Stage3Result:
-    """Execute the five-part Stage 3 audit loop."""
+    """Execute the five-part Stage 3 audit loop.
+
+    Collect-only validation goes through ``collect_cache`` (a fresh one by
+    default), so each cycle only re-collects the test modules that changed
+    since the previous one, in the repo or in the worktree.
+    """
     validate_cycle_bounds(min_cycles=min_cycles, max_cycles=max_cycles)
+    cache = collect_cache or CollectOnlyCache()
 
     blockers: list[RecoveryBlocker] = list(initial_blockers or [])
     validated_worktree: Path | None = None
@@ -282,6 +299,7 @@ def run_stage3(
         ) = _collect_only_validation(
             repo_path,
             stage2_result,
+            cache,
         )
         if collect_blocker is not None:
             _append_blocker_once(blockers, collect_blocker)
@@ -291,6 +309,7 @@ def run_stage3(
             worktree_path=validated_worktree,
             blockers=blockers,
             stage2_result=stage2_result,
+            collect_cache=cache,
         )
         if fix_verify_blocker is not None:
             _append_blocker_once(blockers, fix_verify_blocker)
@@ -4,18 +4,29 @@ Subprocess bridge to the amplihack-xpia-defender Rust CLI binary.
 Calls the compiled `xpia-defend` binary via subprocess, parsing JSON output.
 NO FALLBACKS: if the binary is missing or returns non-JSON, we raise an error.
 Fail-closed: subprocess errors → blocked result, never silently allow.
+
+Set AMPLIHACK_XPIA_WORKER=1 to route calls through a pool of persistent
+`xpia-defend serve` workers (see xpia_worker.py) instead of one process
+spawn per validation. The installed binary is probed once; builds without a
+working `serve` subcommand keep the one-process-per-call path.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import os
 import shutil
 import subprocess
+import threading
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .xpia_worker import XPIAWorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +41,11 @@ EXIT_ERROR = 2
 # Timeout for subprocess calls (seconds)
 SUBPROCESS_TIMEOUT = 30
 
+# Environment variables controlling persistent worker mode
+WORKER_ENV_VAR = "AMPLIHACK_XPIA_WORKER"
+WORKER_POOL_SIZE_ENV_VAR = "AMPLIHACK_XPIA_WORKER_POOL_SIZE"
+DEFAULT_WORKER_POOL_SIZE = 2
+
 
 class RustXPIAError(Exception):
     """Raised when the Rust XPIA binary fails or is unavailable."""
@@ -129,8 +145,82 @@ def find_binary(*, auto_install: bool = False) -> str:
     raise RustXPIAError(msg)
 
 
+_worker_pool: XPIAWorkerPool | None = None
+_worker_pool_lock = threading.Lock()
+# Set when the binary failed the serve probe; cleared by shutdown_worker_pool()
+_worker_mode_unsupported = False
+
+
+def _worker_mode_enabled() -> bool:
+    return os.environ.get(WORKER_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+def _worker_pool_size() -> int:
+    """Worker count from the environment; the default when unset or invalid."""
+    raw = os.environ.get(WORKER_POOL_SIZE_ENV_VAR)
+    if raw is None:
+        return DEFAULT_WORKER_POOL_SIZE
+    try:
+        size = int(raw)
+    except ValueError:
+        size = 0
+    if size < 1:
+        logger.warning(
+            "Ignoring %s=%r (not a positive integer); using %d workers",
+            WORKER_POOL_SIZE_ENV_VAR,
+            raw,
+            DEFAULT_WORKER_POOL_SIZE,
+        )
+        return DEFAULT_WORKER_POOL_SIZE
+    return size
+
+
+def get_worker_pool() -> XPIAWorkerPool | None:
+    """Return the shared XPIAWorkerPool, or None when worker mode is disabled.
+
+    Also None when the installed binary has no working `serve` mode, so
+    callers fall back to one-shot calls instead of failing closed on every
+    validation.
+    """
+    global _worker_pool, _worker_mode_unsupported
+    if not _worker_mode_enabled():
+        return None
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            if _worker_mode_unsupported:
+                return None
+            from .xpia_worker import XPIAWorkerPool
+
+            pool = XPIAWorkerPool(size=_worker_pool_size())
+            if not pool.probe():
+                logger.warning(
+                    "%s is set but xpia-defend cannot run as a worker; using one-shot calls",
+                    WORKER_ENV_VAR,
+                )
+                pool.close()
+                _worker_mode_unsupported = True
+                return None
+            _worker_pool = pool
+            atexit.register(shutdown_worker_pool)
+        return _worker_pool
+
+
+def shutdown_worker_pool() -> None:
+    """Stop all persistent workers (safe to call when none are running)."""
+    global _worker_pool, _worker_mode_unsupported
+    with _worker_pool_lock:
+        _worker_mode_unsupported = False
+        if _worker_pool is not None:
+            _worker_pool.close()
+            _worker_pool = None
+
+
 def _run_command(args: list[str], stdin_data: str | None = None) -> dict[str, Any]:
     """Run xpia-defend with args, return parsed JSON. Fail-closed on any error."""
+    pool = get_worker_pool()
+    if pool is not None:
+        return pool.run(args, stdin_data)
+
     binary = find_binary()
 
     try:
@@ -167,6 +257,87 @@ def _run_command(args: list[str], stdin_data: str | None = None) -> dict[str, An
         ) from e
 
 
+def _content_request(
+    content: str,
+    content_type: str = "user-input",
+    security_level: str = "medium",
+    source: str = "python",
+) -> tuple[list[str], str | None]:
+    args = [
+        "validate-content",
+        "--content-type",
+        content_type,
+        "--security-level",
+        security_level,
+        "--source",
+        source,
+    ]
+    return args, content
+
+
+def _bash_request(
+    command: str,
+    security_level: str = "medium",
+    source: str = "python",
+) -> tuple[list[str], str | None]:
+    args = [
+        "validate-bash",
+        "--command",
+        command,
+        "--security-level",
+        security_level,
+        "--source",
+        source,
+    ]
+    return args, None
+
+
+def _webfetch_request(
+    url: str,
+    prompt: str,
+    security_level: str = "medium",
+    source: str = "python",
+) -> tuple[list[str], str | None]:
+    args = [
+        "validate-webfetch",
+        "--url",
+        url,
+        "--prompt",
+        prompt,
+        "--security-level",
+        security_level,
+        "--source",
+        source,
+    ]
+    return args, None
+
+
+def _agent_request(
+    source_agent: str,
+    target_agent: str,
+    message: str,
+    security_level: str = "medium",
+) -> tuple[list[str], str | None]:
+    args = [
+        "validate-agent",
+        "--source-agent",
+        source_agent,
+        "--target-agent",
+        target_agent,
+        "--security-level",
+        security_level,
+    ]
+    return args, message
+
+
+_REQUEST_BUILDERS = {
+    "content": _content_request,
+    "bash": _bash_request,
+    "webfetch": _webfetch_request,
+    "agent": _agent_request,
+}
+
+
 def validate_content(
     content: str,
     content_type: str = "user-input",
@@ -178,17 +349,9 @@ def validate_content(
     Fail-closed: any error → blocked result.
     """
     try:
-        args = [
-            "validate-content",
-            "--content-type",
-            content_type,
-            "--security-level",
-            security_level,
-            "--source",
-            source,
-        ]
         # Use stdin for content to avoid shell injection via args
-        data = _run_command(args, stdin_data=content)
+        args, stdin_data = _content_request(content, content_type, security_level, source)
+        data = _run_command(args, stdin_data=stdin_data)
         return RustValidationResult.from_json(data)
     except RustXPIAError as e:
         logger.error("XPIA validate_content failed (fail-closed): %s", e)
@@ -205,15 +368,7 @@ def validate_bash_command(
     Fail-closed: any error → blocked result.
     """
     try:
-        args = [
-            "validate-bash",
-            "--command",
-            command,
-            "--security-level",
-            security_level,
-            "--source",
-            source,
-        ]
+        args, _ = _bash_request(command, security_level, source)
         data = _run_command(args)
         return RustValidationResult.from_json(data)
     except RustXPIAError as e:
@@ -232,17 +387,7 @@ def validate_webfetch_request(
     Fail-closed: any error → blocked result.
     """
     try:
-        args = [
-            "validate-webfetch",
-            "--url",
-            url,
-            "--prompt",
-            prompt,
-            "--security-level",
-            security_level,
-            "--source",
-            source,
-        ]
+        args, _ = _webfetch_request(url, prompt, security_level, source)
         data = _run_command(args)
         return RustValidationResult.from_json(data)
     except RustXPIAError as e:
@@ -261,22 +406,66 @@ def validate_agent_communication(
     Fail-closed: any error → blocked result.
     """
     try:
-        args = [
-            "validate-agent",
-            "--source-agent",
-            source_agent,
-            "--target-agent",
-            target_agent,
-            "--security-level",
-            security_level,
-        ]
-        data = _run_command(args, stdin_data=message)
+        args, stdin_data = _agent_request(source_agent, target_agent, message, security_level)
+        data = _run_command(args, stdin_data=stdin_data)
         return RustValidationResult.from_json(data)
     except RustXPIAError as e:
         logger.error("XPIA validate_agent failed (fail-closed): %s", e)
         return RustValidationResult.blocked(str(e))
 
 
+def validate_batch(requests: list[tuple[str, dict[str, Any]]]) -> list[RustValidationResult]:
+    """Validate several items in one worker round trip.
+
+    Each request is ``(kind, kwargs)`` where kind is one of "content",
+    "bash", "webfetch" or "agent" and kwargs are the keyword arguments of
+    the matching validate_* function. Without worker mode the items are
+    validated one process at a time.
+
+    Fail-closed per item: any error → blocked result for that item.
+    """
+    results: list[RustValidationResult | None] = [None] * len(requests)
+    payload: list[dict[str, Any]] = []
+    slots: list[int] = []
+    for i, (kind, kwargs) in enumerate(requests):
+        builder = _REQUEST_BUILDERS.get(kind)
+        if builder is None:
+            results[i] = RustValidationResult.blocked(f"Unknown validation kind: {kind}")
+            continue
+        try:
+            args, stdin_data = builder(**kwargs)
+        except TypeError as e:
+            results[i] = RustValidationResult.blocked(f"Invalid {kind} request: {e}")
+            continue
+        payload.append({"args": args, "stdin": stdin_data})
+        slots.append(i)
+
+    pool = get_worker_pool()
+    if pool is not None and payload:
+        from .xpia_worker import parse_result
+
+        try:
+            raw_results = pool.run_batch(payload)
+        except RustXPIAError as e:
+            logger.error("XPIA validate_batch failed (fail-closed): %s", e)
+            raw_results = [{"error": str(e)}] * len(payload)
+        for slot, raw in zip(slots, raw_results, strict=True):
+            try:
+                results[slot] = RustValidationResult.from_json(parse_result(raw))
+            except RustXPIAError as e:
+                results[slot] = RustValidationResult.blocked(str(e))
+    else:
+        for slot, item in zip(slots, payload, strict=True):
+            try:
+                data = _run_command(item["args"], stdin_data=item["stdin"])
+                results[slot] = RustValidationResult.from_json(data)
+            except RustXPIAError as e:
+                logger.error("XPIA validate_batch item failed (fail-closed): %s", e)
+                results[slot] = RustValidationResult.blocked(str(e))
+
+    return [r if r is not None else RustValidationResult.blocked("Not validated") for r in results]
+
+
 def health_check(settings_path: str | None = None) -> dict[str, Any]:
     """Run XPIA health check via Rust CLI.
 
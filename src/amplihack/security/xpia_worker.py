@@ -0,0 +1,293 @@
+"""
+Persistent worker pool for the xpia-defend Rust CLI.
+
+Instead of spawning one `xpia-defend` process per validation, the pool keeps
+a small number of long-lived `xpia-defend serve` workers and talks to them
+over newline-delimited JSON on stdin/stdout.
+
+Protocol (one JSON object per line):
+    request:  {"id": 7, "requests": [{"args": [...], "stdin": "..."}, ...]}
+    response: {"id": 7, "results": [{"exit_code": 0, "output": {...}}, ...]}
+    ping:     {"id": 8, "ping": true}  ->  {"id": 8, "ok": true}
+
+Each entry in "requests" carries the same argv the one-shot CLI accepts, so
+the worker is a thin loop over the CLI dispatcher. A result may carry
+"error" instead of "output" when the worker could not evaluate it.
+
+Fail-closed: a worker that crashes, times out or answers garbage is killed
+and restarted; the request is retried once on a fresh worker and otherwise
+raises RustXPIAError, which validation callers turn into a blocked result.
+
+Requires an xpia-defend build that implements the `serve` subcommand.
+Released builds without it fail XPIAWorkerPool.probe(), and rust_xpia then
+keeps using one process per call.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import subprocess
+import threading
+import time
+from typing import Any
+
+from .rust_xpia import EXIT_ERROR, SUBPROCESS_TIMEOUT, RustXPIAError, find_binary
+
+logger = logging.getLogger(__name__)
+
+# Argument that switches xpia-defend into long-lived worker mode
+SERVE_COMMAND = "serve"
+
+# Idle workers older than this are pinged before reuse (seconds)
+HEALTH_CHECK_INTERVAL = 60.0
+
+# Timeout for the startup/health ping (seconds)
+PING_TIMEOUT = 5.0
+
+_EOF = object()
+
+
+class XPIAWorker:
+    """One long-lived xpia-defend worker process."""
+
+    def __init__(self, command: list[str], timeout: float = SUBPROCESS_TIMEOUT):
+        self.command = command
+        self.timeout = timeout
+        self.last_used = 0.0
+        self._next_id = 0
+        self._lines: queue.Queue[Any] = queue.Queue()
+        self._proc: subprocess.Popen[str] | None = None
+
+    def start(self) -> None:
+        """Spawn the process and confirm it answers a ping."""
+        try:
+            self._proc = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except OSError as e:
+            raise RustXPIAError(f"Failed to start XPIA worker: {e}") from e
+
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        self.ping()
+
+    def _read_stdout(self) -> None:
+        proc = self._proc
+        assert proc is not None and proc.stdout is not None
+        for line in proc.stdout:
+            self._lines.put(line)
+        self._lines.put(_EOF)
+
+    def is_alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _call(self, message: dict[str, Any], timeout: float) -> dict[str, Any]:
+        if not self.is_alive():
+            raise RustXPIAError("XPIA worker is not running")
+        assert self._proc is not None and self._proc.stdin is not None
+
+        self._next_id += 1
+        message = {"id": self._next_id, **message}
+        try:
+            self._proc.stdin.write(json.dumps(message) + "\n")
+            self._proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise RustXPIAError(f"XPIA worker pipe closed: {e}") from e
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                line = self._lines.get(timeout=max(remaining, 0))
+            except queue.Empty as e:
+                raise RustXPIAError(f"XPIA worker timed out after {timeout}s") from e
+            if line is _EOF:
+                raise RustXPIAError(f"XPIA worker exited (code {self._proc.poll()})")
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise RustXPIAError(f"XPIA worker produced invalid JSON: {line[:200]}") from e
+            # Responses left over from an abandoned request are skipped
+            if response.get("id") == message["id"]:
+                self.last_used = time.monotonic()
+                return response
+
+    def ping(self) -> None:
+        """Raise RustXPIAError unless the worker answers a ping."""
+        response = self._call({"ping": True}, timeout=PING_TIMEOUT)
+        if not response.get("ok"):
+            raise RustXPIAError(f"XPIA worker failed health check: {response}")
+
+    def run_batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Send a batch of {"args", "stdin"} requests and return raw results."""
+        response = self._call({"requests": requests}, timeout=self.timeout)
+        results = response.get("results")
+        if not isinstance(results, list) or len(results) != len(requests):
+            raise RustXPIAError(f"XPIA worker returned a malformed batch response: {response}")
+        return results
+
+    def stop(self) -> None:
+        if self._proc is None:
+            return
+        try:
+            if self._proc.stdin:
+                self._proc.stdin.close()
+            self._proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+
+
+class XPIAWorkerPool:
+    """Bounded pool of persistent xpia-defend workers.
+
+    Workers are created lazily up to ``size``. Callers beyond that wait for
+    a free worker. Each checkout of a worker idle for longer than
+    ``health_check_interval`` is preceded by a ping.
+    """
+
+    def __init__(
+        self,
+        command: list[str] | None = None,
+        size: int = 2,
+        timeout: float = SUBPROCESS_TIMEOUT,
+        health_check_interval: float = HEALTH_CHECK_INTERVAL,
+    ):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self._command = command
+        self.size = size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.restarts = 0
+        self._idle: queue.LifoQueue[XPIAWorker] = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def command(self) -> list[str]:
+        if self._command is None:
+            self._command = [find_binary(), SERVE_COMMAND]
+        return self._command
+
+    def _spawn(self) -> XPIAWorker:
+        worker = XPIAWorker(self.command, timeout=self.timeout)
+        try:
+            worker.start()
+        except RustXPIAError:
+            worker.stop()
+            raise
+        return worker
+
+    def probe(self) -> bool:
+        """Start one worker and return False if the binary cannot serve.
+
+        The started worker is kept idle for the first real request.
+        """
+        try:
+            worker = self._checkout()
+        except RustXPIAError as e:
+            logger.warning("xpia-defend '%s' mode unavailable: %s", SERVE_COMMAND, e)
+            return False
+        self._checkin(worker)
+        return True
+
+    def _checkout(self) -> XPIAWorker:
+        if self._closed:
+            raise RustXPIAError("XPIA worker pool is closed")
+        with self._lock:
+            can_create = self._idle.empty() and self._created < self.size
+            if can_create:
+                self._created += 1
+        if can_create:
+            try:
+                return self._spawn()
+            except RustXPIAError:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            worker = self._idle.get(timeout=self.timeout)
+        except queue.Empty as e:
+            raise RustXPIAError(f"No XPIA worker free after {self.timeout}s") from e
+
+        if not worker.is_alive() or (
+            time.monotonic() - worker.last_used > self.health_check_interval
+        ):
+            try:
+                worker.ping()
+            except RustXPIAError as e:
+                logger.warning("XPIA worker failed health check, restarting: %s", e)
+                worker = self._replace(worker)
+        return worker
+
+    def _replace(self, worker: XPIAWorker) -> XPIAWorker:
+        """Kill a broken worker and start a fresh one in its slot."""
+        worker.stop()
+        self.restarts += 1
+        try:
+            return self._spawn()
+        except RustXPIAError:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _checkin(self, worker: XPIAWorker) -> None:
+        if self._closed:
+            worker.stop()
+        else:
+            self._idle.put(worker)
+
+    def _discard(self, worker: XPIAWorker) -> None:
+        worker.stop()
+        with self._lock:
+            self._created -= 1
+
+    def run_batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Run a batch on one worker, retrying once on a fresh worker after a crash."""
+        worker = self._checkout()
+        try:
+            results = worker.run_batch(requests)
+        except RustXPIAError as e:
+            logger.warning("XPIA worker failed, restarting and retrying: %s", e)
+            worker = self._replace(worker)
+            try:
+                results = worker.run_batch(requests)
+            except RustXPIAError:
+                self._discard(worker)
+                raise
+        self._checkin(worker)
+        return results
+
+    def run(self, args: list[str], stdin_data: str | None = None) -> dict[str, Any]:
+        """Run a single CLI invocation through the pool, returning parsed JSON."""
+        return parse_result(self.run_batch([{"args": args, "stdin": stdin_data}])[0])
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+
+def parse_result(result: dict[str, Any]) -> dict[str, Any]:
+    """Apply the one-shot CLI's fail-closed rules to one worker result."""
+    if result.get("error"):
+        raise RustXPIAError(f"XPIA worker error: {result['error']}")
+    if result.get("exit_code") == EXIT_ERROR:
+        raise RustXPIAError(f"XPIA binary internal error (exit {EXIT_ERROR})")
+    output = result.get("output")
+    if output is None:
+        raise RustXPIAError(f"XPIA worker produced no output (exit {result.get('exit_code')})")
+    return output
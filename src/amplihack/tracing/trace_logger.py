@@ -7,6 +7,9 @@ Philosophy:
 - Minimal overhead when enabled (<10ms)
 - Security-first: Automatic token sanitization
 - Self-contained and regeneratable
+- Optional buffered mode: callers only enqueue; a background writer
+  sanitizes, serializes and writes in batches
+- Optional size-based rotation with gzip compression of rotated files
 
 Public API:
     TraceLogger: Main logging class
@@ -16,9 +19,14 @@ Public API:
 Created for Issue #2071: Native Binary Migration with Optional Trace Logging
 """
 
+import gzip
 import json
 import os
+import queue
+import shutil
+import sys
 import threading
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -28,6 +36,19 @@ from ..utils.token_sanitizer import TokenSanitizer
 # Default trace file location - used by trace_logger
 DEFAULT_TRACE_FILE = Path.home() / ".amplihack" / "trace.jsonl"
 
+# Buffered-mode defaults
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL = 1.0  # seconds
+
+# What log() does when the buffered-mode queue is full
+OVERFLOW_DROP = "drop"
+OVERFLOW_BLOCK = "block"
+
+_FLUSH_TIMEOUT = 10.0  # seconds flush() waits for the writer
+_PUT_POLL = 0.5  # seconds between writer liveness checks while blocked on a full queue
+_STOP = object()
+
 
 class TraceLogger:
     """
@@ -40,29 +61,85 @@ class TraceLogger:
     - Context manager support (sync and async)
     - Zero overhead when disabled
 
+    - Optional buffered mode with a bounded queue and background writer
+    - Optional size-based rotation and compression
+
     Usage:
         >>> logger = TraceLogger(enabled=True, log_file=Path("trace.jsonl"))
         >>> with logger:
         ...     logger.log({"event": "api_call", "model": "claude-3"})
 
+    Buffered mode:
+        log() copies the entry, stamps it and puts it on a queue; sanitizing,
+        serializing and writing happen on a writer thread, which flushes
+        every ``batch_size`` entries or ``flush_interval`` seconds, and on
+        flush()/context exit. When the queue is full, ``overflow="drop"``
+        discards the entry and counts it in ``dropped_entries`` (recorded in
+        the log on close); ``overflow="block"`` makes the caller wait. The
+        entry copy is shallow, so callers must not mutate nested values
+        after logging them.
+
     Performance Requirements:
     - Disabled: <0.1ms overhead
     - Enabled: <10ms overhead per log entry
     """
 
-    def __init__(self, enabled: bool = False, log_file: Path | None = None):
+    def __init__(
+        self,
+        enabled: bool = False,
+        log_file: Path | None = None,
+        *,
+        buffered: bool = False,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        overflow: str = OVERFLOW_DROP,
+        max_bytes: int | None = None,
+        backup_count: int = 5,
+        compress: bool = False,
+    ):
         """
         Initialize TraceLogger.
 
         Args:
             enabled: Whether logging is enabled (default: False, opt-in)
             log_file: Path to JSONL log file (required if enabled=True)
+            buffered: Write from a background thread instead of the caller
+            queue_size: Maximum queued entries in buffered mode
+            batch_size: Entries per write/flush in buffered mode
+            flush_interval: Maximum seconds an entry waits before being flushed
+            overflow: "drop" or "block" when the queue is full
+            max_bytes: Rotate the log once it would exceed this size (None: never)
+            backup_count: Rotated files to keep (trace.jsonl.1 is the newest)
+            compress: Gzip rotated files (trace.jsonl.1.gz, ...)
         """
+        if overflow not in (OVERFLOW_DROP, OVERFLOW_BLOCK):
+            raise ValueError(f"overflow must be {OVERFLOW_DROP!r} or {OVERFLOW_BLOCK!r}")
+        if queue_size < 1 or batch_size < 1:
+            raise ValueError("queue_size and batch_size must be >= 1")
         self.enabled = enabled
         self.log_file = log_file
+        self.buffered = buffered
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
         self._file_handle = None
+        self._file_size = 0
         self._lock = threading.RLock()
         self._context_depth = 0
+        self._queue: queue.Queue | None = None
+        self._writer: threading.Thread | None = None
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    @property
+    def dropped_entries(self) -> int:
+        """Entries discarded because the buffered-mode queue was full."""
+        return self._dropped
 
     @classmethod
     def from_env(cls) -> "TraceLogger":
@@ -72,6 +149,11 @@ class TraceLogger:
         Environment Variables:
             AMPLIHACK_TRACE_LOGGING: "true" to enable logging (default: disabled)
             AMPLIHACK_TRACE_FILE: Path to log file (default: ~/.amplihack/trace.jsonl)
+            AMPLIHACK_TRACE_BUFFERED: "true" to write from a background thread
+            AMPLIHACK_TRACE_OVERFLOW: "drop" (default) or "block" when the buffer is full
+            AMPLIHACK_TRACE_MAX_BYTES: Rotate the log at this size (default: no rotation)
+            AMPLIHACK_TRACE_BACKUPS: Rotated files to keep (default: 5)
+            AMPLIHACK_TRACE_COMPRESS: "true" to gzip rotated files
 
         Returns:
             Configured TraceLogger instance
@@ -88,7 +170,38 @@ class TraceLogger:
             else:
                 log_file = DEFAULT_TRACE_FILE
 
-        return cls(enabled=enabled, log_file=log_file)
+        def _flag(name: str) -> bool:
+            return os.getenv(name, "").lower() in ("true", "1", "yes")
+
+        def _int(name: str, default: int | None) -> int | None:
+            try:
+                return int(os.environ[name])
+            except (KeyError, ValueError):
+                return default
+
+        overflow = os.getenv("AMPLIHACK_TRACE_OVERFLOW", OVERFLOW_DROP).lower()
+        return cls(
+            enabled=enabled,
+            log_file=log_file,
+            buffered=_flag("AMPLIHACK_TRACE_BUFFERED"),
+            overflow=overflow if overflow in (OVERFLOW_DROP, OVERFLOW_BLOCK) else OVERFLOW_DROP,
+            max_bytes=_int("AMPLIHACK_TRACE_MAX_BYTES", None),
+            backup_count=_int("AMPLIHACK_TRACE_BACKUPS", 5) or 0,
+            compress=_flag("AMPLIHACK_TRACE_COMPRESS"),
+        )
+
+    def _open_log_file(self) -> None:
+        """Open log_file for appending with owner-only permissions."""
+        self.log_file.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        os.chmod(self.log_file.parent, 0o700)
+        fd = os.open(
+            self.log_file,
+            os.O_CREAT | os.O_APPEND | os.O_WRONLY,
+            0o600,
+        )
+        os.chmod(self.log_file, 0o600)
+        self._file_size = os.fstat(fd).st_size
+        self._file_handle = os.fdopen(fd, "a", encoding="utf-8")
 
     def __enter__(self):
         """Enter context manager - open log file if enabled."""
@@ -96,22 +209,14 @@ class TraceLogger:
             with self._lock:
                 if self._context_depth == 0:
                     try:
-                        self.log_file.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
-                        os.chmod(self.log_file.parent, 0o700)
-                        fd = os.open(
-                            self.log_file,
-                            os.O_CREAT | os.O_APPEND | os.O_WRONLY,
-                            0o600,
-                        )
-                        os.chmod(self.log_file, 0o600)
-                        self._file_handle = os.fdopen(fd, "a", encoding="utf-8")
+                        self._open_log_file()
+                        if self.buffered:
+                            self._start_writer()
                     except (OSError, PermissionError) as e:
                         # Clean up and disable logging rather than failing
                         self._file_handle = None
                         self.enabled = False
                         # Log to stderr since we can't log to file
-                        import sys
-
                         print(
                             f"Warning: Could not open trace log file {self.log_file}: {e}",
                             file=sys.stderr,
@@ -124,6 +229,10 @@ class TraceLogger:
         with self._lock:
             if self._context_depth > 0:
                 self._context_depth -= 1
+            if self._context_depth == 0:
+                # Stop the writer first: mid-rotation it may briefly have
+                # no file handle open.
+                self._stop_writer()
             if self._context_depth == 0 and self._file_handle:
                 try:
                     self._file_handle.flush()
@@ -163,51 +272,234 @@ class TraceLogger:
         if not self.enabled:
             return
 
+        if self.buffered:
+            self._enqueue(data)
+            return
+
         with self._lock:
             # Validate context manager is active
             if self._file_handle is None:
                 # Instead of raising, just return silently - logging is optional
                 return
 
-            # Handle None or empty data
-            if data is None:
-                data = {}
-
-            # Create a copy to avoid mutating original
-            entry = dict(data)
-
-            # Add timestamp if not present
-            if "timestamp" not in entry:
-                entry["timestamp"] = datetime.now(UTC).isoformat()
-
-            # Sanitize sensitive data
-            sanitized_entry = TokenSanitizer.sanitize_dict(entry)
+            try:
+                self._write(self._serialize(self._stamp(data)))
+            except OSError:
+                # Handle I/O errors (disk full, permissions, etc.)
+                # Trace logging is optional, so silently fail rather than break the caller
+                pass
 
-            # Serialize to JSON and write
+    def flush(self) -> None:
+        """Write out everything logged so far (waits for the buffered writer)."""
+        if self.buffered:
+            q = self._queue
+            if q is None or self._writer is None:
+                return
+            done = threading.Event()
             try:
-                json_line = json.dumps(sanitized_entry, ensure_ascii=False, default=_json_default)
-                self._file_handle.write(json_line + "\n")
-                self._file_handle.flush()  # Ensure immediate write
-            except (TypeError, ValueError) as e:
-                # Handle non-serializable data gracefully
+                q.put(done, timeout=_FLUSH_TIMEOUT)
+            except queue.Full:
+                return
+            done.wait(_FLUSH_TIMEOUT)
+            return
+        with self._lock:
+            if self._file_handle is not None:
                 try:
-                    error_entry = {
-                        "timestamp": datetime.now(UTC).isoformat(),
-                        "event": "trace_logger_error",
-                        "error": str(e),
-                        "original_event": str(entry.get("event", "unknown")),
-                    }
-                    json_line = json.dumps(error_entry, ensure_ascii=False)
-                    self._file_handle.write(json_line + "\n")
                     self._file_handle.flush()
                 except OSError:
-                    # If we can't even log the error, silently give up
                     pass
+
+    @staticmethod
+    def _stamp(data: dict[str, Any] | None) -> dict[str, Any]:
+        """Copy the entry (avoid mutating the caller's dict) and add a timestamp."""
+        entry = dict(data) if data is not None else {}
+        if "timestamp" not in entry:
+            entry["timestamp"] = datetime.now(UTC).isoformat()
+        return entry
+
+    @staticmethod
+    def _serialize(entry: dict[str, Any]) -> str:
+        """Sanitize and serialize one entry to a JSONL line."""
+        try:
+            return (
+                json.dumps(
+                    TokenSanitizer.sanitize_dict(entry),
+                    ensure_ascii=False,
+                    default=_json_default,
+                )
+                + "\n"
+            )
+        except (TypeError, ValueError) as e:
+            # Handle non-serializable data gracefully
+            return TraceLogger._error_line(entry, e)
+
+    @staticmethod
+    def _error_line(entry: dict[str, Any], error: BaseException) -> str:
+        """JSONL line recording an entry that could not be serialized."""
+        error_entry = {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "event": "trace_logger_error",
+            "error": str(error),
+            "original_event": str(entry.get("event", "unknown")),
+        }
+        return json.dumps(error_entry, ensure_ascii=False) + "\n"
+
+    def _write(self, text: str) -> None:
+        """Append text to the log (rotating first if needed) and flush."""
+        if self._file_handle is None:
+            raise OSError("trace log is not open")
+        if self.max_bytes:
+            size = len(text.encode("utf-8"))
+            if self._file_size and self._file_size + size > self.max_bytes:
+                self._rotate()
+            self._file_size += size
+        self._file_handle.write(text)
+        self._file_handle.flush()  # Ensure immediate write
+
+    # -- Rotation ---------------------------------------------------------
+
+    def _backup_path(self, index: int) -> Path:
+        suffix = f".{index}.gz" if self.compress else f".{index}"
+        return self.log_file.with_name(self.log_file.name + suffix)
+
+    def _rotate(self) -> None:
+        """Close the log, shift backups (.1 newest), compress, and reopen."""
+        self._file_handle.close()
+        self._file_handle = None
+        try:
+            if self.backup_count > 0:
+                for index in range(self.backup_count - 1, 0, -1):
+                    src = self._backup_path(index)
+                    if src.exists():
+                        os.replace(src, self._backup_path(index + 1))
+                rotated = self.log_file.with_name(self.log_file.name + ".1")
+                os.replace(self.log_file, rotated)
+                if self.compress:
+                    _gzip_file(rotated, self._backup_path(1))
+            else:
+                self.log_file.unlink()
+        finally:
+            self._open_log_file()
+
+    # -- Buffered mode ----------------------------------------------------
+
+    def _start_writer(self) -> None:
+        self._queue = queue.Queue(maxsize=self.queue_size)
+        self._writer = threading.Thread(
+            target=self._writer_loop, args=(self._queue,), name="trace-logger-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _stop_writer(self) -> None:
+        if self._writer is None or self._queue is None:
+            return
+        self._put_while_writer_alive(self._queue, _STOP)
+        self._writer.join()
+        self._writer = None
+        self._queue = None
+        if self._dropped:
+            try:
+                self._write(
+                    self._serialize(
+                        self._stamp({"event": "trace_logger_dropped", "count": self._dropped})
+                    )
+                )
             except OSError:
-                # Handle I/O errors (disk full, permissions, etc.)
-                # Trace logging is optional, so silently fail rather than break the caller
                 pass
 
+    def _enqueue(self, data: dict[str, Any] | None) -> None:
+        q = self._queue
+        if q is None:
+            return  # Context manager not active
+        entry = self._stamp(data)
+        if self.overflow == OVERFLOW_BLOCK:
+            if not self._put_while_writer_alive(q, entry):
+                with self._dropped_lock:
+                    self._dropped += 1
+            return
+        try:
+            q.put_nowait(entry)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def _put_while_writer_alive(self, q: queue.Queue, item: Any) -> bool:
+        """Block until item is queued; give up (False) if the writer thread died."""
+        writer = self._writer
+        while writer is not None and writer.is_alive():
+            try:
+                q.put(item, timeout=_PUT_POLL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _writer_loop(self, q: queue.Queue) -> None:
+        pending: list[str] = []
+        waiters: list[threading.Event] = []
+        last_flush = time.monotonic()
+        stopping = False
+
+        while not stopping:
+            timeout = None
+            if pending:
+                timeout = max(0.0, last_flush + self.flush_interval - time.monotonic())
+            try:
+                item = q.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            # Drain whatever else is already queued, up to one batch
+            while item is not None:
+                if item is _STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    try:
+                        pending.append(self._serialize(item))
+                    except Exception as e:
+                        # e.g. RecursionError on a self-referencing entry: the
+                        # writer must survive or blocked producers hang
+                        pending.append(self._error_line(item, e))
+                if stopping or len(pending) >= self.batch_size:
+                    break
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    item = None
+
+            now = time.monotonic()
+            if (
+                stopping
+                or waiters
+                or len(pending) >= self.batch_size
+                or (pending and now - last_flush >= self.flush_interval)
+            ):
+                if pending:
+                    # Only this thread touches the file while the writer
+                    # runs, so no lock (__exit__ joins us holding _lock).
+                    try:
+                        self._write("".join(pending))
+                    except Exception:
+                        pass  # Trace logging is optional; keep the writer alive
+                    pending = []
+                last_flush = now
+                for waiter in waiters:
+                    waiter.set()
+                waiters = []
+
+
+def _gzip_file(src: Path, dst: Path) -> None:
+    """Compress src into dst (owner-only) and remove src."""
+    tmp = dst.with_name(dst.name + ".tmp")
+    fd = os.open(tmp, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o600)
+    with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as out:
+        with src.open("rb") as f_in:
+            shutil.copyfileobj(f_in, out)
+    os.replace(tmp, dst)
+    src.unlink()
+
 
 def _json_default(obj: Any) -> str:
     """
@@ -231,4 +523,4 @@ def _json_default(obj: Any) -> str:
     return str(obj)
 
 
-__all__ = ["TraceLogger", "DEFAULT_TRACE_FILE"]
+__all__ = ["TraceLogger", "DEFAULT_TRACE_FILE", "OVERFLOW_DROP", "OVERFLOW_BLOCK"]
@@ -19,6 +19,18 @@ Created to address Issue #1997: API Keys Logged in Plain Text
 import re
 from typing import ClassVar
 
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters but
+# str.lower() leaves alone (or maps elsewhere).
+_CASEFOLD_FIXES = (("\u0130", "i"), ("\u0131", "i"), ("\u017f", "s"))
+
+
+def _casefold_like_re(text: str) -> str:
+    """Lowercase text so ASCII substring tests agree with re.IGNORECASE."""
+    if not text.isascii():
+        for char, replacement in _CASEFOLD_FIXES:
+            text = text.replace(char, replacement)
+    return text.lower()
+
 
 class TokenSanitizer:
     """
@@ -74,21 +86,72 @@ class TokenSanitizer:
         (r'"X-API-Key"\s*:\s*"[^"]+"', '"X-API-Key": "***"'),
     ]
 
+    # Lower-cased literals every match of a pattern must contain. A pattern
+    # whose literals are absent from the (case-folded) input cannot match, so
+    # its regex is skipped. Replacements only contain literals that were
+    # already in the matched text, so checking the original input once is
+    # enough even though patterns apply in sequence. Patterns not listed
+    # here (e.g. added by a subclass) are always run.
+    REQUIRED_LITERALS: ClassVar[dict[str, tuple[str, ...]]] = {
+        r"sk-proj-[a-zA-Z0-9_-]{6,}": ("sk-proj-",),
+        r"sk-[a-zA-Z0-9_-]{6,}": ("sk-",),
+        r"ghp_[a-zA-Z0-9_-]{20,}": ("ghp_",),
+        r"gho_[a-zA-Z0-9_-]{20,}": ("gho_",),
+        r"ghs_[a-zA-Z0-9_-]{20,}": ("ghs_",),
+        r"github_pat_[a-zA-Z0-9_]{22,255}": ("github_pat_",),
+        r"eyJ[a-zA-Z0-9_-]+\.eyJ[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+": ("eyj",),
+        r"AKIA[0-9A-Z]{16}": ("akia",),
+        r"aws_secret_access_key[\'\":\s]*[\'\"]*[a-zA-Z0-9/+=]{40}": ("aws_secret_access_key",),
+        r"Authorization:\s*Bearer\s+[^\s,;\'\"]+": ("authorization:", "bearer"),
+        r'"Authorization"\s*:\s*"[^"]+"': ('"authorization"',),
+        r"Authorization:\s*(?!Bearer)[^\s,;\'\"]+": ("authorization:",),
+        r"(?<!Authorization:\s)Bearer\s+[^\s\'\"]+": ("bearer",),
+        r'"api_key"\s*:\s*"[^"]+"': ('"api_key"',),
+        r'"apiKey"\s*:\s*"[^"]+"': ('"apikey"',),
+        r'"api-key"\s*:\s*"[^"]+"': ('"api-key"',),
+        r'"access_token"\s*:\s*"[^"]+"': ('"access_token"',),
+        r'"accessToken"\s*:\s*"[^"]+"': ('"accesstoken"',),
+        r'"token"\s*:\s*"[^"]+"': ('"token"',),
+        r'"secret"\s*:\s*"[^"]+"': ('"secret"',),
+        r'"password"\s*:\s*"[^"]+"': ('"password"',),
+        r"X-API-Key:\s*[^\s,;]+": ("x-api-key:",),
+        r'"X-API-Key"\s*:\s*"[^"]+"': ('"x-api-key"',),
+    }
+
     # Pre-compiled patterns for performance: compiled once on first sanitize() call,
     # then reused for every subsequent invocation. Avoids re-compiling 20+ regexes
     # on every log line / request sanitization (O(1) compilation amortised).
-    _COMPILED_PATTERNS: ClassVar[list[tuple[re.Pattern[str], str]] | None] = None
+    _COMPILED_PATTERNS: ClassVar[list[tuple[re.Pattern[str], str, tuple[str, ...]]] | None] = None
+
+    # Every distinct required literal, tested once per input with C-level
+    # substring search. Text containing none of them (the common case) is
+    # returned without running a single regex.
+    _LITERALS: ClassVar[tuple[str, ...] | None] = None
 
     @classmethod
-    def _get_compiled_patterns(cls) -> list[tuple[re.Pattern[str], str]]:
-        """Lazy-initialise and return the pre-compiled pattern list."""
+    def _get_compiled_patterns(cls) -> list[tuple[re.Pattern[str], str, tuple[str, ...]]]:
+        """Lazy-initialise and return (regex, replacement, literals) triples."""
         if cls._COMPILED_PATTERNS is None:
             cls._COMPILED_PATTERNS = [
-                (re.compile(pattern, re.IGNORECASE), replacement)
+                (
+                    re.compile(pattern, re.IGNORECASE),
+                    replacement,
+                    # "" is a substring of every text, so unlisted patterns always run
+                    cls.REQUIRED_LITERALS.get(pattern, ("",)),
+                )
                 for pattern, replacement in cls.PATTERNS
             ]
         return cls._COMPILED_PATTERNS
 
+    @classmethod
+    def _get_literals(cls) -> tuple[str, ...]:
+        """Lazy-initialise and return the distinct required literals."""
+        if cls._LITERALS is None:
+            cls._LITERALS = tuple(
+                sorted({lit for _, _, literals in cls._get_compiled_patterns() for lit in literals})
+            )
+        return cls._LITERALS
+
     @classmethod
     def sanitize(cls, text: str | None) -> str:
         """
@@ -112,9 +175,16 @@ class TokenSanitizer:
 
         sanitized = str(text)
 
-        # Apply all pre-compiled patterns (zero regex compilations after first call)
-        for compiled, replacement in cls._get_compiled_patterns():
-            sanitized = compiled.sub(replacement, sanitized)
+        # Only patterns whose literals occur in the input can match; the
+        # candidates still run in PATTERNS order because later patterns
+        # rewrite the output of earlier ones.
+        folded = _casefold_like_re(sanitized)
+        present = {lit for lit in cls._get_literals() if lit in folded}
+        if not present:
+            return sanitized
+        for compiled, replacement, literals in cls._get_compiled_patterns():
+            if present.issuperset(literals):
+                sanitized = compiled.sub(replacement, sanitized)
 
         return sanitized
 
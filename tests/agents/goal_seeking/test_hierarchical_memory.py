@@ -213,6 +213,68 @@ class TestHierarchicalMemory:
         contents = [n.content for n in subgraph.nodes]
         assert any("photosynthesis" in c.lower() for c in contents)
 
+    def test_retrieve_subgraph_round_trips_do_not_grow_with_keywords(self, memory, monkeypatch):
+        """Seed search and expansion should be batched, not per keyword/seed."""
+        for i in range(6):
+            memory.store_knowledge(
+                content=f"Glacier {i} retreat measured in alpine valley survey",
+                concept="glaciology",
+            )
+
+        failures = []
+
+        def count_queries(query: str) -> int:
+            calls = []
+            original = memory.connection.execute
+
+            def spy(*args, **kwargs):
+                calls.append(args[0])
+                try:
+                    return original(*args, **kwargs)
+                except Exception as e:
+                    failures.append(e)
+                    raise
+
+            monkeypatch.setattr(memory.connection, "execute", spy)
+            try:
+                memory.retrieve_subgraph(query)
+            finally:
+                monkeypatch.setattr(memory.connection, "execute", original)
+            return len(calls)
+
+        short = count_queries("glacier retreat")
+        long = count_queries("glacier retreat measured alpine valley survey glaciology")
+        assert long == short
+        # Retrieval swallows query errors; a failing batched query must not pass
+        assert failures == []
+
+    def test_retrieve_subgraph_frequent_keyword_does_not_crowd_out_rare_one(self, memory):
+        """Each keyword gets its own seed window in the batched keyword search."""
+        frequent = [
+            {"memory_id": f"glacier-{i}", "content": f"Glacier survey {i}", "concept": "ice"}
+            for i in range(130)
+        ]
+        rare = {"memory_id": "moraine", "content": "Moraine deposits glacier sediment"}
+        memory.import_from_json({"semantic_nodes": [*frequent, rare]})
+
+        subgraph = memory.retrieve_subgraph("glacier moraine")
+
+        assert any("moraine" in n.content.lower() for n in subgraph.nodes)
+
+    def test_entity_seed_search_common_entity_does_not_crowd_out_rare_one(self, memory):
+        """Each entity candidate gets its own seed window in the batched entity search."""
+        common = [
+            {"memory_id": f"omar-{i}", "content": f"Omar visited site {i}", "entity_name": "omar"}
+            for i in range(30)
+        ]
+        rare = {"memory_id": "priya", "content": "Priya lives in Lisbon", "entity_name": "priya"}
+        memory.import_from_json({"semantic_nodes": [*common, rare]})
+
+        nodes = memory._entity_seed_search("Where do Priya and Omar live", limit=10)
+
+        assert len(nodes) == 10
+        assert nodes[0].node_id == "priya"
+
     def test_retrieve_subgraph_to_llm_context(self, memory):
         """to_llm_context should produce readable formatted text."""
         memory.store_knowledge(
@@ -6,8 +6,12 @@ selection with trust weighting, and convergence measurement.
 
 from __future__ import annotations
 
+import random
+from collections import Counter
+
 from amplihack.agents.goal_seeking.hive_mind.gossip import (
     GossipProtocol,
+    PeerRegistry,
     convergence_check,
     run_gossip_round,
 )
@@ -173,6 +177,80 @@ class TestRunGossipRound:
         assert len(gossip_facts) >= 1
 
 
+class TestPeerRegistry:
+    """Test the shared peer registry and its per-hive views."""
+
+    def _make_hive(self, hive_id: str, trust: float = 1.0) -> InMemoryHiveGraph:
+        hive = InMemoryHiveGraph(hive_id)
+        hive.register_agent(f"{hive_id}-agent", trust=trust)
+        return hive
+
+    def test_view_excludes_own_hive_and_sees_later_peers(self):
+        registry = PeerRegistry([self._make_hive("a"), self._make_hive("b")])
+        view = registry.view(exclude_hive_id="a")
+        assert [p.hive_id for p in view] == ["b"]
+
+        registry.add(self._make_hive("c"))
+        assert [p.hive_id for p in view] == ["b", "c"]
+        assert len(view) == 2
+        assert registry.version == 3
+
+    def test_select_respects_fanout_and_exclusions(self):
+        registry = PeerRegistry([self._make_hive(f"p{i}") for i in range(50)])
+        view = registry.view(exclude_hive_id="p0")
+        random.seed(7)
+        for _ in range(200):
+            selected = [p.hive_id for p in view.select("p1", fanout=3)]
+            assert len(set(selected)) == 3
+            assert "p0" not in selected and "p1" not in selected
+
+    def test_select_is_weighted_by_trust(self):
+        registry = PeerRegistry(
+            [self._make_hive("high", trust=2.0), self._make_hive("low", trust=0.1)]
+        )
+        registry.add(self._make_hive("mid", trust=1.0))
+        random.seed(3)
+        counts = Counter(p.hive_id for _ in range(3000) for p in registry.select(1))
+        assert counts["high"] > counts["mid"] > counts["low"]
+
+    def test_trust_change_is_picked_up_after_refresh(self):
+        hive = self._make_hive("a")
+        registry = PeerRegistry([hive, self._make_hive("b")])
+        hive.update_trust("a-agent", 0.0)
+        registry.refresh()
+        random.seed(5)
+        counts = Counter(p.hive_id for _ in range(2000) for p in registry.select(1))
+        assert counts["b"] > 8 * counts["a"]
+
+    def test_peer_drawn_on_stale_weight_is_redrawn(self):
+        random.seed(11)
+        picks = Counter()
+        for _ in range(500):
+            stale = self._make_hive("stale", trust=2.0)
+            registry = PeerRegistry([stale, self._make_hive("steady", trust=1.0)])
+            stale.update_trust("stale-agent", 0.0)  # weight 2.0 -> 0.1, not refreshed
+            picks.update(p.hive_id for p in registry.select(1))
+        # Fresh weights pick "stale" 0.1 / 1.1 of the time, stale ones 2 / 3
+        assert picks["stale"] < 0.2 * 500
+
+    def test_gossip_through_view_skips_content_peer_already_has(self):
+        source = self._make_hive("source")
+        peer = self._make_hive("peer")
+        for i in range(10):
+            peer.promote_fact(
+                "peer-agent",
+                HiveFact(fact_id="", content=f"reactor note {i}", concept="reactor"),
+            )
+        source.promote_fact(
+            "source-agent",
+            HiveFact(fact_id="", content="reactor note 3", concept="reactor", confidence=0.9),
+        )
+
+        result = run_gossip_round(source, PeerRegistry([peer]).view("source"))
+
+        assert result == {"peer": []}
+
+
 class TestConvergenceCheck:
     """Test convergence measurement."""
 
@@ -13,8 +13,14 @@ Tests the contract, not implementation details:
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
+from amplihack.agents.goal_seeking.hive_mind import hive_graph as hive_graph_module
+from amplihack.agents.goal_seeking.hive_mind.constants import FEDERATED_QUERY_MAX_WORKERS
 from amplihack.agents.goal_seeking.hive_mind.hive_graph import (
     HiveAgent,
     HiveEdge,
@@ -29,6 +35,29 @@ from amplihack.agents.goal_seeking.hive_mind.hive_graph import (
 # ---------------------------------------------------------------------------
 
 
+class _SlowHive(InMemoryHiveGraph):
+    """Hive whose local queries take ``delay`` seconds, like a remote backend."""
+
+    def __init__(self, hive_id: str, delay: float, **kwargs) -> None:
+        super().__init__(hive_id, **kwargs)
+        self.delay = delay
+        self.route_calls = 0
+
+    def query_facts(self, query: str, limit: int = 20) -> list[HiveFact]:
+        time.sleep(self.delay)
+        return super().query_facts(query, limit)
+
+    def route_query(self, query: str) -> list[str]:
+        self.route_calls += 1
+        return super().route_query(query)
+
+
+def _federate(parent: InMemoryHiveGraph, *children: InMemoryHiveGraph) -> None:
+    for child in children:
+        parent.add_child(child)
+        child.set_parent(parent)
+
+
 @pytest.fixture
 def hive() -> InMemoryHiveGraph:
     """Fresh in-memory hive for each test."""
@@ -299,6 +328,19 @@ class TestInMemoryEdges:
     def test_get_edges_empty(self, hive: InMemoryHiveGraph):
         assert hive.get_edges("nonexistent") == []
 
+    def test_get_edges_keeps_insertion_order(self, hive: InMemoryHiveGraph):
+        hive.add_edge(HiveEdge("a", "b", "PROMOTED"))
+        hive.add_edge(HiveEdge("c", "a", "CONFIRMED_BY"))
+        hive.add_edge(HiveEdge("a", "a", "CONTRADICTS"))
+        hive.add_edge(HiveEdge("a", "d", "PROMOTED"))
+        edges = hive.get_edges("a")
+        assert [(e.source_id, e.target_id) for e in edges] == [
+            ("a", "b"),
+            ("c", "a"),
+            ("a", "a"),
+            ("a", "d"),
+        ]
+
 
 # ---------------------------------------------------------------------------
 # TestInMemoryContradictions
@@ -600,6 +642,101 @@ class TestInMemoryFederation:
         contents = [f.content for f in results]
         assert contents.count("shared fact content") == 1
 
+    def test_query_federated_queries_children_concurrently(self):
+        root = InMemoryHiveGraph("root", federated_workers=4)
+        children = [_SlowHive(f"group-{i}", delay=0.2) for i in range(4)]
+        _federate(root, *children)
+        for i, child in enumerate(children):
+            child.register_agent(f"agent-{i}")
+            child.promote_fact(
+                f"agent-{i}", HiveFact(fact_id="", content=f"orbit data {i}", concept="orbit")
+            )
+
+        start = time.monotonic()
+        results = root.query_federated("orbit data")
+        elapsed = time.monotonic() - start
+
+        assert sorted(f.content for f in results) == [f"orbit data {i}" for i in range(4)]
+        assert elapsed < 0.6
+
+    def test_query_federated_drops_branches_past_deadline(self):
+        root = InMemoryHiveGraph("root", federated_timeout=0.2)
+        fast = InMemoryHiveGraph("fast")
+        slow = _SlowHive("slow", delay=1.0)
+        _federate(root, fast, slow)
+        for hive in (root, fast, slow):
+            hive.register_agent(f"{hive.hive_id}-agent")
+            hive.promote_fact(
+                f"{hive.hive_id}-agent",
+                HiveFact(fact_id="", content=f"tide table {hive.hive_id}", concept="tides"),
+            )
+
+        start = time.monotonic()
+        results = root.query_federated("tide table")
+        elapsed = time.monotonic() - start
+
+        assert sorted(f.content for f in results) == ["tide table fast", "tide table root"]
+        assert elapsed < 0.8
+
+    def test_query_federated_caches_child_routes_until_agents_change(self):
+        root = InMemoryHiveGraph("root")
+        child = _SlowHive("child", delay=0.0)
+        _federate(root, child)
+        child.register_agent("geo", domain="geology")
+
+        root.query_federated("geology rocks")
+        root.query_federated("rocks geology")
+        assert child.route_calls == 1
+
+        child.register_agent("bio", domain="biology")
+        root.query_federated("geology rocks")
+        assert child.route_calls == 2
+
+    def test_query_federated_threads_are_shared_across_hives(self):
+        roots = []
+        for r in range(8):
+            root = InMemoryHiveGraph(f"root-{r}")
+            children = [_SlowHive(f"group-{r}-{i}", delay=0.05) for i in range(4)]
+            _federate(root, *children)
+            roots.append(root)
+
+        for root in roots:
+            root.query_federated("orbit data")
+
+        federated_threads = [
+            thread for thread in threading.enumerate() if thread.name.startswith("hive-federated")
+        ]
+        assert 0 < len(federated_threads) <= FEDERATED_QUERY_MAX_WORKERS
+
+    def test_query_federated_deep_tree_completes_on_one_worker(self, monkeypatch):
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(hive_graph_module, "_federated_executor", executor)
+        root = InMemoryHiveGraph("root", federated_timeout=5.0)
+        hives = [root]
+        for i in range(3):
+            middle = _SlowHive(f"middle-{i}", delay=0.02)
+            leaves = [_SlowHive(f"leaf-{i}-{j}", delay=0.02) for j in range(2)]
+            _federate(root, middle)
+            _federate(middle, *leaves)
+            hives.extend([middle, *leaves])
+        for hive in hives:
+            hive.register_agent(f"{hive.hive_id}-agent")
+            hive.promote_fact(
+                f"{hive.hive_id}-agent",
+                HiveFact(fact_id="", content=f"tide table {hive.hive_id}", concept="tides"),
+            )
+
+        start = time.monotonic()
+        results = root.query_federated("tide table")
+        elapsed = time.monotonic() - start
+        executor.shutdown()
+
+        # Branches queued behind the single busy worker run on their caller's thread
+        assert sorted(f.content for f in results) == sorted(
+            f"tide table {hive.hive_id}" for hive in hives
+        )
+        assert elapsed < 2.0
+
     def test_three_level_federation(self):
         """Root -> Science -> Bio, Chem."""
         root = InMemoryHiveGraph("root")
@@ -22,6 +22,7 @@ from amplihack.agents.goal_seeking.hive_mind.event_bus import (
     LocalEventBus,
     make_event,
 )
+from amplihack.agents.goal_seeking.hive_mind.gossip import PeerRegistry
 from amplihack.agents.goal_seeking.hive_mind.hive_graph import (
     HiveFact,
     InMemoryHiveGraph,
@@ -370,6 +371,19 @@ def test_peers_property_is_copy(orch: HiveMindOrchestrator, hive: InMemoryHiveGr
     assert len(orch.peers) == 1, "Modifying the copy should not affect internal state"
 
 
+def test_add_peer_through_view_is_shared(hive: InMemoryHiveGraph, bus: LocalEventBus) -> None:
+    registry = PeerRegistry()
+    orch_a = HiveMindOrchestrator("agent_a", hive, bus, peers=registry.view("local-a"))
+    orch_b = HiveMindOrchestrator("agent_b", hive, bus, peers=registry.view("local-b"))
+    private = HiveMindOrchestrator("agent_c", hive, bus, peers=[])
+
+    orch_a.add_peer(InMemoryHiveGraph("peer-hive"))
+    private.add_peer(InMemoryHiveGraph("private-peer"))
+
+    assert [p.hive_id for p in orch_b.peers] == ["peer-hive"]
+    assert [p.hive_id for p in private.peers] == ["private-peer"]
+
+
 def test_close_does_not_raise(orch: HiveMindOrchestrator) -> None:
     orch.close()  # Should not raise
 
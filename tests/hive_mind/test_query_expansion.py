@@ -6,8 +6,30 @@ Tests both the LLM path (mocked) and the local synonym expansion fallback.
 from __future__ import annotations
 
 import importlib
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+QE = "amplihack.agents.goal_seeking.hive_mind.query_expansion"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_expansion_cache():
+    """Cached LLM expansions must not leak between tests."""
+    importlib.import_module(QE).clear_expansion_cache()
+    yield
+    importlib.import_module(QE).clear_expansion_cache()
+
+
+def _mock_client(text: str) -> MagicMock:
+    client = MagicMock()
+    content = MagicMock()
+    content.text = text
+    client.messages.create.return_value.content = [content]
+    return client
+
 
 class TestHasAnthropic:
     """Test availability detection."""
@@ -256,3 +278,109 @@ class TestGracefulDegradation:
             result = expand_query("some query about memory")
             assert len(result) >= 1
             assert result[0] == "some query about memory"
+
+
+class TestExpansionCache:
+    """LLM expansions are cached by normalized query and the client is reused."""
+
+    def test_normalized_repeat_hits_cache_and_reuses_client(self):
+        client = _mock_client("resolve the bug\naddress the issue")
+        with patch(f"{QE}.HAS_ANTHROPIC", True), patch(f"{QE}.anthropic") as mock_anthropic:
+            mock_anthropic.Anthropic.return_value = client
+            from amplihack.agents.goal_seeking.hive_mind.query_expansion import expand_query
+
+            first = expand_query("Fix the error", max_expansions=3)
+            second = expand_query("  fix   THE error ", max_expansions=3)
+            expand_query("fix a different error", max_expansions=3)
+
+        assert first == ["Fix the error", "resolve the bug", "address the issue"]
+        assert second == ["fix   THE error", "resolve the bug", "address the issue"]
+        assert client.messages.create.call_count == 2
+        assert mock_anthropic.Anthropic.call_count == 1
+
+    def test_fallback_results_are_not_cached(self):
+        with patch(f"{QE}.HAS_ANTHROPIC", True), patch(f"{QE}.anthropic") as mock_anthropic:
+            mock_anthropic.Anthropic.side_effect = [Exception("API error"), _mock_client("x")]
+            from amplihack.agents.goal_seeking.hive_mind.query_expansion import expand_query
+
+            assert "x" not in expand_query("fix the error")
+            assert expand_query("fix the error") == ["fix the error", "x"]
+
+    def test_background_returns_local_then_llm(self):
+        release = threading.Event()
+        client = _mock_client("resolve the bug")
+        create = client.messages.create
+
+        def slow_create(**kwargs):
+            release.wait(5)
+            return create.return_value
+
+        client.messages.create = MagicMock(side_effect=slow_create)
+        qe = importlib.import_module(QE)
+        with patch(f"{QE}.HAS_ANTHROPIC", True), patch(f"{QE}.anthropic") as mock_anthropic:
+            mock_anthropic.Anthropic.return_value = client
+
+            immediate = qe.expand_query("fix the error", background=True)
+            again = qe.expand_query("fix the error", background=True)
+            release.set()
+            deadline = time.monotonic() + 5
+            while qe._pending_expansions and time.monotonic() < deadline:
+                time.sleep(0.01)
+            later = qe.expand_query("fix the error", background=True)
+
+        assert immediate == again == qe._local_expand("fix the error")[: qe._MAX_EXPANSIONS]
+        assert later == ["fix the error", "resolve the bug"]
+        assert client.messages.create.call_count == 1
+
+    def test_cache_is_bounded(self, monkeypatch):
+        qe = importlib.import_module(QE)
+        monkeypatch.setattr(qe, "QUERY_EXPANSION_CACHE_SIZE", 2)
+        for query in ("a", "b", "c"):
+            qe._cache_put((query, 3), [f"{query}!"])
+        assert qe._cache_get(("a", 3)) is None
+        assert qe._cache_get(("c", 3)) == ["c!"]
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        qe = importlib.import_module(QE)
+        monkeypatch.setattr(qe, "QUERY_EXPANSION_CACHE_TTL_SECONDS", 0.0)
+        qe._cache_put(("a", 3), ["a!"])
+        assert qe._cache_get(("a", 3)) is None
+
+
+class TestConcurrentSearchExpanded:
+    """Variant searches run concurrently and merge with reciprocal rank fusion."""
+
+    def test_variants_run_concurrently(self):
+        from amplihack.agents.goal_seeking.hive_mind.query_expansion import search_expanded
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def search(query, limit=20):
+            barrier.wait()
+            return [{"query": query}]
+
+        with patch(f"{QE}.expand_query", return_value=["a", "b", "c"]):
+            results = search_expanded("a", search, limit=10)
+
+        assert len(results) == 3
+
+    def test_results_shared_by_variants_rank_first(self):
+        from amplihack.agents.goal_seeking.hive_mind.query_expansion import search_expanded
+
+        class FakeFact:
+            def __init__(self, content):
+                self.content = content
+
+        ranked = {
+            "a": ["only-a", "shared"],
+            "b": ["only-b", "shared"],
+            "c": ["shared", "only-c"],
+        }
+
+        def search(query, limit=20):
+            return [FakeFact(content) for content in ranked[query]]
+
+        with patch(f"{QE}.expand_query", return_value=["a", "b", "c"]):
+            results = search_expanded("a", search, limit=2)
+
+        assert [fact.content for fact in results] == ["shared", "only-a"]
@@ -7,9 +7,12 @@ merge, plus hybrid scoring.
 from __future__ import annotations
 
 import importlib
+import threading
 from dataclasses import dataclass
 from unittest.mock import MagicMock
 
+import pytest
+
 
 class TestHasCrossEncoder:
     """Test availability detection."""
@@ -436,3 +439,123 @@ class TestQueryFederatedUsesRRF:
         assert len(results) >= 1
         contents = {f.content for f in results}
         assert "DNA stores genetic information" in contents
+
+
+@dataclass
+class _Fact:
+    content: str
+    confidence: float = 0.5
+
+
+class _StubModel:
+    """Cross-encoder stand-in: scores a pair by content length."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls: list[list[tuple[str, str]]] = []
+        self.error = error
+
+    def predict(self, pairs):
+        self.calls.append(list(pairs))
+        if self.error is not None:
+            raise self.error
+        return [float(len(content)) for _, content in pairs]
+
+
+def _service(model, **kwargs):
+    from amplihack.agents.goal_seeking.hive_mind.reranker import (
+        CrossEncoderReranker,
+        RerankService,
+    )
+
+    reranker = CrossEncoderReranker.__new__(CrossEncoderReranker)
+    reranker._model = model
+    reranker._model_name = "stub"
+    kwargs.setdefault("batch_window", 0.0)
+    return RerankService(reranker, **kwargs)
+
+
+class TestRerankService:
+    """Test RerankService caching, batching and candidate capping with a stub model."""
+
+    def test_scores_match_reranker_and_repeat_is_cached(self):
+        model = _StubModel()
+        service = _service(model)
+        facts = [_Fact("bb"), _Fact("a"), _Fact("ccc")]
+
+        first = service.rerank("query", facts)
+        second = service.rerank("query", facts)
+
+        assert [sf.fact.content for sf in first] == ["ccc", "bb", "a"]
+        assert first == second
+        assert first[0].source == "cross_encoder"
+        assert len(model.calls) == 1
+        assert service.get_stats()["cache_hits"] == 3
+
+    def test_overlapping_request_scores_only_new_pairs(self):
+        model = _StubModel()
+        service = _service(model)
+        service.rerank("query", [_Fact("a"), _Fact("bb")])
+        service.rerank("query", [_Fact("bb"), _Fact("ccc")])
+        service.rerank("other", [_Fact("bb")])
+
+        assert model.calls[1:] == [[("query", "ccc")], [("other", "bb")]]
+
+    def test_concurrent_requests_share_one_predict_call(self):
+        model = _StubModel()
+        service = _service(model, batch_window=0.2)
+        barrier = threading.Barrier(4)
+        results = {}
+
+        def worker(i):
+            barrier.wait()
+            results[i] = service.rerank(f"q{i}", [_Fact("shared"), _Fact(f"own fact {i}")])
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(model.calls) == 1
+        assert len(model.calls[0]) == 8
+        assert all(results[i][0].fact.content == f"own fact {i}" for i in range(4))
+
+    def test_batches_are_split_at_max_batch_pairs(self):
+        model = _StubModel()
+        service = _service(model, max_batch_pairs=2)
+        scored = service.rerank("query", [_Fact("x" * n) for n in range(1, 6)])
+
+        assert [len(call) for call in model.calls] == [2, 2, 1]
+        assert [len(sf.fact.content) for sf in scored] == [5, 4, 3, 2, 1]
+
+    def test_candidate_cap_keeps_top_retrieved_and_keyword_matches(self):
+        model = _StubModel()
+        service = _service(model, max_candidates=2)
+        facts = [
+            _Fact("unrelated fact"),
+            _Fact("another unrelated"),
+            _Fact("dna replication"),
+            _Fact("last one"),
+        ]
+
+        scored = service.rerank("dna", facts)
+
+        assert {sf.fact.content for sf in scored} == {"unrelated fact", "dna replication"}
+        assert len(model.calls[0]) == 2
+        assert service.get_stats()["prerank_dropped"] == 2
+
+    def test_predict_failure_propagates_and_is_not_cached(self):
+        model = _StubModel(error=RuntimeError("model crashed"))
+        service = _service(model)
+
+        with pytest.raises(RuntimeError):
+            service.rerank("query", [_Fact("a")])
+        model.error = None
+        assert service.rerank("query", [_Fact("a")])[0].score == 1.0
+
+    def test_unavailable_model_falls_back_to_confidence(self):
+        service = _service(None)
+        scored = service.rerank("query", [_Fact("a", 0.2), _Fact("b", 0.9)])
+
+        assert [sf.fact.content for sf in scored] == ["b", "a"]
+        assert scored[0].source == "confidence_fallback"
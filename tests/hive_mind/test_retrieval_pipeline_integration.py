@@ -120,6 +120,20 @@ class TestEmbeddingIntegration:
         results = hive.query_facts("DNA genetics", limit=5)
         assert len(results) >= 1
 
+    def test_confirmations_break_similarity_ties(self, hive):
+        hive.promote_fact("agent_a", HiveFact(fact_id="f1", content="DNA helix", concept="g"))
+        hive.promote_fact("agent_a", HiveFact(fact_id="f2", content="DNA helix", concept="g"))
+        hive.add_edge(HiveEdge(source_id="agent_b", target_id="f2", edge_type="CONFIRMED_BY"))
+        results = hive.query_facts("DNA helix", limit=1)
+        assert [f.fact_id for f in results] == ["f2"]
+
+    def test_retracted_facts_excluded_from_vector_search(self, hive):
+        hive.promote_fact("agent_a", HiveFact(fact_id="f1", content="DNA helix", concept="g"))
+        hive.promote_fact("agent_a", HiveFact(fact_id="f2", content="DNA strand", concept="g"))
+        hive.retract_fact("f1")
+        results = hive.query_facts("DNA helix", limit=5)
+        assert [f.fact_id for f in results] == ["f2"]
+
 
 # ---------------------------------------------------------------------------
 # Configurable broadcast_threshold
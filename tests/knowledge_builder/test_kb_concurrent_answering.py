@@ -0,0 +1,184 @@
+"""Tests for concurrent, cached question answering in KnowledgeAcquirer.
+
+Uses a fake agent executable instead of mocking subprocess, so timeouts,
+retries and concurrency are exercised against real processes offline.
+"""
+
+import json
+import sys
+
+import pytest
+
+from amplihack.knowledge_builder.kb_types import Question
+from amplihack.knowledge_builder.modules.answer_cache import AnswerCache, answer_key
+from amplihack.knowledge_builder.modules.knowledge_acquirer import KnowledgeAcquirer
+
+FAKE_AGENT = """#!{python}
+import json, pathlib, sys, time
+
+prompt = sys.argv[-1]
+question = prompt.split('"')[1]
+state = pathlib.Path({state_dir!r})
+with open(state / "calls.jsonl", "a") as f:
+    f.write(json.dumps({{"question": question, "start": time.time()}}) + "\\n")
+
+if "slow" in question:
+    time.sleep({delay})
+if "hang" in question:
+    time.sleep(60)
+if "broken" in question:
+    sys.exit(1)
+if "silent" in question:
+    sys.exit(0)
+if "flaky" in question:
+    marker = state / "flaky_failed"
+    if not marker.exists():
+        marker.touch()
+        sys.exit(1)
+
+print(f"ANSWER: Answer to {{question}}\\nSOURCES:\\n- https://example.com/{{len(question)}}")
+"""
+
+
+@pytest.fixture
+def fake_agent(tmp_path, monkeypatch):
+    """Write the fake agent script and return (agent_cmd, state_dir)."""
+    monkeypatch.delenv("AMPLIHACK_AGENT_BINARY", raising=False)
+    state_dir = tmp_path / "agent_state"
+    state_dir.mkdir()
+    script = tmp_path / "fake_agent"
+    script.write_text(FAKE_AGENT.format(python=sys.executable, state_dir=str(state_dir), delay=0.5))
+    script.chmod(0o755)
+    return str(script), state_dir
+
+
+def _calls(state_dir) -> list[dict]:
+    path = state_dir / "calls.jsonl"
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _questions(*texts: str) -> list[Question]:
+    return [Question(text=text, depth=0) for text in texts]
+
+
+class TestConcurrentAnswering:
+    """Test the bounded worker pool, timeouts and retries."""
+
+    def test_questions_are_answered_concurrently(self, fake_agent):
+        agent_cmd, state_dir = fake_agent
+        questions = _questions(*[f"slow question {i}" for i in range(4)])
+
+        KnowledgeAcquirer(agent_cmd, max_workers=4).answer_all_questions(questions, "Topic")
+
+        assert [q.answer for q in questions] == [f"Answer to slow question {i}" for i in range(4)]
+        starts = sorted(call["start"] for call in _calls(state_dir))
+        # Every call started before the first one (0.5s) could have finished
+        assert starts[-1] - starts[0] < 0.5
+
+    def test_worker_pool_is_bounded(self, fake_agent):
+        agent_cmd, state_dir = fake_agent
+        questions = _questions(*[f"slow question {i}" for i in range(4)])
+
+        KnowledgeAcquirer(agent_cmd, max_workers=2).answer_all_questions(questions, "Topic")
+
+        starts = sorted(call["start"] for call in _calls(state_dir))
+        # The third call cannot start before one of the first two finished
+        assert starts[2] - starts[0] >= 0.4
+
+    def test_timed_out_question_is_retried_then_reported(self, fake_agent):
+        agent_cmd, state_dir = fake_agent
+        questions = _questions("hang question", "quick question")
+        acq = KnowledgeAcquirer(agent_cmd, timeout=0.5, retries=1, retry_delay=0)
+
+        acq.answer_all_questions(questions, "Topic")
+
+        assert questions[0].answer == "Unable to answer: hang question"
+        assert questions[1].answer == "Answer to quick question"
+        assert [c["question"] for c in _calls(state_dir)].count("hang question") == 2
+
+    def test_failed_call_is_retried(self, fake_agent):
+        agent_cmd, state_dir = fake_agent
+        questions = _questions("flaky question")
+
+        KnowledgeAcquirer(agent_cmd, retries=1, retry_delay=0).answer_all_questions(
+            questions, "Topic"
+        )
+
+        assert questions[0].answer == "Answer to flaky question"
+        assert len(_calls(state_dir)) == 2
+
+    def test_empty_answer_is_retried_then_reported(self, fake_agent):
+        agent_cmd, state_dir = fake_agent
+        questions = _questions("silent question")
+
+        KnowledgeAcquirer(agent_cmd, retries=1, retry_delay=0).answer_all_questions(
+            questions, "Topic"
+        )
+
+        assert questions[0].answer == "Unable to answer: silent question"
+        assert len(_calls(state_dir)) == 2
+
+    def test_duplicate_questions_are_asked_once(self, fake_agent):
+        agent_cmd, state_dir = fake_agent
+        questions = _questions("same question", "same question")
+
+        KnowledgeAcquirer(agent_cmd).answer_all_questions(questions, "Topic")
+
+        assert [q.answer for q in questions] == ["Answer to same question"] * 2
+        assert len(_calls(state_dir)) == 1
+
+
+class TestAnswerCaching:
+    """Test answers are cached across runs and resume interrupted builds."""
+
+    def test_rerun_reuses_cached_answers(self, fake_agent, tmp_path):
+        agent_cmd, state_dir = fake_agent
+        cache_path = tmp_path / "answers.jsonl"
+        KnowledgeAcquirer(agent_cmd, cache_path=cache_path).answer_all_questions(
+            _questions("q one", "q two"), "Topic"
+        )
+
+        questions = _questions("q one", "q two", "q three")
+        KnowledgeAcquirer(agent_cmd, cache_path=cache_path).answer_all_questions(questions, "Topic")
+
+        assert sorted(c["question"] for c in _calls(state_dir)) == ["q one", "q three", "q two"]
+        assert questions[0].answer == "Answer to q one"
+
+    def test_cache_is_keyed_by_topic(self, fake_agent, tmp_path):
+        agent_cmd, state_dir = fake_agent
+        cache_path = tmp_path / "answers.jsonl"
+        for topic in ("Topic A", "Topic B"):
+            KnowledgeAcquirer(agent_cmd, cache_path=cache_path).answer_all_questions(
+                _questions("q one"), topic
+            )
+
+        assert len(_calls(state_dir)) == 2
+
+    @pytest.mark.parametrize("text", ["broken question", "silent question"])
+    def test_failed_answers_are_not_cached(self, fake_agent, tmp_path, text):
+        agent_cmd, state_dir = fake_agent
+        cache_path = tmp_path / "answers.jsonl"
+        acq = KnowledgeAcquirer(agent_cmd, retries=0, cache_path=cache_path)
+
+        acq.answer_all_questions(_questions(text), "Topic")
+
+        assert AnswerCache(cache_path).get("Topic", text) is None
+
+    def test_interrupted_build_resumes_from_checkpoint(self, fake_agent, tmp_path):
+        agent_cmd, state_dir = fake_agent
+        cache_path = tmp_path / "answers.jsonl"
+        # A build killed mid-write leaves a truncated last line
+        AnswerCache(cache_path).put("Topic", "q one", "Cached answer", ["https://a.com"])
+        with open(cache_path, "a") as f:
+            f.write('{"key": "' + answer_key("Topic", "q two"))
+
+        questions = _questions("q one", "q two")
+        KnowledgeAcquirer(agent_cmd, cache_path=cache_path).answer_all_questions(questions, "Topic")
+
+        assert questions[0].answer == "Cached answer"
+        assert questions[1].answer == "Answer to q two"
+        assert [c["question"] for c in _calls(state_dir)] == ["q two"]
+        # The answer appended after the truncated line is readable on the next run
+        assert AnswerCache(cache_path).get("Topic", "q two")[0] == "Answer to q two"
@@ -0,0 +1,248 @@
+"""Tests for amplihack.llm session pooling, response cache and metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+from amplihack.llm.cache import ResponseCache, cache_key
+
+
+def _reload_client(monkeypatch):
+    import amplihack.llm.client as client
+
+    importlib.reload(client)
+    client._detector_cache = None
+    monkeypatch.setenv("AMPLIHACK_LLM_PROVIDER", "claude")
+    monkeypatch.setattr(client, "_CLAUDE_SDK_OK", True)
+    monkeypatch.setattr(client, "_response_cache", ResponseCache())
+    return client
+
+
+MESSAGES = [{"role": "user", "content": "grade this"}]
+
+
+class TestResponseCache:
+    def test_key_depends_on_every_field(self):
+        base = cache_key("claude", "p", "m", 0.0, 10)
+        assert base == cache_key("claude", "p", "m", 0.0, 10)
+        assert base != cache_key("copilot", "p", "m", 0.0, 10)
+        assert base != cache_key("claude", "q", "m", 0.0, 10)
+        assert base != cache_key("claude", "p", "n", 0.0, 10)
+        assert base != cache_key("claude", "p", "m", 0.5, 10)
+        assert base != cache_key("claude", "p", "m", 0.0, 20)
+
+    def test_lru_is_bounded(self):
+        cache = ResponseCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, key.upper())
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c") == "C"
+
+    def test_empty_responses_are_not_cached(self):
+        cache = ResponseCache()
+        cache.put("k", "")
+        assert cache.get("k") is None
+
+    def test_disk_entries_survive_new_instance(self, tmp_path):
+        ResponseCache(directory=tmp_path).put("k", "answer")
+        assert ResponseCache(directory=tmp_path).get("k") == "answer"
+
+
+class TestCompletionCache:
+    def test_repeated_request_queries_once(self, monkeypatch):
+        client = _reload_client(monkeypatch)
+        calls = []
+
+        async def fake_claude(prompt, project_root):
+            calls.append(prompt)
+            return "ok"
+
+        monkeypatch.setattr(client, "_query_claude", fake_claude)
+
+        async def run():
+            first = await client.completion(MESSAGES, temperature=0.0, cache=True)
+            second = await client.completion(MESSAGES, temperature=0.0, cache=True)
+            return first, second
+
+        assert asyncio.run(run()) == ("ok", "ok")
+        assert len(calls) == 1
+        assert client.get_metrics()["claude"]["cache_hits"] == 1
+
+    def test_concurrent_duplicates_are_coalesced(self, monkeypatch):
+        client = _reload_client(monkeypatch)
+        calls = []
+
+        async def slow_claude(prompt, project_root):
+            calls.append(prompt)
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        monkeypatch.setattr(client, "_query_claude", slow_claude)
+
+        async def run():
+            return await asyncio.gather(
+                *(client.completion(MESSAGES, cache=True) for _ in range(5))
+            )
+
+        assert asyncio.run(run()) == ["ok"] * 5
+        assert len(calls) == 1
+
+    def test_uncached_requests_always_query(self, monkeypatch):
+        client = _reload_client(monkeypatch)
+        calls = []
+
+        async def fake_claude(prompt, project_root):
+            calls.append(prompt)
+            return "ok"
+
+        monkeypatch.setattr(client, "_query_claude", fake_claude)
+
+        async def run():
+            await client.completion(MESSAGES)
+            await client.completion(MESSAGES)
+
+        asyncio.run(run())
+        assert len(calls) == 2
+
+
+class TestConcurrencyAndMetrics:
+    def test_concurrency_is_bounded(self, monkeypatch):
+        client = _reload_client(monkeypatch)
+        monkeypatch.setattr(client, "MAX_CONCURRENCY", 2)
+        active = 0
+        peak = 0
+
+        async def fake_claude(prompt, project_root):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return "ok"
+
+        monkeypatch.setattr(client, "_query_claude", fake_claude)
+
+        async def run():
+            await asyncio.gather(
+                *(client.completion([{"role": "user", "content": str(i)}]) for i in range(6))
+            )
+
+        asyncio.run(run())
+        assert peak == 2
+
+    def test_errors_are_counted_and_fail_open(self, monkeypatch):
+        client = _reload_client(monkeypatch)
+
+        async def broken_claude(prompt, project_root):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(client, "_query_claude", broken_claude)
+
+        assert asyncio.run(client.completion(MESSAGES)) == ""
+        metrics = client.get_metrics()["claude"]
+        assert metrics["calls"] == 1
+        assert metrics["errors"] == 1
+        assert metrics["max_ms"] >= 0.0
+
+
+class _FakeSession:
+    async def send_and_wait(self, prompt, timeout):
+        return SimpleNamespace(data=SimpleNamespace(content=f"echo:{prompt}"))
+
+    async def destroy(self):
+        pass
+
+
+class _FakeCopilotClient:
+    started = 0
+    stopped = 0
+
+    async def start(self):
+        type(self).started += 1
+
+    async def stop(self):
+        type(self).stopped += 1
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def create_session(self, **kwargs):
+        return _FakeSession()
+
+
+class TestSessionPool:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        client = _reload_client(monkeypatch)
+        monkeypatch.setenv("AMPLIHACK_LLM_PROVIDER", "copilot")
+        monkeypatch.setattr(client, "_COPILOT_SDK_OK", True)
+        monkeypatch.setattr(client, "CopilotClient", _FakeCopilotClient, raising=False)
+        monkeypatch.setattr(
+            client,
+            "PermissionHandler",
+            SimpleNamespace(approve_all=None),
+            raising=False,
+        )
+        _FakeCopilotClient.started = 0
+        _FakeCopilotClient.stopped = 0
+        return client
+
+    def test_without_pool_each_call_starts_a_client(self, client):
+        async def run():
+            for _ in range(3):
+                await client.completion(MESSAGES)
+
+        asyncio.run(run())
+        assert _FakeCopilotClient.started == 3
+
+    def test_pool_reuses_warm_client(self, client):
+        async def run():
+            async with client.session_pool(size=2):
+                results = [await client.completion(MESSAGES) for _ in range(3)]
+                assert _FakeCopilotClient.stopped == 0
+            return results
+
+        assert asyncio.run(run()) == ["echo:grade this"] * 3
+        assert _FakeCopilotClient.started == 1
+        assert _FakeCopilotClient.stopped == 1
+
+    def test_pool_is_bounded(self, client):
+        async def run():
+            async with client.session_pool(size=2):
+                await asyncio.gather(
+                    *(client.completion([{"role": "user", "content": str(i)}]) for i in range(6))
+                )
+
+        asyncio.run(run())
+        assert _FakeCopilotClient.started <= 2
+
+    def test_cancelled_calls_do_not_leak_pool_slots(self, client):
+        async def run():
+            async with client.session_pool(size=2):
+                pool = client._copilot_pool.get()
+
+                async def hold(entered: asyncio.Event):
+                    async with pool.client():
+                        entered.set()
+                        await asyncio.sleep(60)
+
+                for _ in range(3):
+                    entered = asyncio.Event()
+                    task = asyncio.create_task(hold(entered))
+                    await asyncio.wait_for(entered.wait(), timeout=5)
+                    task.cancel()
+                    with pytest.raises(asyncio.CancelledError):
+                        await task
+                assert pool._all == []
+                return await asyncio.wait_for(client.completion(MESSAGES), timeout=5)
+
+        assert asyncio.run(run()) == "echo:grade this"
@@ -0,0 +1,214 @@
+"""Tests for incremental, per-module collect-only validation."""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+
+def _require_attr(module_name: str, attr_name: str):
+    module = importlib.import_module(module_name)
+    assert hasattr(module, attr_name), f"{module_name} must define {attr_name}"
+    return getattr(module, attr_name)
+
+
+def _write_suite(repo_path: Path) -> None:
+    (repo_path / "tests" / "unit").mkdir(parents=True)
+    (repo_path / "tests" / "integration").mkdir()
+    (repo_path / "pytest.ini").write_text("[pytest]\ntestpaths = tests\n")
+    (repo_path / "tests" / "unit" / "helpers.py").write_text("VALUE = 1\n")
+    (repo_path / "tests" / "unit" / "test_alpha.py").write_text(
+        "from helpers import VALUE\n\n\ndef test_alpha():\n    assert VALUE\n"
+    )
+    (repo_path / "tests" / "unit" / "test_beta.py").write_text(
+        "def test_beta():\n    assert True\n"
+    )
+    (repo_path / "tests" / "integration" / "test_gamma.py").write_text(
+        "def test_gamma():\n    assert True\n"
+    )
+
+
+@pytest.fixture
+def recorded_runs(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, ...]]:
+    stage2 = importlib.import_module("amplihack.recovery.stage2")
+    real_run_collect_only = stage2._run_collect_only
+    runs: list[tuple[str, ...]] = []
+
+    def recording_run_collect_only(repo_path: Path, *, timeout: int, paths=()):
+        runs.append(tuple(paths))
+        return real_run_collect_only(repo_path, timeout=timeout, paths=paths)
+
+    monkeypatch.setattr(stage2, "_run_collect_only", recording_run_collect_only)
+    return runs
+
+
+class TestIncrementalCollectOnly:
+    """Re-validation must only re-collect modules whose inputs changed."""
+
+    def test_unchanged_suite_is_served_from_cache(self, tmp_path: Path, recorded_runs):
+        collect_error_signatures = _require_attr(
+            "amplihack.recovery.stage2", "collect_error_signatures"
+        )
+        CollectOnlyCache = _require_attr("amplihack.recovery.collect_cache", "CollectOnlyCache")
+        _write_suite(tmp_path)
+        cache = CollectOnlyCache()
+
+        assert collect_error_signatures(tmp_path, timeout=60, cache=cache) == []
+        assert collect_error_signatures(tmp_path, timeout=60, cache=cache) == []
+
+        assert recorded_runs == [()]
+
+    def test_changed_module_is_recollected_and_merged(self, tmp_path: Path, recorded_runs):
+        collect_error_signatures = _require_attr(
+            "amplihack.recovery.stage2", "collect_error_signatures"
+        )
+        CollectOnlyCache = _require_attr("amplihack.recovery.collect_cache", "CollectOnlyCache")
+        _write_suite(tmp_path)
+        cache = CollectOnlyCache()
+        collect_error_signatures(tmp_path, timeout=60, cache=cache)
+
+        (tmp_path / "tests" / "unit" / "test_beta.py").write_text("import missing_dep\n")
+        incremental = collect_error_signatures(tmp_path, timeout=60, cache=cache)
+        full = collect_error_signatures(tmp_path, timeout=60)
+
+        assert recorded_runs == [(), ("tests/unit/test_beta.py",), ()]
+        assert incremental == full
+        assert [signature.normalized_location for signature in incremental] == [
+            "tests/unit/test_beta.py"
+        ]
+
+    def test_change_in_imported_helper_recollects_its_importers(
+        self, tmp_path: Path, recorded_runs
+    ):
+        collect_error_signatures = _require_attr(
+            "amplihack.recovery.stage2", "collect_error_signatures"
+        )
+        CollectOnlyCache = _require_attr("amplihack.recovery.collect_cache", "CollectOnlyCache")
+        _write_suite(tmp_path)
+        cache = CollectOnlyCache()
+        collect_error_signatures(tmp_path, timeout=60, cache=cache)
+
+        (tmp_path / "tests" / "unit" / "helpers.py").write_text("OTHER = 1\n")
+        signatures = collect_error_signatures(tmp_path, timeout=60, cache=cache)
+
+        assert recorded_runs == [(), ("tests/unit/test_alpha.py",)]
+        assert signatures[0].error_type == "ImportError"
+        assert signatures[0].normalized_location == "tests/unit/test_alpha.py"
+
+    def test_module_imported_through_sys_path_edit_is_not_served_stale(
+        self, tmp_path: Path, recorded_runs
+    ):
+        collect_error_signatures = _require_attr(
+            "amplihack.recovery.stage2", "collect_error_signatures"
+        )
+        CollectOnlyCache = _require_attr("amplihack.recovery.collect_cache", "CollectOnlyCache")
+        _write_suite(tmp_path)
+        (tmp_path / "tools").mkdir()
+        (tmp_path / "tools" / "tool_analyzer.py").write_text("def analyze():\n    return 1\n")
+        (tmp_path / "tests" / "unit" / "test_tool.py").write_text(
+            "import sys\n"
+            "from pathlib import Path\n\n"
+            "sys.path.insert(0, str(Path(__file__).parents[2] / 'tools'))\n\n"
+            "from tool_analyzer import analyze\n\n\n"
+            "def test_tool():\n    assert analyze()\n"
+        )
+        cache = CollectOnlyCache()
+        assert collect_error_signatures(tmp_path, timeout=60, cache=cache) == []
+
+        (tmp_path / "tools" / "tool_analyzer.py").write_text("def renamed():\n    return 1\n")
+        signatures = collect_error_signatures(tmp_path, timeout=60, cache=cache)
+
+        assert recorded_runs == [(), ("tests/unit/test_tool.py",)]
+        assert signatures[0].error_type == "ImportError"
+        assert signatures[0].normalized_location == "tests/unit/test_tool.py"
+
+    def test_module_loaded_from_file_location_is_not_served_stale(
+        self, tmp_path: Path, recorded_runs
+    ):
+        collect_error_signatures = _require_attr(
+            "amplihack.recovery.stage2", "collect_error_signatures"
+        )
+        CollectOnlyCache = _require_attr("amplihack.recovery.collect_cache", "CollectOnlyCache")
+        _write_suite(tmp_path)
+        (tmp_path / "deploy").mkdir()
+        (tmp_path / "deploy" / "entrypoint.py").write_text("def main():\n    return 1\n")
+        (tmp_path / "tests" / "unit" / "test_entrypoint.py").write_text(
+            "import importlib.util\n"
+            "from pathlib import Path\n\n"
+            "_path = Path(__file__).parents[2] / 'deploy' / 'entrypoint.py'\n"
+            "_spec = importlib.util.spec_from_file_location('entrypoint', _path)\n"
+            "_entrypoint = importlib.util.module_from_spec(_spec)\n"
+            "_spec.loader.exec_module(_entrypoint)\n\n\n"
+            "def test_main():\n    assert _entrypoint.main()\n"
+        )
+        cache = CollectOnlyCache()
+        before = cache.snapshot(tmp_path)
+        assert collect_error_signatures(tmp_path, timeout=60, cache=cache) == []
+
+        (tmp_path / "deploy" / "entrypoint.py").write_text("def broken(:\n")
+        after = cache.snapshot(tmp_path)
+        signatures = collect_error_signatures(tmp_path, timeout=60, cache=cache)
+
+        module = "tests/unit/test_entrypoint.py"
+        assert after.modules[module] != before.modules[module]
+        assert after.modules["tests/unit/test_beta.py"] == before.modules["tests/unit/test_beta.py"]
+        assert recorded_runs == [(), (module,)]
+        assert [signature.normalized_location for signature in signatures] == [module]
+
+    def test_conftest_failure_falls_back_to_full_runs(self, tmp_path: Path, recorded_runs):
+        collect_error_signatures = _require_attr(
+            "amplihack.recovery.stage2", "collect_error_signatures"
+        )
+        CollectOnlyCache = _require_attr("amplihack.recovery.collect_cache", "CollectOnlyCache")
+        _write_suite(tmp_path)
+        (tmp_path / "tests" / "conftest.py").write_text("import missing_dep\n")
+        cache = CollectOnlyCache()
+
+        first = collect_error_signatures(tmp_path, timeout=60, cache=cache)
+        (tmp_path / "tests" / "unit" / "test_beta.py").write_text("def test_beta():\n    pass\n")
+        second = collect_error_signatures(tmp_path, timeout=60, cache=cache)
+        third = collect_error_signatures(tmp_path, timeout=60, cache=cache)
+
+        assert first
+        assert second == third == first
+        assert recorded_runs == [(), ()]
+
+
+class TestCollectBatches:
+    """Parallel re-collection must split only independent subtrees."""
+
+    def test_batches_split_subtrees_and_keep_basename_collisions_together(self, tmp_path: Path):
+        CollectOnlyCache = _require_attr("amplihack.recovery.collect_cache", "CollectOnlyCache")
+        _write_suite(tmp_path)
+        (tmp_path / "tests" / "other").mkdir()
+        (tmp_path / "tests" / "other" / "test_beta.py").write_text("def test_b():\n    pass\n")
+        cache = CollectOnlyCache(workers=4)
+        snapshot = cache.snapshot(tmp_path)
+
+        batches = cache.batches(
+            snapshot, ["tests/unit/test_beta.py", "tests/integration/test_gamma.py"]
+        )
+
+        assert sorted(batches) == [
+            ["tests/integration/test_gamma.py"],
+            ["tests/other/test_beta.py", "tests/unit/test_beta.py"],
+        ]
+
+    def test_parallel_first_collection_matches_full_run(self, tmp_path: Path, recorded_runs):
+        collect_error_signatures = _require_attr(
+            "amplihack.recovery.stage2", "collect_error_signatures"
+        )
+        CollectOnlyCache = _require_attr("amplihack.recovery.collect_cache", "CollectOnlyCache")
+        _write_suite(tmp_path)
+        (tmp_path / "tests" / "integration" / "test_gamma.py").write_text("import missing_dep\n")
+
+        parallel = collect_error_signatures(tmp_path, timeout=60, cache=CollectOnlyCache(workers=2))
+        full = collect_error_signatures(tmp_path, timeout=60)
+
+        assert parallel == full
+        assert sorted(recorded_runs[:2]) == [
+            ("tests/integration/test_gamma.py",),
+            ("tests/unit/test_alpha.py", "tests/unit/test_beta.py"),
+        ]
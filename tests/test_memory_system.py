@@ -220,6 +220,188 @@ class TestMemoryDatabase:
         assert "top_agents" in stats
         assert "db_size_bytes" in stats
 
+    @staticmethod
+    def _memory(title, content, **overrides):
+        fields = {
+            "id": str(uuid.uuid4()),
+            "session_id": "test_session",
+            "agent_id": "test_agent",
+            "memory_type": MemoryType.CONTEXT,
+            "title": title,
+            "content": content,
+            "metadata": {},
+            "created_at": datetime.now(),
+            "accessed_at": datetime.now(),
+        }
+        fields.update(overrides)
+        return MemoryEntry(**fields)
+
+    def test_relevance_query_ranks_by_bm25(self, temp_db):
+        """Full-text matches come first, best first, then the rest by recency."""
+        now = datetime.now()
+        unrelated = self._memory("Lunch", "Pizza on Friday", accessed_at=now)
+        weak = self._memory("Notes", "CI was slow today", accessed_at=now - timedelta(hours=1))
+        strong = self._memory(
+            "Fix CI failures",
+            "To fix CI failures, rerun the failing jobs",
+            accessed_at=now - timedelta(hours=2),
+        )
+        for memory in (unrelated, weak, strong):
+            temp_db.store_memory(memory)
+
+        query = MemoryQuery(session_id="test_session", relevance_query="How to fix CI failures?")
+        results = temp_db.retrieve_memories(query)
+        assert [m.id for m in results] == [strong.id, weak.id, unrelated.id]
+
+        # Filters and limit apply in the same query
+        query = MemoryQuery(
+            session_id="test_session",
+            relevance_query="CI",
+            min_importance=5,
+            limit=1,
+        )
+        assert temp_db.retrieve_memories(query) == []
+
+        # FTS syntax in user text is treated as plain words
+        query = MemoryQuery(session_id="test_session", relevance_query='fix" OR NEAR(* "ci')
+        assert temp_db.retrieve_memories(query)[0].id == strong.id
+
+    def test_fulltext_index_follows_store_and_delete(self, temp_db):
+        """Replacing or deleting a memory updates the full-text index."""
+        memory = self._memory("Deploy", "kubernetes rollout steps")
+        temp_db.store_memory(memory)
+        memory.content = "terraform plan steps"
+        temp_db.store_memory(memory)  # INSERT OR REPLACE
+
+        conn = temp_db._get_connection()
+
+        def matches(term):
+            return conn.execute(
+                "SELECT COUNT(*) FROM memory_fts WHERE memory_fts MATCH ?", (term,)
+            ).fetchone()[0]
+
+        assert matches("kubernetes") == 0
+        assert matches("terraform") == 1
+
+        temp_db.delete_memory(memory.id)
+        assert matches("terraform") == 0
+        conn.execute("INSERT INTO memory_fts(memory_fts) VALUES ('integrity-check')")
+
+    def test_fulltext_index_backfilled_on_migration(self, temp_db):
+        """Databases created before the full-text index get it backfilled."""
+        temp_db.store_memory(self._memory("Legacy", "authentication tokens rotate weekly"))
+        conn = temp_db._get_connection()
+        for name in ("memory_fts_insert", "memory_fts_delete", "memory_fts_update"):
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.execute("DROP TABLE memory_fts")
+        conn.commit()
+        temp_db.close()
+
+        reopened = MemoryDatabase(temp_db.db_path)
+        query = MemoryQuery(session_id="test_session", relevance_query="authentication")
+        results = reopened.retrieve_memories(query)
+        assert [m.title for m in results] == ["Legacy"]
+        count = (
+            reopened._get_connection()
+            .execute("SELECT COUNT(*) FROM memory_fts WHERE memory_fts MATCH 'authentication'")
+            .fetchone()[0]
+        )
+        assert count == 1
+        reopened.close()
+
+    def test_reads_buffer_access_tracking(self, temp_db):
+        """Reads record access times in memory; a flush writes them in one batch."""
+        old = datetime.now() - timedelta(days=3)
+        memory = self._memory("Tracked", "tracked content", accessed_at=old)
+        temp_db.store_memory(memory)
+
+        def stored_access():
+            return (
+                temp_db._get_connection()
+                .execute(
+                    "SELECT accessed_at, access_count FROM memory_entries WHERE id = ?",
+                    (memory.id,),
+                )
+                .fetchone()
+            )
+
+        temp_db.get_memory_by_id(memory.id)
+        temp_db.retrieve_memories(MemoryQuery(session_id="test_session"))
+        assert stored_access() == (old.isoformat(), 0)
+
+        temp_db.flush_access_times()
+        accessed_at, access_count = stored_access()
+        assert accessed_at > old.isoformat()
+        assert access_count == 2
+
+        # Re-storing keeps the count; an older buffered time never overwrites a newer one
+        temp_db.get_memory_by_id(memory.id)
+        memory.accessed_at = datetime.now() + timedelta(days=1)
+        temp_db.store_memory(memory)
+        temp_db.flush_access_times()
+        assert stored_access() == (memory.accessed_at.isoformat(), 3)
+
+    def test_concurrent_readers_use_own_connections(self, temp_db):
+        """Each reading thread gets its own connection and sees committed writes."""
+        import threading
+
+        for i in range(20):
+            temp_db.store_memory(self._memory(f"Memory {i}", f"content {i}"))
+
+        errors = []
+        counts = []
+        connections = []
+        barrier = threading.Barrier(4)
+
+        def reader():
+            try:
+                barrier.wait()
+                for _ in range(25):
+                    results = temp_db.retrieve_memories(MemoryQuery(session_id="test_session"))
+                    counts.append(len(results))
+                connections.append(temp_db._get_reader())
+            except Exception as e:  # pragma: no cover - surfaced by the assert below
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        for i in range(20, 30):
+            temp_db.store_memory(self._memory(f"Memory {i}", f"content {i}"))
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert min(counts) >= 20 and max(counts) <= 30
+        assert len({id(conn) for conn in connections}) == 3
+        assert len(temp_db.retrieve_memories(MemoryQuery(session_id="test_session"))) == 30
+
+        temp_db.close()
+        assert len(temp_db._readers) == 0
+
+    def test_reader_is_closed_when_its_thread_ends(self, temp_db):
+        """Short-lived reading threads do not leave connections behind."""
+        import sqlite3
+        import threading
+
+        temp_db.store_memory(self._memory("Memory", "content"))
+        connections = []
+
+        def reader():
+            temp_db.retrieve_memories(MemoryQuery(session_id="test_session"))
+            connections.append(temp_db._get_reader())
+
+        for _ in range(10):
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join()
+
+        assert len(temp_db._readers) == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            connections[0].execute("SELECT 1")
+        temp_db.close()
+
 
 class TestMemoryManager:
     """Test the high-level memory manager interface."""
@@ -0,0 +1,182 @@
+"""Unit tests for the persistent issue index and prefilter in SemanticDuplicateDetector."""
+
+import asyncio
+import json
+
+# Add path for imports
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent / "amplifier-bundle" / "tools" / "amplihack" / "reflection"),
+)
+
+import semantic_duplicate_detector
+from semantic_duplicate_detector import IssueIndex, IssueSignature, SemanticDuplicateDetector
+
+
+def _issue(i: int, title: str, body: str) -> dict:
+    return {"id": str(i), "title": title, "body": body}
+
+
+@pytest.fixture
+def index(tmp_path):
+    """IssueIndex backed by a temporary file."""
+    return IssueIndex(index_path=tmp_path / "issue_index.json")
+
+
+@pytest.fixture
+def detector(index):
+    """Detector whose LLM comparison is replaced by a counting fake."""
+    det = SemanticDuplicateDetector(index=index, top_k=3, recall_sample_size=0)
+    det._sdk_available = True
+    det.llm_calls = []
+
+    async def fake_llm(new_content, existing_content, timeout_seconds=120):
+        det.llm_calls.append(existing_content)
+        return det.fallback_detect(new_content, existing_content)
+
+    det.detect_with_llm = fake_llm
+    return det
+
+
+@pytest.fixture
+def existing_issues():
+    """Mostly unrelated issue history with one near-duplicate."""
+    issues = [
+        _issue(i, f"Unrelated topic {i}", f"Widget number {i} renders the wrong colour scheme")
+        for i in range(20)
+    ]
+    issues.append(
+        _issue(
+            99,
+            "Stop hook crashes on empty transcript",
+            "The stop hook raises IndexError when the transcript file is empty",
+        )
+    )
+    return issues
+
+
+class TestIssueIndex:
+    """Tests for the persistent issue index."""
+
+    def test_add_persists_across_instances(self, tmp_path, index):
+        index.add("1", "Title", "Body", pattern_type="bug", repository="repo-a")
+
+        reloaded = IssueIndex(index_path=tmp_path / "issue_index.json")
+        assert len(reloaded) == 1
+        assert reloaded.issues()[0]["title"] == "Title"
+
+    def test_issues_filters_by_repository(self, index):
+        index.add("1", "A", "a", repository="repo-a")
+        index.add("2", "B", "b", repository="repo-b")
+
+        assert [i["id"] for i in index.issues("repo-b")] == ["2"]
+
+    def test_corrupt_index_starts_empty(self, tmp_path):
+        path = tmp_path / "issue_index.json"
+        path.write_text("{not json")
+
+        assert len(IssueIndex(index_path=path)) == 0
+
+    def test_signature_of_other_length_is_recomputed(self, tmp_path, index):
+        index.add("1", "Title", "Body")
+        path = tmp_path / "issue_index.json"
+        data = json.loads(path.read_text())
+        data["issues"][0]["signature"]["minhash"] = [0, 1, 2]
+        path.write_text(json.dumps(data))
+
+        reloaded = IssueIndex(index_path=path)
+        [signature] = reloaded.signatures().values()
+        assert signature == IssueSignature.from_content("Title\nBody")
+        assert signature.similarity(signature) == 1.0
+
+
+class TestPrefilter:
+    """Tests for the prefilter and LLM call accounting."""
+
+    def test_only_top_k_candidates_reach_llm(self, detector, existing_issues):
+        result = asyncio.run(
+            detector.detect_semantic_duplicate(
+                "Stop hook crashes on empty transcript",
+                "The stop hook raises IndexError when the transcript file is empty",
+                existing_issues,
+            )
+        )
+
+        assert len(detector.llm_calls) == 3
+        assert result.is_duplicate
+        assert result.similar_issues[0]["id"] == "99"
+
+    def test_repeated_detection_uses_pair_cache(self, detector, existing_issues):
+        for _ in range(2):
+            asyncio.run(detector.detect_semantic_duplicate("Title", "Body", existing_issues))
+
+        stats = detector.get_stats()
+        assert stats["llm_calls"] == 3
+        assert stats["cache_hits"] == 3
+        assert stats["llm_calls_saved"] == 2 * len(existing_issues) - 3
+
+    def test_uses_index_when_no_issues_given(self, detector, index):
+        index.add("7", "Flaky network test", "The network test times out on CI runners")
+
+        result = asyncio.run(
+            detector.detect_semantic_duplicate(
+                "Flaky network test", "The network test times out on CI runners"
+            )
+        )
+
+        assert result.is_duplicate
+        assert result.similar_issues[0]["id"] == "7"
+
+    def test_recall_audit_reports_full_recall_when_duplicate_is_candidate(
+        self, detector, existing_issues
+    ):
+        detector.recall_sample_size = len(existing_issues)
+        asyncio.run(
+            detector.detect_semantic_duplicate(
+                "Stop hook crashes on empty transcript",
+                "The stop hook raises IndexError when the transcript file is empty",
+                existing_issues,
+            )
+        )
+
+        assert detector.get_stats()["prefilter_recall"] == 1.0
+
+
+class TestSignatureReuse:
+    """Tests that the prefilter does not recompute stored signatures."""
+
+    @pytest.fixture
+    def signature_calls(self, monkeypatch):
+        calls = []
+        original = IssueSignature.from_content.__func__
+
+        def counting(cls, content):
+            calls.append(content)
+            return original(cls, content)
+
+        monkeypatch.setattr(
+            semantic_duplicate_detector.IssueSignature, "from_content", classmethod(counting)
+        )
+        return calls
+
+    def test_existing_signatures_computed_once(self, detector, existing_issues, signature_calls):
+        detector.prefilter("Title\nBody", existing_issues)
+        first = len(signature_calls)
+        detector.prefilter("Other\nBody", existing_issues)
+
+        assert first == len(existing_issues) + 1
+        assert len(signature_calls) == first + 1  # only the new content
+
+    def test_index_signatures_are_reused(self, detector, index, existing_issues, signature_calls):
+        for issue in existing_issues:
+            index.add(issue["id"], issue["title"], issue["body"])
+        signature_calls.clear()
+
+        asyncio.run(detector.detect_semantic_duplicate("Title", "Body"))
+
+        assert signature_calls == ["Title\nBody"]
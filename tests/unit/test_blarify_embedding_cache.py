@@ -0,0 +1,169 @@
+"""Tests for the persistent blarify embedding cache.
+
+Covers:
+- Re-indexing unchanged content costs no embedding calls, across processes
+- Only changed nodes are embedded, in batched requests
+- Model name is part of the cache key
+- Failed embeddings are not cached
+- In-memory LRU bound and hit/miss statistics
+"""
+
+import pytest
+
+from amplihack.vendor.blarify.graph.node.documentation_node import DocumentationNode
+from amplihack.vendor.blarify.services.embedding_service import EmbeddingService
+from amplihack.vendor.blarify.services.embedding_store import EmbeddingStore
+
+
+class FakeEmbeddingClient:
+    """Embeds text deterministically and records every request."""
+
+    def __init__(self, fail: bool = False):
+        self.requests: list[list[str]] = []
+        self.fail = fail
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.requests.append(list(texts))
+        if self.fail:
+            raise RuntimeError("embedding API unavailable")
+        return [[float(len(text)), float(sum(map(ord, text))) / 7.0] for text in texts]
+
+    @property
+    def embedded_texts(self) -> list[str]:
+        return [text for request in self.requests for text in request]
+
+
+def _node(node_id: str, content: str) -> DocumentationNode:
+    return DocumentationNode(
+        content=content,
+        info_type="function",
+        source_type="code",
+        source_path=f"file:///repo/{node_id}.py",
+        source_name=node_id,
+        source_id=node_id,
+    )
+
+
+def _service(cache_path, client, **kwargs) -> EmbeddingService:
+    return EmbeddingService(client=client, cache_path=cache_path, **kwargs)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "embeddings.sqlite3"
+
+
+class TestEmbeddingServiceCache:
+    """Test EmbeddingService against the persistent store."""
+
+    def test_reindex_unchanged_repository_embeds_nothing(self, cache_path):
+        nodes = [_node(f"n{i}", f"doc {i}") for i in range(5)]
+        first_client = FakeEmbeddingClient()
+        first = _service(cache_path, first_client).embed_documentation_nodes(nodes)
+        assert len(first_client.embedded_texts) == 5
+
+        # New service instance: nothing in memory, everything on disk
+        second_client = FakeEmbeddingClient()
+        service = _service(cache_path, second_client)
+        second = service.embed_documentation_nodes(nodes)
+
+        assert second_client.requests == []
+        assert second == first
+        stats = service.get_stats()
+        assert stats["disk_hits"] == 5
+        assert stats["misses"] == 0
+        assert stats["embedded"] == 0
+
+    def test_reindex_embeds_only_changed_nodes(self, cache_path):
+        nodes = [_node(f"n{i}", f"doc {i}") for i in range(5)]
+        _service(cache_path, FakeEmbeddingClient()).embed_documentation_nodes(nodes)
+
+        nodes[1] = _node("n1", "doc 1 rewritten")
+        nodes.append(_node("n5", "doc 5"))
+        client = FakeEmbeddingClient()
+        result = _service(cache_path, client).embed_documentation_nodes(nodes)
+
+        assert sorted(client.embedded_texts) == ["doc 1 rewritten", "doc 5"]
+        assert len(result) == 6
+
+    def test_misses_are_batched_and_duplicates_embedded_once(self, cache_path):
+        nodes = [_node(f"n{i}", f"doc {i % 5}") for i in range(10)]
+        client = FakeEmbeddingClient()
+        service = _service(cache_path, client, batch_size=2)
+
+        result = service.embed_documentation_nodes(nodes)
+
+        assert [len(request) for request in client.requests] == [2, 2, 1]
+        assert result[nodes[0].id] == result[nodes[5].id]
+        assert len(result) == 10
+
+    def test_model_is_part_of_cache_key(self, cache_path):
+        nodes = [_node("n0", "doc 0")]
+        _service(cache_path, FakeEmbeddingClient()).embed_documentation_nodes(nodes)
+
+        client = FakeEmbeddingClient()
+        service = _service(cache_path, client)
+        service.model = "text-embedding-3-small"
+        service.embed_documentation_nodes(nodes)
+
+        assert client.embedded_texts == ["doc 0"]
+
+    def test_failed_embeddings_are_not_cached(self, cache_path, monkeypatch):
+        monkeypatch.setattr("time.sleep", lambda _: None)
+        nodes = [_node("n0", "doc 0")]
+        failing = _service(cache_path, FakeEmbeddingClient(fail=True))
+        assert failing.embed_documentation_nodes(nodes) == {nodes[0].id: None}
+
+        client = FakeEmbeddingClient()
+        result = _service(cache_path, client).embed_documentation_nodes(nodes)
+
+        assert client.embedded_texts == ["doc 0"]
+        assert result[nodes[0].id] is not None
+
+    def test_single_text_shares_cache_with_nodes(self, cache_path):
+        client = FakeEmbeddingClient()
+        service = _service(cache_path, client)
+        service.embed_documentation_nodes([_node("n0", "doc 0")])
+
+        assert service.embed_single_text("doc 0") == client.embed_documents(["doc 0"])[0]
+        assert service.get_stats()["memory_hits"] == 1
+
+
+class TestEmbeddingStore:
+    """Test the two-level store directly."""
+
+    def test_memory_layer_is_lru_bounded(self, cache_path):
+        store = EmbeddingStore(cache_path, memory_cache_size=2)
+        store.put_many("m", {"a": [1.0], "b": [2.0]})
+        store.get_many("m", ["a"])  # a becomes most recently used
+        store.put_many("m", {"c": [3.0]})
+
+        assert store.get_stats()["memory_entries"] == 2
+        assert store.get_many("m", ["a", "b", "c"]) == {"a": [1.0], "b": [2.0], "c": [3.0]}
+        stats = store.get_stats()
+        assert stats["memory_hits"] == 3  # a (twice) and c
+        assert stats["disk_hits"] == 1  # b was evicted from memory
+
+    def test_vectors_round_trip_exactly(self, cache_path):
+        vector = [0.1, -2.5e-8, 1 / 3]
+        EmbeddingStore(cache_path).put_many("m", {"h": vector})
+
+        assert EmbeddingStore(cache_path).get_many("m", ["h"]) == {"h": vector}
+
+    def test_stats_count_misses_and_hit_rate(self):
+        store = EmbeddingStore(":memory:")
+        store.put_many("m", {"a": [1.0]})
+        store.get_many("m", ["a", "b", "c", "d"])
+
+        stats = store.get_stats()
+        assert stats["misses"] == 3
+        assert stats["hit_rate"] == 0.25
+
+    def test_unopenable_database_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        store = EmbeddingStore(blocker / "embeddings.sqlite3")
+
+        store.put_many("m", {"a": [1.0]})
+
+        assert store.get_many("m", ["a"]) == {"a": [1.0]}
@@ -0,0 +1,127 @@
+"""Tests for blarify's parallel code hierarchy build.
+
+Covers:
+- A hierarchy built with parse_workers > 1 has exactly the nodes and
+  relationships of the serial build, in the same order
+- Code files use the definition spans scanned by the pool, and non-code files
+  do not wait for the pool
+"""
+
+import pytest
+
+for _grammar in (
+    "tree_sitter_python",
+    "tree_sitter_javascript",
+    "tree_sitter_typescript",
+    "tree_sitter_c_sharp",
+    "tree_sitter_go",
+    "tree_sitter_java",
+    "tree_sitter_php",
+    "tree_sitter_ruby",
+):
+    pytest.importorskip(_grammar)
+
+from amplihack.vendor.blarify.code_hierarchy import TreeSitterHelper
+from amplihack.vendor.blarify.project_file_explorer import ProjectFilesIterator
+from amplihack.vendor.blarify.project_graph_creator import ProjectGraphCreator
+
+FIXTURE_FILES = {
+    "app/__init__.py": "",
+    "app/models.py": (
+        "class User:\n"
+        "    def __init__(self, name):\n"
+        "        self.name = name\n\n"
+        "    def greet(self):\n"
+        "        return f'hi {self.name}'\n\n\n"
+        "def make_user(name):\n"
+        "    return User(name)\n"
+    ),
+    "app/service/handlers.py": (
+        "from app.models import make_user\n\n\n"
+        "class Handler:\n"
+        "    def handle(self, name):\n"
+        "        def inner():\n"
+        "            return make_user(name)\n"
+        "        return inner()\n"
+    ),
+    "web/index.js": (
+        "function render(items) {\n  return items.map((item) => item.name);\n}\n\n"
+        "class View {\n  show() {\n    return render([]);\n  }\n}\n"
+    ),
+    "web/types.ts": (
+        "export interface Item {\n  name: string;\n}\n\n"
+        "export function count(items: Item[]): number {\n  return items.length;\n}\n"
+    ),
+    "README.md": "# Fixture\n",
+}
+
+
+class NoReferences:
+    """Stand-in reference resolver; the hierarchy build only initializes directories."""
+
+    def initialize_directory(self, file) -> None:
+        pass
+
+
+def _creator(root: str, parse_workers: int) -> ProjectGraphCreator:
+    return ProjectGraphCreator(
+        root_path=root,
+        reference_query_helper=NoReferences(),
+        project_files_iterator=ProjectFilesIterator(root_path=root),
+        parse_workers=parse_workers,
+    )
+
+
+def _build(root: str, parse_workers: int):
+    return _creator(root, parse_workers).build_hierarchy_only()
+
+
+@pytest.fixture
+def fixture_tree(tmp_path):
+    for relpath, content in FIXTURE_FILES.items():
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return str(tmp_path)
+
+
+def test_parallel_build_matches_serial_build(fixture_tree):
+    serial = _build(fixture_tree, parse_workers=1)
+    parallel = _build(fixture_tree, parse_workers=2)
+
+    serial_nodes = serial.get_nodes_as_objects()
+    assert any(node["type"] == "FUNCTION" for node in serial_nodes)
+    assert any(node["type"] == "CLASS" for node in serial_nodes)
+    assert parallel.get_nodes_as_objects() == serial_nodes
+    assert parallel.get_relationships_as_objects() == serial.get_relationships_as_objects()
+
+
+def test_code_files_use_pool_spans_and_other_files_do_not_wait(fixture_tree, monkeypatch):
+    span_files: list[str] = []
+    real_from_spans = TreeSitterHelper.create_nodes_from_definition_spans
+
+    def recording_from_spans(self, file, spans, parent_folder=None):
+        span_files.append(file.name)
+        return real_from_spans(self, file, spans, parent_folder=parent_folder)
+
+    monkeypatch.setattr(
+        TreeSitterHelper, "create_nodes_from_definition_spans", recording_from_spans
+    )
+    creator = _creator(fixture_tree, parse_workers=2)
+    buffered: list[int] = []
+    real_pop = creator._pop_definition_spans
+
+    def recording_pop(file):
+        spans = real_pop(file)
+        buffered.append(len(creator._definition_spans))
+        return spans
+
+    monkeypatch.setattr(creator, "_pop_definition_spans", recording_pop)
+
+    creator.build_hierarchy_only()
+
+    code_files = [path.rsplit("/", 1)[-1] for path in FIXTURE_FILES if path != "README.md"]
+    assert sorted(span_files) == sorted(code_files)
+    # Files are built in the order they were submitted, so no result is read
+    # ahead; README.md would otherwise drain the pool
+    assert buffered and max(buffered) == 0
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Stand-in for `xpia-defend serve` used by tests without the Rust binary.
+
+Speaks the newline-delimited JSON worker protocol from
+amplihack.security.xpia_worker. Content containing "ignore all previous
+instructions" is reported as a critical threat. Two magic inputs exercise
+failure handling: "__crash__" makes the worker exit mid-request and
+"__hang__" makes it stop answering.
+"""
+
+import json
+import os
+import sys
+import time
+
+
+def evaluate(args: list[str], stdin: str | None) -> dict:
+    text = " ".join([*args, stdin or ""])
+    if "__crash__" in text:
+        os._exit(3)
+    if "__hang__" in text:
+        time.sleep(3600)
+    if "__internal__" in text:
+        return {"exit_code": 2}
+    malicious = "ignore all previous instructions" in text.lower()
+    return {
+        "exit_code": 1 if malicious else 0,
+        "output": {
+            "is_valid": not malicious,
+            "risk_level": "critical" if malicious else "none",
+            "threats": [{"threat_type": "injection", "severity": "critical"}] if malicious else [],
+            "recommendations": [],
+            "metadata": {"command": args[0] if args else "", "worker_pid": os.getpid()},
+            "timestamp": "2026-01-01T00:00:00+00:00",
+        },
+    }
+
+
+def main() -> None:
+    for line in sys.stdin:
+        message = json.loads(line)
+        if message.get("ping"):
+            response = {"id": message["id"], "ok": True}
+        else:
+            results = [evaluate(r["args"], r.get("stdin")) for r in message["requests"]]
+            response = {"id": message["id"], "results": results}
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()